@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        logik_projekt_openclip_precomp.py
-# Version:          1.0.3
+# Version:          1.0.4
 # Created:          2024-01-19
-# Modified:         2025-02-25
+# Modified:         2026-10-18
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -213,6 +213,9 @@ class class_projekt_openclip_precomp():
         self.x_position = 0
         self.batch_duration = 1
 
+        # Write File node configured once per invocation, then duplicated
+        self.write_node_preset = None
+
     # ---------------------------------------------------------------------- #
 
     def batch_projekt_precomp_clips(self):
@@ -239,37 +242,16 @@ class class_projekt_openclip_precomp():
             "comp",  # trailing comma is legitimate on last list item in python
         ]
 
-        # Rename 'Schematic Reel' or 'Schematic Reel 1' to 'sources' if it exists
-        for reel in flame.batch.reels:
-            if reel.name == 'Schematic Reel' or reel.name == 'Schematic Reel 1':
-                reel.name = 'sources'
-                print(f"Renamed '{reel.name}' to 'sources'.")
-
-        # Rename 'Schematic Reel' or 'Schematic Reel 2' to 'reference' if it exists
-        for reel in flame.batch.reels:
-            if reel.name == 'Schematic Reel' or reel.name == 'Schematic Reel 2':
-                reel.name = 'reference'
-                print(f"Renamed '{reel.name}' to 'reference'.")
-
-        # Rename 'Schematic Reel' or 'Schematic Reel 3' to 'CGI' if it exists
-        for reel in flame.batch.reels:
-            if reel.name == 'Schematic Reel' or reel.name == 'Schematic Reel 3':
-                reel.name = 'CGI'
-                print(f"Renamed '{reel.name}' to 'CGI'.")
-
-        # Rename 'Schematic Reel' or 'Schematic Reel 4' to 'mattes' if it exists
-        for reel in flame.batch.reels:
-            if reel.name == 'Schematic Reel' or reel.name == 'Schematic Reel 4':
-                reel.name = 'mattes'
-                print(f"Renamed '{reel.name}' to 'mattes'.")
+        # Rename the default schematic reels and create the missing ones
+        default_reel_renames = {
+            'Schematic Reel': 'sources',
+            'Schematic Reel 1': 'sources',
+            'Schematic Reel 2': 'reference',
+            'Schematic Reel 3': 'CGI',
+            'Schematic Reel 4': 'mattes',
+        }
 
-        # Create reels that don't exist
-        for reel_name in reel_names:
-            if not any(reel.name == reel_name for reel in flame.batch.reels):
-                flame.batch.create_reel(reel_name)
-                print(f"Created new schematic reel named '{reel_name}'.")
-            else:
-                print(f"Schematic reel named '{reel_name}' already exists.")
+        self.reconcile_schematic_reels(reel_names, default_reel_renames)
 
         for clip in self.selection:
             self.x_position = clip.pos_x
@@ -285,6 +267,38 @@ class class_projekt_openclip_precomp():
 
     # ---------------------------------------------------------------------- #
 
+    def reconcile_schematic_reels(self, reel_names, default_reel_renames):
+        """
+        Renames the default schematic reels and creates the missing ones.
+
+        The reel list is read from Flame once; the renames and creations
+        are worked out from that snapshot, so only the reels that actually
+        change are touched.
+        """
+
+        # Snapshot the reels and their names, every '.name' read is an API call
+        reels = [(reel, reel.name.get_value()) for reel in self.batch_group.reels]
+
+        existing_reel_names = set()
+        for reel, reel_name in reels:
+            new_reel_name = default_reel_renames.get(reel_name)
+            if new_reel_name:
+                reel.name = new_reel_name
+                print(f"Renamed '{reel_name}' to '{new_reel_name}'.")
+                reel_name = new_reel_name
+            existing_reel_names.add(reel_name)
+
+        # Create reels that don't exist
+        for reel_name in reel_names:
+            if reel_name not in existing_reel_names:
+                self.batch_group.create_reel(reel_name)
+                existing_reel_names.add(reel_name)
+                print(f"Created new schematic reel named '{reel_name}'.")
+            else:
+                print(f"Schematic reel named '{reel_name}' already exists.")
+
+    # ---------------------------------------------------------------------- #
+
     def media_panel_projekt_precomp_clips(self):
         import flame
 
@@ -356,10 +370,12 @@ class class_projekt_openclip_precomp():
         self.clip_duration = clip.duration
         #print('clip_duration:', self.clip_duration)
 
-        self.clip_frame_rate = clip.clip.frame_rate
+        clip_source = clip.clip
+
+        self.clip_frame_rate = clip_source.frame_rate
         #print('clip_frame_rate:', self.clip_frame_rate)
 
-        self.clip_timecode = clip.clip.start_time
+        self.clip_timecode = clip_source.start_time
         #print('clip_timecode:', self.clip_timecode)
 
         self.clip_shot_name = pyside6_qt_get_shot_name(clip)
@@ -419,28 +435,16 @@ class class_projekt_openclip_precomp():
 
         # ------------------------------------------------------------------ #
 
-        def add_write_node():
+        def add_write_node_preset():
 
-            # Create write node
+            # Create write node with the settings shared by every clip
 
             self.render_node = flame.batch.create_node('Write File')
 
             self.render_node.range_start = int(str(flame.batch.start_frame))
-            self.render_node.range_end = int(str(self.batch_group.start_frame)) + int(str(self.clip_duration)) - 1
-
-            self.render_node.frame_rate = self.clip_frame_rate
-
-            self.render_node.source_timecode = self.clip_timecode
-            self.render_node.record_timecode = self.clip_timecode
-
-            # self.render_node.name = self.clip_shot_name + '_comp'
-            # self.render_node.name = self.clip_name + '_mattes'
-            # self.render_node.name = self.clip_name + '_neat_video'
-            self.render_node.name = self.clip_name + '_precomp'
 
             # self.render_node.destination = ('Batch Reels', 'comp')
             # self.render_node.destination = ('Batch Reels', 'mattes')
-            # self.render_node.name = self.clip_name + '_multichannel'
             # self.render_node.destination = ('Batch Reels', 'multichannel')
             # self.render_node.destination = ('Batch Reels', 'neat_video')
             self.render_node.destination = ('Batch Reels', 'precomp')
@@ -476,14 +480,9 @@ class class_projekt_openclip_precomp():
             self.render_node.frame_index_mode = self.settings.write_file_frame_index
             self.render_node.frame_padding = int(self.settings.write_file_padding)
 
-            self.render_node.shot_name = self.clip_shot_name
-
             # self.render_node.format = "Multi-Channel"
             # self.render_node.format = "RGB-A"
 
-            # add version note
-            self.render_node.note = "precomp openclip for: " + str(self.render_node.shot_name) + " configured by logik-projekt."
-
             # add version note collapsed state
             self.render_node.note_collapsed = True
 
@@ -497,6 +496,38 @@ class class_projekt_openclip_precomp():
                 # add version padding
                 self.render_node.version_padding = 4 # Enable if using 'Custom Version'
 
+            return self.render_node
+
+        # ------------------------------------------------------------------ #
+
+        def add_write_node():
+
+            # Duplicate the write node preset, then set the clip values
+
+            if self.write_node_preset is None:
+                self.write_node_preset = add_write_node_preset()
+            else:
+                self.render_node = self.write_node_preset.duplicate()
+
+            self.render_node.range_end = int(str(self.batch_group.start_frame)) + int(str(self.clip_duration)) - 1
+
+            self.render_node.frame_rate = self.clip_frame_rate
+
+            self.render_node.source_timecode = self.clip_timecode
+            self.render_node.record_timecode = self.clip_timecode
+
+            # self.render_node.name = self.clip_shot_name + '_comp'
+            # self.render_node.name = self.clip_name + '_mattes'
+            # self.render_node.name = self.clip_name + '_neat_video'
+            self.render_node.name = self.clip_name + '_precomp'
+
+            # self.render_node.name = self.clip_name + '_multichannel'
+
+            self.render_node.shot_name = self.clip_shot_name
+
+            # add version note
+            self.render_node.note = "precomp openclip for: " + str(self.render_node.shot_name) + " configured by logik-projekt."
+
         # ------------------------------------------------------------------ #
 
         # Add MUX node
@@ -530,8 +561,8 @@ class class_projekt_openclip_precomp():
 
         # Connect nodes
 
-        flame.batch.connect_nodes(clip, 'Default', mux_node, 'Default')
-        flame.batch.connect_nodes(mux_node, 'Default', self.render_node, 'Default')
+        self.batch_group.connect_nodes(clip, 'Default', mux_node, 'Default')
+        self.batch_group.connect_nodes(mux_node, 'Default', self.render_node, 'Default')
         # flame.batch.connect_nodes(clip, 'Default', neat_video_node, 'Default')
         # flame.batch.connect_nodes(neat_video_node, 'Default', self.render_node, 'Default')
 
@@ -930,3 +961,7 @@ def get_media_panel_custom_ui_actions():
 # modified:              2025-02-25 - 07:01:17
 # comments:              Added legacy support for PySide2 imports
 # -------------------------------------------------------------------------- #
+# version:               1.0.4
+# modified:              2026-10-18 - 12:00:00
+# comments:              Reconcile schematic reels from one snapshot and duplicate a preset Write File node per clip.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        create_nuke_scripts.py
-# Version:          2.2.7
+# Version:          2.2.9
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-19
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -51,6 +51,7 @@
 
 # Standard library imports
 import ast
+import contextlib
 import datetime
 import fileinput
 import functools
@@ -154,6 +155,16 @@ from functions.define_job_structure import (
     define_job_structure as define_job_structure
 )
 
+# -------------------------------------------------------------------------- #
+
+# Define the shot tree shared by the script generators
+from functions.shot_tree import (
+    ShotTree as ShotTree
+)
+from functions.create_shot_bookmarks import (
+    ShotBookmarksUpdater as ShotBookmarksUpdater
+)
+
 # ========================================================================== #
 # This section gathers information about logik projekt shots.
 # ========================================================================== #
@@ -276,8 +287,11 @@ def create_openclips_and_scripts(*args, **kwargs):
     # # Setup logging
     # setup_logging()
 
-    # Define job structure using the function
-    job_structure = define_job_structure(job_root)
+    # Define the shot tree of the job once for this run
+    shot_tree = ShotTree(job_root)
+
+    # Define job structure using the shot tree
+    job_structure = shot_tree.job_structure
     # logging.info("Job structure defined.")
 
     # Define app_name and task_types_list
@@ -304,12 +318,23 @@ def create_openclips_and_scripts(*args, **kwargs):
     # Call the function to print variables
     # print_variables()
 
-    # Process shot information
-    process_shot_info(job_structure,
-                      app_name,
-                      task_types_list,
-                      start_frame_min,
-                      end_frame_max)
+    # Bookmark the shots in the Flame project, with one write for the job
+    bookmarks_path = os.path.join(the_current_projekt.setups_folder,
+                                  'status',
+                                  'cf_bookmarks.json')
+    bookmarks = None
+    if os.path.isfile(bookmarks_path):
+        bookmarks = ShotBookmarksUpdater(shot_tree.shots_dir, bookmarks_path)
+
+    # Process shot information, then write the queued bookmarks at once
+    with bookmarks or contextlib.nullcontext():
+        process_shot_info(job_structure,
+                          app_name,
+                          task_types_list,
+                          start_frame_min,
+                          end_frame_max,
+                          shot_tree=shot_tree,
+                          bookmarks=bookmarks)
 
 # ========================================================================== #
 # This section defines the flame menu entries.
@@ -486,3 +511,12 @@ if __name__ == "__main__":
 # modified:              2024-08-31 - 19:04:02
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               2.2.8
+# modified:              2026-10-18 - 12:00:00
+# comments:              Built the shot tree of the job once per run.
+# -------------------------------------------------------------------------- #
+# version:               2.2.9
+# modified:              2026-10-19 - 12:00:00
+# comments:              Bookmarked the processed shots in the Flame project
+#                        with one write per run.
+# -------------------------------------------------------------------------- #
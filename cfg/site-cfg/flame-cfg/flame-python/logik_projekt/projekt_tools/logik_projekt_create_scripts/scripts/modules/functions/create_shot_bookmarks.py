@@ -1,58 +1,236 @@
 import os
 import json
+import bisect
+import tempfile
+
+from shot_index import list_dir_entries
+
+# Where the shot bookmarks live in cf_bookmarks.json, as the names of the
+# section and folders that lead to them
+SHOTS_FOLDER_PATH = ('Project', 'projekt directories', 'shots')
 
 def get_shot_folders(shots_dir):
     """
     Get all shot folders in the specified directory and sort them.
     """
-    shot_folders = [f for f in os.listdir(shots_dir) if os.path.isdir(os.path.join(shots_dir, f))]
-    return sorted(shot_folders)  # Sort the list of shot folders
+    shot_folders, _ = list_dir_entries(shots_dir)  # Sorted by the indexer
+    return shot_folders
 
-def update_bookmarks_json(shots_dir, json_file_path):
+def index_bookmarks(bookmarks_data):
     """
-    Update the bookmarks JSON file with shot folders.
+    Index the sections and folders of a bookmarks document by their path
+    of names, e.g. ('Project', 'projekt directories', 'shots').
     """
-    # Read existing JSON file
-    with open(json_file_path, 'r') as f:
-        bookmarks_data = json.load(f)
-
-    # Find the "shots" folder in the JSON structure
-    shots_folder = None
-    for section in bookmarks_data['DlBookmark']['Sections']:
-        if section['Section'] == 'Project':
-            for bookmark in section['Bookmarks']:
-                if 'Folder' in bookmark and bookmark['Folder'] == 'projekt directories':
-                    for subfolder in bookmark['Bookmarks']:
-                        if subfolder['Folder'] == 'shots':
-                            shots_folder = subfolder
-                            break
-                if shots_folder:
-                    break
-        if shots_folder:
-            break
-
-    if not shots_folder:
-        raise ValueError("Shots folder not found in the JSON structure")
-
-    # Get shot folders
-    shot_folders = get_shot_folders(shots_dir)
-
-    # Update shots folder bookmarks
-    shots_folder['Bookmarks'] = [
-        {
-            "Bookmark": shot,
-            "Path": os.path.join(shots_dir, shot),
-            "Visibility": "Global"
-        } for shot in shot_folders
+    index = {}
+    pending = [
+        ((section['Section'],), section)
+        for section in bookmarks_data['DlBookmark']['Sections']
     ]
+    while pending:
+        path, node = pending.pop()
+        index.setdefault(path, node)
+        for bookmark in node.get('Bookmarks', []):
+            if 'Folder' in bookmark:
+                pending.append((path + (bookmark['Folder'],), bookmark))
+    return index
+
+def write_json_atomic(json_file_path, data):
+    """
+    Write 'data' to a temporary file next to 'json_file_path' and rename it
+    over the file, so readers see either the old or the new document.
+    """
+    directory = os.path.dirname(os.path.abspath(json_file_path))
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory,
+        prefix='.' + os.path.basename(json_file_path) + '.',
+        suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(temp_path, os.stat(json_file_path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, json_file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+class ShotBookmarksUpdater(object):
+    """
+    Keep the shot bookmarks of a cf_bookmarks.json in step with a shots
+    directory.
+
+    Shot additions and removals are queued and merged into the shots
+    folder of the loaded document as a delta, together with the paths of
+    bookmarks that no longer point into the shots directory. flush()
+    writes them in one atomic write. The document is read again before a
+    write if something else changed the file.
+
+    Used as a context manager, the updater is a batch: every change
+    queued inside the 'with' block, e.g. one add_shots() per shot of a
+    job, is written by a single flush() when the block ends without an
+    error.
+    """
+
+    def __init__(self, shots_dir, json_file_path):
+        self.shots_dir = shots_dir
+        self.json_file_path = json_file_path
+        self.bookmarks_data = None
+        # Sections and folders of the document by their path of names
+        self.folders = {}
+        self.shots_folder = None
+        self.file_state = None
+        self.added = set()
+        self.removed = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        return False
+
+    # ---------------------------------------------------------------------- #
+    # This section reads the document.
+    # ---------------------------------------------------------------------- #
+
+    def _file_state(self):
+        stat = os.stat(self.json_file_path)
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _load(self):
+        file_state = self._file_state()
+        with open(self.json_file_path, 'r') as f:
+            bookmarks_data = json.load(f)
+        folders = index_bookmarks(bookmarks_data)
+        shots_folder = folders.get(SHOTS_FOLDER_PATH)
+        if shots_folder is None:
+            raise ValueError("Shots folder not found in the JSON structure")
+        shots_folder.setdefault('Bookmarks', [])
+        self.bookmarks_data = bookmarks_data
+        self.folders = folders
+        self.shots_folder = shots_folder
+        self.file_state = file_state
 
-    # Write updated JSON back to file
-    with open(json_file_path, 'w') as f:
-        json.dump(bookmarks_data, f, indent=4)
+    def _ensure_loaded(self):
+        if self.bookmarks_data is None or self._file_state() != self.file_state:
+            self._load()
 
-    print(f"Updated {len(shot_folders)} shot bookmarks in {json_file_path}")
+    def bookmarked_shots(self):
+        """Return the names of the bookmarked shots."""
+        self._ensure_loaded()
+        return [
+            bookmark['Bookmark']
+            for bookmark in self.shots_folder['Bookmarks']
+        ]
+
+    # ---------------------------------------------------------------------- #
+    # This section queues changes.
+    # ---------------------------------------------------------------------- #
+
+    def add_shots(self, shots):
+        """Queue bookmarks for 'shots'."""
+        for shot in shots:
+            self.added.add(shot)
+            self.removed.discard(shot)
+
+    def remove_shots(self, shots):
+        """Queue the removal of the bookmarks of 'shots'."""
+        for shot in shots:
+            self.removed.add(shot)
+            self.added.discard(shot)
+
+    def sync(self, shots=None):
+        """
+        Queue the changes that make the bookmarks match 'shots'. Without
+        'shots', the shots directory is listed through the shot indexer,
+        which answers from its cache when it runs.
+        """
+        if shots is None:
+            shots = get_shot_folders(self.shots_dir)
+        shots = set(shots)
+        bookmarked = set(self.bookmarked_shots())
+        self.add_shots(shots - bookmarked)
+        self.remove_shots(bookmarked - shots)
+
+    # ---------------------------------------------------------------------- #
+    # This section writes the document.
+    # ---------------------------------------------------------------------- #
+
+    def _merge(self):
+        """
+        Apply the queued changes to the shots folder and point every
+        bookmark at its shot in the shots directory. Return the count.
+        """
+        bookmarks = self.shots_folder['Bookmarks']
+        changed = 0
+
+        if self.removed:
+            kept = [
+                bookmark for bookmark in bookmarks
+                if bookmark['Bookmark'] not in self.removed
+            ]
+            changed += len(bookmarks) - len(kept)
+            bookmarks[:] = kept
+
+        # Insert each new shot at its place in the sorted bookmarks
+        names = [bookmark['Bookmark'] for bookmark in bookmarks]
+        for shot in sorted(self.added - set(names)):
+            position = bisect.bisect(names, shot)
+            names.insert(position, shot)
+            bookmarks.insert(position, {
+                "Bookmark": shot,
+                "Path": os.path.join(self.shots_dir, shot),
+                "Visibility": "Global"
+            })
+            changed += 1
+
+        # Bookmarks made for another shots directory, e.g. before the job
+        # moved, are pointed at this one
+        for bookmark in bookmarks:
+            path = os.path.join(self.shots_dir, bookmark['Bookmark'])
+            if bookmark.get('Path') != path:
+                bookmark['Path'] = path
+                changed += 1
+
+        self.added.clear()
+        self.removed.clear()
+        return changed
+
+    def flush(self):
+        """
+        Write the queued changes and path updates in one atomic write,
+        or leave the file alone if there are none.
+
+        Returns:
+        int: The number of bookmarks added, removed or updated.
+        """
+        self._ensure_loaded()
+        changed = self._merge()
+        if changed:
+            write_json_atomic(self.json_file_path, self.bookmarks_data)
+            self.file_state = self._file_state()
+        return changed
+
+def update_bookmarks_json(shots_dir, json_file_path, shots=None):
+    """
+    Update the bookmarks JSON file with shot folders.
+
+    'shots' may come from a cached listing, e.g. the shots of a ShotTree;
+    by default the shot indexer lists shots_dir.
+    """
+    updater = ShotBookmarksUpdater(shots_dir, json_file_path)
+    updater.sync(shots)
+    changed = updater.flush()
+    shot_count = len(updater.shots_folder['Bookmarks'])
 
-if __name__ == "__main__":
-    shots_dir = "/PROJEKTS/example_projekt_name/shots"  # Replace with your actual shots directory
-    json_file_path = "/path/to/your/bookmarks.json"  # Replace with your actual JSON file path
-    update_bookmarks_json(shots_dir, json_file_path)
\ No newline at end of file
+    print(f"Updated {shot_count} shot bookmarks in {json_file_path} "
+          f"({changed} changed)")
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        define_shot_structure.py
-# Version:          2.2.7
+# Version:          2.2.8
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-18
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -52,13 +52,26 @@ import os
 # This section gathers information about logik projekt shots.
 # ========================================================================== #
 
-# Define function to define shot structure
-def define_shot_structure(shots_dir,
-                          shot_dir,
-                          app_name,
-                          task_type):
+# Shot structure directories that are created. Their parents are created
+# with them.
+SHOT_STRUCTURE_CREATED_DIRS = (
+    "shot_batch_setups_dir",
+    "shot_renders_dir",
+    "shot_sources_dir",
+    "shot_output_clips_app_dir",
+    "shot_segment_clips_app_dir",
+    "shot_scripts_app_dir"
+)
+
+# -------------------------------------------------------------------------- #
+
+# Define function to define shot structure paths
+def shot_structure_paths(shots_dir,
+                         shot_dir,
+                         app_name,
+                         task_type):
     """
-    Define directory structure for a shot.
+    Define directory paths for a shot without creating them.
 
     Parameters:
     shots_dir (str): Directory path where shots are stored.
@@ -70,9 +83,6 @@ def define_shot_structure(shots_dir,
     dict: Dictionary containing directory paths for the shot structure.
     """
 
-    # # This section is for logging purposes
-    # logging.info(f"Defining shot structure for {shot_dir}...")
-
     # Define directories
     shot_batch_setups_dir = f"{shots_dir}/{shot_dir}/batch_setups"
 
@@ -93,28 +103,6 @@ def define_shot_structure(shots_dir,
     shot_scripts_app_dir = f"{shot_scripts_dir}/{app_name}"
     shot_scripts_app_task_dir = f"{shot_scripts_app_dir}/{task_type}"
 
-    # Create directories if they don't exist
-    for directory in [
-        shot_batch_setups_dir,
-        shot_renders_dir,
-        shot_sources_dir,
-        shot_output_clips_dir,
-        shot_output_clips_app_dir,
-        # shot_output_clips_app_task_dir,
-        shot_segment_clips_dir,
-        shot_segment_clips_app_dir,
-        # shot_segment_clips_app_task_dir,
-        shot_scripts_dir,
-        # shot_scripts_app_dir,
-        shot_scripts_app_dir
-        # shot_scripts_app_task_dir
-    ]:
-
-        os.makedirs(directory, exist_ok=True)
-
-    # # This section is for logging purposes
-    # logging.info(f"Shot structure defined for {shot_dir}.")
-
     return {
         "shot_batch_setups_dir": shot_batch_setups_dir,
         "shot_media_dir": shot_media_dir,
@@ -132,6 +120,46 @@ def define_shot_structure(shots_dir,
         "shot_scripts_app_task_dir": shot_scripts_app_task_dir
     }
 
+# -------------------------------------------------------------------------- #
+
+# Define function to define shot structure
+def define_shot_structure(shots_dir,
+                          shot_dir,
+                          app_name,
+                          task_type):
+    """
+    Define directory structure for a shot and create its directories.
+
+    The script generators use the shot tree of shot_tree.py instead,
+    which creates the directories of every shot once per run.
+
+    Parameters:
+    shots_dir (str): Directory path where shots are stored.
+    shot_dir (str): Name of the shot directory.
+    app_name (str): Name of the application.
+    task_type (str): Type of task.
+
+    Returns:
+    dict: Dictionary containing directory paths for the shot structure.
+    """
+
+    # # This section is for logging purposes
+    # logging.info(f"Defining shot structure for {shot_dir}...")
+
+    shot_structure = shot_structure_paths(shots_dir,
+                                          shot_dir,
+                                          app_name,
+                                          task_type)
+
+    # Create directories if they don't exist
+    for key in SHOT_STRUCTURE_CREATED_DIRS:
+        os.makedirs(shot_structure[key], exist_ok=True)
+
+    # # This section is for logging purposes
+    # logging.info(f"Shot structure defined for {shot_dir}.")
+
+    return shot_structure
+
 # ========================================================================== #
 # C2 A9 32 30 32 34 2D 4D 41 4E 2D 4D 41 44 45 2D 4D 45 4B 41 4E 59 5A 4D 53 #
 # ========================================================================== #
@@ -231,3 +259,7 @@ def define_shot_structure(shots_dir,
 # modified:              2024-08-31 - 19:04:02
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               2.2.8
+# modified:              2026-10-18 - 12:00:00
+# comments:              Split the paths from the directory creation.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        list_shot_source_dir.py
-# Version:          2.2.7
+# Version:          2.2.8
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-18
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -48,6 +48,14 @@ import os
 # import logging
 # from datetime import datetime
 
+# ========================================================================== #
+# This section imports the external functions.
+# ========================================================================== #
+
+from shot_index import (
+    list_dir_entries as list_dir_entries
+)
+
 # ========================================================================== #
 # This section gathers information about logik projekt shots.
 # ========================================================================== #
@@ -67,8 +75,9 @@ def list_shot_source_dir(shot_source_dir):
     # # This section is for logging purposes
     # logging.info(f"Listing contents of source directory {shot_source_dir}:")
 
-    shot_source_dir_list = os.listdir(shot_source_dir)
-    shot_source_dir_list.sort()  # Sort the directory list
+    # Ask the shot indexer, which lists shot_source_dir itself if not running
+    shot_source_dir_dirs, shot_source_dir_files = list_dir_entries(shot_source_dir)
+    shot_source_dir_list = sorted(shot_source_dir_dirs + shot_source_dir_files)
 
     # # This section is for logging purposes
     # for shot_source_version_dir in shot_source_dir_list:
@@ -175,3 +184,7 @@ def list_shot_source_dir(shot_source_dir):
 # modified:              2024-08-31 - 19:04:02
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               2.2.8
+# modified:              2026-10-18 - 12:00:00
+# comments:              Listed source versions through the shot indexer.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        list_shot_sources_dir.py
-# Version:          2.2.7
+# Version:          2.2.8
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-18
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -48,6 +48,14 @@ import os
 # import logging
 # from datetime import datetime
 
+# ========================================================================== #
+# This section imports the external functions.
+# ========================================================================== #
+
+from shot_index import (
+    list_dir_entries as list_dir_entries
+)
+
 # ========================================================================== #
 # This section gathers information about logik projekt shots.
 # ========================================================================== #
@@ -67,8 +75,9 @@ def list_shot_sources_dir(shot_sources_dir):
     # # This section is for logging purposes
     # logging.info(f"Listing directories of {shot_sources_dir}:")
 
-    shot_sources_dir_list = os.listdir(shot_sources_dir)
-    shot_sources_dir_list.sort()  # Sort the directory list
+    # Ask the shot indexer, which lists shot_sources_dir itself if not running
+    shot_sources_dir_dirs, shot_sources_dir_files = list_dir_entries(shot_sources_dir)
+    shot_sources_dir_list = sorted(shot_sources_dir_dirs + shot_sources_dir_files)
   
     # # This section is for logging purposes
     # for shot_source_dir in shot_sources_dir_list:
@@ -175,3 +184,7 @@ def list_shot_sources_dir(shot_sources_dir):
 # modified:              2024-08-31 - 19:04:02
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               2.2.8
+# modified:              2026-10-18 - 12:00:00
+# comments:              Listed sources through the shot indexer.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        list_shots_dir.py
-# Version:          2.2.7
+# Version:          2.2.8
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-18
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -48,6 +48,14 @@ import os
 # import logging
 # from datetime import datetime
 
+# ========================================================================== #
+# This section imports the external functions.
+# ========================================================================== #
+
+from shot_index import (
+    list_dir_entries as list_dir_entries
+)
+
 # ========================================================================== #
 # This section gathers information about logik projekt shots.
 # ========================================================================== #
@@ -66,13 +74,8 @@ def list_shots_dir(shots_dir):
     # # This section is for logging purposes
     # logging.info(f"Listing shot directories in {shots_dir}:")
 
-    shots_dir_list = [
-        shots_dir_item for shots_dir_item in os.listdir(shots_dir)
-        if os.path.isdir(os.path.join(shots_dir, shots_dir_item))
-    ]
-
-    # Sort the list alphabetically
-    shots_dir_list.sort()
+    # Ask the shot indexer, which scans shots_dir itself if not running
+    shots_dir_list, _ = list_dir_entries(shots_dir)
 
     # # This section is for logging purposes
     # for shot_dir in shots_dir_list:
@@ -179,3 +182,7 @@ def list_shots_dir(shots_dir):
 # modified:              2024-08-31 - 19:04:02
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               2.2.8
+# modified:              2026-10-18 - 12:00:00
+# comments:              Listed shots through the shot indexer.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        path_to_shot_source_openexr_sequences.py
-# Version:          2.2.7
+# Version:          2.2.9
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-19
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -48,6 +48,14 @@ import os
 # import logging
 # from datetime import datetime
 
+# ========================================================================== #
+# This section imports the external functions.
+# ========================================================================== #
+
+from shot_index import (
+    find_sequences as find_sequences
+)
+
 # ========================================================================== #
 # This section gathers information about logik projekt shots.
 # ========================================================================== #
@@ -75,48 +83,46 @@ def path_to_shot_source_openexr_sequences(directory,
     shot_source_version_openexr_sequences_info = []
     shot_source_version_start_frame = None
     shot_source_version_end_frame = None
-    shot_source_openexr_files_list = []
-
-    # Recursively search for OpenEXR files
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.lower().endswith('.exr'):
-                shot_source_openexr_files_list.append(os.path.join(root, file))
 
-    shot_source_openexr_files_list.sort()
+    # Recursively search for OpenEXR sequences, through the shot indexer
+    # if it is running
+    shot_source_openexr_sequences_list = find_sequences(directory, '.exr')
 
-    # Process each OpenEXR file
-    for shot_source_version_openexr_file in shot_source_openexr_files_list:
-        shot_source_version_openexr_path = shot_source_version_openexr_file
-        shot_source_version_openexr_filename = os.path.basename(shot_source_version_openexr_file)
-        shot_source_version_openexr_frame_number = int(shot_source_version_openexr_filename.split('.')[1])
-
-        # Extract prefix from the filename
-        shot_source_version_openexr_filename_parts = shot_source_version_openexr_filename.split('.')
-        shot_source_version_filename_prefix = '.'.join(shot_source_version_openexr_filename_parts[:-2])
-        shot_source_version_openexr_filename_suffix = shot_source_version_openexr_filename_parts[-1]
-
-        shot_source_version_sequence_dir = os.path.dirname(shot_source_version_openexr_file)
+    # Process each OpenEXR sequence
+    for shot_source_version_sequence in shot_source_openexr_sequences_list:
+        shot_source_version_sequence_dir = shot_source_version_sequence['sequence_dir']
+        shot_source_version_filename_prefix = shot_source_version_sequence['prefix']
+        shot_source_version_openexr_filename_suffix = shot_source_version_sequence['suffix']
 
         # Update start and end frame numbers
         if shot_source_version_start_frame is None:
-            shot_source_version_start_frame = shot_source_version_openexr_frame_number
-            shot_source_version_end_frame = shot_source_version_openexr_frame_number
+            shot_source_version_start_frame = shot_source_version_sequence['start_frame']
+            shot_source_version_end_frame = shot_source_version_sequence['end_frame']
         else:
-            shot_source_version_start_frame = min(shot_source_version_openexr_frame_number, shot_source_version_start_frame)
-            shot_source_version_end_frame = max(shot_source_version_openexr_frame_number, shot_source_version_end_frame)
+            shot_source_version_start_frame = min(shot_source_version_sequence['start_frame'], shot_source_version_start_frame)
+            shot_source_version_end_frame = max(shot_source_version_sequence['end_frame'], shot_source_version_end_frame)
 
         start_frame_min = min(start_frame_min, shot_source_version_start_frame)
         end_frame_max = max(end_frame_max, shot_source_version_end_frame)
 
-        # Append information to the list
-        shot_source_version_openexr_sequences_info.append({
-            'shot_source_version_openexr_path': shot_source_version_openexr_path,
-            'shot_source_version_sequence_dir': shot_source_version_sequence_dir,
-            'shot_source_version_filename_prefix': shot_source_version_filename_prefix,
-            'shot_source_version_openexr_frame_number': shot_source_version_openexr_frame_number,
-            'shot_source_version_openexr_filename_suffix': shot_source_version_openexr_filename_suffix,
-        })
+        # Append information about each frame to the list
+        for shot_source_version_openexr_frame in shot_source_version_sequence['frames']:
+            shot_source_version_openexr_path = os.path.join(
+                shot_source_version_sequence_dir,
+                f'{shot_source_version_filename_prefix}.{shot_source_version_openexr_frame}.{shot_source_version_openexr_filename_suffix}'
+            )
+            shot_source_version_openexr_sequences_info.append({
+                'shot_source_version_openexr_path': shot_source_version_openexr_path,
+                'shot_source_version_sequence_dir': shot_source_version_sequence_dir,
+                'shot_source_version_filename_prefix': shot_source_version_filename_prefix,
+                'shot_source_version_openexr_frame_number': int(shot_source_version_openexr_frame),
+                'shot_source_version_openexr_filename_suffix': shot_source_version_openexr_filename_suffix,
+            })
+
+    # List the frames in path order, like a sorted file search
+    shot_source_version_openexr_sequences_info.sort(
+        key=lambda info: info['shot_source_version_openexr_path']
+    )
 
     return shot_source_version_openexr_sequences_info, shot_source_version_start_frame, shot_source_version_end_frame
 
@@ -219,3 +225,11 @@ def path_to_shot_source_openexr_sequences(directory,
 # modified:              2024-08-31 - 19:04:02
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               2.2.8
+# modified:              2026-10-18 - 12:00:00
+# comments:              Searched OpenEXR files through the shot indexer.
+# -------------------------------------------------------------------------- #
+# version:               2.2.9
+# modified:              2026-10-19 - 12:00:00
+# comments:              Grouped the OpenEXR frames with find_sequences.
+# -------------------------------------------------------------------------- #
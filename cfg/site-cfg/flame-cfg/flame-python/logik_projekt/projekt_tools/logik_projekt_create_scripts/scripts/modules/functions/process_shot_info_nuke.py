@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        process_shot_info_nuke.py
-# Version:          2.2.7
+# Version:          2.2.9
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-19
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -99,6 +99,9 @@ from create_nuke_shot_script import (
 from create_nuke_source_script import (
     create_nuke_source_script as create_nuke_source_script
 )
+from shot_tree import (
+    ShotTree as ShotTree
+)
 # from process_shot_info import (
 #     process_shot_info as process_shot_info
 # )
@@ -112,7 +115,9 @@ def process_shot_info(job_structure,
                       app_name,
                       task_types_list,
                       start_frame_min,
-                      end_frame_max):
+                      end_frame_max,
+                      shot_tree=None,
+                      bookmarks=None):
     """
     Process shot information.
 
@@ -122,18 +127,26 @@ def process_shot_info(job_structure,
     task_types_list (list): List of task types.
     start_frame_min (int): Minimum frame number.
     end_frame_max (int): Maximum frame number.
+    shot_tree (ShotTree): The shot tree of the job, built from
+                          job_structure if not given.
+    bookmarks (ShotBookmarksUpdater): Queues a bookmark for each shot
+                                      processed, if given.
 
     Returns:
     None
     """
-    # Access shots_dir from job_structure dictionary
-    shots_dir = job_structure["shots_dir"]
+    # Build the shot tree once if the caller did not
+    if shot_tree is None:
+        shot_tree = ShotTree(job_structure["job_root"])
+
+    # Access shots_dir from the shot tree
+    shots_dir = shot_tree.shots_dir
 
-    # List shot directories and store them in a variable
-    shots_dir_list = list_shots_dir(shots_dir)
+    # Create the directories of every shot in one pass
+    shot_tree.create_shot_dirs(app_name, task_types_list)
 
     # Define shot structures and list sources directories for each shot
-    for shot_dir in shots_dir_list:
+    for shot_dir in shot_tree.shots:
 
         # Define shot_name
         shot_name = shot_dir
@@ -143,10 +156,9 @@ def process_shot_info(job_structure,
 
         # Iterate over task types list
         for task_type in task_types_list:
-            shot_structure = define_shot_structure(shots_dir,
-                                                   shot_dir,
-                                                   app_name,
-                                                   task_type)
+            shot_structure = shot_tree.shot_structure(shot_dir,
+                                                      app_name,
+                                                      task_type)
           
             # Log shot structure
             # logging.info(f"Shot structure for {shot_dir} ({task_type}): {shot_structure}")
@@ -171,8 +183,8 @@ def process_shot_info(job_structure,
             shot_sources_dir = os.path.join(shots_dir,
                                             shot_structure["shot_sources_dir"])
 
-            # List source directories
-            shot_sources_dir_list = list_shot_sources_dir(shot_sources_dir)
+            # List source directories, once per shot
+            shot_sources_dir_list = shot_tree.shot_sources(shot_dir)
 
             # Log source directories
             # logging.info(f"Source directories for {shot_dir} ({task_type}): {shot_sources_dir_list}")
@@ -183,8 +195,9 @@ def process_shot_info(job_structure,
                                                     shot_source_dir)
                 shot_source_version_openexr_sequences_info, \
                     shot_source_version_start_frame, \
-                        shot_source_version_end_frame = path_to_shot_source_openexr_sequences(
-                            shot_source_dir_path,
+                        shot_source_version_end_frame = shot_tree.source_sequences(
+                            shot_dir,
+                            shot_source_dir,
                             start_frame_min,
                             end_frame_max)
               
@@ -221,6 +234,10 @@ def process_shot_info(job_structure,
                     # # This section is for logging purposes
                     # logging.info(f"No OpenEXR files found in {shot_source_dir_path} ({task_type})")
 
+        # Queue the bookmark of the shot, written once for the whole job
+        if bookmarks is not None:
+            bookmarks.add_shots([shot_dir])
+
 # ========================================================================== #
 # C2 A9 32 30 32 34 2D 4D 41 4E 2D 4D 41 44 45 2D 4D 45 4B 41 4E 59 5A 4D 53 #
 # ========================================================================== #
@@ -320,3 +337,11 @@ def process_shot_info(job_structure,
 # modified:              2024-08-31 - 19:04:02
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               2.2.8
+# modified:              2026-10-18 - 12:00:00
+# comments:              Processed the shots of a shared shot tree.
+# -------------------------------------------------------------------------- #
+# version:               2.2.9
+# modified:              2026-10-19 - 12:00:00
+# comments:              Queued a shot bookmark for each shot processed.
+# -------------------------------------------------------------------------- #
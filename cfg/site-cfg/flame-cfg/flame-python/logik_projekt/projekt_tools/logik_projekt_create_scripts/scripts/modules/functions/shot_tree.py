@@ -0,0 +1,228 @@
+#
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:       This file is part of LOGIK-PROJEKT.
+#                   Copyright © 2024 man-made-mekanyzms
+
+#                   LOGIK-PROJEKT creates directories, files, scripts & tools
+#                   for use with Autodesk Flame and other software.
+
+#                   LOGIK-PROJEKT is free software.
+
+#                   You can redistribute it and/or modify it under the terms
+#                   of the GNU General Public License as published by the
+#                   Free Software Foundation, either version 3 of the License,
+#                   or any later version.
+
+#                   This program is distributed in the hope that it will be
+#                   useful, but WITHOUT ANY WARRANTY; without even the
+#                   implied warranty of MERCHANTABILITY or FITNESS FOR A
+#                   PARTICULAR PURPOSE.
+
+#                   See the GNU General Public License for more details.
+
+#                   You should have received a copy of the GNU General
+#                   Public License along with this program.
+
+#                   If not, see <https://www.gnu.org/licenses/>.
+
+#                   Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+
+# File Name:        shot_tree.py
+# Version:          2.2.9
+# Created:          2026-10-18
+# Modified:         2026-10-19
+
+# ========================================================================== #
+# This section describes the shot tree.
+# ========================================================================== #
+
+"""
+One model of the shots of a job, shared by the script generators.
+
+A ShotTree is built once per run of a generator. It lists the shots once,
+computes the shot structure paths of each shot, app and task type once,
+and creates the shot directories of every shot in one pass that skips
+directories already known to exist in this run. The source directories
+and OpenEXR sequences of a shot are read once and reused for every task
+type.
+
+The Nuke and After Effects generators build one with
+
+    shot_tree = ShotTree(job_root)
+
+and hand it to their process_shot_info.
+"""
+
+# ========================================================================== #
+# This section imports the necessary modules.
+# ========================================================================== #
+
+import os
+
+# ========================================================================== #
+# This section imports the external functions.
+# ========================================================================== #
+
+from define_job_structure import (
+    define_job_structure as define_job_structure
+)
+from define_shot_structure import (
+    SHOT_STRUCTURE_CREATED_DIRS as SHOT_STRUCTURE_CREATED_DIRS,
+    shot_structure_paths as shot_structure_paths
+)
+from list_shots_dir import (
+    list_shots_dir as list_shots_dir
+)
+from list_shot_sources_dir import (
+    list_shot_sources_dir as list_shot_sources_dir
+)
+from path_to_shot_source_openexr_sequences import (
+    path_to_shot_source_openexr_sequences as path_to_shot_source_openexr_sequences
+)
+from shot_index import (
+    find_indexed_dirs as find_indexed_dirs
+)
+
+# ========================================================================== #
+# This section defines the shot tree.
+# ========================================================================== #
+
+class ShotTree(object):
+    """
+    The shots of one job with their structure paths, sources and OpenEXR
+    sequences, each computed once.
+    """
+
+    def __init__(self, job_root, shots=None):
+        """
+        Parameters:
+        job_root (str): The root directory of the job.
+        shots (list): The shot directory names, default every shot in the
+                      shots directory of the job.
+        """
+        self.job_root = job_root
+        self.job_structure = define_job_structure(job_root)
+        self.shots_dir = self.job_structure["shots_dir"]
+        if shots is None:
+            shots = list_shots_dir(self.shots_dir)
+        self.shots = list(shots)
+        self._structures = {}
+        self._sources = {}
+        self._sequences = {}
+        # Directories known to exist, seeded from the shot indexer
+        self._known_dirs = None
+
+    # ---------------------------------------------------------------------- #
+    # This section defines the paths.
+    # ---------------------------------------------------------------------- #
+
+    def shot_structure(self, shot_dir, app_name, task_type):
+        """
+        Returns the shot structure paths of 'shot_dir', as
+        define_shot_structure does, without creating anything.
+        """
+        key = (shot_dir, app_name, task_type)
+        structure = self._structures.get(key)
+        if structure is None:
+            structure = shot_structure_paths(self.shots_dir,
+                                             shot_dir,
+                                             app_name,
+                                             task_type)
+            self._structures[key] = structure
+        return structure
+
+    def shot_dirs(self, app_name, task_types_list):
+        """
+        Returns the shot structure directories to create for every shot,
+        each once, in shot order.
+        """
+        directories = {}
+        for shot_dir in self.shots:
+            for task_type in task_types_list:
+                structure = self.shot_structure(shot_dir, app_name, task_type)
+                for key in SHOT_STRUCTURE_CREATED_DIRS:
+                    directories[structure[key]] = None
+        return list(directories)
+
+    # ---------------------------------------------------------------------- #
+    # This section creates the directories.
+    # ---------------------------------------------------------------------- #
+
+    def create_shot_dirs(self, app_name, task_types_list):
+        """
+        Creates the shot structure directories of every shot for
+        'app_name' in one pass, only the missing ones. When the shot
+        indexer is running, the directories it knows are taken as they
+        are, so a run over an existing job stats none of them. Without it,
+        each directory is checked with one stat, once per shot tree.
+
+        Returns:
+        int: The number of directories created.
+        """
+        if self._known_dirs is None:
+            self._known_dirs = find_indexed_dirs(self.shots_dir) or set()
+        created = 0
+        for directory in self.shot_dirs(app_name, task_types_list):
+            if directory in self._known_dirs:
+                continue
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
+                created += 1
+            self._known_dirs.add(directory)
+        return created
+
+    # ---------------------------------------------------------------------- #
+    # This section reads the sources.
+    # ---------------------------------------------------------------------- #
+
+    def shot_sources_dir(self, shot_dir):
+        return f"{self.shots_dir}/{shot_dir}/media/sources"
+
+    def shot_sources(self, shot_dir):
+        """Returns the source directories of 'shot_dir', listed once."""
+        sources = self._sources.get(shot_dir)
+        if sources is None:
+            sources = list_shot_sources_dir(self.shot_sources_dir(shot_dir))
+            self._sources[shot_dir] = sources
+        return sources
+
+    def source_sequences(self,
+                         shot_dir,
+                         shot_source_dir,
+                         start_frame_min,
+                         end_frame_max):
+        """
+        Returns what path_to_shot_source_openexr_sequences finds in one
+        source directory, searched once.
+        """
+        key = (shot_dir, shot_source_dir, start_frame_min, end_frame_max)
+        sequences = self._sequences.get(key)
+        if sequences is None:
+            sequences = path_to_shot_source_openexr_sequences(
+                os.path.join(self.shot_sources_dir(shot_dir), shot_source_dir),
+                start_frame_min,
+                end_frame_max)
+            self._sequences[key] = sequences
+        return sequences
+
+
+# ========================================================================== #
+# C2 A9 32 30 32 34 2D 4D 41 4E 2D 4D 41 44 45 2D 4D 45 4B 41 4E 59 5A 4D 53 #
+# ========================================================================== #
+
+# Changelist:
+
+# -------------------------------------------------------------------------- #
+# version:               2.2.8
+# modified:              2026-10-18 - 12:00:00
+# comments:              Added the shot tree shared by the script generators.
+# -------------------------------------------------------------------------- #
+# version:               2.2.9
+# modified:              2026-10-19 - 12:00:00
+# comments:              Seeded the known shot directories from the shot
+#                        indexer, so existing ones are not statted.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        create_dated_objects.py
-# Version:          0.1.6
+# Version:          0.2.2
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-19
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -43,6 +43,10 @@
 import flame
 import datetime
 
+# The flame object index is shared with the projekt layout tool, through
+# the same package path, so both tools see one index
+from modules.functions.flame_object_index import flame_object_index
+
 # ========================================================================== #
 # This section defines some variables based on the date.
 # ========================================================================== #
@@ -111,106 +115,45 @@ def create_or_validate_object(
 
     # ---------------------------------------------------------------------- #
 
-    # Check if the object exists in the library
-
-    # For batch groups, continue with the existing logic
-    if object_type == 'batch group':
-
-        if batch_group:
-
-            for group in library.batch_groups:
-
-                if group.name == object_name:
-
-                    print(
-                        f"Batch group '{object_name}' already exists in library "
-                        f"'{library.name}'."
-                    )
-
-                    return group
+    # Batch groups are only created or validated when asked for explicitly
+    if object_type == 'batch group' and not batch_group:
 
-            # If the batch group doesn't exist, create it
-            new_group = library.create_batch_group(
-                name=object_name
-                )
-
-            if object_color:
-
-                new_group.colour = object_color
-
-            print(
-                f"New batch group '{object_name}' created successfully in library "
-                f"'{library.name}'."
+        raise ValueError(
+            f"Batch group '{object_name}' requested without batch_group=True."
             )
-            return new_group
 
     # ---------------------------------------------------------------------- #
 
-    # Reel groups need to be handled separately
-    if object_type == 'reel group':
-
-        for group in library.reel_groups:
-
-            if group.name == object_name:
-
-                print(
-                    f"Reel group '{object_name}' already exists in library "
-                    f"'{library.name}'."
-                    )
-
-                return group
-
-        # If the reel group doesn't exist, create it
-        new_group = library.create_reel_group(
-            name=object_name
-            )
-
-        if object_color:
-
-            new_group.colour = object_color
-
-        print(
-            f"New reel group '{object_name}' created successfully in library "
-            f"'{library.name}'.")
-        return new_group
-
-    # ---------------------------------------------------------------------- #
-
-    # For folders and reels, continue with the existing logic
-    for obj in getattr(
+    # Check if the object exists in the library (listed once per library)
+    existing_object = flame_object_index.find(
         library,
-        f"{object_type}s"
-        ):
+        object_type,
+        object_name
+        )
 
-        if obj.name == object_name:
+    if existing_object is not None:
 
-            print(
-                f"{object_type.capitalize()} '{object_name}' already "
-                f"exists in library '{library.name}'."
-                )
+        print(
+            f"{object_type.capitalize()} '{object_name}' already "
+            f"exists in library '{library.name}'."
+            )
 
-            return obj
+        return existing_object
 
     # ---------------------------------------------------------------------- #
 
     # If the object doesn't exist, create it
-    new_object = getattr(
+    new_object, _ = flame_object_index.ensure(
         library,
-        f"create_{object_type}"
-        )(name=object_name)
-
-    if object_color:
-
-        new_object.colour = object_color
+        object_name,
+        object_type,
+        object_color=object_color,
+        object_reel_type=object_reel_type
+        )
 
-    if object_type == 'reel':
-        if object_reel_type:
-            new_object.attributes['Type'] = object_reel_type
-            print(f"New reel '{object_name}' created successfully in library "
-                f"'{library.name}' with Type '{object_reel_type}'.")
-        else:
-            print(f"New reel '{object_name}' created successfully in library "
-                f"'{library.name}'.")
+    if object_type == 'reel' and object_reel_type:
+        print(f"New reel '{object_name}' created successfully in library "
+            f"'{library.name}' with Type '{object_reel_type}'.")
     else:
         print(
             f"New {object_type} '{object_name}' created successfully in library "
@@ -232,27 +175,32 @@ def create_or_validate_library(
 
     # ---------------------------------------------------------------------- #
 
-    # Check if the library exists in the workspace
-    for library in workspace.libraries:
+    # Check if the library exists in the workspace (listed once)
+    library = flame_object_index.find(
+        workspace,
+        'library',
+        library_name
+        )
 
-        if library.name == library_name:
+    if library is not None:
 
-            print(
-                f"Library '{library_name}' already exists in workspace "
-                f"'{workspace.name}'."
-                )
+        print(
+            f"Library '{library_name}' already exists in workspace "
+            f"'{workspace.name}'."
+            )
 
-            return library
+        return library
 
     # ---------------------------------------------------------------------- #
 
     # If the library doesn't exist, create it.
-    new_library = workspace.create_library(
-        name=library_name
+    new_library, _ = flame_object_index.ensure(
+        workspace,
+        library_name,
+        'library',
+        object_color=object_color
         )
 
-    if object_color:
-        new_library.colour = object_color
     print(
         f"New library '{library_name}' created successfully in workspace "
         f"'{workspace.name}'."
@@ -260,6 +208,24 @@ def create_or_validate_library(
 
     return new_library
 
+# ========================================================================== #
+# This section defines a function to rename the default reels.
+# ========================================================================== #
+
+# Rename and color the default reels of a freshly created reel group
+def rename_default_reels(reel_group):
+
+    for old_name, new_name, color_name in (
+            ('Reel 1', 'ref', "Dark Blue"),
+            ('Reel 2', 'Sources', "Dark Green"),
+            ('Sequences', 'Sequences', "Dark Red")):
+        reel = flame_object_index.find(reel_group, 'reel', old_name)
+        if reel is None:
+            continue
+        if new_name != old_name:
+            flame_object_index.rename(reel_group, 'reel', old_name, new_name)
+        reel.colour = object_colors.get(color_name)
+
 # ========================================================================== #
 # This section defines a function to create a dated flame desktop.
 # ========================================================================== #
@@ -271,6 +237,9 @@ def create_dated_desktop(*args):
     if args:
         print("Received arguments from Flame:", args)
 
+    # Start from a fresh index, the projekt may have changed since last run
+    flame_object_index.reset()
+
     # ---------------------------------------------------------------------- #
 
     the_current_projekt = flame.projects.current_project
@@ -313,19 +282,18 @@ def create_dated_desktop(*args):
     print(f"Current desktop: {the_current_desktop.name}")
 
     # Change the name and color of the reel group in the current desktop
-    for desktop_reel_group in the_current_desktop.reel_groups:
-        if desktop_reel_group.name == 'Reels':
-            desktop_reel_group.name = today_date + '-conform'
-            desktop_reel_group.colour = object_colors.get("Dark Purple")
-            for reel in desktop_reel_group.reels:
-                    if reel.name == 'Reel 1':
-                        reel.name = 'ref'
-                        reel.colour = object_colors.get("Dark Blue")
-                    if reel.name == 'Reel 2':
-                        reel.name = 'Sources'
-                        reel.colour = object_colors.get("Dark Green")
-                    if reel.name == 'Sequences':
-                        reel.colour = object_colors.get("Dark Red")
+    desktop_reel_group = flame_object_index.rename(
+        the_current_desktop,
+        'reel group',
+        'Reels',
+        today_date + '-conform'
+        )
+    if desktop_reel_group is None:
+        print("Reel group 'Reels' not found on the current desktop.")
+        return
+
+    desktop_reel_group.colour = object_colors.get("Dark Purple")
+    rename_default_reels(desktop_reel_group)
 
     # Validate or create dated postings reel in 'pattern_browsed_clips'
     published_sequences_reel = \
@@ -368,6 +336,9 @@ def create_dated_ref_folder(*args):
     if args:
         print("Received arguments from Flame:", args)
 
+    # Start from a fresh index, the projekt may have changed since last run
+    flame_object_index.reset()
+
     # ---------------------------------------------------------------------- #
 
     the_current_projekt = flame.projects.current_project
@@ -405,6 +376,9 @@ def create_dated_conforms_reel_group(*args):
     if args:
         print("Received arguments from Flame:", args)
 
+    # Start from a fresh index, the projekt may have changed since last run
+    flame_object_index.reset()
+
     # ---------------------------------------------------------------------- #
 
     the_current_projekt = flame.projects.current_project
@@ -438,15 +412,7 @@ def create_dated_conforms_reel_group(*args):
             )
 
     # Rename reels in 'dated conforms reel group'
-    for reel in dated_conforms_reel_group.reels:
-        if reel.name == 'Reel 1':
-            reel.name = 'ref'
-            reel.colour = object_colors.get("Dark Blue")
-        if reel.name == 'Reel 2':
-            reel.name = 'Sources'
-            reel.colour = object_colors.get("Dark Green")
-        if reel.name == 'Sequences':
-            reel.colour = object_colors.get("Dark Red")
+    rename_default_reels(dated_conforms_reel_group)
 
     # ---------------------------------------------------------------------- #
 
@@ -461,6 +427,9 @@ def create_dated_postings_reel(*args):
     if args:
         print("Received arguments from Flame:", args)
 
+    # Start from a fresh index, the projekt may have changed since last run
+    flame_object_index.reset()
+
     # ---------------------------------------------------------------------- #
 
     the_current_projekt = flame.projects.current_project
@@ -738,3 +707,17 @@ if __name__ == "__main__":
 # modified:              2024-08-31 - 18:44:01
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               0.2.0
+# modified:              2026-10-18 - 12:00:00
+# comments:              Indexed flame container lookups, listed once per action.
+# -------------------------------------------------------------------------- #
+# version:               0.2.1
+# modified:              2026-10-19 - 12:00:00
+# comments:              Used the shared flame object index; restored the
+#                        batch group guard.
+# -------------------------------------------------------------------------- #
+# version:               0.2.2
+# modified:              2026-10-19 - 12:00:00
+# comments:              Imported the flame object index through its package
+#                        path instead of adding it to sys.path.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        create_projekt_layout.py
-# Version:          0.4.5
+# Version:          0.5.1
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-19
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -126,6 +126,16 @@ from modules.functions.object_colors import (
     object_colors
 )
 
+# ========================================================================== #
+# This section defines the flame object index.
+# ========================================================================== #
+
+# Name index of flame containers, listed once per create_layout call
+from modules.functions.flame_object_index import (
+    ensure_objects,
+    flame_object_index
+)
+
 # ========================================================================== #
 # This section defines a function to create or validate flame objects.
 # ========================================================================== #
@@ -147,106 +157,45 @@ def create_or_validate_object(
 
     # ---------------------------------------------------------------------- #
 
-    # Check if the object exists in the library
-
-    # For batch groups, continue with the existing logic
-    if object_type == 'batch group':
-
-        if batch_group:
-
-            for group in library.batch_groups:
-
-                if group.name == object_name:
+    # Batch groups are only created or validated when asked for explicitly
+    if object_type == 'batch group' and not batch_group:
 
-                    print(
-                        f"Batch group '{object_name}' already exists in library "
-                        f"'{library.name}'."
-                    )
-
-                    return group
-
-            # If the batch group doesn't exist, create it
-            new_group = library.create_batch_group(
-                name=object_name
-                )
-
-            if object_color:
-
-                new_group.colour = object_color
-
-            print(
-                f"  New batch group '{object_name}' created successfully in library "
-                f"'{library.name}'."
+        raise ValueError(
+            f"Batch group '{object_name}' requested without batch_group=True."
             )
-            return new_group
 
     # ---------------------------------------------------------------------- #
 
-    # Reel groups need to be handled separately
-    if object_type == 'reel group':
-
-        for group in library.reel_groups:
-
-            if group.name == object_name:
-
-                print(
-                    f"Reel group '{object_name}' already exists in library "
-                    f"'{library.name}'."
-                    )
-
-                return group
-
-        # If the reel group doesn't exist, create it
-        new_group = library.create_reel_group(
-            name=object_name
-            )
-
-        if object_color:
-
-            new_group.colour = object_color
-
-        print(
-            f"  New reel group '{object_name}' created successfully in library "
-            f"'{library.name}'.")
-        return new_group
-
-    # ---------------------------------------------------------------------- #
-
-    # For folders and reels, continue with the existing logic
-    for obj in getattr(
+    # Check if the object exists in the library (listed once per library)
+    existing_object = flame_object_index.find(
         library,
-        f"{object_type}s"
-        ):
+        object_type,
+        object_name
+        )
 
-        if obj.name == object_name:
+    if existing_object is not None:
 
-            print(
-                f"{object_type.capitalize()} '{object_name}' already "
-                f"exists in library '{library.name}'."
-                )
+        print(
+            f"{object_type.capitalize()} '{object_name}' already "
+            f"exists in library '{library.name}'."
+            )
 
-            return obj
+        return existing_object
 
     # ---------------------------------------------------------------------- #
 
     # If the object doesn't exist, create it
-    new_object = getattr(
+    new_object, _ = flame_object_index.ensure(
         library,
-        f"create_{object_type}"
-        )(name=object_name)
-
-    if object_color:
-
-        new_object.colour = object_color
+        object_name,
+        object_type,
+        object_color=object_color,
+        object_reel_type=object_reel_type
+        )
 
-    if object_type == 'reel':
-        if object_reel_type:
-            new_object.attributes['Type'] = object_reel_type
-            print(f"  New reel '{object_name}' created successfully in library "
-                f"'{library.name}' with Type '{object_reel_type}'.")
-        else:
-            print(f"  New reel '{object_name}' created successfully in library "
-                f"'{library.name}'.")
+    if object_type == 'reel' and object_reel_type:
+        print(f"  New reel '{object_name}' created successfully in library "
+            f"'{library.name}' with Type '{object_reel_type}'.")
     else:
         print(
             f"  New {object_type} '{object_name}' created successfully in library "
@@ -272,27 +221,32 @@ def create_or_validate_library(
 
     # ---------------------------------------------------------------------- #
 
-    # Check if the library exists in the workspace
-    for library in workspace.libraries:
+    # Check if the library exists in the workspace (listed once)
+    library = flame_object_index.find(
+        workspace,
+        'library',
+        library_name
+        )
 
-        if library.name == library_name:
+    if library is not None:
 
-            print(
-                f"Library '{library_name}' already exists in workspace "
-                f"'{workspace.name}'."
-                )
+        print(
+            f"Library '{library_name}' already exists in workspace "
+            f"'{workspace.name}'."
+            )
 
-            return library
+        return library
 
     # ---------------------------------------------------------------------- #
 
     # If the library doesn't exist, create it.
-    new_library = workspace.create_library(
-        name=library_name
+    new_library, _ = flame_object_index.ensure(
+        workspace,
+        library_name,
+        'library',
+        object_color=object_color
         )
 
-    if object_color:
-        new_library.colour = object_color
     print(
         f"  New library '{library_name}' created successfully in workspace "
         f"'{workspace.name}'."
@@ -418,14 +372,14 @@ def change_default_library_color(workspace):
     # ---------------------------------------------------------------------- #
 
     # Find the 'Default Library' in the workspace
-    for library in workspace.libraries:
-        if library.name == 'Default Library':
+    library = flame_object_index.find(workspace, 'library', 'Default Library')
+    if library is not None:
 
-            # Change the color of the 'Default Library'
-            library.colour = object_colors.get("Dark Red")
+        # Change the color of the 'Default Library'
+        library.colour = object_colors.get("Dark Red")
 
-            print(f"Color of 'Default Library' changed to Dark Red.")
-            return True
+        print(f"Color of 'Default Library' changed to Dark Red.")
+        return True
 
     # 'Default Library' not found
     print("Library 'Default Library' not found.")
@@ -442,15 +396,17 @@ def change_default_library_name(workspace, new_name):
 
     # ---------------------------------------------------------------------- #
 
-    # Find the 'Default Library' in the workspace
-    for library in workspace.libraries:
-        if library.name == 'Default Library':
-
-            # Change the name of the 'Default Library'
-            library.name = new_name
+    # Find and rename the 'Default Library', keeping the index current
+    library = flame_object_index.rename(
+        workspace,
+        'library',
+        'Default Library',
+        new_name
+        )
+    if library is not None:
 
-            print(f"Name of 'Default Library' changed to '{new_name}'.")
-            return True
+        print(f"Name of 'Default Library' changed to '{new_name}'.")
+        return True
 
     # 'Default Library' not found
     print("Library 'Default Library' not found.")
@@ -473,6 +429,9 @@ def create_layout(*args):
     if args:
         print("Received arguments from Flame:", args)
 
+    # Start from a fresh index, the projekt may have changed since last run
+    flame_object_index.reset()
+
     (
         abs_script_name,
         abs_path_to_this_script,
@@ -538,47 +497,58 @@ def create_layout(*args):
     
 
     # Change the name and color of the reel group in the current desktop
-    for desktop_reel_group in the_current_desktop.reel_groups:
-        if desktop_reel_group.name == 'Reels':
-            desktop_reel_group.name = today_date + '-conform'
-            desktop_reel_group.colour = object_colors.get("Dark Purple")
-            for reel in desktop_reel_group.reels:
-                    if reel.name == 'Reel 1':
-                        reel.name = 'ref'
-                        reel.colour = object_colors.get("Dark Blue")
-                    if reel.name == 'Reel 2':
-                        reel.name = 'Sources'
-                        reel.colour = object_colors.get("Dark Green")
-                    if reel.name == 'Sequences':
-                        reel.colour = object_colors.get("Dark Red")
-
-    # Validate or create dated postings reel in 'pattern_browsed_clips'
-    published_sequences_reel = \
-        create_or_validate_object(
-            desktop_reel_group,
-            'Published-Sequences',
-            'reel',
-            # object_reel_type='Sequences',
-            object_colors.get("Red")
-            )
-
-    # Validate or create dated postings reel in 'pattern_browsed_clips'
-    published_versions_reel = \
-        create_or_validate_object(
-            desktop_reel_group,
-            'Published-Versions',
-            'reel',
-            object_colors.get("Green")
-            )
+    desktop_reel_group = flame_object_index.rename(
+        the_current_desktop,
+        'reel group',
+        'Reels',
+        today_date + '-conform'
+        )
+    if desktop_reel_group is None:
+        print("Reel group 'Reels' not found on the current desktop.")
+        return
+
+    desktop_reel_group.colour = object_colors.get("Dark Purple")
+    for old_name, new_name, color_name in (
+            ('Reel 1', 'ref', "Dark Blue"),
+            ('Reel 2', 'Sources', "Dark Green"),
+            ('Sequences', 'Sequences', "Dark Red")):
+        reel = flame_object_index.find(desktop_reel_group, 'reel', old_name)
+        if reel is None:
+            continue
+        if new_name != old_name:
+            flame_object_index.rename(
+                desktop_reel_group,
+                'reel',
+                old_name,
+                new_name
+                )
+        reel.colour = object_colors.get(color_name)
 
-    # Validate or create dated postings reel in 'pattern_browsed_clips'
-    todays_postings_reel = \
-        create_or_validate_object(
-            desktop_reel_group,
-            today_date + '-postings',
-            'reel',
-            object_colors.get("Blue")
-            )
+    # Validate or create the published and dated postings reels in one pass
+    (
+        published_sequences_reel,
+        published_versions_reel,
+        todays_postings_reel
+    ) = ensure_objects(
+        desktop_reel_group,
+        [
+            {
+                'object_name': 'Published-Sequences',
+                'object_type': 'reel',
+                'object_color': object_colors.get("Red"),
+            },
+            {
+                'object_name': 'Published-Versions',
+                'object_type': 'reel',
+                'object_color': object_colors.get("Green"),
+            },
+            {
+                'object_name': today_date + '-postings',
+                'object_type': 'reel',
+                'object_color': object_colors.get("Blue"),
+            },
+        ]
+        )
 
     # ---------------------------------------------------------------------- #
 
@@ -781,3 +751,11 @@ if __name__ == "__main__":
 # modified:              2024-08-31 - 18:40:12
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               0.5.0
+# modified:              2026-10-18 - 12:00:00
+# comments:              Indexed flame container lookups and batched reels.
+# -------------------------------------------------------------------------- #
+# version:               0.5.1
+# modified:              2026-10-19 - 12:00:00
+# comments:              Restored the batch group guard.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        create_or_validate_library.py
-# Version:          0.4.5
+# Version:          0.5.0
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-18
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -43,6 +43,10 @@
 # import flame
 import datetime
 
+from modules.functions.flame_object_index import (
+    flame_object_index
+)
+
 # ========================================================================== #
 # This section defines some variables based on the date.
 # ========================================================================== #
@@ -68,27 +72,32 @@ def create_or_validate_library(
 
     # ---------------------------------------------------------------------- #
 
-    # Check if the library exists in the workspace
-    for library in workspace.libraries:
+    # Check if the library exists in the workspace (listed once)
+    library = flame_object_index.find(
+        workspace,
+        'library',
+        library_name
+        )
 
-        if library.name == library_name:
+    if library is not None:
 
-            print(
-                f"Library '{library_name}' already exists in workspace "
-                f"'{workspace.name}'."
-                )
+        print(
+            f"Library '{library_name}' already exists in workspace "
+            f"'{workspace.name}'."
+            )
 
-            return library
+        return library
 
     # ---------------------------------------------------------------------- #
 
     # If the library doesn't exist, create it.
-    new_library = workspace.create_library(
-        name=library_name
+    new_library, _ = flame_object_index.ensure(
+        workspace,
+        library_name,
+        'library',
+        object_color=object_color
         )
 
-    if object_color:
-        new_library.colour = object_color
     print(
         f"New library '{library_name}' created successfully in workspace "
         f"'{workspace.name}'."
@@ -198,3 +207,7 @@ def create_or_validate_library(
 # modified:              2024-08-31 - 18:40:12
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               0.5.0
+# modified:              2026-10-18 - 12:00:00
+# comments:              Looked up existing libraries through flame_object_index.
+# -------------------------------------------------------------------------- #
@@ -32,9 +32,9 @@
 # -------------------------------------------------------------------------- #
 
 # File Name:        create_or_validate_object.py
-# Version:          0.4.5
+# Version:          0.5.1
 # Created:          2024-01-19
-# Modified:         2024-08-31
+# Modified:         2026-10-19
 
 # ========================================================================== #
 # This section imports the necessary modules.
@@ -43,6 +43,10 @@
 # import flame
 import datetime
 
+from modules.functions.flame_object_index import (
+    flame_object_index
+)
+
 # ========================================================================== #
 # This section defines some variables based on the date.
 # ========================================================================== #
@@ -68,110 +72,45 @@ def create_or_validate_object(
 
     # ---------------------------------------------------------------------- #
 
-    import flame
-
-    # ---------------------------------------------------------------------- #
-
-    # Check if the object exists in the library
-
-    # For batch groups, continue with the existing logic
-    if object_type == 'batch group':
-
-        if batch_group:
-
-            for group in library.batch_groups:
-
-                if group.name == object_name:
-
-                    print(
-                        f"Batch group '{object_name}' already exists in library "
-                        f"'{library.name}'."
-                    )
-
-                    return group
-
-            # If the batch group doesn't exist, create it
-            new_group = library.create_batch_group(
-                name=object_name
-                )
-
-            if object_color:
-
-                new_group.colour = object_color
-
-            print(
-                f"New batch group '{object_name}' created successfully in library "
-                f"'{library.name}'."
-            )
-            return new_group
-
-    # ---------------------------------------------------------------------- #
-
-    # Reel groups need to be handled separately
-    if object_type == 'reel group':
+    # Batch groups are only created or validated when asked for explicitly
+    if object_type == 'batch group' and not batch_group:
 
-        for group in library.reel_groups:
-
-            if group.name == object_name:
-
-                print(
-                    f"Reel group '{object_name}' already exists in library "
-                    f"'{library.name}'."
-                    )
-
-                return group
-
-        # If the reel group doesn't exist, create it
-        new_group = library.create_reel_group(
-            name=object_name
+        raise ValueError(
+            f"Batch group '{object_name}' requested without batch_group=True."
             )
 
-        if object_color:
-
-            new_group.colour = object_color
-
-        print(
-            f"New reel group '{object_name}' created successfully in library "
-            f"'{library.name}'.")
-        return new_group
-
     # ---------------------------------------------------------------------- #
 
-    # For folders and reels, continue with the existing logic
-    for obj in getattr(
+    # Check if the object exists in the library (listed once per library)
+    existing_object = flame_object_index.find(
         library,
-        f"{object_type}s"
-        ):
+        object_type,
+        object_name
+        )
 
-        if obj.name == object_name:
+    if existing_object is not None:
 
-            print(
-                f"{object_type.capitalize()} '{object_name}' already "
-                f"exists in library '{library.name}'."
-                )
+        print(
+            f"{object_type.capitalize()} '{object_name}' already "
+            f"exists in library '{library.name}'."
+            )
 
-            return obj
+        return existing_object
 
     # ---------------------------------------------------------------------- #
 
     # If the object doesn't exist, create it
-    new_object = getattr(
+    new_object, _ = flame_object_index.ensure(
         library,
-        f"create_{object_type}"
-        )(name=object_name)
-
-    if object_color:
-
-        new_object.colour = object_color
+        object_name,
+        object_type,
+        object_color=object_color,
+        object_reel_type=object_reel_type
+        )
 
-    if object_type == 'reel':
-        if object_reel_type:
-            new_object.attributes['Type'] = object_reel_type
-            print(f"New reel '{object_name}' created successfully in library "
-                f"'{library.name}' with Type '{object_reel_type}'.")
-        else:
-            print(f"New reel '{object_name}' created successfully in library "
-                f"'{library.name}'.")
+    if object_type == 'reel' and object_reel_type:
+        print(f"New reel '{object_name}' created successfully in library "
+            f"'{library.name}' with Type '{object_reel_type}'.")
     else:
         print(
             f"New {object_type} '{object_name}' created successfully in library "
@@ -282,3 +221,11 @@ def create_or_validate_object(
 # modified:              2024-08-31 - 18:40:12
 # comments:              prep for release.
 # -------------------------------------------------------------------------- #
+# version:               0.5.0
+# modified:              2026-10-18 - 12:00:00
+# comments:              Looked up existing objects through flame_object_index.
+# -------------------------------------------------------------------------- #
+# version:               0.5.1
+# modified:              2026-10-19 - 12:00:00
+# comments:              Restored the batch group guard.
+# -------------------------------------------------------------------------- #
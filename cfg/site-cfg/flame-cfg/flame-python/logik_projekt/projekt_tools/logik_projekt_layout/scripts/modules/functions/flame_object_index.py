@@ -0,0 +1,273 @@
+#
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:       This file is part of LOGIK-PROJEKT.
+#                   Copyright © 2024 man-made-mekanyzms
+
+#                   LOGIK-PROJEKT creates directories, files, scripts & tools
+#                   for use with Autodesk Flame and other software.
+
+#                   LOGIK-PROJEKT is free software.
+
+#                   You can redistribute it and/or modify it under the terms
+#                   of the GNU General Public License as published by the
+#                   Free Software Foundation, either version 3 of the License,
+#                   or any later version.
+
+#                   This program is distributed in the hope that it will be
+#                   useful, but WITHOUT ANY WARRANTY; without even the
+#                   implied warranty of MERCHANTABILITY or FITNESS FOR A
+#                   PARTICULAR PURPOSE.
+
+#                   See the GNU General Public License for more details.
+
+#                   You should have received a copy of the GNU General
+#                   Public License along with this program.
+
+#                   If not, see <https://www.gnu.org/licenses/>.
+
+#                   Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+
+# File Name:        flame_object_index.py
+# Version:          0.5.0
+# Created:          2026-10-18
+# Modified:         2026-10-18
+
+# ========================================================================== #
+# This section defines the flame object types known to the index.
+# ========================================================================== #
+
+# Map each object type to its (children attribute, create method) pair.
+flame_object_types = {
+    'library': ('libraries', 'create_library'),
+    'folder': ('folders', 'create_folder'),
+    'reel group': ('reel_groups', 'create_reel_group'),
+    'reel': ('reels', 'create_reel'),
+    'batch group': ('batch_groups', 'create_batch_group'),
+}
+
+# ========================================================================== #
+# This section defines a helper to read the name of a flame object.
+# ========================================================================== #
+
+# Function to return the plain string name of a flame object.
+def get_object_name(flame_object):
+
+    name = flame_object.name
+
+    if hasattr(name, 'get_value'):
+        return name.get_value()
+
+    return str(name)
+
+# ========================================================================== #
+# This section defines a per-container name index for flame objects.
+# ========================================================================== #
+
+class FlameObjectIndex:
+    """
+    Name index of the children of flame containers.
+
+    Every '.name' access is a round-trip through the Flame API, so each
+    (container, object type) pair is listed exactly once. The index is
+    then kept current by the create, rename and delete helpers below.
+
+    Containers are keyed by identity and held by the index, so the same
+    python object must be passed back in for lookups to hit.
+    """
+
+    def __init__(self):
+        self._indexes = {}
+
+    # ---------------------------------------------------------------------- #
+
+    def reset(self):
+        """Forget every indexed container."""
+        self._indexes.clear()
+
+    # ---------------------------------------------------------------------- #
+
+    def _key(self, container, object_type):
+        if object_type not in flame_object_types:
+            raise ValueError(f"Unknown flame object type: '{object_type}'")
+        return (id(container), object_type)
+
+    # ---------------------------------------------------------------------- #
+
+    def get_index(self, container, object_type):
+        """Return the name -> object mapping, listing the container once."""
+        key = self._key(container, object_type)
+        entry = self._indexes.get(key)
+
+        if entry is None:
+            children_attribute = flame_object_types[object_type][0]
+            names = {}
+            for child in getattr(container, children_attribute):
+                names.setdefault(get_object_name(child), child)
+            entry = (container, names)
+            self._indexes[key] = entry
+
+        return entry[1]
+
+    # ---------------------------------------------------------------------- #
+
+    def find(self, container, object_type, object_name):
+        """Return the named child of the container, or None."""
+        return self.get_index(container, object_type).get(object_name)
+
+    # ---------------------------------------------------------------------- #
+
+    def add(self, container, object_type, object_name, flame_object):
+        """Record a newly created child of the container."""
+        self.get_index(container, object_type)[object_name] = flame_object
+
+    # ---------------------------------------------------------------------- #
+
+    def ensure(
+            self,
+            container,
+            object_name,
+            object_type,
+            object_color=None,
+            object_reel_type=None
+            ):
+        """Return (object, created), creating the child if it is missing."""
+        existing_object = self.find(container, object_type, object_name)
+
+        if existing_object is not None:
+            return existing_object, False
+
+        create_method = flame_object_types[object_type][1]
+        new_object = getattr(container, create_method)(name=object_name)
+
+        if object_color:
+            new_object.colour = object_color
+
+        if object_type == 'reel' and object_reel_type:
+            new_object.attributes['Type'] = object_reel_type
+
+        self.add(container, object_type, object_name, new_object)
+
+        return new_object, True
+
+    # ---------------------------------------------------------------------- #
+
+    def rename(self, container, object_type, old_name, new_name):
+        """Rename an indexed child in Flame and in the index."""
+        names = self.get_index(container, object_type)
+        flame_object = names.pop(old_name, None)
+
+        if flame_object is None:
+            return None
+
+        flame_object.name = new_name
+        names[new_name] = flame_object
+        return flame_object
+
+    # ---------------------------------------------------------------------- #
+
+    def delete(self, container, object_type, object_name):
+        """Delete a child in Flame and drop the container from the index."""
+        import flame
+
+        flame_object = self.find(container, object_type, object_name)
+
+        if flame_object is None:
+            return False
+
+        flame.delete(flame_object)
+        self.invalidate(container, object_type)
+        return True
+
+    # ---------------------------------------------------------------------- #
+
+    def invalidate(self, container, object_type=None):
+        """Drop one or all object types of a container from the index."""
+        object_types = (
+            [object_type] if object_type else list(flame_object_types)
+        )
+
+        for each_type in object_types:
+            self._indexes.pop(self._key(container, each_type), None)
+
+# -------------------------------------------------------------------------- #
+
+# Shared index, reset at the start of each menu action.
+flame_object_index = FlameObjectIndex()
+
+# ========================================================================== #
+# This section defines a function to create flame objects in batches.
+# ========================================================================== #
+
+# Function to ensure that many objects exist in one container.
+def ensure_objects(container, object_specs, index=None):
+    """
+    Create or validate a batch of objects in a single container.
+
+    'object_specs' is a list of dicts with the keys 'object_name' and
+    'object_type', and optionally 'object_color' and 'object_reel_type'.
+    The container is listed at most once per object type, so the Flame
+    call count is linear in the number of objects.
+
+    Returns the flame objects in the order of 'object_specs'.
+    """
+
+    index = index or flame_object_index
+    flame_objects = []
+
+    for object_spec in object_specs:
+        flame_object, created = index.ensure(
+            container,
+            object_spec['object_name'],
+            object_spec['object_type'],
+            object_color=object_spec.get('object_color'),
+            object_reel_type=object_spec.get('object_reel_type')
+            )
+
+        if created:
+            print(
+                f"  New {object_spec['object_type']} "
+                f"'{object_spec['object_name']}' created successfully."
+                )
+
+        flame_objects.append(flame_object)
+
+    return flame_objects
+
+# ========================================================================== #
+# C2 A9 32 30 32 34 2D 4D 41 4E 2D 4D 41 44 45 2D 4D 45 4B 41 4E 59 5A 4D 53 #
+# ========================================================================== #
+
+# -------------------------------------------------------------------------- #
+
+# Disclaimer:       This program is part of LOGIK-PROJEKT.
+#                   LOGIK-PROJEKT is free software.
+
+#                   You can redistribute it and/or modify it under the terms
+#                   of the GNU General Public License as published by the
+#                   Free Software Foundation, either version 3 of the License,
+#                   or any later version.
+
+#                   This program is distributed in the hope that it will be
+#                   useful, but WITHOUT ANY WARRANTY; without even the
+#                   implied warranty of MERCHANTABILITY or FITNESS FOR A
+#                   PARTICULAR PURPOSE.
+
+#                   See the GNU General Public License for more details.
+
+#                   You should have received a copy of the GNU General
+#                   Public License along with this program.
+
+#                   If not, see <https://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------------- #
+# Changelist:
+
+# -------------------------------------------------------------------------- #
+# version:               0.5.0
+# modified:              2026-10-18 - 12:00:00
+# comments:              Added a per-container name index and batch creation.
+# -------------------------------------------------------------------------- #
@@ -14,7 +14,7 @@
 # Status:       Development
 # Type:         Application
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-19
 
 # Changelog:
 # -------------------------------------------------------------------------- #
@@ -24,6 +24,22 @@
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Modified:     2026-10-18
+# Version:      2026.2.0
+#               Replay the workspace plan compiled at projekt creation,
+#               falling back to building from 'flame-workspace.json'.
+# -------------------------------------------------------------------------- #
+# Modified:     2026-10-18
+# Version:      2026.2.0
+#               Print the line that tells LOGIK-PROJEKT Flame is up.
+# -------------------------------------------------------------------------- #
+# Modified:     2026-10-19
+# Version:      2026.2.0
+#               Give desktop reel groups created from the plan their
+#               '<name>-1..3' reels, as the template walk does. Use
+#               library tree names from the plan as written. Keep the
+#               reels of an existing desktop reel group, matched by name.
+# -------------------------------------------------------------------------- #
 
 
 import flame
@@ -956,10 +972,271 @@ def set_all_expansion_states(workspace_data):
         )
 
 
+# Flame object types: (children attribute, create method)
+PLAN_OBJECT_TYPES = {
+    "library": ("libraries", "create_library"),
+    "folder": ("folders", "create_folder"),
+    "reel_group": ("reel_groups", "create_reel_group"),
+    "reel": ("reels", "create_reel"),
+    "batch_group": ("batch_groups", "create_batch_group"),
+}
+
+
+def load_workspace_plan():
+    """
+    Loads the workspace build plan compiled at projekt creation.
+    Returns None when there is no usable plan, so that the caller can fall
+    back to building the workspace from 'flame-workspace.json'.
+    """
+    plan_file = "flame-workspace-plan.json"
+    try:
+        with open(plan_file, 'r') as f:
+            workspace_plan = json.load(f)
+    except FileNotFoundError:
+        print(f"Workspace plan not found at {plan_file}")
+        return None
+    except json.JSONDecodeError:
+        print(f"Error: Could not decode JSON from {plan_file}")
+        return None
+
+    if workspace_plan.get("version") != 1:
+        print(
+            f"Unsupported workspace plan version: "
+            f"{workspace_plan.get('version')}"
+        )
+        return None
+
+    return workspace_plan
+
+
+def replay_workspace_plan(workspace_plan):
+    """
+    Replays a compiled workspace build plan in order.
+
+    Each container is listed at most once per object type. Operations whose
+    parent could not be created are skipped, and a failing operation is
+    reported without stopping the rest of the plan.
+    """
+    current_workspace = flame.projects.current_project.current_workspace
+    today_date = datetime.date.today().strftime("%Y-%m-%d")
+    user_nickname = flame.users.current_user.nickname
+
+    objects = {}
+    locations = {}
+    listings = {}
+    created = set()
+
+    def resolve(name, literal=False):
+        # Names of the library tree are used as written, as the template
+        # walk does; only desktop names carry '{date}' and '{user}'
+        if literal:
+            return name
+        return (
+            name.replace('{date}', today_date).replace('{user}', user_nickname)
+        )
+
+    def get_parent(operation):
+        if operation.get("parent") is None:
+            return current_workspace
+        return objects.get(operation["parent"])
+
+    def get_listing(parent_key, container, object_type):
+        key = (parent_key, object_type)
+        if key not in listings:
+            children_attribute = PLAN_OBJECT_TYPES[object_type][0]
+            listings[key] = {
+                child.name.get_value(): child
+                for child in getattr(container, children_attribute)
+            }
+        return listings[key]
+
+    def create(container, object_type, name):
+        create_method = PLAN_OBJECT_TYPES[object_type][1]
+        return getattr(container, create_method)(name)
+
+    def adopt_reels(container, operation):
+        existing = [
+            (reel, reel.name.get_value()) for reel in container.reels
+        ]
+        targets = operation["reels"]
+        match = dict(operation.get("match", {}))
+        if operation.get("match_names"):
+            for position, target in enumerate(targets):
+                match.setdefault(
+                    resolve(target["name"], operation.get("literal")),
+                    position
+                )
+        reuse_prefix = operation.get("reuse_prefix", "Reel ")
+
+        def is_default(reel_name):
+            return bool(reuse_prefix) and reel_name.startswith(reuse_prefix)
+        assigned = {}
+        spares = []
+
+        last_kept_index = -1
+        for index, (reel, reel_name) in enumerate(existing):
+            position = match.get(reel_name)
+            if (
+                position is not None
+                and position < len(targets)
+                and position not in assigned
+            ):
+                assigned[position] = (reel, reel_name)
+                last_kept_index = index
+            else:
+                spares.append((reel, reel_name))
+                if not (
+                    operation.get("delete_unmatched")
+                    or is_default(reel_name)
+                ):
+                    last_kept_index = index
+
+        # Only default reels after every kept reel are renamed in place,
+        # so the reel order matches deleting them and creating new ones.
+        reusable = [
+            spare for index, spare in enumerate(existing)
+            if spare in spares
+            and index > last_kept_index
+            and is_default(spare[1])
+        ]
+        for position, target in enumerate(targets):
+            target_name = resolve(target["name"], operation.get("literal"))
+            if position in assigned:
+                reel, reel_name = assigned[position]
+            elif reusable:
+                reel, reel_name = reusable.pop(0)
+                spares.remove((reel, reel_name))
+            else:
+                objects[target["ref"]] = create(container, "reel", target_name)
+                print(f"  - Created reel: {target_name}")
+                continue
+            if reel_name != target_name:
+                reel.name = target_name
+                print(f"  - Renamed reel '{reel_name}' to '{target_name}'")
+            objects[target["ref"]] = reel
+
+        for reel, reel_name in spares:
+            if operation.get("delete_unmatched") or is_default(reel_name):
+                print(f"  - Deleting default reel: {reel_name}")
+                flame.delete(reel)
+
+    operations = workspace_plan.get("operations", [])
+    print(f"Replaying {len(operations)} workspace operations...")
+
+    for operation in operations:
+        op = operation.get("op")
+        try:
+            if op == "rename_desktop":
+                new_desktop_name = resolve(operation["name"])
+                current_workspace.desktop.name = new_desktop_name
+                print(f"Current desktop renamed to: {new_desktop_name}")
+
+            elif op == "desktop":
+                objects[operation["ref"]] = current_workspace.desktop
+
+            elif op in ("find", "create", "delete", "adopt_reels"):
+                container = get_parent(operation)
+                if container is None:
+                    continue
+                parent_key = operation.get("parent")
+
+                if op == "adopt_reels":
+                    if (
+                        operation.get("if_created")
+                        and operation["parent"] not in created
+                    ):
+                        continue
+                    adopt_reels(container, operation)
+                    continue
+
+                object_type = operation["type"]
+                name = resolve(operation["name"], operation.get("literal"))
+
+                if op == "delete":
+                    listing = get_listing(parent_key, container, object_type)
+                    flame_object = listing.pop(name, None)
+                    if flame_object is not None:
+                        print(f"Deleting {object_type}: {name}")
+                        flame.delete(flame_object)
+                    continue
+
+                flame_object = None
+                if op == "find" or operation.get("ensure"):
+                    listing = get_listing(parent_key, container, object_type)
+                    flame_object = listing.get(name)
+
+                if flame_object is None and op == "create":
+                    flame_object = create(container, object_type, name)
+                    created.add(operation["ref"])
+                    print(f"Created {object_type}: {name}")
+                elif flame_object is None and operation.get("or_create"):
+                    name = resolve(operation["or_create"])
+                    flame_object = create(container, object_type, name)
+                    print(f"Created {object_type}: {name}")
+
+                if flame_object is not None:
+                    listing = listings.get((parent_key, object_type))
+                    if listing is not None:
+                        listing[name] = flame_object
+                    locations[operation["ref"]] = (
+                        parent_key, object_type, name
+                    )
+                objects[operation["ref"]] = flame_object
+
+            elif op == "rename":
+                flame_object = objects.get(operation["ref"])
+                if flame_object is None:
+                    continue
+                new_name = resolve(operation["name"])
+                parent_key, object_type, old_name = locations.get(
+                    operation["ref"], (None, None, None)
+                )
+                if new_name == old_name:
+                    continue
+                flame_object.name = new_name
+                listing = listings.get((parent_key, object_type))
+                if listing is not None:
+                    listing.pop(old_name, None)
+                    listing[new_name] = flame_object
+                    locations[operation["ref"]] = (
+                        parent_key, object_type, new_name
+                    )
+
+            elif op == "set":
+                flame_object = objects.get(operation["ref"])
+                if flame_object is None:
+                    continue
+                attribute = operation["attribute"]
+                value = operation["value"]
+                if attribute == "colour":
+                    flame_object.colour = tuple(value)
+                elif attribute == "reel_type":
+                    flame_object.attributes['Type'] = value
+                else:
+                    setattr(flame_object, attribute, value)
+
+            else:
+                print(f"Skipping unknown workspace operation: {operation}")
+
+        except Exception as e:
+            print(
+                f"An error occurred while replaying workspace operation "
+                f"{operation}: {e}"
+            )
+
+    print("Finished replaying workspace plan.")
+
+
 if __name__ == '__main__':
-    workspace_data = create_workspace_from_template()
-    if workspace_data:
-        set_all_expansion_states(workspace_data)
+    # LOGIK-PROJEKT waits for this line to report that Flame is up.
+    print("LOGIK-PROJEKT: Flame startup script started.", flush=True)
+    workspace_plan = load_workspace_plan()
+    if workspace_plan:
+        replay_workspace_plan(workspace_plan)
+    else:
+        workspace_data = create_workspace_from_template()
+        if workspace_data:
+            set_all_expansion_states(workspace_data)
 
 
 # -------------------------------------------------------------------------- #
@@ -1004,3 +1281,19 @@ if __name__ == '__main__':
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Modified:     2026-10-18
+# Version:      2026.2.0
+#               Replay the workspace plan compiled at projekt creation,
+#               falling back to building from 'flame-workspace.json'.
+# -------------------------------------------------------------------------- #
+# Modified:     2026-10-18
+# Version:      2026.2.0
+#               Print the line that tells LOGIK-PROJEKT Flame is up.
+# -------------------------------------------------------------------------- #
+# Modified:     2026-10-19
+# Version:      2026.2.0
+#               Give desktop reel groups created from the plan their
+#               '<name>-1..3' reels, as the template walk does. Use
+#               library tree names from the plan as written. Keep the
+#               reels of an existing desktop reel group, matched by name.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,366 @@
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:       This file is part of LOGIK-PROJEKT.
+#                   Copyright © 2024 Silo 84
+
+#                   LOGIK-PROJEKT creates directories, files, scripts & tools
+#                   for use with Autodesk Flame and other software.
+
+#                   LOGIK-PROJEKT is free software.
+
+#                   You can redistribute it and/or modify it under the terms
+#                   of the GNU General Public License as published by the
+#                   Free Software Foundation, either version 3 of the License,
+#                   or any later version.
+
+#                   This program is distributed in the hope that it will be
+#                   useful, but WITHOUT ANY WARRANTY; without even the
+#                   implied warranty of MERCHANTABILITY or FITNESS FOR A
+#                   PARTICULAR PURPOSE.
+
+#                   See the GNU General Public License for more details.
+
+#                   You should have received a copy of the GNU General
+#                   Public License along with this program.
+
+#                   If not, see <https://www.gnu.org/licenses/>.
+
+#                   Contact: brian@silo84.com
+# -------------------------------------------------------------------------- #
+
+# File Name:        toolsetTree.py
+# Version:          0.0.1
+# Created:          2026-10-18
+# Modified:         2026-10-19
+
+# -------------------------------------------------------------------------- #
+
+"""
+This module keeps an in-memory tree of a toolset directory for the toolset
+and template menus. It does not import nuke, so it can be used and tested
+outside of Nuke.
+
+The tree holds, for every directory, its mtime, its toolset files and its
+subdirectories. A directory is shown as a menu only if it contains at
+least one toolset somewhere below it, like the menus `os.walk` used to
+build. Every change to the tree returns a list of menu changes:
+
+- `{'action': 'addItem', 'menuPath', 'name', 'path', 'index'}`
+- `{'action': 'removeItem', 'menuPath', 'name'}`
+- `{'action': 'addMenu', 'menuPath', 'name', 'index', 'entries'}`
+- `{'action': 'removeMenu', 'menuPath', 'name'}`
+
+'menuPath' is the tuple of directory names of the parent menu, 'index' the
+position among its toolset entries and 'entries' the content of a new menu,
+as returned by `ToolsetTree.entries`.
+
+Classes:
+1. `ToolsetTree(root: Path)`: The tree of one toolset directory.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+
+# ========================================================================== #
+# This section defines the ToolsetTree class.
+# ========================================================================== #
+
+class ToolsetTree(object):
+    '''
+    In-memory tree of the toolsets below 'root', updated one entry or one
+    directory at a time.
+    '''
+    def __init__(self, root):
+        self.root = Path(root)
+        self._lock = threading.RLock()
+        # relative directory tuple -> {'mtime', 'files', 'dirs'}, where
+        # 'files' maps file names to menu names and 'dirs' is a set.
+        self._dirs = {}
+        # relative directory tuple -> number of toolsets below it.
+        self._counts = {}
+
+    # ---------------------------------------------------------------------- #
+
+    @staticmethod
+    def menuName(fileName):
+        return fileName.split('.')[0]
+
+    def isToolset(self, dirPath, fileName):
+        '''The toolset filter of the original os.walk menu.'''
+        return ('#' not in str(dirPath) and '#' not in fileName
+                and fileName.endswith('.nk') and not fileName.startswith('__'))
+
+    def dirPath(self, relDir):
+        return self.root.joinpath(*relDir)
+
+    def relativeParts(self, path):
+        '''Returns (relative directory tuple, file name) of a toolset path,
+        or None for a path outside the tree.'''
+        try:
+            relative = Path(path).relative_to(self.root)
+        except ValueError:
+            return None
+        if not relative.parts:
+            return None
+        return tuple(relative.parts[:-1]), relative.parts[-1]
+
+    # ---------------------------------------------------------------------- #
+    # This section reads directories.
+    # ---------------------------------------------------------------------- #
+
+    def _listDir(self, relDir):
+        '''Returns (mtime, files, dirs) of one directory, or None if it is
+        gone.'''
+        dirPath = self.dirPath(relDir)
+        try:
+            mtime = os.stat(dirPath).st_mtime_ns
+            files = {}
+            dirs = set()
+            with os.scandir(dirPath) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            dirs.add(entry.name)
+                    elif self.isToolset(dirPath, entry.name):
+                        files[entry.name] = self.menuName(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return mtime, files, dirs
+
+    def _scanSubtree(self, relDir):
+        '''Reads 'relDir' and everything below it into the tree and returns
+        its toolset count. Ancestor counts are not updated.'''
+        listing = self._listDir(relDir)
+        if listing is None:
+            return 0
+        mtime, files, dirs = listing
+        self._dirs[relDir] = {'mtime': mtime, 'files': files, 'dirs': dirs}
+        count = len(files)
+        for name in sorted(dirs):
+            count += self._scanSubtree(relDir + (name,))
+        self._counts[relDir] = count
+        return count
+
+    def scan(self):
+        '''Reads the whole toolset directory.'''
+        with self._lock:
+            self._dirs = {}
+            self._counts = {}
+            self._scanSubtree(())
+
+    # ---------------------------------------------------------------------- #
+    # This section describes menus.
+    # ---------------------------------------------------------------------- #
+
+    def isVisible(self, relDir):
+        return self._counts.get(relDir, 0) > 0
+
+    def _children(self, relDir):
+        '''The visible children of a directory in menu order: toolsets by
+        file name, then submenus by directory name.'''
+        node = self._dirs.get(relDir)
+        if node is None:
+            return []
+        children = [('item', fileName) for fileName in sorted(node['files'])]
+        children += [('menu', name) for name in sorted(node['dirs'])
+                     if self.isVisible(relDir + (name,))]
+        return children
+
+    def _index(self, relDir, kind, name):
+        return self._children(relDir).index((kind, name))
+
+    def entries(self, relDir=()):
+        '''
+        Returns the menu content of a directory as a list of
+        `('item', name, path)` and `('menu', name, entries)` tuples.
+        '''
+        with self._lock:
+            result = []
+            for kind, name in self._children(relDir):
+                if kind == 'item':
+                    result.append(('item', self.menuName(name),
+                                   self.dirPath(relDir).joinpath(name).as_posix()))
+                else:
+                    result.append(('menu', name, self.entries(relDir + (name,))))
+            return result
+
+    # ---------------------------------------------------------------------- #
+    # This section updates the tree.
+    # ---------------------------------------------------------------------- #
+
+    def _changeCount(self, relDir, delta):
+        '''
+        Adds 'delta' to the count of 'relDir' and its ancestors and returns
+        the topmost directory below the root whose visibility changed, or
+        None.
+        '''
+        changed = None
+        for depth in range(len(relDir), -1, -1):
+            ancestor = relDir[:depth]
+            before = self._counts.get(ancestor, 0)
+            after = before + delta
+            self._counts[ancestor] = after
+            if ancestor and (before > 0) != (after > 0):
+                changed = ancestor
+        return changed
+
+    def _addMenuChange(self, relDir):
+        return {'action': 'addMenu', 'menuPath': relDir[:-1],
+                'name': relDir[-1],
+                'index': self._index(relDir[:-1], 'menu', relDir[-1]),
+                'entries': self.entries(relDir)}
+
+    @staticmethod
+    def _removeMenuChange(relDir):
+        return {'action': 'removeMenu', 'menuPath': relDir[:-1],
+                'name': relDir[-1]}
+
+    def _addFile(self, relDir, fileName):
+        node = self._dirs[relDir]
+        if fileName in node['files']:
+            return []
+        node['files'][fileName] = self.menuName(fileName)
+        shown = self._changeCount(relDir, 1)
+        if shown:
+            return [self._addMenuChange(shown)]
+        return [{'action': 'addItem', 'menuPath': relDir,
+                 'name': self.menuName(fileName),
+                 'path': self.dirPath(relDir).joinpath(fileName).as_posix(),
+                 'index': self._index(relDir, 'item', fileName)}]
+
+    def _removeFile(self, relDir, fileName):
+        node = self._dirs.get(relDir)
+        if node is None or fileName not in node['files']:
+            return []
+        name = node['files'].pop(fileName)
+        hidden = self._changeCount(relDir, -1)
+        if hidden:
+            return [self._removeMenuChange(hidden)]
+        return [{'action': 'removeItem', 'menuPath': relDir, 'name': name}]
+
+    def _addRoot(self):
+        '''
+        Reads the root directory if it was missing at scan() time and
+        returns the changes that show its content.
+        '''
+        if not self._scanSubtree(()):
+            return []
+        changes = []
+        for kind, name in self._children(()):
+            if kind == 'menu':
+                changes.append(self._addMenuChange((name,)))
+            else:
+                changes.append({'action': 'addItem', 'menuPath': (),
+                                'name': self.menuName(name),
+                                'path': self.root.joinpath(name).as_posix(),
+                                'index': self._index((), 'item', name)})
+        return changes
+
+    def _ensureDir(self, relDir):
+        '''Adds missing directories down to 'relDir', returning the changes.'''
+        changes = []
+        if () not in self._dirs:
+            changes += self._addRoot()
+            if () not in self._dirs:
+                return changes
+        for depth in range(1, len(relDir) + 1):
+            ancestor = relDir[:depth]
+            if ancestor not in self._dirs:
+                changes += self._addDir(ancestor[:-1], ancestor[-1])
+        return changes
+
+    def _addDir(self, relDir, name):
+        subDir = relDir + (name,)
+        self._dirs[relDir]['dirs'].add(name)
+        count = self._scanSubtree(subDir)
+        if not count:
+            return []
+        # The subtree counts are set, now count it in the ancestors.
+        self._counts[subDir] = 0
+        shown = self._changeCount(subDir, count)
+        return [self._addMenuChange(shown)]
+
+    def _removeDir(self, relDir, name):
+        subDir = relDir + (name,)
+        self._dirs[relDir]['dirs'].discard(name)
+        count = self._counts.get(subDir, 0)
+        for key in [key for key in self._dirs if key[:len(subDir)] == subDir]:
+            del self._dirs[key]
+            self._counts.pop(key, None)
+        if not count:
+            return []
+        self._counts[subDir] = count
+        hidden = self._changeCount(subDir, -count)
+        self._counts.pop(subDir, None)
+        return [self._removeMenuChange(hidden)]
+
+    def add(self, path):
+        '''Adds one saved toolset and returns the menu changes.'''
+        with self._lock:
+            parts = self.relativeParts(path)
+            if parts is None:
+                return []
+            relDir, fileName = parts
+            if not self.isToolset(self.dirPath(relDir), fileName):
+                return []
+            changes = self._ensureDir(relDir)
+            if relDir in self._dirs:
+                # A new directory was read from disk with the toolset in it.
+                changes += self._addFile(relDir, fileName)
+            return changes
+
+    def remove(self, path):
+        '''Removes one deleted toolset and returns the menu changes.'''
+        with self._lock:
+            parts = self.relativeParts(path)
+            if parts is None:
+                return []
+            return self._removeFile(*parts)
+
+    def refresh(self):
+        '''
+        Stats every directory and rereads only those whose mtime changed.
+        Returns the menu changes.
+        '''
+        changes = []
+        with self._lock:
+            if () not in self._dirs:
+                changes += self._addRoot()
+            mtimes = {}
+            for relDir in list(self._dirs):
+                try:
+                    mtimes[relDir] = os.stat(self.dirPath(relDir)).st_mtime_ns
+                except OSError:
+                    mtimes[relDir] = None
+
+        for relDir in sorted(mtimes, key=len):
+            with self._lock:
+                node = self._dirs.get(relDir)
+                if node is None or node['mtime'] == mtimes[relDir]:
+                    continue
+                listing = self._listDir(relDir)
+                if listing is None:
+                    if relDir:
+                        changes += self._removeDir(relDir[:-1], relDir[-1])
+                    continue
+                mtime, files, dirs = listing
+                for fileName in sorted(set(node['files']) - set(files)):
+                    changes += self._removeFile(relDir, fileName)
+                for name in sorted(node['dirs'] - dirs):
+                    changes += self._removeDir(relDir, name)
+                for fileName in sorted(set(files) - set(node['files'])):
+                    changes += self._addFile(relDir, fileName)
+                for name in sorted(dirs - node['dirs']):
+                    changes += self._addDir(relDir, name)
+                node['mtime'] = mtime
+        return changes
+
+
+# -------------------------------------------------------------------------- #
+
+# ========================================================================== #
+# 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 C2 A9 32 30 32 35 #
+# ========================================================================== #
@@ -19,9 +19,9 @@
 #                   Contact: brian@silo84.com
 # -------------------------------------------------------------------------- #
 # File Name:        download_tools.py
-# Version:          0.0.4
+# Version:          0.0.6
 # Created:          2024-11-03
-# Modified:         2024-11-08
+# Modified:         2026-10-19
 # -------------------------------------------------------------------------- #
 
 """
@@ -34,14 +34,35 @@ and includes functions to:
 3. Process lists of repository and zip URLs and track them for updates.
 4. Create an `init.py` and `menu.py` file with `nuke.pluginAddPath()` 
    statements based on the extracted directories.
+
+Downloads run concurrently on a small thread pool and go through a local
+content cache keyed by URL. Cached archives are revalidated with ETag and
+Last-Modified conditional requests, checked against their SHA-256 digest
+and extracted straight from the cache file. Entries that were not used for
+a while, or that do not fit the size budget, are evicted at the end of a run.
+
+Environment variables:
+    PROJEKT_DOWNLOAD_CACHE: Cache directory, may be shared between
+        workstations. Defaults to ~/.cache/logik-projekt/nuke-downloads.
+    PROJEKT_DOWNLOAD_WORKERS: Number of concurrent downloads.
+    PROJEKT_DOWNLOAD_ALLOWED_HOSTS: Comma separated hosts to allow in
+        addition to GitHub, e.g. 'localhost' for a local test server.
+    PROJEKT_DOWNLOAD_CACHE_MAX_MB: Size budget of the cache. Defaults to 2048.
+    PROJEKT_DOWNLOAD_CACHE_MAX_AGE_DAYS: Days an unused entry is kept.
+        Defaults to 90.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
+import urllib.error
 import urllib.request
 import zipfile
-import io
+import hashlib
+import json
 import logging
+import os
+import tempfile
 import time
 from typing import Dict, List, Optional
 
@@ -79,7 +100,25 @@ zip_urls = {
 
 # list of directories to avoid drilling down into when creating the menu and init files
 no_drill_down_list = ["KnobScripter"]
-ALLOWED_HOSTS = ["github.com", "raw.githubusercontent.com"]
+ALLOWED_HOSTS = ["github.com", "raw.githubusercontent.com"] + [
+    host.strip()
+    for host in os.getenv("PROJEKT_DOWNLOAD_ALLOWED_HOSTS", "").split(",")
+    if host.strip()
+]
+
+# ========================================================================== #
+# This section defines the download cache and concurrency settings.
+# ========================================================================== #
+DOWNLOAD_CACHE_DIR = Path(
+    os.getenv("PROJEKT_DOWNLOAD_CACHE")
+    or Path.home() / ".cache" / "logik-projekt" / "nuke-downloads"
+)
+MAX_DOWNLOAD_WORKERS = int(os.getenv("PROJEKT_DOWNLOAD_WORKERS", "4"))
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_CACHE_MAX_BYTES = int(os.getenv("PROJEKT_DOWNLOAD_CACHE_MAX_MB", "2048")) * 1024 * 1024
+DOWNLOAD_CACHE_MAX_AGE = float(os.getenv("PROJEKT_DOWNLOAD_CACHE_MAX_AGE_DAYS", "90")) * 86400
+# Partial downloads older than this are left over from an interrupted run
+DOWNLOAD_PART_MAX_AGE = 3600
 
 
 # ========================================================================== #
@@ -158,7 +197,242 @@ def fetch_url_with_retries(url: str, retries: int = 3, delay: int = 5) -> Option
                     return response.read()
         except Exception as e:
             logger.warning(f"Attempt {attempt + 1} failed for URL {url}: {e}")
+            if attempt + 1 < retries:
+                time.sleep(delay)
+    logger.error(f"All retries failed for URL: {url}")
+    return None
+
+# ========================================================================== #
+# This section contains the functions of the URL-keyed download cache.
+# ========================================================================== #
+
+def get_cache_paths(url: str, cache_dir: Optional[Path] = None) -> tuple:
+    """
+    Returns the cached content and metadata paths for a URL.
+
+    Args:
+        url (str): The URL of the cached content.
+        cache_dir (Path, optional): The cache directory. Defaults to DOWNLOAD_CACHE_DIR.
+
+    Returns:
+        tuple: (content path, metadata json path)
+    """
+    cache_dir = Path(cache_dir or DOWNLOAD_CACHE_DIR)
+    cache_key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return cache_dir / f"{cache_key}.download", cache_dir / f"{cache_key}.json"
+
+
+def file_sha256(file_path: Path) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_cache_metadata(metadata_path: Path, metadata: dict) -> None:
+    """
+    Writes the metadata JSON of a cache entry to a temporary file and renames
+    it into place, so a reader never sees a half written file.
+    """
+    fd, temp_name = tempfile.mkstemp(dir=metadata_path.parent, suffix=".part")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(metadata, f, indent=4)
+        os.replace(temp_name, metadata_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def touch_cache_entry(url: str, cache_dir: Optional[Path] = None) -> None:
+    """
+    Marks a cache entry as used now, for the least recently used eviction.
+    """
+    for path in get_cache_paths(url, cache_dir):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+def prune_download_cache(
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DOWNLOAD_CACHE_MAX_BYTES,
+        max_age: float = DOWNLOAD_CACHE_MAX_AGE
+    ) -> List[str]:
+    """
+    Evicts cache entries that were not used for 'max_age' seconds, then the
+    least recently used entries until the cache fits in 'max_bytes'. Stale
+    partial downloads and content without metadata are removed as well.
+
+    Args:
+        cache_dir (Path, optional): The cache directory. Defaults to DOWNLOAD_CACHE_DIR.
+        max_bytes (int, optional): Size budget of the cache.
+        max_age (float, optional): Seconds an unused entry is kept.
+
+    Returns:
+        List[str]: The URLs of the evicted entries.
+    """
+    cache_dir = Path(cache_dir or DOWNLOAD_CACHE_DIR)
+    if not cache_dir.is_dir():
+        return []
+    now = time.time()
+
+    entries = []
+    for path in cache_dir.iterdir():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if path.suffix == ".part":
+            if now - stat.st_mtime > DOWNLOAD_PART_MAX_AGE:
+                path.unlink(missing_ok=True)
+        elif path.suffix == ".download" and not path.with_suffix(".json").exists():
+            path.unlink(missing_ok=True)
+        elif path.suffix == ".json":
+            content_path = path.with_suffix(".download")
+            try:
+                size = content_path.stat().st_size
+            except OSError:
+                size = 0
+            entries.append((stat.st_mtime, size, path, content_path))
+
+    # Least recently used first
+    entries.sort(key=lambda entry: entry[0])
+    total_size = sum(entry[1] for entry in entries)
+    evicted = []
+    for used, size, metadata_path, content_path in entries:
+        if now - used <= max_age and total_size <= max_bytes:
+            continue
+        try:
+            with open(metadata_path, "r") as f:
+                url = json.load(f).get("url", metadata_path.stem)
+        except (OSError, ValueError):
+            url = metadata_path.stem
+        # The metadata goes first, so an entry is never used half removed
+        metadata_path.unlink(missing_ok=True)
+        content_path.unlink(missing_ok=True)
+        total_size -= size
+        evicted.append(url)
+        logger.info(f"Evicted cached download for {url}.")
+    return evicted
+
+
+def read_cache_metadata(url: str, cache_dir: Optional[Path] = None) -> Optional[dict]:
+    """
+    Returns the metadata of a cached URL if its content is present and intact.
+
+    The content is hashed and compared with the digest recorded when it
+    was downloaded, so a truncated or modified cache entry is never used.
+    """
+    content_path, metadata_path = get_cache_paths(url, cache_dir)
+    try:
+        with open(metadata_path, "r") as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not content_path.is_file() or file_sha256(content_path) != metadata.get("sha256"):
+        logger.warning(f"Cached download for {url} is missing or corrupt, discarding it.")
+        return None
+    return metadata
+
+
+def fetch_url_to_cache(
+        url: str,
+        expected_sha256: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        retries: int = 3,
+        delay: int = 5
+    ) -> Optional[Path]:
+    """
+    Downloads a URL into the local cache and returns the cached file path.
+
+    If the URL is already cached, a conditional request is made with the
+    stored ETag and Last-Modified values, and a '304 Not Modified' answer
+    reuses the cached file without transferring it again. New content is
+    streamed to a temporary file in the cache directory while it is hashed,
+    then moved into place.
+
+    Args:
+        url (str): The URL to fetch.
+        expected_sha256 (str, optional): Pinned SHA-256 digest of the content.
+        cache_dir (Path, optional): The cache directory. Defaults to DOWNLOAD_CACHE_DIR.
+        retries (int, optional): The number of retry attempts. Defaults to 3.
+        delay (int, optional): The delay in seconds between retry attempts. Defaults to 5.
+
+    Returns:
+        Optional[Path]: The path of the cached content, or None on failure.
+    """
+    if not is_safe_url(url, ALLOWED_HOSTS):
+        logger.error(f"URL {url} failed safety validation. Hostname not in allowed list.")
+        return None
+
+    cache_dir = Path(cache_dir or DOWNLOAD_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    content_path, metadata_path = get_cache_paths(url, cache_dir)
+    metadata = read_cache_metadata(url, cache_dir)
+
+    if metadata and expected_sha256 and metadata["sha256"] != expected_sha256:
+        metadata = None
+
+    headers = {}
+    if metadata:
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+
+    for attempt in range(retries):
+        temp_path = None
+        try:
+            request = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(request, timeout=10) as response:
+                digest = hashlib.sha256()
+                with tempfile.NamedTemporaryFile(
+                        dir=cache_dir, suffix=".part", delete=False) as temp_file:
+                    temp_path = Path(temp_file.name)
+                    for chunk in iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                        temp_file.write(chunk)
+                sha256 = digest.hexdigest()
+                if expected_sha256 and sha256 != expected_sha256:
+                    logger.error(
+                        f"SHA-256 mismatch for {url}: expected {expected_sha256}, got {sha256}"
+                    )
+                    temp_path.unlink()
+                    return None
+                os.replace(temp_path, content_path)
+                metadata = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "sha256": sha256,
+                    "size": content_path.stat().st_size,
+                }
+                write_cache_metadata(metadata_path, metadata)
+                logger.info(f"Downloaded {url} to cache ({metadata['size']} bytes).")
+                return content_path
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and metadata:
+                logger.info(f"{url} not modified, using cached download.")
+                touch_cache_entry(url, cache_dir)
+                return content_path
+            logger.warning(f"Attempt {attempt + 1} failed for URL {url}: {e}")
+        except Exception as e:
+            logger.warning(f"Attempt {attempt + 1} failed for URL {url}: {e}")
+        if temp_path is not None and temp_path.exists():
+            temp_path.unlink()
+        if attempt + 1 < retries:
             time.sleep(delay)
+
+    if metadata:
+        logger.warning(f"All retries failed for URL: {url}, using cached download.")
+        touch_cache_entry(url, cache_dir)
+        return content_path
     logger.error(f"All retries failed for URL: {url}")
     return None
 
@@ -226,10 +500,11 @@ def download_and_extract_zip(zip_url: str, final_dir: str) -> None:
         logger.error(f"Error processing URL {zip_url}: {e}")
         return
     
-    zip_content = fetch_url_with_retries(zip_url)
-    if zip_content:
+    zip_path = fetch_url_to_cache(zip_url)
+    if zip_path:
         try:
-            with zipfile.ZipFile(io.BytesIO(zip_content)) as z:
+            # Extract straight from the cached file, the archive never sits in memory
+            with zipfile.ZipFile(zip_path) as z:
                 temp_dir = Path(final_dir) / "temp"
                 temp_dir.mkdir(parents=True, exist_ok=True)
                 z.extractall(temp_dir)
@@ -311,9 +586,12 @@ def process_repo_urls(repo_urls: Dict[str, str]) -> None:
     Returns:
         None
     """
-    for repo_url, key in repo_urls.items():
+    for repo_url in repo_urls:
         logger.info(f"Processing repo URL: {repo_url}")
-        final_dir = download_latest_release(repo_url) or f"{repo_url.rstrip('/').split('/')[-1]}_latest"
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        final_dirs = list(executor.map(download_latest_release, repo_urls))
+    for (repo_url, key), final_dir in zip(repo_urls.items(), final_dirs):
+        final_dir = final_dir or f"{repo_url.rstrip('/').split('/')[-1]}_latest"
         add_item_to_dict(init_py_items if key == "init" else menu_py_items, final_dir, key)
 
 # ========================================================================== #
@@ -340,14 +618,18 @@ def process_zip_urls(zip_urls: Dict[str, str]) -> None:
     Returns:
         None
     """
+    downloads = []
     for zip_url, key in zip_urls.items():
         final_dir = zip_url.split('/')[-1].replace('.zip', '')
         if not Path(final_dir).exists():
-            download_and_extract_zip(zip_url, final_dir)
+            downloads.append((zip_url, final_dir))
         else:
             logger.info(f"Directory {final_dir} already exists.")
         add_item_to_dict(init_py_items if key == "init" else menu_py_items, final_dir, key)
 
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        list(executor.map(lambda download: download_and_extract_zip(*download), downloads))
+
 # ========================================================================== #
 # This section contains the function to create an `init.py` or `menu.py` file.
 # # ========================================================================== #
@@ -442,6 +724,7 @@ def main() -> None:
     delete_existing_files()
     process_repo_urls(repo_urls)
     process_zip_urls(zip_urls)
+    prune_download_cache()
     create_nuke_py("init.py", init_py_items, ["init.py", "__init__.py"], no_drill_down_list)
     create_nuke_py("menu.py", menu_py_items, ["menu.py", "__menu__.py", "__init__.py"], no_drill_down_list)
     logger.info("Script execution completed.")
@@ -32,7 +32,7 @@
 # File Name:        gizmoUtilities.py
 # Version:          0.0.1
 # Created:          2024-10-27
-# Modified:         2021-11-06
+# Modified:         2026-10-18
 
 # -------------------------------------------------------------------------- #
 
@@ -44,6 +44,8 @@ Key Features:
 - Sets up the gizmo directory path based on project settings.
 - Logs the gizmo directory path for debugging purposes.
 - Provides a mechanism to add gizmos to the Nuke plugin path and menu.
+- Caches the crawl of the gizmo directories between Nuke launches, keyed by
+  the mtime of each directory, so only changed directories are listed again.
 
 Usage:
 - This module is typically imported and used in the `menu.py` file to add gizmos to the Nuke menu.
@@ -52,7 +54,11 @@ Usage:
 import nuke
 import os
 import re
+import json
+import stat
+import time
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import projekt_core.settings
 
@@ -86,6 +92,22 @@ gizManager = None  # Declare gizManager as a global variable
 CUSTOM_GIZMO_LOCATION = projekt_core.settings.nuke_custom_gizmos_path()
 logger.info(f"CUSTOM_GIZMO_LOCATION: {CUSTOM_GIZMO_LOCATION}")
 
+# The crawl cache is kept on local disk, one per user, so that a Nuke launch
+# reads one small file instead of listing every gizmo directory on the
+# network.
+GIZMO_CACHE_PATH = os.environ.get(
+    'PROJEKT_GIZMO_CACHE',
+    os.path.join(os.path.expanduser('~'), '.nuke', 'projekt_core',
+                 'gizmo_crawl_cache.json'))
+GIZMO_CACHE_VERSION = 1
+
+# Threads used to stat the cached directories when revalidating the cache.
+GIZMO_CACHE_STAT_WORKERS = 16
+
+# A directory changed this close to the crawl may change again within the
+# same mtime tick, so it is not trusted the next time.
+GIZMO_CACHE_RACY_NS = 2 * 10**9
+
 # -------------------------------------------------------------------------- #
 
 # ========================================================================== #
@@ -97,7 +119,8 @@ class GizmoPathManager(object):
     Class used to automatically add directory trees to the Nuke plugin path,
     and to build menu items for any gizmos found in those trees.
     '''
-    def __init__(self, searchPaths=None, exclude=r'^\.|^_', ):
+    def __init__(self, searchPaths=None, exclude=r'^\.|^_',
+                 cachePath=GIZMO_CACHE_PATH):
         '''
         'searchPaths': An iterable of paths to recursively search. If omitted,
         the search will first try to use the `NUKE_GIZMO_PATH` environment
@@ -107,10 +130,14 @@ class GizmoPathManager(object):
 
         'exclude': A regular expression for folders and gizmo files to ignore.
         The default pattern ignores anything beginning with `.`.
+
+        'cachePath': The file the crawl is cached in between launches, or
+        None to crawl without a cache.
         '''
         if isinstance(exclude, str):
             exclude = re.compile(exclude)
         self.exclude = exclude
+        self.cachePath = cachePath
         self.logger = logger
         self.logger.info(f'Search path: {searchPaths}')
         self.logger.info(f'Exclude pattern: {exclude}')
@@ -131,52 +158,174 @@ class GizmoPathManager(object):
 
     def reset(self):
         self._crawlData = {}
+        self._cacheHits = 0
+        self._cacheMisses = 0
 
     def addGizmoPaths(self):
         '''Recursively search ``self.searchPaths`` for folders whose names do not
         match the exclusion pattern ``self.exclude``, and add them to the Nuke
-        plugin path.'''
+        plugin path.
+
+        The crawl of each search path is read from ``self.cachePath``. Every
+        cached directory is stat'ed in parallel, and only the directories
+        whose mtime changed are listed again.'''
         self.reset()
         self._visited = set()
+        start = time.perf_counter()
+
+        cachedRoots = self._loadCache()
+        mtimes = self._statCachedDirs(cachedRoots.values())
+        self._crawlTime = time.time_ns()
+
+        roots = {}
         for gizPath in self.searchPaths:
             self.logger.info(f'GizPath: {gizPath}')
-            self._recursiveAddGizmoPaths(gizPath, self._crawlData,
-                                         foldersOnly=True)
+            gizPath = os.fspath(gizPath)
+            if not gizPath or not os.path.isdir(gizPath):
+                continue
+            node = self._crawlDirectory(self.canonical_path(gizPath),
+                                        cachedRoots.get(gizPath), mtimes)
+            if node is None:
+                continue
+            roots[gizPath] = node
+            self._addCrawlNode(node, self._crawlData, foldersOnly=True)
 
-    def _recursiveAddGizmoPaths(self, folder, crawlData, foldersOnly=False):
-        # If we're in GUI mode, also store away data in _crawlData to to be used
-        # later by addGizmoMenuItems
-        if not os.path.isdir(folder):
-            return
+        if self._cacheMisses:
+            self._saveCache(roots)
 
-        if nuke.GUI:
-            if 'files' not in crawlData:
-                crawlData['gizmos'] = []
-            if 'dirs' not in crawlData:
-                crawlData['dirs'] = {}
+        directories = self._cacheHits + self._cacheMisses
+        self.logger.debug(
+            f'Gizmo crawl: {(time.perf_counter() - start) * 1000:.1f} ms, '
+            f'cache hits {self._cacheHits}/{directories} directories '
+            f'({self._cacheHits / directories if directories else 0:.0%})')
 
+    def _crawlDirectory(self, path, cachedNode, mtimes):
+        '''
+        Returns the crawl of the canonical directory 'path' as a node
+        ``{'path', 'mtime', 'dirs', 'gizmos'}``. The listing of 'cachedNode'
+        is reused if the mtime of 'path' did not change.
+        '''
         # avoid an infinite loop due to symlinks...
-        canonical_path = self.canonical_path(folder)
-        if canonical_path in self._visited:
+        if path in self._visited:
+            return {'path': path, 'mtime': None, 'dirs': {}, 'gizmos': []}
+
+        mtime = mtimes.get(path)
+        if mtime is None:
+            mtime = self._statMtime(path)
+            if mtime is None:
+                return None
+        self._visited.add(path)
+
+        if (cachedNode and cachedNode.get('path') == path
+                and cachedNode.get('mtime') == mtime):
+            self._cacheHits += 1
+            gizmos = cachedNode['gizmos']
+            subDirs = [(name, child['path'], child)
+                       for name, child in cachedNode['dirs'].items()]
+        else:
+            self._cacheMisses += 1
+            cachedDirs = cachedNode.get('dirs', {}) if cachedNode else {}
+            gizmos = []
+            subDirs = []
+            with os.scandir(path) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if self.exclude and self.exclude.search(entry.name):
+                        continue
+                    if entry.is_dir():
+                        if entry.is_symlink():
+                            subPath = self.canonical_path(entry.path)
+                        else:
+                            subPath = os.path.normcase(entry.path)
+                        subDirs.append((entry.name, subPath,
+                                        cachedDirs.get(entry.name)))
+                    elif entry.is_file():
+                        name, ext = os.path.splitext(entry.name)
+                        if ext == '.gizmo':
+                            gizmos.append(name)
+                        if ext == '.nk':
+                            gizmos.append(name + '.nk')
+            if self._crawlTime - mtime < GIZMO_CACHE_RACY_NS:
+                mtime = None
+
+        dirs = {}
+        for name, subPath, cachedChild in subDirs:
+            child = self._crawlDirectory(subPath, cachedChild, mtimes)
+            if child is not None:
+                dirs[name] = child
+        return {'path': path, 'mtime': mtime, 'dirs': dirs, 'gizmos': gizmos}
+
+    def _addCrawlNode(self, node, crawlData, foldersOnly=False):
+        '''Adds a crawled tree to the plugin path and to 'crawlData', which is
+        used later by addGizmoMenuItems.'''
+        crawlData['gizmos'] = [] if foldersOnly else list(node['gizmos'])
+        crawlData['dirs'] = {}
+        for name, child in node['dirs'].items():
+            nuke.pluginAppendPath(child['path'])
+            subData = {}
+            crawlData['dirs'][name] = subData
+            self._addCrawlNode(child, subData)
+
+    @staticmethod
+    def _statMtime(path):
+        try:
+            pathStat = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(pathStat.st_mode):
+            return None
+        return pathStat.st_mtime_ns
+
+    def _statCachedDirs(self, cachedRoots):
+        '''Returns the current mtime of every cached directory by path, or
+        None for directories that are gone.'''
+        paths = []
+        pending = list(cachedRoots)
+        while pending:
+            node = pending.pop()
+            paths.append(node['path'])
+            pending.extend(node['dirs'].values())
+        if not paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=GIZMO_CACHE_STAT_WORKERS) as executor:
+            return dict(zip(paths, executor.map(self._statMtime, paths)))
+
+    def _cacheKey(self):
+        return self.exclude.pattern if self.exclude else ''
+
+    def _readCacheFile(self):
+        try:
+            with open(self.cachePath, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cache.get('version') != GIZMO_CACHE_VERSION:
+            return None
+        return cache
+
+    def _loadCache(self):
+        '''Returns the cached crawls of this manager's exclude pattern, by
+        search path.'''
+        if not self.cachePath:
+            return {}
+        cache = self._readCacheFile()
+        if not cache:
+            return {}
+        return cache.get('crawls', {}).get(self._cacheKey(), {})
+
+    def _saveCache(self, roots):
+        if not self.cachePath:
             return
-        self._visited.add(canonical_path)
-
-        for subItem in sorted(os.listdir(canonical_path)):
-            if self.exclude and self.exclude.search(subItem):
-                continue
-            subPath = os.path.join(canonical_path, subItem)
-            if os.path.isdir(subPath):
-                nuke.pluginAppendPath(subPath)
-                subData = {}
-                if nuke.GUI:
-                    crawlData['dirs'][subItem] = subData
-                self._recursiveAddGizmoPaths(subPath, subData)
-            elif nuke.GUI and (not foldersOnly) and os.path.isfile(subPath):
-                name, ext = os.path.splitext(subItem)
-                if ext == '.gizmo':
-                    crawlData['gizmos'].append(name)
-                if ext == '.nk':
-                    crawlData['gizmos'].append(name + '.nk')
+        cache = self._readCacheFile() or {'version': GIZMO_CACHE_VERSION,
+                                          'crawls': {}}
+        cache['crawls'].setdefault(self._cacheKey(), {}).update(roots)
+        tempPath = f'{self.cachePath}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.cachePath), exist_ok=True)
+            with open(tempPath, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tempPath, self.cachePath)
+        except OSError as e:
+            self.logger.warning(f'Could not write gizmo cache {self.cachePath}: {e}')
 
     def addGizmoMenuItems(self, rootMenu=None, defaultTopMenu=None):
         '''
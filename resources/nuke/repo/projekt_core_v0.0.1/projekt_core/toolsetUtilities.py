@@ -32,7 +32,7 @@
 # File Name:        toolsetUtilities.py
 # Version:          0.0.1
 # Created:          2024-10-28
-# Modified:         2021-11-06
+# Modified:         2026-10-18
 
 # -------------------------------------------------------------------------- #
 
@@ -52,6 +52,13 @@ Functions:
     populated with items found in the specified directory path.
 8. `addMenu(menu_title: str, index: int) -> None`: Adds a menu to Nuke.
 9. `reloadMenu(menu_title: str, index: int) -> None`: Reloads the specified menu in Nuke.
+10. `updateMenu(menu_title: str, index: int, path: str) -> None`: Adds one saved toolset to the menu.
+11. `removeMenuEntry(menu_title: str, path: str) -> None`: Removes one deleted toolset from the menu.
+
+The menus are built from an in-memory `ToolsetTree` of each directory. Saving
+or deleting a toolset changes only its own menu entry, and a background thread
+checks the directory mtimes every `TOOLSET_REFRESH_INTERVAL` seconds for
+changes made elsewhere.
 
 Dependencies:
 - nuke
@@ -60,6 +67,7 @@ Dependencies:
 - pathlib
 - projekt_core.settings
 - projekt_core.utilities
+- projekt_core.toolsetTree
 - logging (for logger)
 
 
@@ -68,10 +76,13 @@ Dependencies:
 import nuke
 import os
 import sys
+import time
+import threading
 from pathlib import Path
 
 import projekt_core.settings as settings
 import projekt_core.utilities as utilities
+from projekt_core.toolsetTree import ToolsetTree
 
 
 print("# -------------------------------------------------------------------------- #")
@@ -94,6 +105,16 @@ try:
 except Exception as e:
     logger.info(f'Error: {str(e)}')
 
+# Seconds between the background checks for toolsets changed outside of this
+# Nuke session.
+TOOLSET_REFRESH_INTERVAL = 30
+
+# The ToolsetTree and menu bar index of every menu created by createMenu, by
+# menu title.
+menuTrees = {}
+menuIndexes = {}
+toolsetWatcher = None
+
 
 # ========================================================================== #
 # This section exports selected nodes as a script in the specified directory.
@@ -109,7 +130,8 @@ def exportNodesAsScript(export_type: str, directory: Path, reload_function) -> N
 
     :param export_type: The type of export (e.g., "Template" or "Toolset").
     :param directory: The directory where the script will be saved.
-    :param reload_function: The function to reload the menu.
+    :param reload_function: The function to update the menu, called with the
+        saved path, or None if the export was cancelled.
     """
     logger.info(f'Saving {export_type}')
     try:
@@ -123,7 +145,7 @@ def exportNodesAsScript(export_type: str, directory: Path, reload_function) -> N
         s = nuke.getFilename(f"Export Nodes As {export_type}", f"*{nukeExt}", f"{directory}/", "script", "save", extension=nukeExt)
         if s is not None:
             nuke.nodeCopy(s)
-        reload_function()
+        reload_function(s)
     except Exception as e:
         logger.error(f'Error saving {export_type}: {str(e)}')
         
@@ -136,7 +158,7 @@ def saveNodesAsToolset() -> None:
     """
     Export selected nodes as an nk script on disk in the toolSetsDir folder.
     """
-    exportNodesAsScript("Toolset", toolSetsDir, lambda: reloadMenu("Toolsets", 22))
+    exportNodesAsScript("Toolset", toolSetsDir, lambda path: updateMenu("Toolsets", 22, path))
 
 # -------------------------------------------------------------------------- #
 
@@ -144,7 +166,7 @@ def saveNodesAsTemplate() -> None:
     """
     Export selected nodes as an nk script on disk in the templatesDir folder.
     """
-    exportNodesAsScript("Template", templatesDir, lambda: reloadMenu("Templates", 23))
+    exportNodesAsScript("Template", templatesDir, lambda path: updateMenu("Templates", 23, path))
 
 
 # ========================================================================== #
@@ -171,19 +193,12 @@ def createMenu(menu_title: str, index: int, directory_path: Path, reload_command
 
     logger.info(f'Loading items from {directory_path}')
 
-    for path, dirs, files in os.walk(directory_path):
-        files.sort()
-        dirs.sort()
-        for file in files:
-            if '#' not in path and '#' not in file and file.endswith(".nk") and not file.startswith("__"):
-                name = file.split('.')[0]
-                file_path = Path(path) / file
-                menus = file_path.relative_to(directory_path).parts
-                parent_menu = menu
-                for menu_name in menus[:-1]:
-                    if menu_name:
-                        parent_menu = parent_menu.addMenu(f"&{menu_name}")
-                parent_menu.addCommand(name, f'nuke.loadToolset("{file_path.as_posix()}")')
+    tree = ToolsetTree(directory_path)
+    tree.scan()
+    menuTrees[menu_title] = tree
+    menuIndexes[menu_title] = index
+    addMenuEntries(menu, tree.entries())
+    startToolsetWatcher()
 
     menu.addSeparator()
     menu.addCommand('refreshMenu', reload_command, '')
@@ -193,6 +208,119 @@ def createMenu(menu_title: str, index: int, directory_path: Path, reload_command
 
 
 
+# ========================================================================== #
+# This section updates menus from the changes of their ToolsetTree.
+# ========================================================================== #
+
+def addMenuEntries(menu, entries) -> None:
+    """
+    Adds toolset entries, as returned by ToolsetTree.entries, to a menu.
+    """
+    for kind, name, value in entries:
+        if kind == 'item':
+            menu.addCommand(name, f'nuke.loadToolset("{value}")')
+        else:
+            addMenuEntries(menu.addMenu(f"&{name}"), value)
+
+# -------------------------------------------------------------------------- #
+
+def findSubMenu(menu_title: str, menu_path):
+    """
+    Returns the submenu of the menu 'menu_title' at 'menu_path', a tuple of
+    directory names, or None if it does not exist.
+    """
+    menu = nuke.menu("Nuke").findItem(menu_title)
+    for name in menu_path:
+        if menu is None:
+            break
+        menu = menu.findItem(name)
+    return menu
+
+# -------------------------------------------------------------------------- #
+
+def applyMenuChanges(menu_title: str, changes) -> None:
+    """
+    Applies the changes of a ToolsetTree to its menu, touching only the
+    entries and submenus that changed.
+    """
+    for change in changes:
+        parent = findSubMenu(menu_title, change['menuPath'])
+        if parent is None:
+            logger.warning(f'Menu {menu_title} is out of date, rebuilding it')
+            rebuildMenu(menu_title)
+            return
+        if change['action'] == 'addItem':
+            parent.addCommand(change['name'], f'nuke.loadToolset("{change["path"]}")',
+                              index=change['index'])
+        elif change['action'] == 'addMenu':
+            addMenuEntries(parent.addMenu(f"&{change['name']}", index=change['index']),
+                           change['entries'])
+        else:
+            parent.removeItem(change['name'])
+
+# -------------------------------------------------------------------------- #
+
+def updateMenu(menu_title: str, index: int, path) -> None:
+    """
+    Adds one saved toolset to the specified menu.
+
+    :param menu_title: The title of the menu.
+    :param index: The index of the menu, used if it has to be created.
+    :param path: The saved toolset, or None to do nothing.
+    """
+    if path is None:
+        return
+    tree = menuTrees.get(menu_title)
+    if tree is None:
+        reloadMenu(menu_title, index)
+        return
+    applyMenuChanges(menu_title, tree.add(path))
+
+# -------------------------------------------------------------------------- #
+
+def removeMenuEntry(menu_title: str, path) -> None:
+    """
+    Removes one deleted toolset from the specified menu.
+
+    :param menu_title: The title of the menu.
+    :param path: The deleted toolset.
+    """
+    tree = menuTrees.get(menu_title)
+    if tree is not None:
+        applyMenuChanges(menu_title, tree.remove(path))
+
+# -------------------------------------------------------------------------- #
+
+def watchToolsets() -> None:
+    """
+    Checks every menu's toolset directory for outside changes, forever,
+    and applies them in the main thread.
+    """
+    while True:
+        time.sleep(TOOLSET_REFRESH_INTERVAL)
+        for menu_title, tree in list(menuTrees.items()):
+            try:
+                changes = tree.refresh()
+            except Exception as e:
+                logger.error(f'Error checking {tree.root}: {str(e)}')
+                continue
+            if changes:
+                logger.info(f'{len(changes)} toolset changes in {tree.root}')
+                nuke.executeInMainThread(applyMenuChanges, (menu_title, changes))
+
+# -------------------------------------------------------------------------- #
+
+def startToolsetWatcher() -> None:
+    """
+    Starts the background check of the toolset directories once.
+    """
+    global toolsetWatcher
+    if toolsetWatcher is None and nuke.GUI:
+        toolsetWatcher = threading.Thread(target=watchToolsets,
+                                          name='toolsetWatcher', daemon=True)
+        toolsetWatcher.start()
+
+
 # ========================================================================== #
 # This section adds a menu to Nuke.
 # ========================================================================== #
@@ -230,16 +358,36 @@ def addMenu(menu_title: str, index: int) -> None:
 
 def reloadMenu(menu_title: str, index: int) -> None:
     """
-    Reloads the specified menu in Nuke.
+    Reloads the specified menu in Nuke. A menu created by createMenu is
+    brought up to date from the directories that changed; any other is
+    rebuilt.
 
     :param menu_title: The title of the menu to reload.
     :param index: The index at which the reloaded menu should be inserted.
     """
+    tree = menuTrees.get(menu_title)
+    if tree is not None and findSubMenu(menu_title, ()) is not None:
+        applyMenuChanges(menu_title, tree.refresh())
+        return
     menubar = nuke.menu("Nuke")
     menu = menubar.addMenu(f"&{menu_title}", str(index))
     menu.clearMenu()
     addMenu(menu_title, index)
 
+# -------------------------------------------------------------------------- #
+
+def rebuildMenu(menu_title: str) -> None:
+    """
+    Rebuilds the specified menu from scratch.
+
+    :param menu_title: The title of the menu to rebuild.
+    """
+    menu = nuke.menu("Nuke").findItem(menu_title)
+    if menu is not None:
+        menu.clearMenu()
+    menuTrees.pop(menu_title, None)
+    addMenu(menu_title, menuIndexes.get(menu_title, 0))
+
 
 # -------------------------------------------------------------------------- #
 
@@ -31,7 +31,7 @@
 # File Name:        vfxtools.py
 # Version:          0.0.1
 # Created:          2024-10-25
-# Modified:         2021-11-06
+# Modified:         2026-10-18
 
 # -------------------------------------------------------------------------- #
 
@@ -63,6 +63,8 @@ Dependencies:
 import nuke
 import os
 import base64
+import threading
+import time
 import zlib
 import json
 from typing import Dict, Any
@@ -188,47 +190,125 @@ def create_projekt_panel():
     update_root_warnings()
     return
 
+# ========================================================================== #
+# This section defines cached path checks for the root.PROJEKT warnings.
+# ========================================================================== #
+
+# Seconds a path existence result is trusted before the disk is asked again.
+PATH_EXISTS_TTL = 10.0
+
+# Seconds without knob changes before the root warnings are updated.
+ROOT_WARNINGS_DEBOUNCE = 0.3
+
+# Set PROJEKT_DEBUG_ROOT_WARNINGS to log the callback counts and timings.
+ROOT_WARNINGS_DEBUG = bool(os.getenv('PROJEKT_DEBUG_ROOT_WARNINGS'))
+
+_path_exists_cache = {}
+_root_warnings_lock = threading.Lock()
+_root_warnings_timer = None
+_root_warnings_generation = 0
+_root_warnings_stats = {
+    'callbacks': 0,
+    'callback_seconds': 0.0,
+    'updates': 0,
+    'check_seconds': 0.0,
+    'path_checks': 0,
+    'path_cache_hits': 0,
+}
+
+# -------------------------------------------------------------------------- #
+
+def cached_path_exists(path, ttl=PATH_EXISTS_TTL):
+    """
+    Returns os.path.exists(path), asking the filesystem at most once per ttl.
+
+    Args:
+        path (str): The path to check.
+        ttl (float): Seconds a cached result stays valid.
+
+    Returns:
+        bool: True if the path exists.
+    """
+    now = time.monotonic()
+    with _root_warnings_lock:
+        cached = _path_exists_cache.get(path)
+        if cached is not None and now - cached[1] < ttl:
+            _root_warnings_stats['path_cache_hits'] += 1
+            return cached[0]
+
+    exists = os.path.exists(path)
+
+    with _root_warnings_lock:
+        _path_exists_cache[path] = (exists, time.monotonic())
+        _root_warnings_stats['path_checks'] += 1
+    return exists
+
+# -------------------------------------------------------------------------- #
+
+def clear_path_exists_cache():
+    """
+    Forgets every cached path existence result.
+    """
+    with _root_warnings_lock:
+        _path_exists_cache.clear()
+
 # ========================================================================== #
 # This section defines functions to update the job warnings in Nuke.
 # ========================================================================== #
 
-def update_root_warnings():
+def _read_root_warning_inputs():
     """
-    Add warnings to the root.PROJEKT tab if the folders do not exist.
-    This function checks if the job folder exists and if it is set to the project root.
-    If the job folder does not exist or is set to the project root, it adds a warning message 
-    to the root.PROJEKT tab.
+    Reads the knob and settings values the root warnings depend on.
+
+    Knobs may only be read from the main thread, so this runs in the
+    knob-changed callback and the result is handed to the path checks.
+
+    Returns:
+        dict: The projekt name, projekt path and shot name, as set on the
+        knobs and as expected from the environment.
     """
-    projekt_name_value = str(settings.projekt_name())
-    projekt_path_value = str(settings.projekt_path())
+    return {
+        'projekt_name_value': str(settings.projekt_name()),
+        'projekt_path_value': str(settings.projekt_path()),
+        'projekt_name_knob': nuke.root().knob('projekt_name_knob').value(),
+        'projekt_path_knob': nuke.root().knob('projekt_path_knob').value(),
+        'shot_name_knob': nuke.root().knob('shot_name_knob').value(),
+    }
 
-   
-    # root_node = nuke.root()
-    projekt_name_knob = nuke.root().knob('projekt_name_knob').value()
-    projekt_path_knob = nuke.root().knob('projekt_path_knob').value()
-    shot_name_knob = nuke.root().knob('shot_name_knob').value()
+# -------------------------------------------------------------------------- #
 
-  
+def _evaluate_root_warnings(inputs):
+    """
+    Builds the root.PROJEKT warning messages from the knob values.
 
-    job_message = '<b style="color:green">Name: good</b>'
-    path_message = '<b style="color:green">Path: good</b>'
-    shot_message = '<b style="color:green">Shot: good</b>'
+    Touches the filesystem, through the path existence cache, but not
+    Nuke, so it is safe to run on a background thread.
 
-    logger.info('running update_root_warnings...')
-    logger.info(f"projekt_name_knob: {projekt_name_knob}")
-    logger.info(f"projekt_name_value: {projekt_name_value}")
-    logger.info(f"projekt_path_knob: {projekt_path_knob}")
-    logger.info(f"projekt_path_value: {projekt_path_value}")
-    logger.info(f"shot_name_knob: {shot_name_knob}")
+    Args:
+        inputs (dict): The values returned by _read_root_warning_inputs().
 
+    Returns:
+        tuple: The job, path and shot warning messages.
+    """
+    start_time = time.perf_counter()
 
+    projekt_name_value = inputs['projekt_name_value']
+    projekt_path_value = inputs['projekt_path_value']
+    projekt_name_knob = inputs['projekt_name_knob']
+    projekt_path_knob = inputs['projekt_path_knob']
+    shot_name_knob = inputs['shot_name_knob']
 
-    # PROJEKT checks
-    # if not projekt_name_knob and not projekt_path_knob:
-    # if not projekt_name_knob:        
-    #     job_message = '<b style="color:orange">ERROR: name is blank!</b>'
-    #     # path_message = '<b style="color:orange">ERROR: path is blank!</b>'
-    #     logger.warning('PROJEKT name is blank!')
+    job_message = '<b style="color:green">Name: good</b>'
+    path_message = '<b style="color:green">Path: good</b>'
+    shot_message = '<b style="color:green">Shot: good</b>'
+
+    if ROOT_WARNINGS_DEBUG:
+        logger.info('running update_root_warnings...')
+        logger.info(f"projekt_name_knob: {projekt_name_knob}")
+        logger.info(f"projekt_name_value: {projekt_name_value}")
+        logger.info(f"projekt_path_knob: {projekt_path_knob}")
+        logger.info(f"projekt_path_value: {projekt_path_value}")
+        logger.info(f"shot_name_knob: {shot_name_knob}")
 
     if not projekt_name_knob:
         job_message = '<b style="color:orange">ERROR: name is blank!</b>'
@@ -247,14 +327,11 @@ def update_root_warnings():
         path_message = f'<b style="color:orange">ERROR: Path does not match! Expected: {projekt_path_value}</b>'
         logger.warning(f'PROJEKT path does not match! Expected: {projekt_path_value}')
 
-    elif not os.path.exists(projekt_path_knob):
+    elif not cached_path_exists(projekt_path_knob):
         path_message = '<b style="color:orange">ERROR: path does not exist on disk!</b>'
         logger.warning('PROJEKT path does not exist on disk')
-    # if not projekt_path_knob:
-    #     path_message = '<b style="color:orange">ERROR: path is blank!</b>'
-    #     logger.warning('PROJEKT name and path are blank!')
 
-    else:
+    elif ROOT_WARNINGS_DEBUG:
         logger.info(f"PROJEKT name is {projekt_name_knob}")
         logger.info(f"path {projekt_path_knob} exists on disk")
 
@@ -264,18 +341,124 @@ def update_root_warnings():
         logger.warning('Shot name is blank!')
     else:
         shot_path = os.path.join(projekt_path_knob, 'shots', shot_name_knob)
-        if not os.path.exists(shot_path):
+        if not cached_path_exists(shot_path):
             shot_message = '<b style="color:orange">ERROR: shot path does not exist on disk!</b>'
             logger.warning(f'Shot path {shot_path} does not exist on disk')
-        else:
+        elif ROOT_WARNINGS_DEBUG:
             logger.info(f"Shot path {shot_path} exists on disk")
 
-    logger.info("... update_root_warnings completed.")
+    with _root_warnings_lock:
+        _root_warnings_stats['updates'] += 1
+        _root_warnings_stats['check_seconds'] += (
+            time.perf_counter() - start_time
+        )
+
+    return job_message, path_message, shot_message
+
+# -------------------------------------------------------------------------- #
+
+def _apply_root_warnings(messages, generation=None):
+    """
+    Writes the warning messages to the root.PROJEKT knobs.
+
+    Runs on the main thread. Results of a deferred update are dropped if
+    the knobs changed again while the paths were being checked.
+
+    Args:
+        messages (tuple): The job, path and shot warning messages.
+        generation (int): The scheduled update the messages belong to, or
+            None for an immediate update.
+    """
+    if generation is not None and generation != _root_warnings_generation:
+        return
+
+    job_message, path_message, shot_message = messages
 
     nuke.root().knob('projekt_warning').setValue(job_message)
     nuke.root().knob('path_warning').setValue(path_message)
     nuke.root().knob('shot_warning').setValue(shot_message)
-    
+
+    if ROOT_WARNINGS_DEBUG:
+        logger.info("... update_root_warnings completed.")
+        report_root_warnings_stats()
+
+# -------------------------------------------------------------------------- #
+
+def update_root_warnings():
+    """
+    Add warnings to the root.PROJEKT tab if the folders do not exist.
+    This function checks if the job folder exists and if it is set to the project root.
+    If the job folder does not exist or is set to the project root, it adds a warning message
+    to the root.PROJEKT tab.
+
+    The update runs immediately, on the calling thread. Knob changes use
+    schedule_root_warnings_update() instead.
+    """
+    messages = _evaluate_root_warnings(_read_root_warning_inputs())
+    _apply_root_warnings(messages)
+
+# -------------------------------------------------------------------------- #
+
+def _run_scheduled_root_warnings(inputs, generation):
+    # Timer thread: check the paths, then hand the result to the main thread
+    try:
+        messages = _evaluate_root_warnings(inputs)
+    except Exception as e:
+        logger.error("An error occurred in update_root_warnings: %s", str(e))
+        return
+    nuke.executeInMainThread(_apply_root_warnings, args=(messages, generation))
+
+# -------------------------------------------------------------------------- #
+
+def schedule_root_warnings_update(delay=None):
+    """
+    Collapses a burst of knob changes into one deferred warnings update.
+
+    The knob values are read now, on the main thread. Every call restarts
+    the timer, so only the last call of a burst checks the paths, on the
+    timer thread, and posts the messages back to the main thread.
+
+    Args:
+        delay (float): Seconds to wait for further knob changes. Defaults
+            to ROOT_WARNINGS_DEBOUNCE.
+    """
+    global _root_warnings_timer, _root_warnings_generation
+
+    if not nuke.GUI:
+        update_root_warnings()
+        return
+
+    inputs = _read_root_warning_inputs()
+
+    with _root_warnings_lock:
+        if _root_warnings_timer is not None:
+            _root_warnings_timer.cancel()
+        _root_warnings_generation += 1
+        _root_warnings_timer = threading.Timer(
+            ROOT_WARNINGS_DEBOUNCE if delay is None else delay,
+            _run_scheduled_root_warnings,
+            args=(inputs, _root_warnings_generation)
+        )
+        _root_warnings_timer.daemon = True
+        _root_warnings_timer.start()
+
+# -------------------------------------------------------------------------- #
+
+def report_root_warnings_stats():
+    """
+    Logs how often the root warnings callback ran and the time it took.
+    """
+    with _root_warnings_lock:
+        stats = dict(_root_warnings_stats)
+    logger.info(
+        f"root warnings: {stats['callbacks']} callbacks "
+        f"({stats['callback_seconds']:.4f}s), "
+        f"{stats['updates']} updates "
+        f"({stats['check_seconds']:.4f}s in path checks), "
+        f"{stats['path_checks']} path checks on disk, "
+        f"{stats['path_cache_hits']} from cache"
+    )
+
 print("# -------------------------------------------------------------------------- #")
 
 # -------------------------------------------------------------------------- #
@@ -291,6 +474,7 @@ def update_root_warnings_callback():
     Returns:
         None
     """
+    start_time = time.perf_counter()
     try:
         # Verify that a script is open by checking if nuke.root() is valid
         root = nuke.root()
@@ -307,7 +491,7 @@ def update_root_warnings_callback():
             knob_name = nuke.thisKnob().name()
             if knob_name in ['projekt_name_knob', 'shot_name_knob', 'projekt_path_knob', 'favorites']:
                 try:
-                    update_root_warnings()
+                    schedule_root_warnings_update()
                 except Exception as e:
                     logger.error("An error occurred in update_root_warnings_callback: %s", str(e))
     except ValueError as ve:
@@ -315,6 +499,12 @@ def update_root_warnings_callback():
         # logger.error("ValueError in update_root_warnings_callback: %s", str(ve))
     except Exception as e:
         logger.error("An unexpected error occurred in update_root_warnings_callback: %s", str(e))
+    finally:
+        with _root_warnings_lock:
+            _root_warnings_stats['callbacks'] += 1
+            _root_warnings_stats['callback_seconds'] += (
+                time.perf_counter() - start_time
+            )
 
     # # Check if the required knobs exist
     # if nuke.root().knob('projekt_path_knob') and nuke.root().knob('projekt_name_knob'):
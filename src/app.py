@@ -14,16 +14,12 @@
 # Status:       Development
 # Type:         Application
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-19
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 import sys
 import logging
-import os
-from datetime import (
-    datetime
-)
 from PySide6.QtWidgets import (
     QApplication
 )
@@ -36,6 +32,23 @@ from src.ui.themes.modular_dark_theme import (
 from src.ui import (
     ui_config
 )
+from src.core.functions.get.get_application_paths import (
+    GetApplicationPaths
+)
+from src.core.utils.path_utils import (
+    get_repository_root_dir
+)
+from src.core.utils.session_log_utils import (
+    start_session_log,
+)
+from src.core.utils.trace_utils import (
+    start_tracing,
+    tracing_requested,
+)
+from src.core.utils.system_snapshot_utils import (
+    DEFAULT_SYSTEM_SNAPSHOT_CACHE,
+    start_system_snapshot,
+)
 
 
 def main():
@@ -45,49 +58,24 @@ def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-    # Generate session log file path
-    log_dir_base = (
-        "logs/"
-        "session-logs"
-    )
-    current_time = (
-        datetime.now()
-    )
-    year = (
-        current_time.strftime("%Y")
-    )
-    month = (
-        current_time.strftime("%m")
-    )
-    day = (
-        current_time.strftime("%d")
-    )
-    log_dir = (
-        os.path.join(log_dir_base, year, month, day)
-    )
-    os.makedirs(
-        log_dir,
-        exist_ok=True
-    )
-    log_filename = (
-        current_time.strftime("%Y-%m-%d-%H-%M-%S-session.log")
-    )
-    session_log_filepath = (
-        os.path.join(log_dir, log_filename)
+    # Start the size-rotated session log and record it in the index, in
+    # the directory copy_current_session_files reads, whatever the cwd
+    session_log_manager = start_session_log(
+        str(
+            get_repository_root_dir() / GetApplicationPaths.SESSION_LOGS_DIR
+        )
     )
 
-    # Add a FileHandler to the root logger
-    file_handler = (
-        logging.FileHandler(session_log_filepath)
-    )
-    file_handler.setLevel(logging.DEBUG)
-    formatter = (
-        logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    # Record spans next to the session log when LOGIK_PROJEKT_TRACE is set
+    if tracing_requested():
+        start_tracing(
+            session_log_manager.get_trace_path()
         )
+
+    # Gather user, group and host details while the UI is built
+    start_system_snapshot(
+        cache_path=DEFAULT_SYSTEM_SNAPSHOT_CACHE
     )
-    file_handler.setFormatter(formatter)
-    logging.getLogger().addHandler(file_handler)
 
     app = (
         QApplication(sys.argv)
@@ -181,3 +169,20 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Start gathering the system snapshot at launch.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Start the session log through the session log manager.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Start tracing to the session log dir when
+#               LOGIK_PROJEKT_TRACE is set.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Resolve the session log dir from the repository root.
+# -------------------------------------------------------------------------- #
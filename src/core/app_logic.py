@@ -17,7 +17,7 @@
 # Status:       Production
 # Type:         Module
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -157,15 +157,24 @@ class AppLogic:
             flame_options_data
         )
 
-    def create_projekt(self, projekt_summary_data: dict):
+    def create_projekt(
+            self,
+            projekt_summary_data: dict,
+            on_flame_status=None
+    ):
         """
         Create a new project using the provided summary data.
       
         Args:
             projekt_summary_data:   Dictionary containing all
                                     project configuration data
+            on_flame_status:        Called with each status of the
+                                    Flame launch
+
+        Returns:
+            FlameLaunch: The status handle of the Flame launch, or None
         """
-        create_projekt(projekt_summary_data)
+        return create_projekt(projekt_summary_data, on_flame_status)
 
 
 # -------------------------------------------------------------------------- #
@@ -208,3 +217,8 @@ class AppLogic:
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Return the status handle of the Flame launch from
+#               create_projekt.
+# -------------------------------------------------------------------------- #
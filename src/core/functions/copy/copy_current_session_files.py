@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -24,13 +24,15 @@ import os
 import logging
 import sys
 import shutil
-import glob
 from pathlib import Path
 
 from src.core.utils.path_utils import get_repository_root_dir
 from src.core.functions.get.get_application_paths import GetApplicationPaths
+from src.core.utils.session_log_utils import get_session_log_manager
+from src.core.utils.trace_utils import trace_span, traced
 
 
+@traced()
 def copy_current_session_files(
         logik_projekt_path: str,
         current_workstation: str
@@ -69,7 +71,12 @@ def copy_current_session_files(
                 f"{session_files_source}/ {session_files_destination}"
             )
             logging.info(f"Executing: {rsync_command}")
-            os.system(rsync_command)
+            with trace_span(
+                "rsync",
+                source=str(session_files_source),
+                destination=str(session_files_destination)
+            ):
+                os.system(rsync_command)
             logging.info(
                 f"Successfully rsynced {session_files_source} to "
                 f"{session_files_destination}"
@@ -80,30 +87,40 @@ def copy_current_session_files(
                 f"{session_files_source}"
             )
 
-        # 2. Find and copy the most recent session log
+        # 2. Copy the log of this session, or of the latest one when run
+        # outside the application
         log_dir = repository_root_dir / GetApplicationPaths.SESSION_LOGS_DIR
-        log_files = glob.glob(
-            str(log_dir / '**' / '*.log'),
-            recursive=True
+        session_log_manager = get_session_log_manager(str(log_dir))
+        session = (
+            session_log_manager.current_session() or
+            session_log_manager.latest_session()
         )
 
-        if not log_files:
+        if session is None:
             logging.warning("No session log files found.")
             return
 
-        latest_log_file = max(log_files, key=os.path.getmtime)
+        session_log_manager.add_projekt(
+            os.path.basename(os.path.normpath(logik_projekt_path))
+        )
         log_file_destination = (
             Path(logik_projekt_path) / "logs" / current_workstation
         )
 
-        if os.path.exists(latest_log_file):
-            shutil.copy(latest_log_file, log_file_destination)
+        session_log_files = session_log_manager.get_session_files(session)
+        if not session_log_files:
+            logging.warning(f"Log file not found: {session['path']}")
+        for session_log_file in session_log_files:
+            with trace_span(
+                "copy",
+                source=session_log_file,
+                bytes=os.path.getsize(session_log_file)
+            ):
+                shutil.copy(session_log_file, log_file_destination)
             logging.info(
-                f"Successfully copied {latest_log_file} to "
+                f"Successfully copied {session_log_file} to "
                 f"{log_file_destination}"
             )
-        else:
-            logging.warning(f"Log file not found: {latest_log_file}")
 
     except FileNotFoundError as e:
         logging.error(f"Error finding project root: {e}")
@@ -175,3 +192,13 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Look up the session log in the session log index instead
+#               of scanning every log ever written. Rotated segments of
+#               the session are copied too.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -23,10 +23,12 @@
 import os
 import shutil
 import logging
+from src.core.utils.trace_utils import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced()
 def copy_flame_bookmarks(source_path: str, destination_dir: str):
     """
     Copies the cf_bookmarks.json file to the specified destination directory.
@@ -106,3 +108,7 @@ def copy_flame_bookmarks(source_path: str, destination_dir: str):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -27,9 +27,15 @@ import sys
 from pathlib import Path
 
 from src.core.utils.path_utils import get_repository_root_dir
+from src.core.utils.preset_store_utils import (
+    get_preset_store_dir,
+    materialize_tree,
+)
 from src.core.functions.get.get_application_paths import GetApplicationPaths
+from src.core.utils.trace_utils import trace_span, traced
 
 
+@traced()
 def copy_flame_presets(logik_projekt_path: str, flame_projekt_setups_dir: str):
     """
     Copies site-level presets and configurations to the newly created
@@ -46,24 +52,31 @@ def copy_flame_presets(logik_projekt_path: str, flame_projekt_setups_dir: str):
     try:
         repository_root_dir = get_repository_root_dir()
 
-        # 1. Rsync flame-presets to flame_projekt_setups_dir
+        # 1. Materialize flame-presets in flame_projekt_setups_dir from the
+        # preset store shared by the projekts
         flame_presets_source = (
             repository_root_dir / GetApplicationPaths.FLAME_PRESETS_DIR
         )
         flame_presets_destination = flame_projekt_setups_dir
 
         if flame_presets_source.exists() and flame_presets_source.is_dir():
-            rsync_command_flame = (
-                f"rsync -avh --ignore-existing "
-                f"{flame_presets_source}/ {flame_presets_destination}"
-            )
-            logging.info(f"Executing: {rsync_command_flame}")
-            os.system(rsync_command_flame)
+            preset_store_dir = get_preset_store_dir(logik_projekt_path)
             logging.info(
-                "Successfully rsynced %s to %s",
+                "Materializing %s from preset store %s",
                 flame_presets_source,
-                flame_presets_destination
+                preset_store_dir
             )
+            with trace_span(
+                "materialize",
+                source=str(flame_presets_source),
+                destination=str(flame_presets_destination)
+            ) as span:
+                counts = materialize_tree(
+                    flame_presets_source,
+                    flame_presets_destination,
+                    preset_store_dir
+                )
+                span.set(**counts)
         else:
             logging.warning(
                 "Source directory not found or not a directory: %s",
@@ -86,7 +99,12 @@ def copy_flame_presets(logik_projekt_path: str, flame_projekt_setups_dir: str):
                 "Note: Copying to /opt/Autodesk/shared/ "
                 "might require root privileges."
             )
-            os.system(rsync_command_shared)
+            with trace_span(
+                "rsync",
+                source=str(shared_presets_source),
+                destination=str(shared_presets_destination)
+            ):
+                os.system(rsync_command_shared)
             logging.info(
                 "Successfully rsynced %s to %s",
                 shared_presets_source,
@@ -169,3 +187,12 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Materialize the flame presets from the content-addressed
+#               preset store instead of copying them with rsync.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-19
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -26,22 +26,49 @@ import sys
 from pathlib import Path
 
 from src.core.utils.path_utils import get_repository_root_dir
+from src.core.utils.preset_store_utils import (
+    PRESET_MANIFEST_FILENAME,
+    get_preset_store_dir,
+    materialize_tree,
+)
 from src.core.functions.get.get_application_paths import GetApplicationPaths
+from src.core.utils.trace_utils import trace_span, traced
+
+
+OPENCLIP_PYTHON_PATH_STRING = (
+    "base_python_path = Path('/opt/Autodesk/shared/python')"
+)
+
+
+def replace_openclip_python_config_path(
+        content: str,
+        scripts_destination: Path
+):
+    """
+    Returns 'content' with the openclip base_python_path pointing at
+    'scripts_destination', or None if 'content' does not set it.
+    """
+    if OPENCLIP_PYTHON_PATH_STRING not in content:
+        return None
+    return content.replace(
+        OPENCLIP_PYTHON_PATH_STRING,
+        f"base_python_path = Path('{scripts_destination}')"
+    )
 
 
+@traced()
 def modify_openclip_python_config_paths(scripts_destination: Path):
     """
     Modifies the base_python_path in copied Python scripts.
 
+    Files are replaced rather than rewritten in place, so Flame never
+    reads a half-written script.
+
     Args:
         scripts_destination (Path): The directory containing the Python
             scripts.
     """
     logging.info("Modifying Python script paths in copied scripts...")
-    old_path_string = (
-        "base_python_path = Path('/opt/Autodesk/shared/python')"
-    )
-    new_path_string = f"base_python_path = Path('{scripts_destination}')"
 
     if not scripts_destination.is_dir():
         logging.warning(f"Script directory not found: {scripts_destination}")
@@ -49,29 +76,45 @@ def modify_openclip_python_config_paths(scripts_destination: Path):
 
     for filepath in scripts_destination.rglob("*.py"):
         try:
-            content = filepath.read_text()
-            if old_path_string in content:
+            content = replace_openclip_python_config_path(
+                filepath.read_text(),
+                scripts_destination
+            )
+            if content is not None:
                 logging.info(f"Updating path in: {filepath.name}")
-                content = content.replace(old_path_string, new_path_string)
-                filepath.write_text(content)
+                temp_path = filepath.with_name(f".{filepath.name}.tmp")
+                temp_path.write_text(content)
+                os.chmod(temp_path, filepath.stat().st_mode & 0o777 | 0o200)
+                os.replace(temp_path, filepath)
         except Exception as e:
             logging.error(f"Failed to modify {filepath.name}: {e}")
 
 
-def copy_flame_python_scripts(flame_projekt_setups_dir: str):
+@traced()
+def copy_flame_python_scripts(
+        flame_projekt_setups_dir: str,
+        logik_projekt_path: str = None
+):
     """
     Copies Flame Python scripts to the project's setups directory.
 
+    The scripts are materialized from the preset store next to
+    'logik_projekt_path'. Scripts that set the openclip base_python_path
+    get a private copy pointing at the projekt.
+
     Args:
         flame_projekt_setups_dir (str): The absolute path to
             the Flame project's "setups" directory.
+        logik_projekt_path (str): The absolute path to the LOGIK-PROJEKT
+            directory. Defaults to the Flame project directory, which
+            puts the store next to the Flame projects.
     """
     logging.info("Copying Flame Python scripts...")
 
     try:
         repository_root_dir = get_repository_root_dir()
 
-        # Rsync flame-python/* to flame_projekt_setups_dir/python
+        # Materialize flame-python/* in flame_projekt_setups_dir/python
         flame_scripts_source = (
             repository_root_dir / GetApplicationPaths.FLAME_PYTHON_SCRIPTS_DIR
         )
@@ -83,18 +126,41 @@ def copy_flame_python_scripts(flame_projekt_setups_dir: str):
         flame_scripts_destination.mkdir(parents=True, exist_ok=True)
 
         if flame_scripts_source.exists() and flame_scripts_source.is_dir():
-            rsync_command = (
-                f"rsync -avh --ignore-existing "
-                f"{flame_scripts_source}/ {flame_scripts_destination}"
+            preset_store_dir = get_preset_store_dir(
+                logik_projekt_path
+                or os.path.dirname(os.path.abspath(flame_projekt_setups_dir))
             )
-            logging.info(f"Executing: {rsync_command}")
-            os.system(rsync_command)
             logging.info(
-                "Successfully rsynced %s to %s",
+                "Materializing %s from preset store %s",
                 flame_scripts_source,
-                flame_scripts_destination,
+                preset_store_dir
             )
-            modify_openclip_python_config_paths(flame_scripts_destination)
+
+            def transform(relative_path, source_path):
+                if not relative_path.endswith(".py"):
+                    return None
+                with open(source_path, "r") as f:
+                    return replace_openclip_python_config_path(
+                        f.read(),
+                        flame_scripts_destination
+                    )
+
+            with trace_span(
+                "materialize",
+                source=str(flame_scripts_source),
+                destination=str(flame_scripts_destination)
+            ) as span:
+                counts = materialize_tree(
+                    flame_scripts_source,
+                    flame_scripts_destination,
+                    preset_store_dir,
+                    os.path.join(
+                        flame_projekt_setups_dir,
+                        PRESET_MANIFEST_FILENAME
+                    ),
+                    transform
+                )
+                span.set(**counts)
         else:
             logging.warning(
                 "Source directory not found or not a directory: %s",
@@ -169,3 +235,19 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Materialize the flame python scripts from the
+#               content-addressed preset store instead of copying them
+#               with rsync, and replace rather than rewrite the scripts
+#               whose openclip path is changed.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Updated the docstring now that the preset store no longer
+#               hard links scripts.
+# -------------------------------------------------------------------------- #
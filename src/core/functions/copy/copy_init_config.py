@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -26,10 +26,12 @@ import logging
 from pathlib import Path
 
 from src.core.utils.path_utils import get_repository_root_dir
+from src.core.utils.trace_utils import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced()
 def copy_init_config(
     init_config_filename: str, setups_dir: str, flame_projekt_name: str
 ):
@@ -116,3 +118,7 @@ def copy_init_config(
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
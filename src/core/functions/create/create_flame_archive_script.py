@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -25,45 +25,40 @@ import logging
 import datetime
 import shutil
 
-logger = logging.getLogger(__name__)
-
-
-def create_flame_archive_script(projekt_summary_data: dict):
-
-    logger.info(
-        f"Creating PROJEKT flame archive script for "
-        f"{projekt_summary_data['logik_projekt_name']} on "
-        f"{projekt_summary_data['current_workstation']}."
-    )
+from src.core.utils.template_utils import (
+    TemplateJob,
+    render_templates,
+)
+from src.core.utils.trace_utils import traced
 
-    the_projekt_dir = (
-        projekt_summary_data['logik_projekt_path']
-    )
+logger = logging.getLogger(__name__)
 
-    os.umask(0)
 
+def get_flame_archive_dirs(projekt_summary_data: dict) -> list:
+    """
+    Returns the archive directories of the workstation in
+    'projekt_summary_data', parents first.
+    """
     tgt_flame_archive_dir = os.path.join(
-        the_projekt_dir,
+        projekt_summary_data['logik_projekt_path'],
         'flame',
         'archive',
     )
-
-    os.makedirs(
+    return [
         tgt_flame_archive_dir,
-        exist_ok=True
-    )
+        os.path.join(
+            tgt_flame_archive_dir,
+            projekt_summary_data['current_workstation'],
+        ),
+    ]
 
-    tgt_workstation_flame_archive_dir = os.path.join(
-        the_projekt_dir,
-        'flame',
-        'archive',
-        projekt_summary_data['current_workstation'],
-    )
 
-    os.makedirs(
-        tgt_workstation_flame_archive_dir,
-        exist_ok=True
-    )
+def get_flame_archive_script_jobs(projekt_summary_data: dict) -> list:
+    """
+    Returns the TemplateJobs of the archive script and its crontab script
+    for the workstation in 'projekt_summary_data'.
+    """
+    tgt_flame_archive_dir = get_flame_archive_dirs(projekt_summary_data)[0]
 
     src_archive_template = (
         "cfg/"
@@ -103,9 +98,6 @@ def create_flame_archive_script(projekt_summary_data: dict):
         f"{projekt_summary_data['current_workstation']}.sh"
     )
 
-    with open(src_archive_template, 'r') as f:
-        template_content = f.read()
-
     replacements = {
         "%%ARCHIVE_SCRIPT_NAME%%": archive_script_name,
         "%%ARCHIVE_SCRIPT_PROJEKT%%": projekt_summary_data[
@@ -128,38 +120,6 @@ def create_flame_archive_script(projekt_summary_data: dict):
         ),
     }
 
-    for placeholder, value in replacements.items():
-        template_content = (
-            template_content.replace(
-                placeholder,
-                str(value)
-            )
-        )
-
-    os.makedirs(
-        os.path.dirname(tgt_projekt_archive_script),
-        exist_ok=True
-    )
-    with open(tgt_projekt_archive_script, 'w') as f:
-        f.write(template_content)
-
-    os.chmod(
-        tgt_projekt_archive_script,
-        0o755
-    )
-
-    logger.info(
-        f"Successfully created PROJEKT flame archive script to: "
-        f"{tgt_projekt_archive_script}"
-    )
-
-    os.makedirs(
-        os.path.dirname(tgt_projekt_archive_crontab),
-        exist_ok=True
-    )
-    with open(src_archive_crontab_template, 'r') as f:
-        crontab_template_content = f.read()
-
     crontab_replacements = {
         "%%LOGIK_PROJEKT_NAME%%": projekt_summary_data['logik_projekt_name'],
         "%%FLAME_PROJEKT_NAME%%": projekt_summary_data['flame_projekt_name'],
@@ -170,23 +130,48 @@ def create_flame_archive_script(projekt_summary_data: dict):
         "%%ARCHIVE_SCRIPT_NAME%%": archive_script_name,
     }
 
-    for placeholder, value in crontab_replacements.items():
-        crontab_template_content = crontab_template_content.replace(
-            placeholder,
-            str(value)
+    return [
+        TemplateJob(
+            src_archive_template,
+            tgt_projekt_archive_script,
+            replacements
+        ),
+        TemplateJob(
+            src_archive_crontab_template,
+            tgt_projekt_archive_crontab,
+            crontab_replacements
+        ),
+    ]
+
+
+@traced()
+def create_flame_archive_script(projekt_summary_data: dict):
+
+    logger.info(
+        f"Creating PROJEKT flame archive script for "
+        f"{projekt_summary_data['logik_projekt_name']} on "
+        f"{projekt_summary_data['current_workstation']}."
+    )
+
+    os.umask(0)
+
+    for archive_dir in get_flame_archive_dirs(projekt_summary_data):
+        os.makedirs(
+            archive_dir,
+            exist_ok=True
         )
 
-    with open(tgt_projekt_archive_crontab, 'w') as f:
-        f.write(crontab_template_content)
+    archive_jobs = get_flame_archive_script_jobs(projekt_summary_data)
+    render_templates(archive_jobs)
 
-    os.chmod(
-        tgt_projekt_archive_crontab,
-        0o755
+    logger.info(
+        f"Successfully created PROJEKT flame archive script to: "
+        f"{archive_jobs[0].output_path}"
     )
 
     logger.info(
         f"Successfully created PROJEKT flame archive crontab script to: "
-        f"{tgt_projekt_archive_crontab}"
+        f"{archive_jobs[1].output_path}"
     )
 
 
@@ -230,3 +215,17 @@ def create_flame_archive_script(projekt_summary_data: dict):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Render both scripts in one batch with the shared
+#               single-pass template renderer.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Split out the archive directories and template jobs of one
+#               workstation for the multi-workstation fan-out.
+# -------------------------------------------------------------------------- #
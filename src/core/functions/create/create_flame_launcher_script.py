@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -25,9 +25,75 @@ import logging
 import datetime
 import shutil
 
+from src.core.utils.template_utils import (
+    TemplateJob,
+    render_templates,
+)
+from src.core.utils.trace_utils import traced
+
 logger = logging.getLogger(__name__)
 
+FLAME_LAUNCHER_TEMPLATE = (
+    "cfg/"
+    "site-cfg/"
+    "flame-cfg/"
+    "flame-templates/"
+    "flame-launcher-templates/"
+    "flame_launcher_template.sh"
+)
+FLAME_LAUNCHER_SCRIPT_NAME = "current_session-flame_launcher.sh"
+
+
+def get_flame_launcher_script_values(
+    logik_projekt_path: str,
+    current_workstation: str,
+    current_os: str,
+    the_projekts_dir: str,
+    the_projekt_flame_dirs: str,
+    the_adsk_dir: str,
+    the_adsk_dir_linux: str,
+    the_adsk_dir_macos: str,
+    logik_projekt_name: str,
+    the_projekt_flame_name: str,
+    flame_software_sanitized_version: str,
+    flame_software_choice: str,
+    flame_projekt_setups_dir: str,
+) -> dict:
+    """
+    Returns the placeholder values of the Flame launcher template for one
+    workstation. The arguments are those of create_flame_launcher_script.
+    """
+    software_choice_lower = flame_software_choice.lower()
+
+    app_starter = ""
+    if 'flame' in software_choice_lower:
+        app_starter = 'startFlame'
+    elif 'flare' in software_choice_lower:
+        app_starter = 'startFlare'
+    elif 'assist' in software_choice_lower:
+        app_starter = 'startFlameAssist'
+
+    return {
+        "%%FLAME_STARTUP_SCRIPT_PY%%": (
+            "scripts/startup/flame_startup_script.py"
+        ),
+        "%%LAUNCHER_SCRIPT_NAME%%": FLAME_LAUNCHER_SCRIPT_NAME,
+        "%%LAUNCHER_SCRIPT_PROJEKT%%": the_projekt_flame_name,
+        "%%SCRIPT_CREATION_DATE%%": datetime.datetime.now().strftime(
+            "%Y-%m-%d %H:%M:%S"
+        ),
+        "%%LOGIK_PROJEKT_PATH%%": logik_projekt_path,
+        "%%LOGIK_PROJEKT_NAME%%": logik_projekt_name,
+        "%%FLAME_PROJEKT_NAME%%": the_projekt_flame_name,
+        "%%CURRENT_WORKSTATION%%": current_workstation,
+        "%%FLAME_FIRST_RUN_NAME%%": "current_session-flame_launcher.log",
+        "%%FLAME_SOFTWARE_CHOICE%%": flame_software_choice,
+        "%%APPLICATION_STARTER%%": app_starter,
+        "%%FLAME_PROJEKT_SETUPS_DIR%%": flame_projekt_setups_dir,
+    }
+
 
+@traced()
 def create_flame_launcher_script(
     repository_root_dir: str,
     logik_projekt_path: str,
@@ -83,7 +149,7 @@ def create_flame_launcher_script(
         repository_root_dir,
         'pref',
         'session-preferences',
-        'current_session-flame_launcher.sh'
+        FLAME_LAUNCHER_SCRIPT_NAME
     )
 
     os.makedirs(
@@ -91,59 +157,31 @@ def create_flame_launcher_script(
         exist_ok=True
     )
 
-    src_launcher_template = (
-        "cfg/"
-        "site-cfg/"
-        "flame-cfg/"
-        "flame-templates/"
-        "flame-launcher-templates/"
-        "flame_launcher_template.sh"
+    replacements = get_flame_launcher_script_values(
+        logik_projekt_path=logik_projekt_path,
+        current_workstation=current_workstation,
+        current_os=current_os,
+        the_projekts_dir=the_projekts_dir,
+        the_projekt_flame_dirs=the_projekt_flame_dirs,
+        the_adsk_dir=the_adsk_dir,
+        the_adsk_dir_linux=the_adsk_dir_linux,
+        the_adsk_dir_macos=the_adsk_dir_macos,
+        logik_projekt_name=logik_projekt_name,
+        the_projekt_flame_name=the_projekt_flame_name,
+        flame_software_sanitized_version=flame_software_sanitized_version,
+        flame_software_choice=flame_software_choice,
+        flame_projekt_setups_dir=flame_projekt_setups_dir,
     )
 
-    with open(src_launcher_template, 'r') as f:
-        template_content = f.read()
-
-    app_starter = ""
-    software_choice_lower = flame_software_choice.lower()
-
-    # Initialize replacements with default values
-    replacements = {
-        "%%FLAME_STARTUP_SCRIPT_PY%%": (
-            "scripts/startup/flame_startup_script.py"
-        ),
-        "%%LAUNCHER_SCRIPT_PROJEKT%%": the_projekt_flame_name,
-        "%%SCRIPT_CREATION_DATE%%": datetime.datetime.now().strftime(
-            "%Y-%m-%d %H:%M:%S"
-        ),
-        "%%LOGIK_PROJEKT_PATH%%": logik_projekt_path,
-        "%%LOGIK_PROJEKT_NAME%%": logik_projekt_name,
-        "%%FLAME_PROJEKT_NAME%%": the_projekt_flame_name,
-        "%%CURRENT_WORKSTATION%%": current_workstation,
-        "%%FLAME_FIRST_RUN_NAME%%": "current_session-flame_launcher.log",
-        "%%FLAME_SOFTWARE_CHOICE%%": flame_software_choice,
-        "%%APPLICATION_STARTER%%": app_starter,  # Will be updated below
-        "%%FLAME_PROJEKT_SETUPS_DIR%%": flame_projekt_setups_dir,
-    }
-
-    if 'flame' in software_choice_lower:
-        app_starter = 'startFlame'
-    elif 'flare' in software_choice_lower:
-        app_starter = 'startFlare'
-    elif 'assist' in software_choice_lower:
-        app_starter = 'startFlameAssist'
-
-    # Update the app_starter in replacements after it's determined
-    replacements["%%APPLICATION_STARTER%%"] = app_starter
-
-    for placeholder, value in replacements.items():
-        template_content = (
-            template_content.replace(placeholder, str(value))
-        )
-
-    with open(tgt_launcher_script, 'w') as f:
-        f.write(template_content)
-
-    os.chmod(tgt_launcher_script, 0o755)
+    render_templates(
+        [
+            TemplateJob(
+                FLAME_LAUNCHER_TEMPLATE,
+                tgt_launcher_script,
+                replacements
+            )
+        ]
+    )
 
     logger.info(
         f"Successfully modified PROJEKT flame launcher: {tgt_launcher_script}"
@@ -214,3 +252,17 @@ def create_flame_launcher_script(
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Render the launcher with the shared single-pass template
+#               renderer. Fill the previously unset LAUNCHER_SCRIPT_NAME.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Split out the launcher template values of one workstation
+#               for the multi-workstation fan-out.
+# -------------------------------------------------------------------------- #
@@ -16,7 +16,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -28,9 +28,11 @@ import sys
 from pathlib import Path
 
 from src.core.utils.path_utils import get_repository_root_dir
+from src.core.utils.trace_utils import traced
 
 
 # Configure logging
+@traced()
 def create_flame_setup_dirs(setups_dir_path: str):
     """
     Creates a predefined set of subdirectories within the Flame project's
@@ -149,3 +151,7 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -16,7 +16,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -28,9 +28,12 @@ import sys
 from pathlib import Path
 
 from src.core.utils.path_utils import get_repository_root_dir
+from src.core.utils.flame_workspace_utils import write_flame_workspace_plan
+from src.core.utils.trace_utils import traced
 
 
 # Configure logging
+@traced()
 def create_flame_startup_script(
         flame_projekt_setups_dir: str,
         logik_projekt_config_workspace_path: str
@@ -39,6 +42,10 @@ def create_flame_startup_script(
     Creates a Flame startup script by combining a template with a 
     workspace layout.
 
+    The workspace layout is also compiled into 'flame-workspace-plan.json',
+    a flat list of operations that the startup script replays, so that no
+    template tree is walked while Flame is starting.
+
     Args:
         flame_projekt_setups_dir (str): The absolute path to the Flame 
         project's 'setups' directory.
@@ -73,6 +80,12 @@ def create_flame_startup_script(
             / 'startup'
             / 'flame-workspace.json'
         )
+        output_plan_path = (
+            Path(flame_projekt_setups_dir)
+            / 'scripts'
+            / 'startup'
+            / 'flame-workspace-plan.json'
+        )
 
         # Ensure the destination directory exists
         os.makedirs(output_script_dir, exist_ok=True)
@@ -92,6 +105,9 @@ def create_flame_startup_script(
         injected_script_content = script_template.replace(
             'workspace_file = "flame-workspace.json"',
             f'workspace_file = "{output_workspace_path}"'
+        ).replace(
+            'plan_file = "flame-workspace-plan.json"',
+            f'plan_file = "{output_plan_path}"'
         )
 
         # 3. Write the modified template content to flame_startup_script.py
@@ -119,6 +135,9 @@ def create_flame_startup_script(
                 f"Successfully created Flame workspace JSON at: "
                 f"{output_workspace_path}"
             )
+
+            # 5. Compile the workspace into the startup build plan
+            write_flame_workspace_plan(workspace_data, output_plan_path)
         except FileNotFoundError:
             logging.error(
                 f"Workspace JSON file not found at: "
@@ -200,3 +219,11 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Compile 'flame-workspace-plan.json' for the startup script.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
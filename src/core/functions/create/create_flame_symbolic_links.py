@@ -18,7 +18,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -27,6 +27,7 @@ import os
 import logging
 import time
 from src.core.utils import path_utils
+from src.core.utils.trace_utils import traced
 
 
 # Configure logging
@@ -35,6 +36,7 @@ logging.basicConfig(
 )
 
 
+@traced()
 def create_flame_symbolic_links(
     logik_projekt_path: str,
     flame_projekt_setups_dir: str,
@@ -369,3 +371,7 @@ def create_flame_symbolic_links(
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 # -------------------------------------------------------------------------- #
 # Filename:     create_flame_wiretap_node.py
-# Purpose:      Creates a Flame project node using wiretap_create_node.
-# Description:  This script executes a bash command to create a new Autodesk
-#               Flame project node via the Wiretap API, using a provided
-#               XML configuration.
+# Purpose:      Creates a Flame project node through a wiretap backend.
+# Description:  This script creates a new Autodesk Flame project node from
+#               a provided XML configuration, with wiretap_create_node by
+#               default or another backend of wiretap_utils.
 
 # Author:       phil_man@mac.com
 # Copyright:    Copyright (c) 2025
@@ -16,56 +16,39 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
-import subprocess
 import logging
+from src.core.utils.trace_utils import traced
+from src.core.utils.wiretap_utils import (
+    WiretapNode,
+    WiretapResult,
+    get_wiretap_backend,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def create_flame_wiretap_node(flame_projekt_name, projekt_xml_path):
-    """
-    Create the logik projekt flame project node using wiretap_create_node.
+@traced()
+def create_flame_wiretap_node(
+        flame_projekt_name,
+        projekt_xml_path,
+        backend=None
+) -> WiretapResult:
     """
-
-    bash_command = f"""
-
-    umask 0
-
-    /opt/Autodesk/wiretap/tools/current/wiretap_create_node \
-    -h 127.0.0.1:IFFFS \
-    -n /projects \
-    -t PROJECT \
-    -d "{flame_projekt_name}" \
-    -s XML \
-    -f "{projekt_xml_path}"
+    Create the logik projekt flame project node from the project XML,
+    through 'backend', default the wiretap backend of
+    LOGIK_PROJEKT_WIRETAP.
     """
 
-    logging.info(f"Running the following bash command:\n{bash_command}")
-
-    process = (
-        subprocess.Popen(
-            bash_command,
-            shell=True,
-            executable='/bin/bash',
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+    if backend is None:
+        backend = get_wiretap_backend()
+    return backend.create_node(
+        WiretapNode(flame_projekt_name, projekt_xml_path)
     )
-    stdout, stderr = process.communicate()
-
-    if stdout:
-        logging.info(
-            f"Command stdout:\n{stdout.decode()}"
-        )
-    if stderr:
-        logging.error(
-            f"Command stderr:\n{stderr.decode()}"
-        )
 
 
 # -------------------------------------------------------------------------- #
@@ -108,3 +91,12 @@ def create_flame_wiretap_node(flame_projekt_name, projekt_xml_path):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Moved the node creation behind the wiretap backends of
+#               wiretap_utils and returned its WiretapResult.
+# -------------------------------------------------------------------------- #
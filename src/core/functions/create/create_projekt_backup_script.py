@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -25,34 +25,24 @@ import stat
 import logging
 from datetime import datetime
 
+from src.core.utils.template_utils import (
+    TemplateJob,
+    render_templates,
+)
+from src.core.utils.trace_utils import traced
+
 logger = logging.getLogger(__name__)
 
 
-def create_projekt_backup_script(
+def get_projekt_backup_script_jobs(
         projekt_summary_data: dict,
         backup_template_path: str,
         backup_script_dir: str
-):
+) -> list:
     """
-    Creates a backup script and a crontab entry for a project.
-
-    Args:
-        projekt_summary_data (dict): Data for the project.
-        backup_template_path (str): Path to the backup script template.
-        backup_script_dir (str): Directory to save the generated scripts.
+    Returns the TemplateJobs of the backup script and its crontab script
+    for the workstation in 'projekt_summary_data'.
     """
-    logger.info(
-        f"Creating PROJEKT backup infrastructure for "
-        f"{projekt_summary_data['logik_projekt_name']} on "
-        f"{projekt_summary_data['current_workstation']}."
-    )
-
-    os.umask(0)
-
-    # Ensure the backup script directory exists
-    os.makedirs(backup_script_dir, exist_ok=True)
-
-    # --- Create Backup Script ---
     backup_script_name = (
         f"backup-"
         f"{projekt_summary_data['logik_projekt_name']}-"
@@ -63,9 +53,6 @@ def create_projekt_backup_script(
         backup_script_name
     )
 
-    with open(backup_template_path, 'r') as f:
-        template_content = f.read()
-
     script_creation_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     replacements = {
@@ -88,49 +75,7 @@ def create_projekt_backup_script(
         ),
     }
 
-    for placeholder, value in replacements.items():
-        template_content = template_content.replace(placeholder, str(value))
-
-    with open(tgt_projekt_backup_script, 'w') as f:
-        f.write(template_content)
-
-    os.chmod(tgt_projekt_backup_script, 0o755)
-
-    logger.info(
-        f"Successfully created PROJEKT backup script at: "
-        f"{tgt_projekt_backup_script}"
-    )
-
-    # --- Copy and rename the exclusion_list.txt template ---
-    exclusion_list_template_path = (
-        "cfg/"
-        "site-cfg/"
-        "logik-projekt-cfg/"
-        "logik-projekt-templates/"
-        "rsync-backup-templates/"
-        "exclusion_list.txt"
-    )
-    exclusion_list_output_name = (
-        f"backup-"
-        f"{projekt_summary_data['logik_projekt_name']}-"
-        f"{projekt_summary_data['current_workstation']}-exclusion_list.txt"
-    )
-    exclusion_list_output_path = os.path.join(
-        backup_script_dir,
-        exclusion_list_output_name
-    )
-
-    with open(exclusion_list_template_path, 'r') as f_src:
-        exclusion_list_content = f_src.read()
-
-    with open(exclusion_list_output_path, 'w') as f_dst:
-        f_dst.write(exclusion_list_content)
-
-    logger.info(
-        f"Exclusion list created at: {exclusion_list_output_path}"
-    )
-
-    # --- Create Crontab Script ---
+    # --- Crontab Script ---
     crontab_template_path = (
         "cfg/"
         "site-cfg/"
@@ -149,9 +94,6 @@ def create_projekt_backup_script(
         crontab_script_name
     )
 
-    with open(crontab_template_path, 'r') as f:
-        crontab_template_content = f.read()
-
     crontab_replacements = {
         "%%LOGIK_PROJEKT_NAME%%": projekt_summary_data['logik_projekt_name'],
         "%%FLAME_PROJEKT_NAME%%": projekt_summary_data['flame_projekt_name'],
@@ -162,21 +104,105 @@ def create_projekt_backup_script(
         "%%BACKUP_SCRIPT_NAME%%": backup_script_name,
     }
 
-    for placeholder, value in crontab_replacements.items():
-        crontab_template_content = crontab_template_content.replace(
-            placeholder,
-            str(value)
-        )
+    return [
+        TemplateJob(
+            backup_template_path,
+            tgt_projekt_backup_script,
+            replacements
+        ),
+        TemplateJob(
+            crontab_template_path,
+            tgt_projekt_crontab_script,
+            crontab_replacements
+        ),
+    ]
+
+
+def get_exclusion_list_paths(
+        projekt_summary_data: dict,
+        backup_script_dir: str
+) -> tuple:
+    """
+    Returns the exclusion list template and the path of its copy for the
+    workstation in 'projekt_summary_data'.
+    """
+    exclusion_list_template_path = (
+        "cfg/"
+        "site-cfg/"
+        "logik-projekt-cfg/"
+        "logik-projekt-templates/"
+        "rsync-backup-templates/"
+        "exclusion_list.txt"
+    )
+    exclusion_list_output_name = (
+        f"backup-"
+        f"{projekt_summary_data['logik_projekt_name']}-"
+        f"{projekt_summary_data['current_workstation']}-exclusion_list.txt"
+    )
+    return (
+        exclusion_list_template_path,
+        os.path.join(backup_script_dir, exclusion_list_output_name)
+    )
+
 
-    with open(tgt_projekt_crontab_script, 'w') as f:
-        f.write(crontab_template_content)
+@traced()
+def create_projekt_backup_script(
+        projekt_summary_data: dict,
+        backup_template_path: str,
+        backup_script_dir: str
+):
+    """
+    Creates a backup script and a crontab entry for a project.
 
-    os.chmod(tgt_projekt_crontab_script, 0o755)
+    Args:
+        projekt_summary_data (dict): Data for the project.
+        backup_template_path (str): Path to the backup script template.
+        backup_script_dir (str): Directory to save the generated scripts.
+    """
+    logger.info(
+        f"Creating PROJEKT backup infrastructure for "
+        f"{projekt_summary_data['logik_projekt_name']} on "
+        f"{projekt_summary_data['current_workstation']}."
+    )
+
+    os.umask(0)
+
+    # Ensure the backup script directory exists
+    os.makedirs(backup_script_dir, exist_ok=True)
+
+    # --- Render the backup and crontab scripts in one batch ---
+    backup_jobs = get_projekt_backup_script_jobs(
+        projekt_summary_data,
+        backup_template_path,
+        backup_script_dir
+    )
+    render_templates(backup_jobs)
 
     logger.info(
-        f"Backup crontab script created at: {tgt_projekt_crontab_script}"
+        f"Successfully created PROJEKT backup script at: "
+        f"{backup_jobs[0].output_path}"
+    )
+
+    # --- Copy and rename the exclusion_list.txt template ---
+    (exclusion_list_template_path,
+     exclusion_list_output_path) = get_exclusion_list_paths(
+        projekt_summary_data,
+        backup_script_dir
     )
 
+    with open(exclusion_list_template_path, 'r') as f_src:
+        exclusion_list_content = f_src.read()
+
+    with open(exclusion_list_output_path, 'w') as f_dst:
+        f_dst.write(exclusion_list_content)
+
+    logger.info(
+        f"Exclusion list created at: {exclusion_list_output_path}"
+    )
+
+    logger.info(
+        f"Backup crontab script created at: {backup_jobs[1].output_path}"
+    )
 
 # -------------------------------------------------------------------------- #
 
@@ -218,3 +244,17 @@ def create_projekt_backup_script(
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Render the backup and crontab scripts in one batch with
+#               the shared single-pass template renderer.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Split out the template jobs and exclusion list paths of one
+#               workstation for the multi-workstation fan-out.
+# -------------------------------------------------------------------------- #
@@ -16,7 +16,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -25,8 +25,10 @@ import json
 import os
 import logging
 import sys
+from src.core.utils.trace_utils import trace_span, traced
 
 
+@traced()
 def create_projekt_filesystem_dirs(
         json_filepath: str,
         target_root_dir: str,
@@ -96,19 +98,25 @@ def create_projekt_filesystem_dirs(
         return
 
     logging.info(f"Recreating directory tree in: {final_target_dir}")
-    created_count = 0
-    for entry in subdirectories:
-        relative_path = entry.get('path')
-        if relative_path:
-            full_path = os.path.join(final_target_dir, relative_path)
-            try:
-                os.makedirs(full_path, exist_ok=True)
-                logging.info(f"Created: {full_path}")
-                created_count += 1
-            except OSError as e:
-                logging.error(f"Error creating directory {full_path}: {e}")
-        else:
-            logging.warning(f"Skipping entry with no 'path' key: {entry}")
+    with trace_span("makedirs", root=final_target_dir) as span:
+        created_count = 0
+        for entry in subdirectories:
+            relative_path = entry.get('path')
+            if relative_path:
+                full_path = os.path.join(final_target_dir, relative_path)
+                try:
+                    os.makedirs(full_path, exist_ok=True)
+                    logging.info(f"Created: {full_path}")
+                    created_count += 1
+                except OSError as e:
+                    logging.error(
+                        f"Error creating directory {full_path}: {e}"
+                    )
+            else:
+                logging.warning(
+                    f"Skipping entry with no 'path' key: {entry}"
+                )
+        span.set(count=created_count)
 
     logging.info(f"Successfully created {created_count} directories.")
 
@@ -171,3 +179,7 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Development
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -24,6 +24,7 @@ import os
 import logging
 import sys
 from pathlib import Path
+from src.core.utils.trace_utils import traced
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +33,7 @@ logging.basicConfig(
 )
 
 
+@traced()
 def create_projekt_launcher_alias(alias_name: str, launcher_script_path: str):
     """
     Creates a shell alias for launching the Flame project.
@@ -170,3 +172,7 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 # -------------------------------------------------------------------------- #
 # Filename:     create_projekt_pgsql_db.py
-# Purpose:      Initializes a PostgreSQL database for the project.
-# Description:  This script provides a placeholder for creating or connecting
-#               to a PostgreSQL database for project-specific data storage.
+# Purpose:      Records the project in the projekt catalog.
+# Description:  Inserts the ProjektParameters, step timings and artifacts
+#               of a creation into the projekt catalog, a SQLite database
+#               by default or PostgreSQL when configured.
 
 # Author:       phil_man@mac.com
 # Copyright:    Copyright (c) 2025
@@ -12,17 +13,23 @@
 #               https://www.gnu.org/licenses/gpl-3.0.en.html
 
 # Version:      2026.2.0
-# Status:       Development
+# Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
-import os
-import logging
 import sys
+import json
+import logging
+
+from src.core.utils.trace_utils import traced
+from src.core.utils.projekt_catalog_utils import (
+    get_projekt_catalog,
+    make_catalog_entry,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -30,102 +37,62 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s')
 
 
+@traced()
 def create_projekt_pgsql_db(
-        logik_projekt_name: str,
-        logik_projekt_path: str
+        projekt_parameters: dict,
+        step_timings: list = None,
+        artifacts: list = None
     ):
     """
-    Initializes a PostgreSQL database for the project.
+    Records a created projekt in the projekt catalog.
+
+    The catalog is a local SQLite database unless LOGIK_PROJEKT_CATALOG
+    names another path or a postgresql:// DSN. A catalog that cannot be
+    written is logged and does not stop the creation.
 
     Args:
-        logik_projekt_name (str): The name of the project, to be used as 
-        the database name.
-        logik_projekt_path (str): The path to the LOGIK-PROJEKT directory 
-        where the DB data could be stored.
+        projekt_parameters (dict): The ProjektParameters of the creation.
+        step_timings (list): The creation steps timed so far, as dicts
+        with 'number', 'title', 'seconds' and 'error'.
+        artifacts (list): (kind, path) pairs of what the creation made.
     """
+    logik_projekt_name = projekt_parameters.get("logik_projekt_name", "")
+    try:
+        catalog = get_projekt_catalog()
+        catalog.record(
+            [
+                make_catalog_entry(
+                    projekt_parameters,
+                    steps=step_timings or [],
+                    artifacts=artifacts or []
+                )
+            ]
+        )
+    except Exception as e:
+        logging.error(
+            f"Could not record '{logik_projekt_name}' "
+            f"in the projekt catalog: {e}"
+        )
+        return
     logging.info(
-        f"""Attempting to create PostgreSQL database
-        for project '{logik_projekt_name}'...""")
-
-    # This is a placeholder for the database creation logic.
-    # PostgreSQL typically runs as a system-wide service, and creating 
-    # a new database
-    # requires connecting to that service with appropriate credentials.
-    # An alternative for a self-contained project is to initialize 
-    # a new database cluster
-    # within the project path, but this is less common and more complex.
-
-    # --- Example 1: Connecting to an existing PostgreSQL service (most common) ---
-    # import psycopg2
-    # from psycopg2 import sql
-    # from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-
-    # try:
-    #     # IMPORTANT: Connection details should be securely managed, not hardcoded.
-    #     conn = psycopg2.connect(
-    #         dbname="postgres",  # Connect to the default 'postgres' db to create a new one
-    #         user="your_db_user",
-    #         password="your_db_password",
-    #         host="localhost",
-    #         port="5432"
-    #     )
-    #     conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-    #     cursor = conn.cursor()
-    #
-    #     # Use sql.Identifier to safely quote the new database name
-    #     db_name = sql.Identifier(logik_projekt_name.lower()) # PGSQL names are often lowercased
-    #     cursor.execute(sql.SQL("CREATE DATABASE {}").format(db_name))
-    #
-    #     logging.info(f"Successfully created database: {logik_projekt_name}")
-    #
-    # except psycopg2.errors.DuplicateDatabase:
-    #     logging.warning(f"Database '{logik_projekt_name}' already exists. Skipping creation.")
-    # except psycopg2.OperationalError as e:
-    #     logging.error(f"Could not connect to PostgreSQL. Please ensure the service is running and credentials are correct. Error: {e}")
-    # except Exception as e:
-    #     logging.error(f"An unexpected error occurred during database creation: {e}")
-    # finally:
-    #     if 'conn' in locals() and conn:
-    #         conn.close()
-
-    # --- Example 2: Initializing a new DB cluster in the project path (advanced) ---
-    # import subprocess
-    #
-    # db_data_path = os.path.join(logik_projekt_path, 'db_data')
-    # if not os.path.exists(db_data_path):
-    #     try:
-    #         os.makedirs(db_data_path)
-    #         # The 'initdb' command must be in the system's PATH.
-    #         subprocess.run(['initdb', '-D', db_data_path], check=True, capture_output=True, text=True)
-    #         logging.info(f"Successfully initialized new PostgreSQL cluster at: {db_data_path}")
-    #     except FileNotFoundError:
-    #         logging.error("'initdb' command not found. Is PostgreSQL installed and in your PATH?")
-    #     except subprocess.CalledProcessError as e:
-    #         logging.error(f"Failed to initialize database cluster. Error: {e.stderr}")
-    #     except Exception as e:
-    #         logging.error(f"An unexpected error occurred: {e}")
-    # else:
-    #     logging.warning(f"Database cluster path already exists: {db_data_path}. Skipping initialization.")
-
-    logging.info(
-        "Database creation step is currently a placeholder "
-        "and has been skipped."
+        f"Recorded '{logik_projekt_name}' in the projekt catalog "
+        f"{catalog.location}"
     )
 
 
 if __name__ == "__main__":
-    # Example usage for direct script execution and testing
-    if len(sys.argv) != 3:
+    # Records a projekt from its session variables file.
+    if len(sys.argv) != 2:
         print(
             "Usage: python create_projekt_pgsql_db.py "
-            "<logik_projekt_name> <logik_projekt_path>"
+            "<current_session-variables.json>"
         )
         sys.exit(1)
 
-    projekt_name = sys.argv[1]
-    projekt_path = sys.argv[2]
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        session_variables = json.load(f)
 
-    create_projekt_pgsql_db(projekt_name, projekt_path)
+    create_projekt_pgsql_db(session_variables)
 
 
 # -------------------------------------------------------------------------- #
@@ -168,3 +135,12 @@ if __name__ == "__main__":
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Replaced the placeholder with an insert into the projekt
+#               catalog.
+# -------------------------------------------------------------------------- #
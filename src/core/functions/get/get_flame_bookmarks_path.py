@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -29,10 +29,12 @@ from src.core.functions.get.get_application_paths import (
     GetApplicationPaths
 )
 from src.core.utils.path_utils import get_repository_root_dir
+from src.core.utils.trace_utils import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced()
 def get_flame_bookmarks_path(logik_projekt_config_name: str) -> str:
     """
     Retrieves the path to the Flame bookmarks JSON file based on the
@@ -142,3 +144,7 @@ def get_flame_bookmarks_path(logik_projekt_config_name: str) -> str:
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
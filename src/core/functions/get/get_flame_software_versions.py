@@ -15,14 +15,16 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
 from src.core.utils.flame_software_utils import get_installed_flame_versions
+from src.core.utils.trace_utils import traced
 
 
+@traced()
 def get_flame_software_versions() -> list[str]:
     """Load available Flame software versions."""
     return get_installed_flame_versions()
@@ -68,3 +70,7 @@ def get_flame_software_versions() -> list[str]:
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,15 +15,17 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
 from src.core.functions.get.get_json_data import get_json_data
 from src.core.functions.get.get_application_paths import GetApplicationPaths
+from src.core.utils.trace_utils import traced
 
 
+@traced()
 def get_frame_rate_values() -> list[str]:
     return get_json_data(
         GetApplicationPaths.FRAME_RATE_LIST_VALUES,
@@ -71,3 +73,7 @@ def get_frame_rate_values() -> list[str]:
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,14 +15,16 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
 import json
+from src.core.utils.trace_utils import traced
 
 
+@traced()
 def get_json_data(file_path: str, key: str = None):
     try:
         with open(file_path, 'r') as f:
@@ -81,3 +83,7 @@ def get_json_data(file_path: str, key: str = None):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,14 +15,16 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
 from src.core.utils import logik_projekt_utils
+from src.core.utils.trace_utils import traced
 
 
+@traced()
 def get_logik_projekt_config_values() -> list[dict]:
     """
     Load LOGIK-PROJEKT configuration values.
@@ -77,3 +79,7 @@ def get_logik_projekt_config_values() -> list[dict]:
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,14 +15,16 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
 from src.core.utils import ocio_utils
+from src.core.utils.trace_utils import traced
 
 
+@traced()
 def get_ocio_config_values() -> list[tuple[str, str]]:
     try:
         return ocio_utils.GetOCIOConfigs()
@@ -73,3 +75,7 @@ def get_ocio_config_values() -> list[tuple[str, str]]:
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -17,7 +17,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-19
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -26,10 +26,9 @@ from src.core.template_manager.template_models import (
     TemplateInfo,
     TemplateParameters,
 )
-from src.core.utils.system_info_utils import (
-    get_current_user,
-    get_primary_group,
-    get_short_hostname,
+from src.core.utils.system_snapshot_utils import (
+    DEFAULT_SNAPSHOT_WAIT_TIMEOUT,
+    get_system_snapshot,
 )
 from src.core.utils.flame_software_utils import (
     get_installed_flame_versions,
@@ -37,8 +36,26 @@ from src.core.utils.flame_software_utils import (
     sanitize_flame_version_number,
 )
 from src.core.utils import ocio_utils
+from src.core.utils.trace_utils import traced
 
 
+def get_flame_projekt_name(
+    logik_projekt_name: str,
+    flame_software_sanitized_version: str,
+    workstation: str,
+) -> str:
+    """
+    Returns the name of the Flame projekt of a LOGIK-PROJEKT on one
+    workstation, e.g. 'job_20262_ws1'.
+    """
+    return (
+        f"{logik_projekt_name}_"
+        f"{flame_software_sanitized_version}_"
+        f"{workstation}"
+    )
+
+
+@traced()
 def get_projekt_summary_data(
     template_info: TemplateInfo,
     template_parameters: TemplateParameters,
@@ -56,9 +73,18 @@ def get_projekt_summary_data(
         Dictionary containing all project summary data
     """
     # Environment Data
-    current_user = get_current_user()["username"]
-    current_group = get_primary_group()
-    current_workstation = get_short_hostname()
+    # Bounded, so a hung probe cannot block the UI refresh
+    system_snapshot = get_system_snapshot(
+        timeout=DEFAULT_SNAPSHOT_WAIT_TIMEOUT
+    )
+    current_user = system_snapshot.username
+    current_group = system_snapshot.primary_group
+    current_workstation = system_snapshot.short_hostname
+    if not current_workstation:
+        raise RuntimeError(
+            "Could not determine the hostname of this workstation for the "
+            "Flame projekt name."
+        )
     current_os = "linux"  # Placeholder for actual OS detection
 
     # Flame Software Data
@@ -86,10 +112,10 @@ def get_projekt_summary_data(
     )
 
     # Flame Projekt Data
-    flame_projekt_name = (
-        f"{template_info.template_calculated_name}_"
-        f"{flame_software_sanitized_version}_"
-        f"{current_workstation}"
+    flame_projekt_name = get_flame_projekt_name(
+        template_info.template_calculated_name,
+        flame_software_sanitized_version,
+        current_workstation,
     )
     flame_projekt_nickname = template_info.template_calculated_name
     flame_projekt_shotgun_name = template_info.template_calculated_name
@@ -285,3 +311,22 @@ def get_projekt_summary_data(
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Read user, group and workstation from the cached
+#               SystemSnapshot instead of probing on every refresh.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Moved the Flame projekt name into get_flame_projekt_name,
+#               which the workstation fan-out shares.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Waits a bounded time for the system snapshot and refuses an
+#               empty workstation name.
+# -------------------------------------------------------------------------- #
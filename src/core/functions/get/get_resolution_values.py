@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -23,8 +23,10 @@
 import json
 import os
 from src.core.functions.get.get_application_paths import GetApplicationPaths
+from src.core.utils.trace_utils import traced
 
 
+@traced()
 def get_resolution_values() -> list[dict]:
     resolution_path = GetApplicationPaths.RESOLUTION_PATH
     load_order_file = GetApplicationPaths.RESOLUTION_LOAD_ORDER_FILE
@@ -114,3 +116,7 @@ def get_resolution_values() -> list[dict]:
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -23,8 +23,10 @@
 import json
 import os
 from src.core.utils import ocio_utils
+from src.core.utils.trace_utils import traced
 
 
+@traced()
 def export_logik_projekt_template(
     template_info_data: dict,
     template_params_data: dict,
@@ -185,3 +187,7 @@ def export_logik_projekt_template(
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
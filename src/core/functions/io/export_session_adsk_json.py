@@ -16,7 +16,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -24,6 +24,7 @@
 import json
 import os
 import logging
+from src.core.utils.trace_utils import traced
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +32,7 @@ logging.basicConfig(
 )
 
 
+@traced()
 def export_session_adsk_json(projekt_summary_data: dict):
     """
     Exports a JSON file with a subset of the project data
@@ -175,3 +177,7 @@ def export_session_adsk_json(projekt_summary_data: dict):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -15,24 +15,82 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
 import xml.etree.ElementTree as ET
+import copy
 import os
 import logging
 from src.core.functions.get.get_application_paths import GetApplicationPaths
+from src.core.utils.template_utils import (
+    compile_template,
+    get_key_pattern,
+)
+from src.core.utils.trace_utils import traced
 
 logger = logging.getLogger(__name__)
 
+# Compiled XML templates by (absolute path, placeholder keys), with the
+# mtime they were compiled from.
+_xml_template_cache = {}
+
+
+@traced()
+def compile_xml_template(template_path: str, keys) -> tuple:
+    """
+    Parses an XML template and compiles the text of every element below
+    the root against the placeholder 'keys', once per path, mtime and
+    key set.
 
+    Returns:
+        tuple: (root element, [(element index, CompiledTemplate), ...]),
+        with element indexes in 'root.iter()' order.
+    """
+    path = os.path.abspath(template_path)
+    mtime = os.stat(path).st_mtime_ns
+    cache_key = (path, frozenset(keys))
+
+    cached = _xml_template_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    root = ET.parse(path).getroot()
+    key_pattern = get_key_pattern(cache_key[1])
+    text_templates = []
+
+    for index, element in enumerate(root.iter()):
+        if index == 0 or not element.text:
+            continue
+        compiled_template = compile_template(
+            element.text,
+            pattern=key_pattern,
+            source=f"{template_path} <{element.tag}>"
+        )
+        if compiled_template.placeholders:
+            text_templates.append((index, compiled_template))
+        elif len(element) == 0 and element.text.strip():
+            logger.warning(
+                f"No placeholder in <{element.tag}> of XML template "
+                f"{template_path}: '{element.text.strip()}'"
+            )
+
+    compiled = (root, text_templates)
+    _xml_template_cache[cache_key] = (mtime, compiled)
+    return compiled
+
+
+@traced()
 def export_session_xml(data: dict, template_path: str, output_path: str):
     """
     Processes an XML template, replacing placeholders with values from
     a dictionary, and writes the result to an output XML file.
 
+    Every key of 'data' is a placeholder. Longer keys win over their
+    prefixes and each text node is filled in a single pass.
+
     Args:
         data (dict): The dictionary containing data to populate the template.
         template_path (str): The absolute path to the XML template file.
@@ -40,29 +98,22 @@ def export_session_xml(data: dict, template_path: str, output_path: str):
         will be saved.
     """
     try:
-        tree = ET.parse(GetApplicationPaths.WIRETAP_XML_TEMPLATE)
-        root = tree.getroot()
-
-        def replace_placeholders(element, data_dict):
-            # Sort keys by length in descending order to avoid
-            # partial replacements
-            sorted_keys = sorted(data_dict.keys(), key=len, reverse=True)
-            for child in element:
-                if child.text:
-                    for key in sorted_keys:
-                        value = data_dict[key]
-                        placeholder = f"{key}"
-                        if placeholder in child.text:
-                            child.text = child.text.replace(
-                                placeholder,
-                                str(value)
-                            )
-                replace_placeholders(child, data_dict)
-
-        replace_placeholders(root, data)
+        template_root, text_templates = compile_xml_template(
+            GetApplicationPaths.WIRETAP_XML_TEMPLATE,
+            data
+        )
+
+        root = copy.deepcopy(template_root)
+        elements = list(root.iter())
+        for index, compiled_template in text_templates:
+            elements[index].text = compiled_template.render(data)
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        tree.write(output_path, encoding="utf-8", xml_declaration=True)
+        ET.ElementTree(root).write(
+            output_path,
+            encoding="utf-8",
+            xml_declaration=True
+        )
         logging.info(
             f"XML generated successfully from template "
             f"and saved to {output_path}")
@@ -72,7 +123,6 @@ def export_session_xml(data: dict, template_path: str, output_path: str):
     except Exception as e:
         logging.error(f"Error processing XML template: {e}")
 
-
 # -------------------------------------------------------------------------- #
 
 # DISCLAIMER:   This file is part of LOGIK-PROJEKT.
@@ -113,3 +163,12 @@ def export_session_xml(data: dict, template_path: str, output_path: str):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Compile the XML template once per key set and fill each
+#               text node in a single pass.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
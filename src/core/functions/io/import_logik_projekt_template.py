@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -28,8 +28,10 @@ from src.core.template_manager.template_models import (
 from src.core.functions.io.export_logik_projekt_template import (
     export_logik_projekt_template
 )
+from src.core.utils.trace_utils import traced
 
 
+@traced()
 def import_logik_projekt_template(
     file_path: str,
 ) -> tuple[TemplateInfo, TemplateParameters, str]:
@@ -208,3 +210,7 @@ def import_logik_projekt_template(
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every call with the 'traced' decorator.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     projekt_artifacts.py
+# Purpose:      List what the creation steps make for one workstation.
+# Description:  The symbolic links and generated scripts of a projekt, as
+#               the projekt doctor checks them and the projekt catalog
+#               records them.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Module
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import json
+import hashlib
+from dataclasses import dataclass
+
+from src.core.utils import path_utils
+from src.core.projekt_manager.projekt_models import ProjektParameters
+
+# The links create_flame_symbolic_links makes in the setups directory, by
+# link name and source relative to the repository root.
+FLAME_SYMBOLIC_LINKS = {
+    "logik_scripts": "scripts",
+    "logik_presets": "cfg/site-cfg/flame-cfg/flame-presets",
+    "logik_templates": "cfg/site-cfg/flame-cfg/flame-templates",
+}
+
+# Records the template hash of each generated script, by generator, in the
+# logs directory of its workstation.
+SCRIPT_TEMPLATES_FILENAME = "script_templates.json"
+
+# Template hashes by absolute path, with the mtime and size they were read
+# at. Hundreds of projekts share a handful of templates.
+_template_hash_cache = {}
+
+
+@dataclass
+class ScriptSpec:
+    """A generated script, the template it comes from and its generator."""
+    path: str
+    template_path: str
+    generator: str
+    executable: bool = True
+
+
+def resolve_repository_path(path: str) -> str:
+    """Resolves a path of the session variables against the repository."""
+    return os.path.join(path_utils.get_repository_root_dir(), path)
+
+
+def get_symbolic_links(config: ProjektParameters) -> list:
+    """
+    Lists the links create_flame_symbolic_links makes for one workstation
+    as (link path, source path) pairs.
+    """
+    repository_root_dir = str(path_utils.get_repository_root_dir())
+    setups_dir = config.flame_projekt_setups_dir
+    links = [
+        (
+            os.path.join(setups_dir, link_name),
+            os.path.join(repository_root_dir, source_relative)
+        )
+        for link_name, source_relative in FLAME_SYMBOLIC_LINKS.items()
+    ]
+    links.append(
+        (
+            os.path.join(setups_dir, "batch", "flame", "iterations"),
+            os.path.join(config.logik_projekt_path, "flame", "iterations")
+        )
+    )
+    links.append(
+        (
+            os.path.join(
+                config.logik_projekt_path,
+                "flame",
+                "setups",
+                config.current_workstation,
+                "setups"
+            ),
+            setups_dir
+        )
+    )
+    return links
+
+
+def get_script_specs(config: ProjektParameters) -> list:
+    """Lists the scripts the creation steps generate for one workstation."""
+    name = config.logik_projekt_name
+    workstation = config.current_workstation
+    archive_scripts_dir = os.path.join(
+        config.logik_projekt_path,
+        "flame",
+        "archive",
+        "scripts"
+    )
+    backup_scripts_dir = os.path.join(
+        config.logik_projekt_path,
+        "backup",
+        "backup-scripts",
+        workstation
+    )
+    startup_dir = os.path.join(
+        config.flame_projekt_setups_dir,
+        "scripts",
+        "startup"
+    )
+    flame_templates_dir = resolve_repository_path(
+        "cfg/site-cfg/flame-cfg/flame-templates"
+    )
+    backup_templates_dir = resolve_repository_path(
+        "cfg/site-cfg/logik-projekt-cfg/logik-projekt-templates/"
+        "rsync-backup-templates"
+    )
+    return [
+        ScriptSpec(
+            os.path.join(
+                archive_scripts_dir,
+                f"archive_script-{name}-{workstation}.sh"
+            ),
+            os.path.join(
+                flame_templates_dir,
+                "flame-archive-templates",
+                "archive_script_template"
+            ),
+            "create_archive_script",
+        ),
+        ScriptSpec(
+            os.path.join(
+                backup_scripts_dir,
+                f"backup-{name}-{workstation}.sh"
+            ),
+            os.path.join(backup_templates_dir, "backup_template"),
+            "create_backup_script",
+        ),
+        ScriptSpec(
+            os.path.join(startup_dir, "flame_startup_script.py"),
+            resolve_repository_path(
+                "cfg/site-cfg/flame-cfg/flame-scripts/"
+                "flame-startup-scripts/flame_startup_script_template.py"
+            ),
+            "create_startup_script",
+            executable=False,
+        ),
+        ScriptSpec(
+            os.path.join(startup_dir, "flame_launcher_script.sh"),
+            os.path.join(
+                flame_templates_dir,
+                "flame-launcher-templates",
+                "flame_launcher_template.sh"
+            ),
+            "create_launcher_script",
+        ),
+    ]
+
+
+def get_template_hash(template_path: str) -> str:
+    """Returns the SHA-256 of a template file, read once per change."""
+    path = os.path.abspath(template_path)
+    template_stat = os.stat(path)
+    state = (template_stat.st_mtime_ns, template_stat.st_size)
+    cached = _template_hash_cache.get(path)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+    with open(path, 'rb') as f:
+        template_hash = hashlib.sha256(f.read()).hexdigest()
+    _template_hash_cache[path] = (state, template_hash)
+    return template_hash
+
+
+def get_script_templates_path(config: ProjektParameters) -> str:
+    """Returns the template record of the scripts of one workstation."""
+    return os.path.join(
+        config.logik_projekt_path,
+        "logs",
+        config.current_workstation,
+        SCRIPT_TEMPLATES_FILENAME
+    )
+
+
+def load_script_templates(config: ProjektParameters) -> dict:
+    """
+    Returns the template hash each script of one workstation was generated
+    from, by generator. Scripts generated before the record existed have
+    no entry.
+    """
+    try:
+        with open(get_script_templates_path(config), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_script_templates(config: ProjektParameters, generators) -> dict:
+    """
+    Returns the template record of one workstation with the current
+    template hashes of 'generators' merged in.
+    """
+    script_templates = load_script_templates(config)
+    for spec in get_script_specs(config):
+        if spec.generator in generators:
+            script_templates[spec.generator] = get_template_hash(
+                spec.template_path
+            )
+    return script_templates
+
+
+def record_script_templates(config: ProjektParameters, generators):
+    """
+    Records the current template hashes of the scripts 'generators' just
+    wrote, so that the projekt doctor can tell when a template changed.
+    """
+    script_templates_path = get_script_templates_path(config)
+    script_templates = get_script_templates(config, generators)
+    os.makedirs(os.path.dirname(script_templates_path), exist_ok=True)
+    temp_path = f"{script_templates_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(script_templates, f, indent=4, sort_keys=True)
+    os.replace(temp_path, script_templates_path)
+
+
+def list_projekt_artifacts(config: ProjektParameters) -> list:
+    """
+    Lists what the creation steps make for one workstation as
+    (kind, path) pairs: the projekt and Flame setups directories, the
+    generated scripts and the symbolic links.
+    """
+    artifacts = [
+        ("projekt_dir", config.logik_projekt_path),
+        ("flame_setups_dir", config.flame_projekt_setups_dir),
+    ]
+    artifacts += [("script", spec.path) for spec in get_script_specs(config)]
+    artifacts += [
+        ("symbolic_link", link_path)
+        for link_path, _ in get_symbolic_links(config)
+    ]
+    return artifacts
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Moved the links and scripts lists out of the projekt doctor
+#               and added list_projekt_artifacts for the projekt catalog.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Record the template hash of each generated script.
+# -------------------------------------------------------------------------- #
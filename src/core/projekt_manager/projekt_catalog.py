@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     projekt_catalog.py
+# Purpose:      Fill and query the projekt catalog from the command line.
+# Description:  'backfill' imports projekts created before the catalog, or
+#               on another site, from the session variables each
+#               workstation left in '<projekt>/logs/<workstation>'. The
+#               projekts are read in parallel and written in batches, one
+#               transaction per batch. 'list' and 'show' are indexed
+#               lookups in the catalog.
+#
+#               python -m src.core.projekt_manager.projekt_catalog \
+#                   backfill /PROJEKTS
+#               python -m src.core.projekt_manager.projekt_catalog \
+#                   list --workstation <workstation>
+#               python -m src.core.projekt_manager.projekt_catalog \
+#                   show /PROJEKTS/<projekt>
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Module
+# Created:      2026-10-18
+# Modified:     2026-10-18
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import sys
+import json
+import logging
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.utils.trace_utils import traced
+from src.core.utils.projekt_catalog_utils import (
+    SOURCE_BACKFILL,
+    get_projekt_catalog,
+    make_catalog_entry,
+)
+from src.core.projekt_manager.projekt_artifacts import list_projekt_artifacts
+from src.core.projekt_manager.projekt_doctor import (
+    find_projekts,
+    find_session_variables,
+    load_projekt_config,
+)
+
+logger = logging.getLogger(__name__)
+
+# Entries written per transaction by a backfill.
+BACKFILL_BATCH_SIZE = 200
+
+
+def read_projekt_entries(projekt_path: str) -> list:
+    """
+    Builds the catalog entries of one existing projekt, one per
+    workstation session variables file.
+    """
+    entries = []
+    for variables_path in find_session_variables(projekt_path):
+        try:
+            config = load_projekt_config(variables_path)
+            recorded_at = os.stat(variables_path).st_mtime
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Skipping {variables_path}: {e}")
+            continue
+        workstation = (
+            config.current_workstation or
+            os.path.basename(os.path.dirname(variables_path))
+        )
+        entries.append(
+            make_catalog_entry(
+                config.__dict__,
+                artifacts=list_projekt_artifacts(config),
+                source=SOURCE_BACKFILL,
+                recorded_at=recorded_at,
+                projekt_path=projekt_path,
+                workstation=workstation
+            )
+        )
+    return entries
+
+
+@traced()
+def backfill_catalog(paths, jobs: int = None, catalog=None) -> int:
+    """
+    Imports every projekt found in 'paths' into the catalog.
+
+    Returns:
+        int: The number of entries written.
+    """
+    if catalog is None:
+        catalog = get_projekt_catalog()
+    projekt_paths = find_projekts(paths)
+    if jobs is None:
+        jobs = min(32, (os.cpu_count() or 1) * 4)
+    recorded = 0
+    batch = []
+    with ThreadPoolExecutor(
+            max_workers=max(1, jobs),
+            thread_name_prefix="projekt_catalog"
+    ) as executor:
+        for entries in executor.map(read_projekt_entries, projekt_paths):
+            batch.extend(entries)
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                catalog.record(batch)
+                recorded += len(batch)
+                batch = []
+    catalog.record(batch)
+    recorded += len(batch)
+    logger.info(
+        f"Backfilled {recorded} sessions of {len(projekt_paths)} projekts "
+        f"into {catalog.location}"
+    )
+    return recorded
+
+
+def format_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def print_projekts(projekts: list):
+    for projekt in projekts:
+        workstations = ", ".join(
+            session["workstation"] for session in projekt["sessions"]
+        )
+        print(
+            f"{projekt['projekt_name']:<32} "
+            f"{format_time(projekt['updated_at'])}  "
+            f"{projekt['projekt_path']}  [{workstations}]"
+        )
+
+
+def print_projekt(projekt: dict):
+    print(f"{projekt['projekt_name']}  {projekt['projekt_path']}")
+    print(f"    Flame projekt: {projekt['flame_projekt_name']}")
+    print(f"    Created:       {format_time(projekt['created_at'])}")
+    print(f"    Updated:       {format_time(projekt['updated_at'])}")
+    for session in projekt["sessions"]:
+        print(
+            f"    {session['workstation']}: {session['user_name']}, "
+            f"Flame {session['flame_version']}, {session['resolution']} "
+            f"@ {session['frame_rate']}, {session['source']} "
+            f"{format_time(session['recorded_at'])}"
+        )
+        for step in session["steps"]:
+            error = f"  {step['error']}" if step["error"] else ""
+            print(
+                f"        step {step['number']:02} {step['title']:<40} "
+                f"{step['seconds']:8.3f} s{error}"
+            )
+        missing = [
+            artifact["path"] for artifact in session["artifacts"]
+            if not artifact["present"]
+        ]
+        print(
+            f"        {len(session['artifacts'])} artifacts, "
+            f"{len(missing)} missing when recorded"
+        )
+        for path in missing:
+            print(f"            missing: {path}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fill and query the projekt catalog."
+    )
+    parser.add_argument(
+        "--catalog",
+        default=None,
+        help="catalog path or postgresql:// DSN"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    backfill_parser = commands.add_parser(
+        "backfill",
+        help="import existing projekts; each path is a projekt or a "
+             "directory of projekts"
+    )
+    backfill_parser.add_argument("paths", nargs="+")
+    backfill_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="projekts read in parallel"
+    )
+
+    list_parser = commands.add_parser("list", help="list projekts")
+    list_parser.add_argument(
+        "--name",
+        default=None,
+        help="projekt name, '*' matches anything"
+    )
+    list_parser.add_argument("--workstation", default=None)
+    list_parser.add_argument("--flame-version", default=None)
+    list_parser.add_argument("--limit", type=int, default=None)
+    list_parser.add_argument("--json", action="store_true")
+
+    show_parser = commands.add_parser("show", help="show one projekt")
+    show_parser.add_argument("projekt_path")
+    show_parser.add_argument("--json", action="store_true")
+
+    arguments = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    catalog = get_projekt_catalog(arguments.catalog)
+
+    if arguments.command == "backfill":
+        backfill_catalog(arguments.paths, arguments.jobs, catalog)
+        return 0
+
+    if arguments.command == "list":
+        projekts = catalog.find_projekts(
+            name=arguments.name,
+            workstation=arguments.workstation,
+            flame_version=arguments.flame_version,
+            limit=arguments.limit
+        )
+        if arguments.json:
+            print(json.dumps(projekts, indent=4))
+        else:
+            print_projekts(projekts)
+        return 0
+
+    projekt = catalog.get_projekt(arguments.projekt_path)
+    if projekt is None:
+        logger.error(f"Not in the catalog: {arguments.projekt_path}")
+        return 1
+    if arguments.json:
+        print(json.dumps(projekt, indent=4))
+    else:
+        print_projekt(projekt)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the projekt catalog backfill, list and show commands.
+# -------------------------------------------------------------------------- #
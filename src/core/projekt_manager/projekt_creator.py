@@ -17,14 +17,15 @@
 # Status:       Production
 # Type:         Module
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-19
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
 
 import os
+import time
 import logging
-import subprocess
+from contextlib import contextmanager
 
 from src.core.utils import (
     path_utils
@@ -32,6 +33,10 @@ from src.core.utils import (
 from src.core.projekt_manager.projekt_models import (
     ProjektParameters
 )
+from src.core.projekt_manager.projekt_artifacts import (
+    list_projekt_artifacts,
+    record_script_templates,
+)
 from src.core.functions.io.export_session_variables import (
     export_session_variables
 )
@@ -89,13 +94,64 @@ from src.core.functions.create.create_projekt_pgsql_db import (
 from src.core.functions.copy.copy_current_session_files import (
     copy_current_session_files
 )
+from src.core.utils.flame_launch_utils import launch_flame
+from src.core.utils.wiretap_utils import WiretapError
 from src.core.utils.system_info_utils import get_short_hostname
+from src.core.utils.trace_utils import (
+    flush_trace,
+    trace_span,
+    traced,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def creation_step(number: int, title: str, step_timings: list = None):
+    """
+    Times one numbered creation step as a trace span and, if given,
+    appends its timing to 'step_timings' for the projekt catalog.
+    """
+    start = time.perf_counter()
+    error = ""
+    try:
+        with trace_span(
+                f"step {number:02} {title}",
+                category="projekt_creator"
+        ) as span:
+            yield span
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        if step_timings is not None:
+            step_timings.append(
+                {
+                    "number": number,
+                    "title": title,
+                    "seconds": time.perf_counter() - start,
+                    "error": error,
+                }
+            )
+
+
 class ProjektCreator:
-    def create_projekt(self, config: ProjektParameters):
+    @traced(category="projekt_creator")
+    def create_projekt(
+            self,
+            config: ProjektParameters,
+            on_flame_status=None
+    ):
+        """
+        Creates the projekt described by 'config'. Flame is launched
+        without waiting for it, and 'on_flame_status' is called with each
+        status of the launch.
+
+        Returns:
+            FlameLaunch: The status handle of the Flame launch, or None.
+        """
+        step_timings = []
+
         # 1. Start Logging
         logger.info(
             f"Creating PROJEKT: "
@@ -107,132 +163,221 @@ class ProjektCreator:
         )
 
         # 2. Export Session Variables
-        export_session_variables(config.__dict__)
+        with creation_step(2, "export session variables", step_timings):
+            export_session_variables(config.__dict__)
 
         # 3. Export Session ADSK JSON
-        export_session_adsk_json(config.__dict__)
+        with creation_step(3, "export session adsk json", step_timings):
+            export_session_adsk_json(config.__dict__)
 
         # 4. Create Filesystem Directories
-        json_filepath = config.logik_projekt_config_tree
-        target_root_dir = config.logik_projekt_path
-        path_utils.create_directory(
-            os.path.dirname(
-                target_root_dir
+        with creation_step(4, "create filesystem directories", step_timings):
+            json_filepath = config.logik_projekt_config_tree
+            target_root_dir = config.logik_projekt_path
+            path_utils.create_directory(
+                os.path.dirname(
+                    target_root_dir
+                )
             )
-        )
-        create_projekt_filesystem_dirs(
-            json_filepath,
-            os.path.dirname(target_root_dir),
-            os.path.basename(target_root_dir)
-        )
-        iterations_dir = (
-            os.path.join(
-                config.logik_projekt_path,
-                "flame",
-                "iterations"
+            create_projekt_filesystem_dirs(
+                json_filepath,
+                os.path.dirname(target_root_dir),
+                os.path.basename(target_root_dir)
             )
-        )
-        path_utils.create_directory(iterations_dir)
+            iterations_dir = (
+                os.path.join(
+                    config.logik_projekt_path,
+                    "flame",
+                    "iterations"
+                )
+            )
+            path_utils.create_directory(iterations_dir)
 
         # 5. Generate Flame Project XML
-        xml_template_path = (
-            "cfg/"
-            "site-cfg/"
-            "flame-cfg/"
-            "flame-templates/"
-            "wiretap-templates/"
-            "wiretap_IFFFS_project_EXAMPLE.xml"
-        )
-        output_xml_path = (
-            "pref/"
-            "session-preferences/"
-            "current_session-wiretap_template.xml"
-        )
-        export_session_xml(
-            config.__dict__,
-            xml_template_path,
-            output_xml_path
-        )
+        with creation_step(5, "generate flame project xml", step_timings):
+            xml_template_path = (
+                "cfg/"
+                "site-cfg/"
+                "flame-cfg/"
+                "flame-templates/"
+                "wiretap-templates/"
+                "wiretap_IFFFS_project_EXAMPLE.xml"
+            )
+            output_xml_path = (
+                "pref/"
+                "session-preferences/"
+                "current_session-wiretap_template.xml"
+            )
+            export_session_xml(
+                config.__dict__,
+                xml_template_path,
+                output_xml_path
+            )
 
         # 6. Create Flame Project via Wiretap
-        create_flame_wiretap_node(
-            config.flame_projekt_name,
-            output_xml_path
-        )
+        with creation_step(
+                6,
+                "create flame project via wiretap",
+                step_timings
+        ):
+            self.create_flame_projekt(config, output_xml_path)
 
         # 7. Create Flame Project Setup Directories
-        create_flame_setup_dirs(
-            config.flame_projekt_setups_dir
-        )
+        with creation_step(
+                7,
+                "create flame project setup directories",
+                step_timings
+        ):
+            create_flame_setup_dirs(
+                config.flame_projekt_setups_dir
+            )
 
         # 8. Create Symbolic Links
-        create_flame_symbolic_links(
-            config.logik_projekt_path,
-            config.flame_projekt_setups_dir,
-            config.current_workstation
-        )
+        with creation_step(8, "create symbolic links", step_timings):
+            create_flame_symbolic_links(
+                config.logik_projekt_path,
+                config.flame_projekt_setups_dir,
+                config.current_workstation
+            )
 
         # 9. Copy Site Presets
-        copy_flame_presets(
-            config.logik_projekt_path,
-            config.flame_projekt_setups_dir
-        )
+        with creation_step(9, "copy site presets", step_timings):
+            copy_flame_presets(
+                config.logik_projekt_path,
+                config.flame_projekt_setups_dir
+            )
 
         # 10. Copy Flame Python Scripts
-        copy_flame_python_scripts(
-            config.flame_projekt_setups_dir
-        )
-
-        # 11. Copy Flame Bookmarks
-        try:
-            flame_bookmarks_source_path = get_flame_bookmarks_path(
-                config.logik_projekt_config_name
-            )
-            flame_bookmarks_destination_dir = os.path.join(
+        with creation_step(10, "copy flame python scripts", step_timings):
+            copy_flame_python_scripts(
                 config.flame_projekt_setups_dir,
-                "status"
+                config.logik_projekt_path
             )
-            copy_flame_bookmarks(
-                flame_bookmarks_source_path,
-                flame_bookmarks_destination_dir
-            )
-        except Exception as e:
-            logger.error(f"Failed to copy Flame bookmarks: {e}")
 
-        # 12. Copy Flame Init Config
-        if config.flame_projekt_init:
+        # 11. Copy Flame Bookmarks
+        with creation_step(11, "copy flame bookmarks", step_timings):
             try:
-                copy_init_config(
-                    os.path.basename(config.flame_projekt_init),
+                flame_bookmarks_source_path = get_flame_bookmarks_path(
+                    config.logik_projekt_config_name
+                )
+                flame_bookmarks_destination_dir = os.path.join(
                     config.flame_projekt_setups_dir,
-                    config.flame_projekt_name
+                    "status"
+                )
+                copy_flame_bookmarks(
+                    flame_bookmarks_source_path,
+                    flame_bookmarks_destination_dir
                 )
             except Exception as e:
-                logger.error(f"Failed to copy Flame init config: {e}")
-        else:
-            logger.info("No Flame init config file specified. Skipping copy.")
+                logger.error(f"Failed to copy Flame bookmarks: {e}")
+
+        # 12. Copy Flame Init Config
+        with creation_step(12, "copy flame init config", step_timings):
+            if config.flame_projekt_init:
+                try:
+                    copy_init_config(
+                        os.path.basename(config.flame_projekt_init),
+                        config.flame_projekt_setups_dir,
+                        config.flame_projekt_name
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to copy Flame init config: {e}")
+            else:
+                logger.info(
+                    "No Flame init config file specified. Skipping copy."
+                )
 
         # 13. Create Archive Script
-        create_flame_archive_script(config.__dict__)
+        with creation_step(13, "create archive script", step_timings):
+            self.create_archive_script(config)
 
         # 14. Create Backup Script
-        template_dir = os.path.join(
-            path_utils.get_repository_root_dir(),
-            "cfg",
-            "site-cfg",
-            "logik-projekt-cfg",
-            "logik-projekt-templates"
-        )
-        backup_template_path = os.path.join(
-            template_dir,
-            "rsync-backup-templates",
-            "backup_template"
-        )
-        backup_script_dir = os.path.join(
-            config.logik_projekt_path,
-            "backup",
-            "backup-scripts",
-            config.current_workstation
+        with creation_step(14, "create backup script", step_timings):
+            self.create_backup_script(config)
+
+        # 15. Create Flame Startup Script
+        with creation_step(15, "create flame startup script", step_timings):
+            self.create_startup_script(config)
+
+        # 16. Create Flame Launcher Script
+        with creation_step(16, "create flame launcher script", step_timings):
+            launcher_script_path = self.create_launcher_script(config)
+
+        # 17. Create Project Launcher Alias
+        with creation_step(17, "create project launcher alias", step_timings):
+            create_projekt_launcher_alias(
+                config.logik_projekt_name,
+                launcher_script_path
+            )
+
+        # 18. Launch Flame (Optional)
+        flame_launch = None
+        with creation_step(18, "launch flame (optional)", step_timings):
+            if config.launch_flame_after_creation:
+                logger.info(
+                    f"Launching Flame with script: "
+                    f"{launcher_script_path}"
+                )
+                flame_launch = launch_flame(
+                    launcher_script_path,
+                    os.path.join(
+                        config.logik_projekt_path,
+                        "logs",
+                        config.current_workstation,
+                        "flame_launch.log"
+                    ),
+                    on_flame_status
+                )
+
+        # 19. Copy Current Session Files
+        with creation_step(19, "copy current session files", step_timings):
+            copy_current_session_files(
+                config.logik_projekt_path,
+                config.current_workstation
+            )
+
+        # 20. Record Projekt in Catalog
+        # Last, so that only a finished creation is recorded, with the
+        # timings of every step before this one.
+        with creation_step(20, "record projekt in catalog"):
+            create_projekt_pgsql_db(
+                config.__dict__,
+                step_timings,
+                list_projekt_artifacts(config)
+            )
+
+        logger.info("PROJEKT creation logic executed.")
+        flush_trace()
+        return flame_launch
+
+    def create_flame_projekt(
+            self,
+            config: ProjektParameters,
+            projekt_xml_path: str
+    ):
+        """
+        Creates the Flame project node. A wiretap backend that cannot be
+        used is logged and the creation carries on without the node.
+
+        Returns:
+            WiretapResult: The result of the node, or None.
+        """
+        try:
+            return create_flame_wiretap_node(
+                config.flame_projekt_name,
+                projekt_xml_path
+            )
+        except WiretapError as e:
+            logger.error(f"Failed to create Flame project via wiretap: {e}")
+            return None
+
+    def create_archive_script(self, config: ProjektParameters):
+        create_flame_archive_script(config.__dict__)
+        record_script_templates(config, ["create_archive_script"])
+
+    def create_backup_script(self, config: ProjektParameters):
+        backup_template_path, backup_script_dir = get_backup_script_paths(
+            config
         )
         path_utils.create_directory(backup_script_dir)
         create_projekt_backup_script(
@@ -240,87 +385,85 @@ class ProjektCreator:
             backup_template_path,
             backup_script_dir
         )
+        record_script_templates(config, ["create_backup_script"])
 
-        # 15. Create Flame Startup Script
+    def create_startup_script(self, config: ProjektParameters):
         create_flame_startup_script(
             config.flame_projekt_setups_dir,
             config.logik_projekt_config_workspace
         )
+        record_script_templates(config, ["create_startup_script"])
 
-        # 16. Create Flame Launcher Script
+    def create_launcher_script(self, config: ProjektParameters) -> str:
         launcher_script_path = create_flame_launcher_script(
             repository_root_dir=path_utils.get_repository_root_dir(),
-            logik_projekt_path=config.logik_projekt_path,
-            current_workstation=config.current_workstation,
-            current_os=config.current_os,
-            the_projekts_dir=config.logik_projekt_path.rsplit('/', 1)[0],
-            the_projekt_flame_dirs=config.flame_projekt_home.rsplit('/', 1)[0],
-            the_adsk_dir="/opt/Autodesk",
-            the_adsk_dir_linux="/opt/Autodesk",
-            the_adsk_dir_macos="/Applications/Autodesk",
-            logik_projekt_name=config.logik_projekt_name,
-            the_projekt_flame_name=config.flame_projekt_name,
-            flame_software_sanitized_version=config.flame_software_sanitized_version,
-            flame_software_choice=config.flame_software_choice,
-            flame_projekt_setups_dir=config.flame_projekt_setups_dir,
+            **get_launcher_script_arguments(config)
         )
+        record_script_templates(config, ["create_launcher_script"])
+        return launcher_script_path
 
-        # 17. Create Project Launcher Alias
-        create_projekt_launcher_alias(
-            config.logik_projekt_name,
-            launcher_script_path
-        )
 
-        # 18. Create PostgreSQL Database
-        create_projekt_pgsql_db(
-            config.logik_projekt_name,
-            config.logik_projekt_path
-        )
+def get_backup_script_paths(config: ProjektParameters) -> tuple:
+    """
+    Returns the backup script template and the backup script directory
+    of one workstation.
+    """
+    template_dir = os.path.join(
+        path_utils.get_repository_root_dir(),
+        "cfg",
+        "site-cfg",
+        "logik-projekt-cfg",
+        "logik-projekt-templates"
+    )
+    backup_template_path = os.path.join(
+        template_dir,
+        "rsync-backup-templates",
+        "backup_template"
+    )
+    backup_script_dir = os.path.join(
+        config.logik_projekt_path,
+        "backup",
+        "backup-scripts",
+        config.current_workstation
+    )
+    return backup_template_path, backup_script_dir
 
-        # 19. Launch Flame (Optional)
-        if config.launch_flame_after_creation:
-            logger.info(
-                f"Launching Flame with script: "
-                f"{launcher_script_path}"
-            )
-            try:
-                os.chmod(launcher_script_path, 0o755)
-                process = subprocess.Popen(
-                    [launcher_script_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
-                for line in iter(process.stdout.readline, ''):
-                    logger.info(line.strip())
-                process.stdout.close()
-                return_code = process.wait()
-                if return_code:
-                    raise subprocess.CalledProcessError(
-                        return_code,
-                        launcher_script_path
-                    )
-                logger.info("Flame launched successfully.")
-            except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                logger.error(f"Failed to launch Flame: {e}")
-
-        # 20. Copy Current Session Files
-        copy_current_session_files(
-            config.logik_projekt_path,
-            config.current_workstation
-        )
 
-        logger.info("PROJEKT creation logic executed.")
+def get_launcher_script_arguments(config: ProjektParameters) -> dict:
+    """
+    Returns the arguments of create_flame_launcher_script for one
+    workstation, without the repository root.
+    """
+    return dict(
+        logik_projekt_path=config.logik_projekt_path,
+        current_workstation=config.current_workstation,
+        current_os=config.current_os,
+        the_projekts_dir=config.logik_projekt_path.rsplit('/', 1)[0],
+        the_projekt_flame_dirs=config.flame_projekt_home.rsplit('/', 1)[0],
+        the_adsk_dir="/opt/Autodesk",
+        the_adsk_dir_linux="/opt/Autodesk",
+        the_adsk_dir_macos="/Applications/Autodesk",
+        logik_projekt_name=config.logik_projekt_name,
+        the_projekt_flame_name=config.flame_projekt_name,
+        flame_software_sanitized_version=(
+            config.flame_software_sanitized_version
+        ),
+        flame_software_choice=config.flame_software_choice,
+        flame_projekt_setups_dir=config.flame_projekt_setups_dir,
+    )
+
 
 
-def create_projekt(projekt_summary_data: dict):
+def create_projekt(projekt_summary_data: dict, on_flame_status=None):
     """
     Create a new project using the provided summary data.
   
     Args:
         projekt_summary_data: Dictionary containing all project config data
+        on_flame_status: Called with each status of the Flame launch
+
+    Returns:
+        FlameLaunch: The status handle of the Flame launch, or None
     """
     projekt_creator = ProjektCreator()
     projekt_config = ProjektParameters(
@@ -481,7 +624,7 @@ def create_projekt(projekt_summary_data: dict):
             False,
         ),
     )
-    projekt_creator.create_projekt(projekt_config)
+    return projekt_creator.create_projekt(projekt_config, on_flame_status)
 
 
 # -------------------------------------------------------------------------- #
@@ -524,3 +667,49 @@ def create_projekt(projekt_summary_data: dict):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced every creation step as a span and flush the trace
+#               once the projekt is created.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Moved the archive, backup, startup and launcher script
+#               steps into methods so that the projekt doctor can rerun
+#               them.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Pass the projekt path to copy_flame_python_scripts so the
+#               scripts come from the projekts' preset store.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Time every creation step and record the projekt, its step
+#               timings and artifacts in the projekt catalog in step 18.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Launch Flame detached in step 19, so the session files are
+#               copied and the projekt creation returns right away with a
+#               status handle of the launch.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Log a wiretap backend that cannot be used in step 6 and
+#               carry on, as the wiretap_create_node call did before.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Record the template hash of each generated script.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Record the projekt in the catalog last, in step 20, after
+#               the Flame launch and the session file copy.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Moved step 6 into create_flame_projekt, so the fallback
+#               for an unusable wiretap backend can be tested.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,810 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     projekt_doctor.py
+# Purpose:      Check existing projekts against their templates and repair
+#               them.
+# Description:  Reads the session variables each workstation left in
+#               '<projekt>/logs/<workstation>', rebuilds the directories,
+#               Flame setups directories, symbolic links and scripts the
+#               projekt should have, scans the disk with 'scandir' and
+#               diffs both as sets. Missing or extra directories, broken
+#               or wrong links, stale scripts and permission problems are
+#               reported and, on request, repaired. Projekts are checked
+#               in parallel so that every live projekt fits in one nightly
+#               pass.
+#
+#               python -m src.core.projekt_manager.projekt_doctor /PROJEKTS
+#               python -m src.core.projekt_manager.projekt_doctor --repair \
+#                   /PROJEKTS/<projekt>
+#               python -m src.core.projekt_manager.projekt_doctor --catalog \
+#                   --workstation <workstation>
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Module
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import sys
+import json
+import stat
+import shutil
+import logging
+import argparse
+import dataclasses
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.utils import path_utils
+from src.core.utils.trace_utils import traced
+from src.core.utils.template_utils import TemplateJob, render_templates
+from src.core.utils.projekt_catalog_utils import get_projekt_catalog
+from src.core.projekt_manager.projekt_models import ProjektParameters
+from src.core.projekt_manager.projekt_artifacts import (
+    get_script_specs,
+    get_symbolic_links,
+    get_template_hash,
+    load_script_templates,
+    record_script_templates,
+    resolve_repository_path,
+)
+from src.core.projekt_manager.projekt_creator import (
+    get_backup_script_paths,
+    get_launcher_script_arguments,
+)
+from src.core.functions.create.create_flame_archive_script import (
+    get_flame_archive_dirs,
+    get_flame_archive_script_jobs,
+)
+from src.core.functions.create.create_projekt_backup_script import (
+    get_exclusion_list_paths,
+    get_projekt_backup_script_jobs,
+)
+from src.core.functions.create.create_flame_launcher_script import (
+    FLAME_LAUNCHER_TEMPLATE,
+    get_flame_launcher_script_values,
+)
+from src.core.functions.create.create_flame_startup_script import (
+    create_flame_startup_script,
+)
+
+logger = logging.getLogger(__name__)
+
+SESSION_VARIABLES_FILENAME = "current_session-variables.json"
+
+FLAME_SETUP_DIRS_PATH = (
+    "pref/"
+    "site-prefs/"
+    "default-prefs/"
+    "logik-projekt-prefs/"
+    "flame_setup_dirs.json"
+)
+
+# Directories the creation steps make outside the filesystem tree, relative
+# to the projekt. '{workstation}' is filled per workstation.
+CREATED_PROJEKT_DIRS = (
+    "flame/iterations",
+    "flame/setups/{workstation}",
+    "flame/archive/scripts",
+    "flame/archive/{workstation}",
+    "backup/backup-scripts/{workstation}",
+    "logs/{workstation}",
+)
+
+# Permission bits the doctor adds to a directory it has to repair.
+DIRECTORY_REPAIR_MODE = stat.S_IRWXU | stat.S_IRWXG
+
+# Kinds of findings that are reported but never make a projekt unhealthy.
+INFORMATIONAL_KINDS = frozenset({"extra_dir"})
+
+# Parsed JSON templates by absolute path, with their mtime. Hundreds of
+# projekts share a handful of templates, so each is read once per pass.
+_json_cache = {}
+
+
+@dataclass
+class DoctorFinding:
+    """One difference between a projekt and its templates."""
+    kind: str
+    path: str
+    detail: str = ""
+    repaired: bool = False
+
+
+@dataclass
+class ProjektDoctorReport:
+    """Everything the doctor found in one projekt."""
+    projekt_path: str
+    workstations: list = field(default_factory=list)
+    findings: list = field(default_factory=list)
+
+    def add(self, kind: str, path: str, detail: str = "") -> DoctorFinding:
+        finding = DoctorFinding(kind, path, detail)
+        self.findings.append(finding)
+        return finding
+
+    @property
+    def problems(self) -> list:
+        """The findings that still need attention."""
+        return [
+            finding for finding in self.findings
+            if not finding.repaired
+            and finding.kind not in INFORMATIONAL_KINDS
+        ]
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+    def to_dict(self) -> dict:
+        return {
+            "projekt_path": self.projekt_path,
+            "workstations": self.workstations,
+            "ok": self.ok,
+            "findings": [
+                dataclasses.asdict(finding) for finding in self.findings
+            ],
+        }
+
+
+def load_json_template(template_path: str):
+    """Returns a parsed JSON template, reading it only when it changed."""
+    path = os.path.abspath(template_path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _json_cache[path] = (mtime, data)
+    return data
+
+
+def is_projekt_dir(path: str) -> bool:
+    return bool(find_session_variables(path))
+
+
+def find_session_variables(projekt_path: str) -> list:
+    """
+    Returns the session variables files in '<projekt>/logs/*', one per
+    workstation that created or updated the projekt.
+    """
+    logs_dir = os.path.join(projekt_path, "logs")
+    try:
+        with os.scandir(logs_dir) as entries:
+            candidates = [
+                os.path.join(entry.path, SESSION_VARIABLES_FILENAME)
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return []
+    return sorted(
+        candidate for candidate in candidates if os.path.isfile(candidate)
+    )
+
+
+def find_projekts(paths) -> list:
+    """
+    Returns the projekt directories among 'paths'. A path that is not a
+    projekt itself is taken as a projekts root and its children are
+    searched instead.
+    """
+    projekt_paths = []
+    for path in paths:
+        path = os.path.abspath(path)
+        if is_projekt_dir(path):
+            projekt_paths.append(path)
+            continue
+        try:
+            with os.scandir(path) as entries:
+                children = sorted(
+                    entry.path for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                )
+        except OSError as e:
+            logger.error(f"Cannot read projekts directory {path}: {e}")
+            continue
+        projekt_paths.extend(
+            child for child in children if is_projekt_dir(child)
+        )
+    return projekt_paths
+
+
+def load_projekt_config(variables_path: str) -> ProjektParameters:
+    """Reads one session variables file into ProjektParameters."""
+    with open(variables_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    names = {
+        parameter.name for parameter in dataclasses.fields(ProjektParameters)
+    }
+    return ProjektParameters(
+        **{key: value for key, value in data.items() if key in names}
+    )
+
+
+def close_dir_set(expected: set) -> set:
+    """
+    Adds the missing ancestors to a set of relative directories.
+
+    Returns:
+        set: The directories whose children are all defined by the
+        template, i.e. the root and every parent in 'expected'. Leaf
+        directories hold user content and are not searched.
+    """
+    for relative_path in list(expected):
+        parent = os.path.dirname(relative_path)
+        while parent and parent not in expected:
+            expected.add(parent)
+            parent = os.path.dirname(parent)
+    return {""} | {
+        os.path.dirname(relative_path) for relative_path in expected
+    }
+
+
+def expected_projekt_dirs(tree_path: str, workstations) -> tuple:
+    """
+    Builds the directory set of a projekt from its filesystem tree and
+    the directories the creation steps add per workstation.
+
+    Returns:
+        tuple: (expected, closed) relative paths, see close_dir_set.
+    """
+    data = load_json_template(tree_path)
+    expected = {
+        entry["path"]
+        for entry in data.get("subdirectories", [])
+        if entry.get("path")
+    }
+    for workstation in workstations:
+        for relative_path in CREATED_PROJEKT_DIRS:
+            expected.add(relative_path.format(workstation=workstation))
+    return expected, close_dir_set(expected)
+
+
+def scan_child_dirs(path: str) -> dict:
+    """
+    Returns the entries of a directory by name as 'dir', 'link' or
+    'other', using one scandir call.
+    """
+    children = {}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_symlink():
+                children[entry.name] = "link"
+            elif entry.is_dir(follow_symlinks=False):
+                children[entry.name] = "dir"
+            else:
+                children[entry.name] = "other"
+    return children
+
+
+def scan_tree(root: str, closed) -> tuple:
+    """
+    Scans 'root' and every closed directory below it that exists.
+
+    Returns:
+        tuple: (actual, not_dirs, unreadable) relative paths. 'actual'
+        holds every directory found, 'not_dirs' the closed-directory
+        children that are files or links, and 'unreadable' the closed
+        directories scandir was denied.
+    """
+    actual = set()
+    not_dirs = {}
+    unreadable = set()
+    pending = [""]
+    while pending:
+        relative_dir = pending.pop()
+        try:
+            children = scan_child_dirs(os.path.join(root, relative_dir))
+        except FileNotFoundError:
+            continue
+        except PermissionError:
+            unreadable.add(relative_dir)
+            continue
+        except NotADirectoryError:
+            continue
+        for name, kind in children.items():
+            relative_path = os.path.join(relative_dir, name)
+            if kind == "dir":
+                actual.add(relative_path)
+                if relative_path in closed:
+                    pending.append(relative_path)
+            else:
+                not_dirs[relative_path] = kind
+    return actual, not_dirs, unreadable
+
+
+def check_directories(
+        report: ProjektDoctorReport,
+        root: str,
+        expected: set,
+        closed: set,
+        repair: bool,
+        report_extra: bool = True
+):
+    """Diffs the expected directory set of 'root' against the disk."""
+    actual, not_dirs, unreadable = scan_tree(root, closed)
+
+    for relative_dir in sorted(unreadable):
+        report.add(
+            "permission",
+            os.path.join(root, relative_dir),
+            "directory cannot be read"
+        )
+
+    missing = expected - actual
+    for relative_path in sorted(missing):
+        path = os.path.join(root, relative_path)
+        parent = os.path.dirname(relative_path)
+        if parent in unreadable or any(
+                parent.startswith(f"{denied}/") for denied in unreadable
+        ):
+            continue
+        if relative_path in not_dirs:
+            report.add(
+                "not_a_directory",
+                path,
+                f"expected a directory, found a {not_dirs[relative_path]}"
+            )
+            continue
+        finding = report.add("missing_dir", path)
+        if repair:
+            try:
+                os.makedirs(path, exist_ok=True)
+                finding.repaired = True
+            except OSError as e:
+                finding.detail = f"repair failed: {e}"
+
+    if report_extra:
+        for relative_path in sorted(actual - expected):
+            report.add("extra_dir", os.path.join(root, relative_path))
+
+    for relative_path in sorted(actual & expected):
+        path = os.path.join(root, relative_path)
+        if os.access(path, os.W_OK | os.X_OK):
+            continue
+        finding = report.add("permission", path, "directory not writable")
+        if repair:
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+                os.chmod(path, mode | DIRECTORY_REPAIR_MODE)
+                finding.repaired = True
+            except OSError as e:
+                finding.detail = f"directory not writable, repair failed: {e}"
+
+
+def check_symbolic_links(
+        report: ProjektDoctorReport,
+        config: ProjektParameters,
+        repair: bool
+):
+    """Checks the links create_flame_symbolic_links makes."""
+    for link_path, source_path in get_symbolic_links(config):
+        if not os.path.lexists(link_path):
+            kind, detail = "missing_link", f"should point to {source_path}"
+        elif not os.path.islink(link_path):
+            report.add(
+                "not_a_link",
+                link_path,
+                f"should be a link to {source_path}"
+            )
+            continue
+        elif os.readlink(link_path) != source_path:
+            kind, detail = (
+                "wrong_link",
+                f"points to {os.readlink(link_path)}, "
+                f"should point to {source_path}"
+            )
+        elif not os.path.exists(link_path):
+            kind, detail = "broken_link", f"{source_path} does not exist"
+        else:
+            continue
+
+        finding = report.add(kind, link_path, detail)
+        if repair and os.path.exists(source_path):
+            temp_path = f"{link_path}.doctor-{os.getpid()}"
+            try:
+                os.makedirs(os.path.dirname(link_path), exist_ok=True)
+                os.symlink(source_path, temp_path)
+                os.replace(temp_path, link_path)
+                finding.repaired = True
+            except OSError as e:
+                finding.detail = f"{detail}, repair failed: {e}"
+                if os.path.lexists(temp_path):
+                    os.remove(temp_path)
+
+
+def check_scripts(
+        report: ProjektDoctorReport,
+        config: ProjektParameters,
+        repair: bool
+):
+    """
+    Reports scripts that are missing, generated from another version of
+    their template or not executable. A script is compared with its
+    template by the template hash recorded when it was generated, since
+    checkouts and copies change template mtimes but not their content.
+    Repair writes the scripts of their creation step again.
+    """
+    script_templates = load_script_templates(config)
+    regenerate = {}
+    for spec in get_script_specs(config):
+        try:
+            script_stat = os.stat(spec.path)
+        except FileNotFoundError:
+            finding = report.add("missing_script", spec.path)
+            regenerate.setdefault(spec.generator, []).append(finding)
+            continue
+        try:
+            template_hash = get_template_hash(spec.template_path)
+        except FileNotFoundError:
+            template_hash = None
+        recorded_hash = script_templates.get(spec.generator)
+        if (
+                template_hash is not None
+                and recorded_hash is not None
+                and recorded_hash != template_hash
+        ):
+            finding = report.add(
+                "stale_script",
+                spec.path,
+                f"generated from another version of {spec.template_path}"
+            )
+            regenerate.setdefault(spec.generator, []).append(finding)
+        elif spec.executable and not script_stat.st_mode & stat.S_IXUSR:
+            finding = report.add("permission", spec.path, "not executable")
+            if repair:
+                try:
+                    os.chmod(spec.path, 0o755)
+                    finding.repaired = True
+                except OSError as e:
+                    finding.detail = f"not executable, repair failed: {e}"
+
+    if not repair:
+        return
+    for generator, findings in regenerate.items():
+        try:
+            repair_scripts(config, generator, findings[0].path)
+        except Exception as e:
+            for finding in findings:
+                finding.detail = f"{finding.detail} repair failed: {e}".strip()
+            continue
+        for finding in findings:
+            finding.repaired = os.path.exists(finding.path)
+        record_script_templates(config, [generator])
+
+
+def repair_scripts(
+        config: ProjektParameters,
+        generator: str,
+        script_path: str
+):
+    """
+    Writes the scripts of one creation step again, straight to their
+    place in the projekt. Unlike the creation steps, no file outside the
+    projekt is written, so projekts can be repaired in parallel and the
+    session preferences of the application are left alone.
+    """
+    data = config.__dict__
+    dirs = []
+    jobs = []
+    copies = []
+    if generator == "create_archive_script":
+        dirs += get_flame_archive_dirs(data)
+        jobs += get_flame_archive_script_jobs(data)
+    elif generator == "create_backup_script":
+        backup_template_path, backup_script_dir = get_backup_script_paths(
+            config
+        )
+        dirs.append(backup_script_dir)
+        jobs += get_projekt_backup_script_jobs(
+            data,
+            backup_template_path,
+            backup_script_dir
+        )
+        copies.append(get_exclusion_list_paths(data, backup_script_dir))
+    elif generator == "create_launcher_script":
+        jobs.append(
+            TemplateJob(
+                FLAME_LAUNCHER_TEMPLATE,
+                script_path,
+                get_flame_launcher_script_values(
+                    **get_launcher_script_arguments(config)
+                )
+            )
+        )
+    elif generator == "create_startup_script":
+        # Only writes to the scripts/startup directory of the projekt.
+        create_flame_startup_script(
+            config.flame_projekt_setups_dir,
+            config.logik_projekt_config_workspace
+        )
+        return
+    else:
+        raise ValueError(f"Unknown script generator: {generator}")
+
+    for directory in dirs:
+        os.makedirs(directory, exist_ok=True)
+    render_templates(jobs)
+    for source_path, destination_path in copies:
+        shutil.copyfile(source_path, destination_path)
+
+
+@traced()
+def check_projekt(
+        projekt_path: str,
+        repair: bool = False
+) -> ProjektDoctorReport:
+    """
+    Checks one projekt against its templates.
+
+    Args:
+        projekt_path (str): The projekt directory.
+        repair (bool): Create missing directories, relink links, rerun
+            the script steps and fix modes where possible. Extra
+            directories are only reported, never removed.
+
+    Returns:
+        ProjektDoctorReport: The findings.
+    """
+    report = ProjektDoctorReport(projekt_path)
+    configs = []
+    for variables_path in find_session_variables(projekt_path):
+        try:
+            configs.append(load_projekt_config(variables_path))
+        except (OSError, ValueError, TypeError) as e:
+            report.add("unreadable_config", variables_path, str(e))
+    if not configs:
+        report.add(
+            "unreadable_config",
+            projekt_path,
+            f"no logs/*/{SESSION_VARIABLES_FILENAME}"
+        )
+        return report
+    report.workstations = [config.current_workstation for config in configs]
+
+    tree_path = resolve_repository_path(configs[-1].logik_projekt_config_tree)
+    try:
+        expected, closed = expected_projekt_dirs(
+            tree_path,
+            report.workstations
+        )
+    except (OSError, ValueError) as e:
+        report.add("unreadable_template", tree_path, str(e))
+    else:
+        check_directories(report, projekt_path, expected, closed, repair)
+
+    try:
+        setup_dirs = load_json_template(
+            resolve_repository_path(FLAME_SETUP_DIRS_PATH)
+        ).get("flame_setup_dirs.json", [])
+    except (OSError, ValueError) as e:
+        report.add("unreadable_template", FLAME_SETUP_DIRS_PATH, str(e))
+        setup_dirs = None
+
+    for config in configs:
+        setups_dir = config.flame_projekt_setups_dir
+        if not setups_dir:
+            continue
+        if setup_dirs is not None:
+            expected = set(setup_dirs)
+            closed = close_dir_set(expected)
+            if not os.path.isdir(setups_dir):
+                finding = report.add("missing_dir", setups_dir)
+                if repair:
+                    try:
+                        os.makedirs(setups_dir, exist_ok=True)
+                        finding.repaired = True
+                    except OSError as e:
+                        finding.detail = f"repair failed: {e}"
+            check_directories(
+                report,
+                setups_dir,
+                expected,
+                closed,
+                repair,
+                report_extra=False
+            )
+        check_symbolic_links(report, config, repair)
+        check_scripts(report, config, repair)
+
+    return report
+
+
+def check_projekts(paths, repair: bool = False, jobs: int = None) -> list:
+    """
+    Checks every projekt found in 'paths' in parallel.
+
+    Returns:
+        list: One ProjektDoctorReport per projekt, in path order.
+    """
+    projekt_paths = find_projekts(paths)
+    if jobs is None:
+        jobs = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(
+            max_workers=max(1, jobs),
+            thread_name_prefix="projekt_doctor"
+    ) as executor:
+        return list(
+            executor.map(
+                lambda projekt_path: check_projekt(projekt_path, repair),
+                projekt_paths
+            )
+        )
+
+
+def log_report(report: ProjektDoctorReport):
+    if report.ok and not report.findings:
+        logger.info(f"OK: {report.projekt_path}")
+        return
+    log = logger.info if report.ok else logger.warning
+    log(
+        f"{'OK' if report.ok else 'PROBLEMS'}: {report.projekt_path} "
+        f"({len(report.problems)} open, {len(report.findings)} found)"
+    )
+    for finding in report.findings:
+        if finding.repaired:
+            state = "repaired"
+        elif finding.kind in INFORMATIONAL_KINDS:
+            state = "info"
+        else:
+            state = "open"
+        detail = f" - {finding.detail}" if finding.detail else ""
+        log(f"    [{state}] {finding.kind}: {finding.path}{detail}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Check projekts against their templates. Each path is a "
+            "projekt or a directory of projekts."
+        )
+    )
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="check the projekts in the projekt catalog instead of "
+             "scanning directories"
+    )
+    parser.add_argument(
+        "--name",
+        default=None,
+        help="with --catalog, the projekt name; '*' matches anything"
+    )
+    parser.add_argument(
+        "--workstation",
+        default=None,
+        help="with --catalog, projekts used on this workstation"
+    )
+    parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="repair what can be repaired; extra directories are kept"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="projekts checked in parallel"
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="also write the reports to this JSON file"
+    )
+    arguments = parser.parse_args(argv)
+    if not arguments.paths and not arguments.catalog:
+        parser.error("give projekt paths or --catalog")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    # The creation steps rerun by --repair read their templates relative to
+    # the repository root.
+    os.chdir(path_utils.get_repository_root_dir())
+
+    paths = list(arguments.paths)
+    if arguments.catalog:
+        paths += [
+            projekt["projekt_path"]
+            for projekt in get_projekt_catalog().find_projekts(
+                name=arguments.name,
+                workstation=arguments.workstation
+            )
+        ]
+
+    reports = check_projekts(paths, arguments.repair, arguments.jobs)
+    for report in reports:
+        log_report(report)
+
+    unhealthy = [report for report in reports if not report.ok]
+    logger.info(
+        f"Checked {len(reports)} projekts, "
+        f"{len(unhealthy)} with open problems."
+    )
+
+    if arguments.json_path:
+        with open(arguments.json_path, 'w') as f:
+            json.dump(
+                [report.to_dict() for report in reports],
+                f,
+                indent=4
+            )
+
+    return 1 if unhealthy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the projekt doctor.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Moved the links and scripts lists to projekt_artifacts.
+#               Added --catalog to check the projekts of the projekt
+#               catalog without scanning directories.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Script repair renders each script straight to its place
+#               in the projekt instead of rerunning the creation steps,
+#               which wrote the launcher to the shared session
+#               preferences first.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tell stale scripts by the recorded template hash, not by
+#               the template mtime.
+# -------------------------------------------------------------------------- #
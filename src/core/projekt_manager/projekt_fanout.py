@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     projekt_fanout.py
+# Purpose:      Create the per-workstation artifacts of a projekt for many
+#               workstations at once.
+# Description:  Renders, for every given workstation, what a projekt
+#               creation on that workstation leaves in the shared projekt
+#               directory: the archive and backup scripts with their
+#               crontab scripts and exclusion list, the link to the Flame
+#               setups directory and the session files in
+#               '<projekt>/logs/<workstation>', including its launcher.
+#               Every template is compiled once and checked before the
+#               first file is written, and the files are written
+#               concurrently. Session files a workstation already has are
+#               kept, as the 'rsync --ignore-existing' of the creation
+#               does. Workstations that are new to the projekt are
+#               recorded in the projekt catalog.
+#
+#               The Flame setups directory itself and the session log are
+#               local to the workstation that runs Flame, and are left to
+#               that workstation.
+#
+#               python -m src.core.projekt_manager.projekt_fanout \
+#                   /PROJEKTS/<projekt> <workstation> [<workstation> ...]
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Module
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import sys
+import json
+import shutil
+import logging
+import argparse
+import dataclasses
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.utils import path_utils
+from src.core.utils.trace_utils import traced
+from src.core.utils.template_utils import TemplateJob, render_templates
+from src.core.utils.projekt_catalog_utils import (
+    SOURCE_FAN_OUT,
+    get_projekt_catalog,
+    make_catalog_entry,
+)
+from src.core.functions.get.get_application_paths import GetApplicationPaths
+from src.core.functions.get.get_projekt_summary_data import (
+    get_flame_projekt_name,
+)
+from src.core.functions.create.create_flame_archive_script import (
+    get_flame_archive_dirs,
+    get_flame_archive_script_jobs,
+)
+from src.core.functions.create.create_projekt_backup_script import (
+    get_exclusion_list_paths,
+    get_projekt_backup_script_jobs,
+)
+from src.core.functions.create.create_flame_launcher_script import (
+    FLAME_LAUNCHER_SCRIPT_NAME,
+    FLAME_LAUNCHER_TEMPLATE,
+    get_flame_launcher_script_values,
+)
+from src.core.projekt_manager.projekt_models import ProjektParameters
+from src.core.projekt_manager.projekt_artifacts import (
+    get_script_templates,
+    get_script_templates_path,
+    get_symbolic_links,
+    list_projekt_artifacts,
+)
+from src.core.projekt_manager.projekt_creator import (
+    get_backup_script_paths,
+    get_launcher_script_arguments,
+)
+from src.core.projekt_manager.projekt_doctor import (
+    SESSION_VARIABLES_FILENAME,
+    find_session_variables,
+    load_projekt_config,
+)
+
+logger = logging.getLogger(__name__)
+
+# Session files that are the same on every workstation and are copied
+# from the session that is fanned out.
+SHARED_SESSION_FILES = (
+    "current_session-adsk.json",
+    "current_session-wiretap_template.xml",
+)
+
+
+@dataclass
+class FanOutPlan:
+    """Everything a fan-out writes, grouped by how it is written."""
+    dirs: set = field(default_factory=set)
+    template_jobs: list = field(default_factory=list)
+    # (source path, destination path)
+    copies: list = field(default_factory=list)
+    # Session files, copied with their mode and times like rsync -a.
+    session_copies: list = field(default_factory=list)
+    # (path, text)
+    writes: list = field(default_factory=list)
+    # (link path, source path)
+    links: list = field(default_factory=list)
+    # Workstations without session variables in the projekt.
+    new_workstations: list = field(default_factory=list)
+
+
+# The Flame directories that are '<project home>/<name>' unless set apart.
+FLAME_PROJEKT_HOME_DIR_FIELDS = (
+    "flame_projekt_setups_dir",
+    "flame_projekt_media_dir",
+    "flame_projekt_catalog_dir",
+)
+
+
+def get_workstation_config(
+        config: ProjektParameters,
+        workstation: str
+) -> ProjektParameters:
+    """
+    Returns 'config' as a creation on 'workstation' would have made it.
+
+    The Flame projekt name ends with the workstation, as in
+    get_projekt_summary_data. The Flame projekt home is named after it,
+    and the setups, media and catalog directories inside the home move
+    with it. Directories set apart from the home are shared.
+    """
+    flame_projekt_name = get_flame_projekt_name(
+        config.logik_projekt_name,
+        config.flame_software_sanitized_version,
+        workstation
+    )
+    flame_projekt_home = "/".join(
+        flame_projekt_name if part == config.flame_projekt_name else part
+        for part in config.flame_projekt_home.split("/")
+    )
+    changes = {
+        "current_workstation": workstation,
+        "flame_projekt_name": flame_projekt_name,
+        "flame_projekt_home": flame_projekt_home,
+    }
+    home_prefix = config.flame_projekt_home.rstrip("/") + "/"
+    for field_name in FLAME_PROJEKT_HOME_DIR_FIELDS:
+        path = getattr(config, field_name)
+        if config.flame_projekt_home and path.startswith(home_prefix):
+            changes[field_name] = (
+                flame_projekt_home.rstrip("/") + "/" + path[len(home_prefix):]
+            )
+    return dataclasses.replace(config, **changes)
+
+
+def plan_workstation(
+        plan: FanOutPlan,
+        config: ProjektParameters,
+        session_files_dir: str
+):
+    """Adds the artifacts of the workstation of 'config' to 'plan'."""
+    data = config.__dict__
+
+    plan.dirs.update(get_flame_archive_dirs(data))
+    plan.template_jobs += get_flame_archive_script_jobs(data)
+
+    backup_template_path, backup_script_dir = get_backup_script_paths(
+        config
+    )
+    plan.dirs.add(backup_script_dir)
+    plan.template_jobs += get_projekt_backup_script_jobs(
+        data,
+        backup_template_path,
+        backup_script_dir
+    )
+    plan.copies.append(get_exclusion_list_paths(data, backup_script_dir))
+    plan.writes.append(
+        (
+            get_script_templates_path(config),
+            json.dumps(
+                get_script_templates(
+                    config,
+                    ["create_archive_script", "create_backup_script"]
+                ),
+                indent=4,
+                sort_keys=True
+            )
+        )
+    )
+
+    for link_path, source_path in get_symbolic_links(config):
+        # The other links live in the Flame setups directory.
+        if link_path.startswith(config.logik_projekt_path + os.sep):
+            plan.dirs.add(os.path.dirname(link_path))
+            plan.links.append((link_path, source_path))
+
+    # The session files, without replacing those the workstation has.
+    logs_dir = os.path.join(
+        config.logik_projekt_path,
+        "logs",
+        config.current_workstation
+    )
+    plan.dirs.add(logs_dir)
+    variables_path = os.path.join(logs_dir, SESSION_VARIABLES_FILENAME)
+    if not os.path.exists(variables_path):
+        plan.new_workstations.append(config.current_workstation)
+        plan.writes.append(
+            (variables_path, json.dumps(data, indent=4))
+        )
+    launcher_path = os.path.join(logs_dir, FLAME_LAUNCHER_SCRIPT_NAME)
+    if not os.path.exists(launcher_path):
+        plan.template_jobs.append(
+            TemplateJob(
+                FLAME_LAUNCHER_TEMPLATE,
+                launcher_path,
+                get_flame_launcher_script_values(
+                    **get_launcher_script_arguments(config)
+                )
+            )
+        )
+    for filename in SHARED_SESSION_FILES:
+        source_path = os.path.join(session_files_dir, filename)
+        destination_path = os.path.join(logs_dir, filename)
+        if (
+                os.path.isfile(source_path) and
+                not os.path.exists(destination_path)
+        ):
+            plan.session_copies.append((source_path, destination_path))
+
+
+def write_text(path: str, text: str):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def create_link(link_path: str, source_path: str):
+    """Links like create_flame_symbolic_links: existing paths are kept."""
+    if os.path.lexists(link_path):
+        if not (
+                os.path.islink(link_path) and
+                os.readlink(link_path) == source_path
+        ):
+            logger.warning(
+                f"Destination path already exists and is not a symlink "
+                f"to {source_path}: {link_path}. Skipping."
+            )
+        return
+    os.symlink(source_path, link_path)
+
+
+@traced()
+def fan_out_workstations(
+        config: ProjektParameters,
+        workstations,
+        session_files_dir: str = None,
+        max_workers: int = None,
+        catalog=None
+) -> FanOutPlan:
+    """
+    Creates the per-workstation artifacts of the projekt of 'config' for
+    every workstation in 'workstations', in one pass.
+
+    Args:
+        config (ProjektParameters): The projekt, as created on any
+            workstation.
+        workstations: The workstation names.
+        session_files_dir (str): Where the workstation-independent
+            session files are copied from, default the session
+            preferences of this application.
+        max_workers (int): Threads writing files.
+        catalog (CatalogBackend): Where new workstations are recorded,
+            default the projekt catalog.
+
+    Returns:
+        FanOutPlan: What was written.
+    """
+    if session_files_dir is None:
+        session_files_dir = os.path.join(
+            path_utils.get_repository_root_dir(),
+            GetApplicationPaths.SESSION_PREFERENCES_DIR
+        )
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    workstation_configs = [
+        get_workstation_config(config, workstation)
+        for workstation in dict.fromkeys(workstations)
+    ]
+
+    plan = FanOutPlan()
+    for workstation_config in workstation_configs:
+        plan_workstation(plan, workstation_config, session_files_dir)
+
+    # The generators leave their files writable by every workstation.
+    os.umask(0)
+    for directory in sorted(plan.dirs):
+        os.makedirs(directory, exist_ok=True)
+
+    # Checks every template before writing, then writes concurrently.
+    render_templates(plan.template_jobs, max_workers=max_workers)
+
+    with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="projekt_fanout"
+    ) as executor:
+        futures = [
+            executor.submit(shutil.copyfile, source, destination)
+            for source, destination in plan.copies
+        ]
+        futures += [
+            executor.submit(shutil.copy2, source, destination)
+            for source, destination in plan.session_copies
+        ]
+        futures += [
+            executor.submit(write_text, path, text)
+            for path, text in plan.writes
+        ]
+        futures += [
+            executor.submit(create_link, link_path, source_path)
+            for link_path, source_path in plan.links
+        ]
+        for future in futures:
+            future.result()
+
+    if plan.new_workstations:
+        if catalog is None:
+            catalog = get_projekt_catalog()
+        catalog.record(
+            make_catalog_entry(
+                workstation_config.__dict__,
+                artifacts=list_projekt_artifacts(workstation_config),
+                source=SOURCE_FAN_OUT
+            )
+            for workstation_config in workstation_configs
+            if workstation_config.current_workstation in plan.new_workstations
+        )
+
+    logger.info(
+        f"Fanned out {config.logik_projekt_name} to "
+        f"{len(workstation_configs)} workstations: "
+        f"{len(plan.template_jobs)} scripts, "
+        f"{len(plan.copies) + len(plan.session_copies) + len(plan.writes)}"
+        f" files, "
+        f"{len(plan.links)} links."
+    )
+    return plan
+
+
+def find_projekt_session(
+        projekt_path: str,
+        workstation: str = None
+) -> str:
+    """
+    Returns the session variables file of 'workstation' in a projekt, or
+    of its first workstation.
+    """
+    variables_paths = find_session_variables(projekt_path)
+    for variables_path in variables_paths:
+        if workstation in (
+                None,
+                os.path.basename(os.path.dirname(variables_path))
+        ):
+            return variables_path
+    raise FileNotFoundError(
+        f"No session variables of {workstation or 'any workstation'} in "
+        f"{projekt_path}"
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Create the per-workstation scripts, links and session files "
+            "of a projekt for many workstations at once."
+        )
+    )
+    parser.add_argument(
+        "projekt",
+        help="projekt directory, or a session variables file"
+    )
+    parser.add_argument("workstations", nargs="+")
+    parser.add_argument(
+        "--from-workstation",
+        default=None,
+        help="workstation whose session is fanned out, default the first"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="files written in parallel"
+    )
+    parser.add_argument(
+        "--catalog",
+        default=None,
+        help="catalog path or postgresql:// DSN"
+    )
+    arguments = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    projekt = os.path.abspath(arguments.projekt)
+    try:
+        if os.path.isdir(projekt):
+            variables_path = find_projekt_session(
+                projekt,
+                arguments.from_workstation
+            )
+        else:
+            variables_path = projekt
+        config = load_projekt_config(variables_path)
+    except (OSError, ValueError, TypeError) as e:
+        logger.error(f"Cannot read the projekt session: {e}")
+        return 1
+
+    # The templates are given relative to the repository.
+    os.chdir(path_utils.get_repository_root_dir())
+    fan_out_workstations(
+        config,
+        arguments.workstations,
+        session_files_dir=os.path.dirname(variables_path),
+        max_workers=arguments.jobs,
+        catalog=get_projekt_catalog(arguments.catalog)
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the multi-workstation fan-out of per-workstation
+#               artifacts.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Derived the Flame projekt name, home and the directories
+#               inside the home for each target workstation instead of
+#               keeping those of the source workstation.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Record the template hashes of the fanned-out scripts.
+# -------------------------------------------------------------------------- #
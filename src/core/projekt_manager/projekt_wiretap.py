@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     projekt_wiretap.py
+# Purpose:      Create the Flame project nodes of many projekts at once.
+# Description:  Reads, for every projekt found in the given paths, the
+#               Flame project name and the project XML that its creation
+#               left in '<projekt>/logs/<workstation>', and creates all of
+#               their nodes in one call of a wiretap backend. With the
+#               'api' backend that is one Wiretap session for every node.
+#               Nodes that already exist are reported and skipped.
+#
+#               python -m src.core.projekt_manager.projekt_wiretap \
+#                   /PROJEKTS [--backend api]
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Module
+# Created:      2026-10-18
+# Modified:     2026-10-18
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+from src.core.utils.trace_utils import traced
+from src.core.utils.wiretap_utils import (
+    WiretapError,
+    WiretapNode,
+    get_wiretap_backend,
+    get_wiretap_metrics,
+)
+from src.core.projekt_manager.projekt_doctor import (
+    find_projekts,
+    load_projekt_config,
+)
+from src.core.projekt_manager.projekt_fanout import find_projekt_session
+
+logger = logging.getLogger(__name__)
+
+WIRETAP_XML_FILENAME = "current_session-wiretap_template.xml"
+
+
+def get_projekt_wiretap_node(
+        projekt_path: str,
+        workstation: str = None
+) -> WiretapNode:
+    """
+    Returns the Flame project node of a projekt, described by the project
+    XML of 'workstation', default its first workstation.
+    """
+    variables_path = find_projekt_session(projekt_path, workstation)
+    config = load_projekt_config(variables_path)
+    xml_path = os.path.join(
+        os.path.dirname(variables_path),
+        WIRETAP_XML_FILENAME
+    )
+    if not os.path.isfile(xml_path):
+        raise FileNotFoundError(f"No project XML in {xml_path}")
+    return WiretapNode(config.flame_projekt_name, xml_path)
+
+
+@traced(category="projekt_wiretap")
+def create_projekt_wiretap_nodes(
+        paths,
+        workstation: str = None,
+        backend=None
+) -> list:
+    """
+    Creates the Flame project nodes of every projekt found in 'paths' in
+    one call of 'backend', default the wiretap backend of
+    LOGIK_PROJEKT_WIRETAP.
+
+    Returns:
+        list: The WiretapResult of each node.
+    """
+    if backend is None:
+        backend = get_wiretap_backend()
+    nodes = []
+    for projekt_path in find_projekts(paths):
+        try:
+            nodes.append(get_projekt_wiretap_node(projekt_path, workstation))
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Skipping {projekt_path}: {e}")
+    results = backend.create_nodes(nodes)
+    created = sum(result.ok for result in results)
+    existing = sum(result.exists for result in results)
+    logger.info(
+        f"Created {created} of {len(results)} wiretap nodes with the "
+        f"{backend.name} backend, {existing} already existed."
+    )
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Create the Flame project nodes of many projekts in one "
+            "wiretap session."
+        )
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="projekts, or directories of projekts"
+    )
+    parser.add_argument(
+        "--workstation",
+        default=None,
+        help="workstation whose project XML is used, default the first"
+    )
+    parser.add_argument(
+        "--backend",
+        default=None,
+        help="'cli', 'api' or 'local:<directory>', "
+             "default LOGIK_PROJEKT_WIRETAP or 'cli'"
+    )
+    parser.add_argument("--json", action="store_true")
+    arguments = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    try:
+        results = create_projekt_wiretap_nodes(
+            arguments.paths,
+            arguments.workstation,
+            get_wiretap_backend(arguments.backend)
+        )
+    except WiretapError as e:
+        logger.error(str(e))
+        return 1
+
+    metrics = get_wiretap_metrics().to_dict()
+    if arguments.json:
+        print(json.dumps(
+            {
+                "results": [result.to_dict() for result in results],
+                "metrics": metrics,
+            },
+            indent=4
+        ))
+    else:
+        for name, metric in metrics.items():
+            print(
+                f"{name}: {metric['calls']} calls, "
+                f"{metric['failures']} failed, "
+                f"mean {metric['mean_seconds'] * 1000:.1f} ms, "
+                f"max {metric['max_seconds'] * 1000:.1f} ms"
+            )
+    failed = [
+        result for result in results
+        if not result.ok and not result.exists
+    ]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the bulk creation of projekt wiretap nodes.
+# -------------------------------------------------------------------------- #
@@ -6,6 +6,15 @@ from .backup_utils import (
 from .calculated_name_utils import (
     get_calculated_name,
 )
+from .flame_launch_utils import (
+    FlameLaunch,
+    get_flame_launches,
+    launch_flame,
+)
+from .flame_workspace_utils import (
+    compile_flame_workspace_plan,
+    write_flame_workspace_plan,
+)
 from .flame_software_utils import (
     get_installed_flame_versions,
     sanitize_flame_version_name,
@@ -26,6 +35,21 @@ from .path_utils import (
     get_repository_root_dir,
     create_directory,
 )
+from .preset_store_utils import (
+    PresetStore,
+    get_preset_store_dir,
+    materialize_tree,
+)
+from .projekt_catalog_utils import (
+    CatalogBackend,
+    CatalogError,
+    get_projekt_catalog,
+)
+from .session_log_utils import (
+    SessionLogManager,
+    get_session_log_manager,
+    start_session_log,
+)
 from .system_info_utils import (
     get_current_user,
     get_fqdn,
@@ -38,6 +62,26 @@ from .system_info_utils import (
     get_os_name,
     print_system_info,
 )
+from .system_snapshot_utils import (
+    SystemSnapshot,
+    get_system_snapshot,
+    start_system_snapshot,
+)
+from .template_utils import (
+    TemplateError,
+    TemplateJob,
+    compile_template,
+    load_template,
+    render_template,
+    render_templates,
+)
+from .trace_utils import (
+    flush_trace,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+    traced,
+)
 from .threaded_logging_utils import (
     LogEmitter,
     SignalHandler,
@@ -47,12 +91,25 @@ from .validation_utils import (
     validate_init_config,
     validate_logik_projekt_name,
 )
+from .wiretap_utils import (
+    WiretapBackend,
+    WiretapError,
+    WiretapNode,
+    WiretapResult,
+    get_wiretap_backend,
+    get_wiretap_metrics,
+)
 
 __all__ = [
     "get_rsync_backup_command",
     "run_rsync_backup",
     "get_rsync_backup_script_path",
     "get_calculated_name",
+    "FlameLaunch",
+    "get_flame_launches",
+    "launch_flame",
+    "compile_flame_workspace_plan",
+    "write_flame_workspace_plan",
     "get_installed_flame_versions",
     "sanitize_flame_version_name",
     "sanitize_flame_version_number",
@@ -65,6 +122,15 @@ __all__ = [
     "get_ocio_name",
     "get_repository_root_dir",
     "create_directory",
+    "PresetStore",
+    "get_preset_store_dir",
+    "materialize_tree",
+    "CatalogBackend",
+    "CatalogError",
+    "get_projekt_catalog",
+    "SessionLogManager",
+    "get_session_log_manager",
+    "start_session_log",
     "get_current_user",
     "get_fqdn",
     "get_hostnames",
@@ -75,9 +141,29 @@ __all__ = [
     "get_short_hostname",
     "get_os_name",
     "print_system_info",
+    "SystemSnapshot",
+    "get_system_snapshot",
+    "start_system_snapshot",
+    "TemplateError",
+    "TemplateJob",
+    "compile_template",
+    "load_template",
+    "render_template",
+    "render_templates",
+    "flush_trace",
+    "start_tracing",
+    "stop_tracing",
+    "trace_span",
+    "traced",
     "LogEmitter",
     "SignalHandler",
     "validate_client_campaign_names",
     "validate_init_config",
     "validate_logik_projekt_name",
+    "WiretapBackend",
+    "WiretapError",
+    "WiretapNode",
+    "WiretapResult",
+    "get_wiretap_backend",
+    "get_wiretap_metrics",
 ]
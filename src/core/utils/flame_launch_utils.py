@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     flame_launch_utils.py
+# Purpose:      Launch Flame detached from the projekt creation.
+# Description:  Starts the Flame launcher script in its own session and
+#               returns at once with a FlameLaunch handle. A background
+#               thread pumps the launcher output into a size-rotated log
+#               and follows the state of the launch, which the UI can poll
+#               or be called back with. Flame is up once the projekt's
+#               startup script prints FLAME_READY_MARKER.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-18
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import time
+import logging
+import threading
+import subprocess
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLAME_LAUNCH_LOG_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_FLAME_LAUNCH_LOG_BACKUP_COUNT = 3
+DEFAULT_FLAME_LAUNCH_LOG_FORMAT = '%(asctime)s - %(message)s'
+
+# Printed by flame_startup_script_template.py once Flame runs it.
+FLAME_READY_MARKER = "LOGIK-PROJEKT: Flame startup script started."
+
+FLAME_LAUNCH_STARTING = "starting"
+FLAME_LAUNCH_RUNNING = "running"
+FLAME_LAUNCH_READY = "ready"
+FLAME_LAUNCH_EXITED = "exited"
+FLAME_LAUNCH_FAILED = "failed"
+
+_launches = []
+_launches_lock = threading.Lock()
+
+
+class FlameLaunch:
+    """
+    Status handle of one Flame launch.
+
+    'status' goes from starting to running when the launcher process is
+    up, to ready when Flame runs the projekt's startup script, and ends as
+    exited or failed. 'on_status' is called with the new status from the
+    output thread, so UI code must hand it over to its own thread.
+    """
+
+    def __init__(
+            self,
+            launcher_script_path: str,
+            log_path: str,
+            on_status: Optional[Callable[[str], None]] = None,
+            max_bytes: int = DEFAULT_FLAME_LAUNCH_LOG_MAX_BYTES,
+            backup_count: int = DEFAULT_FLAME_LAUNCH_LOG_BACKUP_COUNT
+    ):
+        self.launcher_script_path = launcher_script_path
+        self.log_path = log_path
+        self.on_status = on_status
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.status = FLAME_LAUNCH_STARTING
+        self.returncode = None
+        self.error = None
+        self.started_at = None
+        self.ready_at = None
+        self.finished_at = None
+        self.process = None
+        self._ready = threading.Event()
+        self._finished = threading.Event()
+        self._thread = None
+
+    # ====================================================================== #
+    # This section starts the launch and pumps its output.
+    # ====================================================================== #
+
+    def start(self) -> "FlameLaunch":
+        """
+        Starts the launcher and the output thread, and returns without
+        waiting for Flame.
+        """
+        self.started_at = time.time()
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            os.chmod(self.launcher_script_path, 0o755)
+            # SIGPIPE stays ignored in the launcher, so if this application
+            # quits first, its 'tee' loses the pipe but Flame keeps running
+            # and logging to the projekt.
+            self.process = subprocess.Popen(
+                [self.launcher_script_path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                bufsize=1,
+                start_new_session=True,
+                restore_signals=False
+            )
+        except OSError as e:
+            self.error = str(e)
+            logger.error(f"Failed to launch Flame: {e}")
+            self._finish(FLAME_LAUNCH_FAILED)
+            return self
+
+        logger.info(
+            f"Launched Flame with {self.launcher_script_path} "
+            f"(pid {self.process.pid}), output in {self.log_path}"
+        )
+        self._set_status(FLAME_LAUNCH_RUNNING)
+        self._thread = threading.Thread(
+            target=self._pump,
+            name=f"flame-launch-{self.process.pid}",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _open_log(self) -> logging.Logger:
+        output_logger = logging.getLogger(
+            f"{__name__}.output.{self.process.pid}"
+        )
+        output_logger.propagate = False
+        output_logger.setLevel(logging.INFO)
+        handler = RotatingFileHandler(
+            self.log_path,
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count
+        )
+        handler.setFormatter(
+            logging.Formatter(DEFAULT_FLAME_LAUNCH_LOG_FORMAT)
+        )
+        output_logger.addHandler(handler)
+        return output_logger
+
+    def _pump(self):
+        """Copies the launcher output to the log until the launcher exits."""
+        output_logger = self._open_log()
+        try:
+            for line in self.process.stdout:
+                output_logger.info(line.rstrip("\n"))
+                if not self._ready.is_set() and FLAME_READY_MARKER in line:
+                    self.ready_at = time.time()
+                    logger.info(
+                        f"Flame is up after "
+                        f"{self.ready_at - self.started_at:.1f} s."
+                    )
+                    self._set_status(FLAME_LAUNCH_READY)
+            self.process.stdout.close()
+            self.returncode = self.process.wait()
+        finally:
+            for handler in list(output_logger.handlers):
+                output_logger.removeHandler(handler)
+                handler.close()
+
+        if self.returncode:
+            self.error = f"launcher exited with code {self.returncode}"
+            logger.error(f"Flame launch failed: {self.error}")
+            self._finish(FLAME_LAUNCH_FAILED)
+        else:
+            logger.info("Flame exited.")
+            self._finish(FLAME_LAUNCH_EXITED)
+
+    def _set_status(self, status: str):
+        self.status = status
+        if status == FLAME_LAUNCH_READY:
+            self._ready.set()
+        if self.on_status is not None:
+            try:
+                self.on_status(status)
+            except Exception as e:
+                logger.warning(f"Flame launch status callback failed: {e}")
+
+    def _finish(self, status: str):
+        self.finished_at = time.time()
+        self._set_status(status)
+        self._finished.set()
+
+    # ====================================================================== #
+    # This section reports the launch.
+    # ====================================================================== #
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def is_finished(self) -> bool:
+        return self._finished.is_set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until Flame is up or the launch is over.
+
+        Returns:
+            bool: True if Flame is up.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._ready.is_set() and not self._finished.is_set():
+            remaining = (
+                None if deadline is None else deadline - time.monotonic()
+            )
+            if remaining is not None and remaining <= 0:
+                break
+            self._finished.wait(
+                0.1 if remaining is None else min(0.1, remaining)
+            )
+        return self._ready.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Waits until the launch is over and returns the exit code."""
+        self._finished.wait(timeout)
+        return self.returncode
+
+    def to_dict(self) -> dict:
+        return {
+            "launcher_script_path": self.launcher_script_path,
+            "log_path": self.log_path,
+            "pid": self.pid,
+            "status": self.status,
+            "returncode": self.returncode,
+            "error": self.error,
+            "started_at": self.started_at,
+            "ready_at": self.ready_at,
+            "finished_at": self.finished_at,
+        }
+
+
+def launch_flame(
+        launcher_script_path: str,
+        log_path: str,
+        on_status: Optional[Callable[[str], None]] = None
+) -> FlameLaunch:
+    """
+    Starts Flame with 'launcher_script_path' without waiting for it.
+
+    Returns:
+        FlameLaunch: The status handle of the launch.
+    """
+    launch = FlameLaunch(launcher_script_path, log_path, on_status)
+    with _launches_lock:
+        _launches[:] = [
+            previous for previous in _launches
+            if not previous.is_finished()
+        ]
+        _launches.append(launch)
+    return launch.start()
+
+
+def get_flame_launches() -> list:
+    """Returns the launches of this process that have not finished."""
+    with _launches_lock:
+        return [
+            launch for launch in _launches
+            if not launch.is_finished()
+        ]
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the detached Flame launch with its output pump,
+#               rotating log and status handle.
+# -------------------------------------------------------------------------- #
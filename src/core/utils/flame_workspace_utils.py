@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     flame_workspace_utils.py
+# Purpose:      Compile a Flame workspace template into a build plan.
+# Description:  Flattens the nested 'flame-workspace.json' template into an
+#               ordered list of create, rename, colour and expand operations
+#               that the Flame startup script replays with the fewest Flame
+#               API calls. All of the tree walking and name matching happens
+#               here, at projekt creation, instead of at Flame launch.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+FLAME_WORKSPACE_PLAN_VERSION = 1
+
+# Default reels of the desktop 'Reels' group, mapped to template positions.
+DEFAULT_DESKTOP_REEL_MATCH = {
+    "Reel 1": 0,
+    "Reel 2": 1,
+    "Sequences": 2,
+}
+
+# Item types whose final expanded state is looked up by name, as the
+# legacy 'set_all_expansion_states' pass of the startup script did.
+NAME_MATCHED_EXPANSION_TYPES = ("library", "folder", "reel_group")
+
+
+def filler_reel_names(reel_group_name: str) -> list:
+    """The reels a new reel group gets when the template lists none."""
+    return [f"{reel_group_name}-{number}" for number in range(1, 4)]
+
+
+class _FlameWorkspacePlanCompiler:
+    def __init__(self, workspace_data: list):
+        self.workspace_data = workspace_data
+        self.operations = []
+        self.expansions = []
+        self.next_ref = 0
+        self.template_map = {}
+        self._build_template_map(workspace_data)
+
+    def _build_template_map(self, items):
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            if item.get("name"):
+                self.template_map[item["name"]] = item
+            for child_key in ("children", "reels", "items"):
+                if isinstance(item.get(child_key), list):
+                    self._build_template_map(item[child_key])
+
+    def _new_ref(self) -> int:
+        ref = self.next_ref
+        self.next_ref += 1
+        return ref
+
+    def _final_expanded(self, item: dict, name_matched: bool) -> bool:
+        if name_matched:
+            name = item.get("name", "")
+            if "{" not in name and name in self.template_map:
+                return bool(self.template_map[name].get("expanded", False))
+        return bool(item.get("expanded", False))
+
+    def _emit_properties(self, ref: int, item: dict, item_type: str):
+        if item.get("colour") is not None and item_type != "folder":
+            self.operations.append(
+                {"op": "set", "ref": ref, "attribute": "colour",
+                 "value": list(item["colour"])}
+            )
+        if item_type == "library":
+            for attribute in ("colour_label", "tags"):
+                if item.get(attribute) is not None:
+                    self.operations.append(
+                        {"op": "set", "ref": ref, "attribute": attribute,
+                         "value": item[attribute]}
+                    )
+        if item_type == "reel" and item.get("reel_type"):
+            self.operations.append(
+                {"op": "set", "ref": ref, "attribute": "reel_type",
+                 "value": item["reel_type"]}
+            )
+
+    def _emit_expansion(self, ref: int, expanded: bool):
+        self.expansions.append(
+            {"op": "set", "ref": ref, "attribute": "expanded",
+             "value": expanded}
+        )
+
+    def _emit_reels(
+            self,
+            parent_ref: int,
+            reel_items: list,
+            match: dict,
+            delete_unmatched: bool,
+            name_matched: bool,
+            literal: bool = False,
+            match_names: bool = False
+    ):
+        reel_items = [
+            reel_item for reel_item in reel_items
+            if isinstance(reel_item, dict) and reel_item.get("name")
+        ]
+        targets = []
+        for reel_item in reel_items:
+            targets.append(
+                {"ref": self._new_ref(), "name": reel_item["name"]}
+            )
+        operation = {
+            "op": "adopt_reels",
+            "parent": parent_ref,
+            "reels": targets,
+            "match": match,
+            "reuse_prefix": "Reel ",
+            "delete_unmatched": delete_unmatched,
+        }
+        if literal:
+            operation["literal"] = True
+        if match_names:
+            # Reels already in the group are found by name and kept, and
+            # its 'Reel ' reels are left alone, as the template walk does
+            operation["match_names"] = True
+            operation["reuse_prefix"] = None
+        self.operations.append(operation)
+        for target, reel_item in zip(targets, reel_items):
+            self._emit_properties(target["ref"], reel_item, "reel")
+            self._emit_expansion(
+                target["ref"],
+                self._final_expanded(reel_item, name_matched)
+            )
+
+    def _emit_filler_reels(self, parent_ref: int, group_name: str):
+        # A reel group created on the desktop gets the '<name>-1..3' reels
+        # of 'create_reel_group' before the reels the template lists. A
+        # group that already exists is left as it is.
+        self.operations.append(
+            {
+                "op": "adopt_reels",
+                "parent": parent_ref,
+                "reels": [
+                    {"ref": self._new_ref(), "name": reel_name}
+                    for reel_name in filler_reel_names(group_name)
+                ],
+                "match": {},
+                "reuse_prefix": "Reel ",
+                "delete_unmatched": False,
+                "if_created": True,
+            }
+        )
+
+    def _compile_desktop_contents(self, items: list):
+        desktop_ref = self._new_ref()
+        self.operations.append({"op": "desktop", "ref": desktop_ref})
+
+        template_default_reel_group = next(
+            (item for item in items if item.get("type") == "reel_group"),
+            None
+        )
+
+        if template_default_reel_group is not None:
+            group_ref = self._new_ref()
+            self.operations.append(
+                {
+                    "op": "find",
+                    "ref": group_ref,
+                    "parent": desktop_ref,
+                    "type": "reel_group",
+                    "name": "Reels",
+                    "or_create": template_default_reel_group.get("name"),
+                }
+            )
+            self.operations.append(
+                {"op": "rename", "ref": group_ref,
+                 "name": template_default_reel_group.get("name")}
+            )
+            self._emit_properties(
+                group_ref, template_default_reel_group, "reel_group"
+            )
+            self._emit_expansion(
+                group_ref,
+                bool(template_default_reel_group.get("expanded", False))
+            )
+            self._emit_reels(
+                group_ref,
+                template_default_reel_group.get("reels", []),
+                DEFAULT_DESKTOP_REEL_MATCH,
+                delete_unmatched=True,
+                name_matched=True
+            )
+
+        for item in items:
+            if item is template_default_reel_group:
+                continue
+            item_type = item.get("type")
+            if item_type not in ("reel_group", "batch_group", "reel"):
+                logger.warning(f"Skipping invalid desktop item: {item}")
+                continue
+            if not item.get("name"):
+                logger.warning(f"Skipping invalid desktop item: {item}")
+                continue
+            ref = self._new_ref()
+            self.operations.append(
+                {
+                    "op": "create",
+                    "ref": ref,
+                    "parent": desktop_ref,
+                    "type": item_type,
+                    "name": item["name"],
+                    "ensure": True,
+                }
+            )
+            if item_type == "batch_group":
+                continue
+            self._emit_properties(ref, item, item_type)
+            self._emit_expansion(ref, bool(item.get("expanded", False)))
+            if item_type == "reel_group":
+                self._emit_filler_reels(ref, item["name"])
+                self._emit_reels(
+                    ref,
+                    item.get("reels", []),
+                    {},
+                    delete_unmatched=False,
+                    name_matched=False,
+                    match_names=True
+                )
+
+    def _compile_item(self, item: dict, parent_ref):
+        item_type = item.get("type")
+        item_name = item.get("name")
+
+        if item_type == "desktop":
+            self.operations.append(
+                {
+                    "op": "rename_desktop",
+                    "name": item.get("name_template", "{date}-{user}"),
+                }
+            )
+            return
+
+        if item_type == "desktop_contents":
+            self._compile_desktop_contents(item.get("items", []))
+            return
+
+        if not item_type or not item_name:
+            logger.warning(f"Skipping invalid workspace item: {item}")
+            return
+
+        if item_type != "library" and parent_ref is None:
+            logger.warning(
+                f"Skipping item '{item_name}' of type '{item_type}' "
+                f"because it has no valid parent."
+            )
+            return
+
+        if item_type not in ("library", "folder", "reel", "reel_group"):
+            logger.warning(f"Skipping unknown workspace item type: {item}")
+            return
+
+        ref = self._new_ref()
+        self.operations.append(
+            {
+                "op": "create",
+                "ref": ref,
+                "parent": None if item_type == "library" else parent_ref,
+                "type": item_type,
+                "name": item_name,
+                "literal": True,
+            }
+        )
+        self._emit_properties(ref, item, item_type)
+        self._emit_expansion(
+            ref,
+            self._final_expanded(
+                item,
+                item_type in NAME_MATCHED_EXPANSION_TYPES
+            )
+        )
+
+        if item_type == "reel_group":
+            reel_names = (
+                item.get("reel_names") or filler_reel_names(item_name)
+            )
+            self._emit_reels(
+                ref,
+                [{"name": reel_name} for reel_name in reel_names],
+                {},
+                delete_unmatched=False,
+                name_matched=False,
+                literal=True
+            )
+
+        for child_item in item.get("children", []):
+            if isinstance(child_item, dict):
+                self._compile_item(child_item, ref)
+
+    def compile(self) -> dict:
+        for item in self.workspace_data:
+            if isinstance(item, dict):
+                self._compile_item(item, None)
+
+        self.operations.append(
+            {"op": "delete", "parent": None, "type": "library",
+             "name": "Default Library"}
+        )
+
+        return {
+            "version": FLAME_WORKSPACE_PLAN_VERSION,
+            "operations": self.operations + self.expansions,
+        }
+
+
+def compile_flame_workspace_plan(workspace_data: list) -> dict:
+    """
+    Compiles the nested workspace template into a flat build plan.
+
+    Every operation refers to Flame objects by an integer 'ref' assigned
+    at compile time. Desktop names may keep the '{date}' and '{user}'
+    tokens, which the startup script resolves when Flame launches; names
+    of the library tree are marked 'literal' and used as written. Expanded
+    states are set once per object, after everything has been created.
+
+    Args:
+        workspace_data (list): The parsed 'flame-workspace.json' template.
+
+    Returns:
+        dict: {'version': int, 'operations': list of operation dicts}.
+    """
+    return _FlameWorkspacePlanCompiler(workspace_data).compile()
+
+
+def write_flame_workspace_plan(workspace_data: list, plan_path) -> dict:
+    """Compiles the workspace template and writes the plan as JSON."""
+    workspace_plan = compile_flame_workspace_plan(workspace_data)
+    with open(plan_path, 'w', encoding='utf-8') as f:
+        json.dump(workspace_plan, f, indent=4)
+    logger.info(
+        f"Compiled {len(workspace_plan['operations'])} Flame workspace "
+        f"operations to: {plan_path}"
+    )
+    return workspace_plan
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Compile the Flame workspace template into a build plan.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Give new desktop reel groups their '<name>-1..3' reels.
+#               Keep library tree names literal, as the template walk does.
+#               Match the reels of existing desktop reel groups by name.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Utility
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -26,12 +26,21 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# The root found from this file, which does not move while running.
+_repository_root_dir = None
+
 
 def get_repository_root_dir(start_path=None):
+    global _repository_root_dir
     if start_path is None:
-        current_path = Path(__file__).resolve()
-    else:
-        current_path = Path(start_path).resolve()
+        if _repository_root_dir is None:
+            _repository_root_dir = find_repository_root_dir(__file__)
+        return _repository_root_dir
+    return find_repository_root_dir(start_path)
+
+
+def find_repository_root_dir(start_path):
+    current_path = Path(start_path).resolve()
 
     # Primary method: Look for .git and src
     for parent in [current_path] + list(current_path.parents):
@@ -97,3 +106,7 @@ def create_directory(path: str):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Find the repository root of this file once per process.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     preset_store_utils.py
+# Purpose:      Share preset files between projekts through a
+#               content-addressed store.
+# Description:  Keeps one blob per distinct file content in a store on the
+#               projekts volume and materializes preset trees into a
+#               projekt as reflinks (FICLONE) where the filesystem can
+#               clone, else as copies. A manifest in the projekt records
+#               the blob and method of every path.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import sys
+import json
+import stat
+import errno
+import fcntl
+import shutil
+import hashlib
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# The store lives next to the projekts, e.g. /PROJEKTS/.logik-preset-store.
+PRESET_STORE_DIRNAME = ".logik-preset-store"
+PRESET_STORE_INDEX_FILENAME = "index.json"
+PRESET_STORE_LOCK_FILENAME = ".index.lock"
+PRESET_STORE_INDEX_VERSION = 1
+
+# Written to the root of every materialized destination.
+PRESET_MANIFEST_FILENAME = ".logik-preset-manifest.json"
+PRESET_MANIFEST_VERSION = 1
+
+# Linux ioctl cloning a whole file (linux/fs.h), not exported by 'fcntl'.
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+# The materialization methods, in the order they are tried.
+METHOD_REFLINK = "reflink"
+METHOD_COPY = "copy"
+METHOD_LOCAL = "local"
+
+# Errors meaning "this filesystem cannot do that", as opposed to real
+# failures.
+_UNSUPPORTED_ERRNOS = frozenset(
+    {
+        errno.EXDEV,
+        errno.EPERM,
+        errno.EMLINK,
+        errno.EINVAL,
+        errno.ENOTTY,
+        errno.ENOSYS,
+        errno.EOPNOTSUPP,
+    }
+)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_preset_store_dir(logik_projekt_path: str) -> str:
+    """Returns the store shared by the projekts next to 'logik_projekt_path'."""
+    return os.path.join(
+        os.path.dirname(os.path.abspath(logik_projekt_path)),
+        PRESET_STORE_DIRNAME
+    )
+
+
+def _write_json_atomic(path: str, data):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f, indent=4)
+    os.replace(temp_path, path)
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(source_path: str, destination_path: str):
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflinks need Linux FICLONE")
+    with open(source_path, "rb") as src:
+        try:
+            with open(destination_path, "xb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            if os.path.lexists(destination_path):
+                os.remove(destination_path)
+            raise
+
+
+class PresetStore:
+    """
+    A content-addressed store of preset files.
+
+    Blobs are named by the SHA-256 of their content, with a '.x' suffix
+    for executable files, and are read-only. Presets are never hard
+    linked to a blob: reflinks and copies are private to the projekt and
+    carry the mode of their source, so a preset can be edited in place.
+    The index remembers the blob of every source file by size and mtime,
+    so unchanged sources are not hashed again.
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = os.path.abspath(store_dir)
+        self.blobs_dir = os.path.join(self.store_dir, "blobs")
+        self.index_path = os.path.join(
+            self.store_dir,
+            PRESET_STORE_INDEX_FILENAME
+        )
+        self.lock_path = os.path.join(
+            self.store_dir,
+            PRESET_STORE_LOCK_FILENAME
+        )
+        self.index = None
+        self.index_changed = False
+        # (method, st_dev) pairs found not to work on a filesystem, so a
+        # failing ioctl is tried once per destination filesystem.
+        self.unsupported = set()
+
+    # ====================================================================== #
+    # This section reads and writes the index.
+    # ====================================================================== #
+
+    @contextmanager
+    def _locked(self):
+        """Serialises index updates between workstations."""
+        os.makedirs(self.store_dir, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+            if index.get("version") == PRESET_STORE_INDEX_VERSION:
+                return index
+        except (OSError, ValueError):
+            pass
+        return {"version": PRESET_STORE_INDEX_VERSION, "sources": {}}
+
+    def load_index(self):
+        if self.index is None:
+            self.index = self._read_index()
+
+    def save_index(self):
+        """Merges the sources added since loading into the index file."""
+        if not self.index_changed:
+            return
+        with self._locked():
+            index = self._read_index()
+            index["sources"].update(self.index["sources"])
+            _write_json_atomic(self.index_path, index)
+            self.index = index
+        self.index_changed = False
+
+    # ====================================================================== #
+    # This section adds blobs.
+    # ====================================================================== #
+
+    def blob_path(self, key: str) -> str:
+        return os.path.join(self.blobs_dir, key[:2], key)
+
+    def add_file(self, source_path: str, source_stat=None) -> str:
+        """
+        Stores the content of 'source_path' unless it is stored already.
+
+        Returns:
+            str: The blob key.
+        """
+        self.load_index()
+        source_path = os.path.abspath(source_path)
+        if source_stat is None:
+            source_stat = os.stat(source_path)
+        executable = bool(source_stat.st_mode & 0o111)
+
+        known = self.index["sources"].get(source_path)
+        if (
+                known
+                and known[0] == source_stat.st_size
+                and known[1] == source_stat.st_mtime_ns
+                and os.path.exists(self.blob_path(known[2]))
+        ):
+            return known[2]
+
+        key = _hash_file(source_path) + (".x" if executable else "")
+        blob_path = self.blob_path(key)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            temp_path = f"{blob_path}.{os.getpid()}.tmp"
+            shutil.copyfile(source_path, temp_path)
+            os.chmod(temp_path, 0o555 if executable else 0o444)
+            os.replace(temp_path, blob_path)
+
+        self.index["sources"][source_path] = [
+            source_stat.st_size,
+            source_stat.st_mtime_ns,
+            key,
+        ]
+        self.index_changed = True
+        return key
+
+    # ====================================================================== #
+    # This section materializes blobs.
+    # ====================================================================== #
+
+    def link_blob(self, key: str, destination_path: str, mode: int) -> str:
+        """
+        Creates 'destination_path' from a blob with 'mode', as a reflink
+        where the filesystem can clone, else as a copy.
+
+        Returns:
+            str: The method that worked.
+        """
+        blob_path = self.blob_path(key)
+        device = os.stat(os.path.dirname(destination_path)).st_dev
+
+        if (METHOD_REFLINK, device) not in self.unsupported:
+            try:
+                _reflink(blob_path, destination_path)
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                self.unsupported.add((METHOD_REFLINK, device))
+                logger.debug(
+                    f"No {METHOD_REFLINK}s from {self.store_dir} to "
+                    f"{os.path.dirname(destination_path)}: {e}"
+                )
+            else:
+                os.chmod(destination_path, mode)
+                return METHOD_REFLINK
+
+        shutil.copyfile(blob_path, destination_path)
+        os.chmod(destination_path, mode)
+        return METHOD_COPY
+
+    def materialize(
+            self,
+            source_dir: str,
+            destination_dir: str,
+            manifest_path: str = None,
+            transform=None
+    ) -> dict:
+        """
+        Recreates 'source_dir' in 'destination_dir' from the store.
+
+        Existing destination paths are left alone, like 'rsync
+        --ignore-existing'. Symbolic links are recreated as links.
+
+        Args:
+            source_dir (str): The tree to materialize.
+            destination_dir (str): Where to materialize it.
+            manifest_path (str): The manifest to record the files in.
+                Defaults to PRESET_MANIFEST_FILENAME in 'destination_dir'.
+            transform (callable): Called with the relative path and the
+                source path of every file. If it returns a string, the
+                file is written with that content instead of being
+                linked, and recorded as 'local'.
+
+        Returns:
+            dict: The number of files per method, plus 'existing'.
+        """
+        source_dir = os.path.abspath(source_dir)
+        destination_dir = os.path.abspath(destination_dir)
+        if manifest_path is None:
+            manifest_path = os.path.join(
+                destination_dir,
+                PRESET_MANIFEST_FILENAME
+            )
+        manifest_root = os.path.dirname(os.path.abspath(manifest_path))
+
+        counts = {}
+        entries = {}
+        for dir_path, dir_names, file_names in os.walk(source_dir):
+            dir_names.sort()
+            relative_dir = os.path.relpath(dir_path, source_dir)
+            target_dir = os.path.normpath(
+                os.path.join(destination_dir, relative_dir)
+            )
+            os.makedirs(target_dir, exist_ok=True)
+
+            for name in sorted(file_names):
+                source_path = os.path.join(dir_path, name)
+                relative_path = os.path.normpath(
+                    os.path.join(relative_dir, name)
+                )
+                target_path = os.path.join(target_dir, name)
+                if os.path.lexists(target_path):
+                    counts["existing"] = counts.get("existing", 0) + 1
+                    continue
+
+                source_stat = os.lstat(source_path)
+                if stat.S_ISLNK(source_stat.st_mode):
+                    os.symlink(os.readlink(source_path), target_path)
+                    continue
+
+                content = (
+                    transform(relative_path, source_path)
+                    if transform else None
+                )
+                if content is not None:
+                    with open(target_path, "w") as f:
+                        f.write(content)
+                    os.chmod(target_path, stat.S_IMODE(source_stat.st_mode))
+                    key, method = None, METHOD_LOCAL
+                else:
+                    key = self.add_file(source_path, source_stat)
+                    method = self.link_blob(
+                        key,
+                        target_path,
+                        stat.S_IMODE(source_stat.st_mode)
+                    )
+
+                counts[method] = counts.get(method, 0) + 1
+                entries[os.path.relpath(target_path, manifest_root)] = {
+                    "blob": key,
+                    "method": method,
+                }
+
+        self.save_index()
+        if entries:
+            update_manifest(manifest_path, self.store_dir, entries)
+        return counts
+
+
+def read_manifest(manifest_path: str) -> dict:
+    try:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == PRESET_MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": PRESET_MANIFEST_VERSION, "store": "", "files": {}}
+
+
+def update_manifest(manifest_path: str, store_dir: str, entries: dict):
+    """Adds 'entries' to a manifest, keeping the paths recorded before."""
+    manifest = read_manifest(manifest_path)
+    manifest["store"] = store_dir
+    manifest["files"].update(entries)
+    _write_json_atomic(manifest_path, manifest)
+
+
+def materialize_tree(
+        source_dir: str,
+        destination_dir: str,
+        store_dir: str,
+        manifest_path: str = None,
+        transform=None
+) -> dict:
+    """Materializes one tree through the store in 'store_dir'."""
+    counts = PresetStore(store_dir).materialize(
+        source_dir,
+        destination_dir,
+        manifest_path,
+        transform
+    )
+    logger.info(
+        f"Materialized {source_dir} in {destination_dir}: "
+        + ", ".join(
+            f"{count} {method}" for method, count in sorted(counts.items())
+        )
+    )
+    return counts
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the content-addressed preset store.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Presets are reflinked or copied with the mode of their
+#               source instead of hard linked to the read-only blobs.
+# -------------------------------------------------------------------------- #
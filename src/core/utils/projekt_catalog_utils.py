@@ -0,0 +1,780 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     projekt_catalog_utils.py
+# Purpose:      Keep a catalog of every projekt in a database.
+# Description:  Every creation records its full ProjektParameters, the
+#               timing of each creation step and the artifacts it made,
+#               one entry per projekt and workstation. The UI, the command
+#               line and the projekt doctor look projekts up in the catalog
+#               instead of scanning the projekts directory.
+#
+#               The catalog is a SQLite database in the local data
+#               directory of the user by default, which needs no service.
+#               Setting LOGIK_PROJEKT_CATALOG to a path moves it; setting
+#               it to a postgresql:// DSN uses a PostgreSQL server through
+#               psycopg2 instead.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# A path or a postgresql:// DSN. Unset, the catalog is the SQLite database
+# in the local data directory of the user, DEFAULT_CATALOG_PATH.
+CATALOG_ENVIRONMENT_VARIABLE = "LOGIK_PROJEKT_CATALOG"
+# Local and per user, since SQLite locking is unreliable over NFS.
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.environ.get(
+        "XDG_DATA_HOME",
+        os.path.join(os.path.expanduser("~"), ".local", "share")
+    ),
+    "logik-projekt",
+    "logik_projekt_catalog.sqlite"
+)
+POSTGRES_DSN_PREFIXES = ("postgresql://", "postgres://")
+
+# Escapes '%' and '_' in LIKE patterns, which are common in projekt names.
+LIKE_ESCAPE_CHARACTER = "\\"
+
+# How long a writer waits for another writer to finish, in seconds.
+SQLITE_BUSY_TIMEOUT = 30
+
+PROC_MOUNTS_PATH = "/proc/mounts"
+
+# Filesystems on which SQLite cannot share the WAL index between hosts.
+NETWORK_FILESYSTEM_TYPES = frozenset(
+    {
+        "nfs",
+        "nfs4",
+        "cifs",
+        "smbfs",
+        "smb3",
+        "afs",
+        "9p",
+        "ceph",
+        "glusterfs",
+        "lustre",
+        "gpfs",
+        "fuse.sshfs",
+    }
+)
+
+# Projekts looked up per query when collecting their sessions.
+QUERY_CHUNK_SIZE = 500
+
+# Where an entry came from.
+SOURCE_CREATION = "creation"
+SOURCE_BACKFILL = "backfill"
+SOURCE_FAN_OUT = "fan-out"
+
+# The schema is written in the SQL both backends understand.
+CATALOG_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS projekts (
+        projekt_path TEXT PRIMARY KEY,
+        projekt_name TEXT NOT NULL,
+        flame_projekt_name TEXT NOT NULL,
+        config_name TEXT NOT NULL,
+        created_at DOUBLE PRECISION NOT NULL,
+        updated_at DOUBLE PRECISION NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        projekt_path TEXT NOT NULL
+            REFERENCES projekts (projekt_path) ON DELETE CASCADE,
+        workstation TEXT NOT NULL,
+        user_name TEXT NOT NULL,
+        flame_version TEXT NOT NULL,
+        resolution TEXT NOT NULL,
+        frame_rate TEXT NOT NULL,
+        ocio_config TEXT NOT NULL,
+        source TEXT NOT NULL,
+        recorded_at DOUBLE PRECISION NOT NULL,
+        parameters TEXT NOT NULL,
+        PRIMARY KEY (projekt_path, workstation)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS steps (
+        projekt_path TEXT NOT NULL,
+        workstation TEXT NOT NULL,
+        number INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        seconds DOUBLE PRECISION NOT NULL,
+        error TEXT NOT NULL,
+        PRIMARY KEY (projekt_path, workstation, number),
+        FOREIGN KEY (projekt_path, workstation)
+            REFERENCES sessions (projekt_path, workstation) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS artifacts (
+        projekt_path TEXT NOT NULL,
+        workstation TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        path TEXT NOT NULL,
+        present INTEGER NOT NULL,
+        PRIMARY KEY (projekt_path, workstation, path),
+        FOREIGN KEY (projekt_path, workstation)
+            REFERENCES sessions (projekt_path, workstation) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS projekts_name ON projekts (projekt_name)",
+    "CREATE INDEX IF NOT EXISTS projekts_updated ON projekts (updated_at)",
+    "CREATE INDEX IF NOT EXISTS sessions_workstation "
+    "ON sessions (workstation)",
+    "CREATE INDEX IF NOT EXISTS sessions_flame_version "
+    "ON sessions (flame_version)",
+    "CREATE INDEX IF NOT EXISTS artifacts_path ON artifacts (path)",
+)
+
+UPSERT_PROJEKT_SQL = """
+    INSERT INTO projekts (
+        projekt_path, projekt_name, flame_projekt_name, config_name,
+        created_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (projekt_path) DO UPDATE SET
+        projekt_name = excluded.projekt_name,
+        flame_projekt_name = excluded.flame_projekt_name,
+        config_name = excluded.config_name,
+        created_at = CASE
+            WHEN excluded.created_at < projekts.created_at
+            THEN excluded.created_at ELSE projekts.created_at END,
+        updated_at = CASE
+            WHEN excluded.updated_at > projekts.updated_at
+            THEN excluded.updated_at ELSE projekts.updated_at END
+"""
+
+# A backfill refreshes the parameters of a session but keeps the source of
+# a session recorded by its creation.
+UPSERT_SESSION_SQL = """
+    INSERT INTO sessions (
+        projekt_path, workstation, user_name, flame_version, resolution,
+        frame_rate, ocio_config, source, recorded_at, parameters
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (projekt_path, workstation) DO UPDATE SET
+        user_name = excluded.user_name,
+        flame_version = excluded.flame_version,
+        resolution = excluded.resolution,
+        frame_rate = excluded.frame_rate,
+        ocio_config = excluded.ocio_config,
+        source = CASE
+            WHEN excluded.source = 'backfill'
+            THEN sessions.source ELSE excluded.source END,
+        recorded_at = excluded.recorded_at,
+        parameters = excluded.parameters
+"""
+
+INSERT_STEP_SQL = """
+    INSERT INTO steps (
+        projekt_path, workstation, number, title, seconds, error
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_ARTIFACT_SQL = """
+    INSERT INTO artifacts (projekt_path, workstation, kind, path, present)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+PROJEKT_COLUMNS = (
+    "projekt_path, projekt_name, flame_projekt_name, config_name, "
+    "created_at, updated_at"
+)
+
+SESSION_COLUMNS = (
+    "projekt_path, workstation, user_name, flame_version, resolution, "
+    "frame_rate, ocio_config, source, recorded_at"
+)
+
+# Open catalogs by location.
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+class CatalogError(Exception):
+    """The catalog cannot be opened."""
+
+
+def make_catalog_entry(
+        parameters: dict,
+        steps=(),
+        artifacts=(),
+        source: str = SOURCE_CREATION,
+        recorded_at: float = None,
+        projekt_path: str = None,
+        workstation: str = None
+) -> dict:
+    """
+    Builds the catalog entry of one projekt and workstation.
+
+    Args:
+        parameters (dict): The ProjektParameters of the session.
+        steps: Step timings as dicts with 'number', 'title', 'seconds'
+            and 'error'.
+        artifacts: (kind, path) pairs. Whether each path exists is
+            recorded with it.
+        source (str): SOURCE_CREATION, SOURCE_BACKFILL or
+            SOURCE_FAN_OUT.
+        recorded_at (float): Seconds since the epoch, default now.
+        projekt_path (str): Default 'logik_projekt_path'.
+        workstation (str): Default 'current_workstation'.
+    """
+    return {
+        "projekt_path": os.path.abspath(
+            projekt_path or parameters.get("logik_projekt_path", "")
+        ),
+        "workstation": (
+            workstation or parameters.get("current_workstation", "")
+        ),
+        "parameters": dict(parameters),
+        "steps": [dict(step) for step in steps],
+        "artifacts": [
+            {
+                "kind": kind,
+                "path": path,
+                "present": os.path.lexists(path),
+            }
+            for kind, path in artifacts
+            if path
+        ],
+        "source": source,
+        "recorded_at": time.time() if recorded_at is None else recorded_at,
+    }
+
+
+def get_like_pattern(name: str) -> str:
+    """
+    Turns a name with '*' wildcards into a LIKE pattern in which '%', '_'
+    and the escape character match only themselves.
+    """
+    for character in (LIKE_ESCAPE_CHARACTER, "%", "_"):
+        name = name.replace(character, LIKE_ESCAPE_CHARACTER + character)
+    return name.replace("*", "%")
+
+
+class CatalogBackend:
+    """
+    The storage interface of the catalog.
+
+    A backend records entries made by make_catalog_entry and answers the
+    lookups. Entries are dicts and results are lists of dicts, so callers
+    never see the database.
+    """
+
+    location = ""
+
+    def record(self, entries):
+        """Adds or updates entries in one transaction."""
+        raise NotImplementedError
+
+    def find_projekts(
+            self,
+            name: str = None,
+            workstation: str = None,
+            flame_version: str = None,
+            limit: int = None
+    ) -> list:
+        """
+        Returns the projekts matching every given filter, most recently
+        updated first, each with its 'sessions'. 'name' may contain '*'
+        wildcards.
+        """
+        raise NotImplementedError
+
+    def get_projekt(self, projekt_path: str):
+        """
+        Returns one projekt with its sessions, including their parameters,
+        steps and artifacts, or None.
+        """
+        raise NotImplementedError
+
+    def find_artifact(self, path: str) -> list:
+        """Returns the sessions that made 'path'."""
+        raise NotImplementedError
+
+    def projekt_paths(self) -> list:
+        """Returns every cataloged projekt path."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SQLCatalogBackend(CatalogBackend):
+    """
+    The catalog on a DB-API database. Statements are written with '?'
+    parameters and translated by 'sql'. Each thread has its own
+    connection.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._schema_ready = False
+
+    # ---------------------------------------------------------------------- #
+    # Connections, implemented by each database.
+    # ---------------------------------------------------------------------- #
+
+    def connect(self):
+        raise NotImplementedError
+
+    @contextmanager
+    def transaction(self, connection):
+        raise NotImplementedError
+
+    def sql(self, statement: str) -> str:
+        return statement
+
+    def connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self.connect()
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+                if not self._schema_ready:
+                    with self.transaction(connection) as cursor:
+                        for statement in CATALOG_SCHEMA:
+                            cursor.execute(statement)
+                    self._schema_ready = True
+        return connection
+
+    def close(self):
+        with self._connections_lock:
+            for connection in self._connections:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+            self._connections = []
+        self._local = threading.local()
+
+    def query(self, statement: str, parameters=()) -> list:
+        connection = self.connection()
+        with self.transaction(connection) as cursor:
+            cursor.execute(self.sql(statement), tuple(parameters))
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    # ---------------------------------------------------------------------- #
+    # Writes.
+    # ---------------------------------------------------------------------- #
+
+    def record(self, entries):
+        entries = list(entries)
+        if not entries:
+            return
+        connection = self.connection()
+        with self.transaction(connection) as cursor:
+            for entry in entries:
+                self._record_entry(cursor, entry)
+
+    def _record_entry(self, cursor, entry: dict):
+        parameters = entry["parameters"]
+        key = (entry["projekt_path"], entry["workstation"])
+        cursor.execute(
+            self.sql(UPSERT_PROJEKT_SQL),
+            (
+                entry["projekt_path"],
+                parameters.get("logik_projekt_name", ""),
+                parameters.get("flame_projekt_name", ""),
+                parameters.get("logik_projekt_config_name", ""),
+                entry["recorded_at"],
+                entry["recorded_at"],
+            )
+        )
+        cursor.execute(
+            self.sql(UPSERT_SESSION_SQL),
+            key + (
+                parameters.get("current_user", ""),
+                parameters.get("flame_software_version", ""),
+                "{}x{}".format(
+                    parameters.get("flame_projekt_width", ""),
+                    parameters.get("flame_projekt_height", "")
+                ),
+                parameters.get("flame_projekt_rate", ""),
+                parameters.get("flame_projekt_ocio", ""),
+                entry["source"],
+                entry["recorded_at"],
+                json.dumps(parameters, sort_keys=True),
+            )
+        )
+        # A backfill knows no step timings, keep those of the creation.
+        if entry["steps"]:
+            cursor.execute(
+                self.sql(
+                    "DELETE FROM steps "
+                    "WHERE projekt_path = ? AND workstation = ?"
+                ),
+                key
+            )
+            cursor.executemany(
+                self.sql(INSERT_STEP_SQL),
+                [
+                    key + (
+                        step["number"],
+                        step["title"],
+                        step["seconds"],
+                        step.get("error", ""),
+                    )
+                    for step in entry["steps"]
+                ]
+            )
+        cursor.execute(
+            self.sql(
+                "DELETE FROM artifacts "
+                "WHERE projekt_path = ? AND workstation = ?"
+            ),
+            key
+        )
+        cursor.executemany(
+            self.sql(INSERT_ARTIFACT_SQL),
+            [
+                key + (
+                    artifact["kind"],
+                    artifact["path"],
+                    int(artifact["present"]),
+                )
+                for artifact in entry["artifacts"]
+            ]
+        )
+
+    # ---------------------------------------------------------------------- #
+    # Lookups.
+    # ---------------------------------------------------------------------- #
+
+    def find_projekts(
+            self,
+            name: str = None,
+            workstation: str = None,
+            flame_version: str = None,
+            limit: int = None
+    ) -> list:
+        conditions = []
+        parameters = []
+        if name and "*" in name:
+            conditions.append(
+                f"p.projekt_name LIKE ? ESCAPE '{LIKE_ESCAPE_CHARACTER}'"
+            )
+            parameters.append(get_like_pattern(name))
+        elif name:
+            conditions.append("p.projekt_name = ?")
+            parameters.append(name)
+        session_conditions = []
+        if workstation:
+            session_conditions.append("s.workstation = ?")
+            parameters.append(workstation)
+        if flame_version:
+            session_conditions.append("s.flame_version = ?")
+            parameters.append(flame_version)
+        if session_conditions:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM sessions s "
+                "WHERE s.projekt_path = p.projekt_path AND "
+                + " AND ".join(session_conditions) + ")"
+            )
+        statement = (
+            "SELECT " + PROJEKT_COLUMNS + " FROM projekts p"
+            + (" WHERE " + " AND ".join(conditions) if conditions else "")
+            + " ORDER BY p.updated_at DESC, p.projekt_path"
+        )
+        if limit:
+            statement += " LIMIT ?"
+            parameters.append(int(limit))
+        projekts = self.query(statement, parameters)
+
+        by_path = {}
+        for projekt in projekts:
+            projekt["sessions"] = []
+            by_path[projekt["projekt_path"]] = projekt
+        paths = list(by_path)
+        for start in range(0, len(paths), QUERY_CHUNK_SIZE):
+            chunk = paths[start:start + QUERY_CHUNK_SIZE]
+            sessions = self.query(
+                "SELECT " + SESSION_COLUMNS + " FROM sessions "
+                "WHERE projekt_path IN (" + ", ".join("?" * len(chunk)) + ") "
+                "ORDER BY workstation",
+                chunk
+            )
+            for session in sessions:
+                by_path[session["projekt_path"]]["sessions"].append(session)
+        return projekts
+
+    def get_projekt(self, projekt_path: str):
+        projekt_path = os.path.abspath(projekt_path)
+        projekts = self.query(
+            "SELECT " + PROJEKT_COLUMNS + " FROM projekts "
+            "WHERE projekt_path = ?",
+            (projekt_path,)
+        )
+        if not projekts:
+            return None
+        projekt = projekts[0]
+        sessions = self.query(
+            "SELECT " + SESSION_COLUMNS + ", parameters FROM sessions "
+            "WHERE projekt_path = ? ORDER BY workstation",
+            (projekt_path,)
+        )
+        by_workstation = {}
+        for session in sessions:
+            session["parameters"] = json.loads(session["parameters"])
+            session["steps"] = []
+            session["artifacts"] = []
+            by_workstation[session["workstation"]] = session
+        for step in self.query(
+            "SELECT workstation, number, title, seconds, error FROM steps "
+            "WHERE projekt_path = ? ORDER BY workstation, number",
+            (projekt_path,)
+        ):
+            by_workstation[step.pop("workstation")]["steps"].append(step)
+        for artifact in self.query(
+            "SELECT workstation, kind, path, present FROM artifacts "
+            "WHERE projekt_path = ? ORDER BY workstation, path",
+            (projekt_path,)
+        ):
+            artifact["present"] = bool(artifact["present"])
+            by_workstation[artifact.pop("workstation")]["artifacts"].append(
+                artifact
+            )
+        projekt["sessions"] = sessions
+        return projekt
+
+    def find_artifact(self, path: str) -> list:
+        return self.query(
+            "SELECT projekt_path, workstation, kind, present FROM artifacts "
+            "WHERE path = ? ORDER BY projekt_path, workstation",
+            (os.path.abspath(path),)
+        )
+
+    def projekt_paths(self) -> list:
+        return [
+            row["projekt_path"]
+            for row in self.query(
+                "SELECT projekt_path FROM projekts ORDER BY projekt_path"
+            )
+        ]
+
+
+def get_filesystem_type(path: str):
+    """
+    Returns the type of the filesystem holding 'path', which need not
+    exist yet, from /proc/mounts, or None where that cannot be read.
+    """
+    path = os.path.realpath(path)
+    try:
+        with open(PROC_MOUNTS_PATH, "r") as f:
+            mounts = [line.split() for line in f]
+    except OSError:
+        return None
+    filesystem_type = None
+    mount_point_length = -1
+    for fields in mounts:
+        if len(fields) < 3:
+            continue
+        # Spaces in mount points are written as \040.
+        mount_point = fields[1].replace("\\040", " ")
+        if (
+                (
+                    path == mount_point
+                    or path.startswith(mount_point.rstrip("/") + "/")
+                )
+                and len(mount_point) > mount_point_length
+        ):
+            filesystem_type = fields[2]
+            mount_point_length = len(mount_point)
+    return filesystem_type
+
+
+def get_sqlite_journal_mode(database_path: str) -> str:
+    """
+    Returns WAL for a database on a local filesystem and DELETE for one
+    on a network filesystem, or where the filesystem is unknown.
+    """
+    filesystem_type = get_filesystem_type(database_path)
+    if filesystem_type is None or filesystem_type in NETWORK_FILESYSTEM_TYPES:
+        return "DELETE"
+    return "WAL"
+
+
+class SQLiteCatalogBackend(SQLCatalogBackend):
+    """
+    The catalog in a SQLite database, in WAL mode on a local filesystem
+    and with a rollback journal on a network filesystem.
+    """
+
+    def __init__(self, database_path: str):
+        super().__init__()
+        self.location = os.path.abspath(database_path)
+        self.journal_mode = get_sqlite_journal_mode(self.location)
+
+    def connect(self):
+        try:
+            os.makedirs(os.path.dirname(self.location), exist_ok=True)
+            connection = sqlite3.connect(
+                self.location,
+                timeout=SQLITE_BUSY_TIMEOUT,
+                isolation_level=None
+            )
+            connection.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            if self.journal_mode == "WAL":
+                connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+        except (OSError, sqlite3.Error) as e:
+            raise CatalogError(
+                f"Cannot open the projekt catalog {self.location}: {e}"
+            ) from e
+        return connection
+
+    @contextmanager
+    def transaction(self, connection):
+        cursor = connection.cursor()
+        cursor.execute("BEGIN")
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        else:
+            cursor.execute("COMMIT")
+        finally:
+            cursor.close()
+
+
+class PostgresCatalogBackend(SQLCatalogBackend):
+    """The catalog on a PostgreSQL server, reached through psycopg2."""
+
+    def __init__(self, dsn: str):
+        super().__init__()
+        self.location = dsn
+
+    def connect(self):
+        try:
+            import psycopg2
+        except ImportError as e:
+            raise CatalogError(
+                "The PostgreSQL projekt catalog needs psycopg2."
+            ) from e
+        try:
+            return psycopg2.connect(self.location)
+        except psycopg2.Error as e:
+            raise CatalogError(
+                f"Cannot connect to the projekt catalog: {e}"
+            ) from e
+
+    @contextmanager
+    def transaction(self, connection):
+        # The connection commits on success and rolls back on error.
+        with connection:
+            with connection.cursor() as cursor:
+                yield cursor
+
+    def sql(self, statement: str) -> str:
+        return statement.replace("?", "%s")
+
+
+def get_catalog_location() -> str:
+    location = os.environ.get(CATALOG_ENVIRONMENT_VARIABLE, "")
+    if location:
+        return location
+    return DEFAULT_CATALOG_PATH
+
+
+def get_projekt_catalog(location: str = None) -> CatalogBackend:
+    """
+    Returns the catalog at 'location', default LOGIK_PROJEKT_CATALOG or
+    the SQLite database in the local data directory of the user. A
+    postgresql:// DSN selects the PostgreSQL backend. Catalogs stay open
+    for the process.
+    """
+    if location is None:
+        location = get_catalog_location()
+    with _catalogs_lock:
+        catalog = _catalogs.get(location)
+        if catalog is None:
+            if location.startswith(POSTGRES_DSN_PREFIXES):
+                catalog = PostgresCatalogBackend(location)
+            else:
+                catalog = SQLiteCatalogBackend(location)
+            _catalogs[location] = catalog
+        return catalog
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the projekt catalog with SQLite and PostgreSQL
+#               backends.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the fan-out session source.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Moved the default SQLite catalog from the repository to
+#               the local data directory of the user, and use a rollback
+#               journal instead of WAL on network filesystems.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Escape '%' and '_' in name patterns of find_projekts.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     session_log_utils.py
+# Purpose:      Manage the LOGIK-PROJEKT session logs.
+# Description:  Writes one size-rotated log per application session under
+#               logs/session-logs/YYYY/MM/DD, keeps an index of every
+#               session (path, projekts, start, end, size) and a pointer to
+#               the latest session, and gzips sessions older than a number
+#               of days in the background.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import gzip
+import json
+import fcntl
+import atexit
+import shutil
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_LOG_MAX_BYTES = 20 * 1024 * 1024
+DEFAULT_SESSION_LOG_BACKUP_COUNT = 5
+DEFAULT_SESSION_LOG_COMPRESS_AFTER_DAYS = 7
+DEFAULT_SESSION_LOG_INDEX_MAX_ENTRIES = 500
+DEFAULT_SESSION_LOG_FORMAT = (
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+SESSION_LOG_INDEX_VERSION = 1
+SESSION_LOG_INDEX_FILENAME = "session-log-index.json"
+SESSION_LOG_LATEST_FILENAME = "latest-session.json"
+SESSION_LOG_ARCHIVE_FILENAME = "session-log-index-archive.jsonl"
+SESSION_LOG_LOCK_FILENAME = ".session-log-index.lock"
+SESSION_LOG_SUFFIX = "-session.log"
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _write_json_atomic(path: str, data):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f, indent=4)
+    os.replace(temp_path, path)
+
+
+def _gzip_file(path: str) -> str:
+    """Compresses 'path' to 'path.gz', removes 'path' and returns the new path."""
+    gz_path = f"{path}.gz"
+    temp_path = f"{gz_path}.{os.getpid()}.tmp"
+    with open(path, "rb") as src, gzip.open(temp_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    shutil.copystat(path, temp_path)
+    os.replace(temp_path, gz_path)
+    os.remove(path)
+    return gz_path
+
+
+class SessionLogManager:
+    """
+    Owns the session logs in one directory.
+
+    The index file maps each session id to its log and is only rewritten
+    when a session starts, ends, compresses or gains a projekt. It holds
+    at most 'max_index_entries' sessions; older entries are appended to
+    an archive file, one JSON line each, and never rewritten. The latest
+    session is kept in a separate small pointer file, so finding it
+    never reads the index or walks the log tree.
+    """
+
+    def __init__(
+            self,
+            log_dir: str,
+            max_bytes: int = DEFAULT_SESSION_LOG_MAX_BYTES,
+            backup_count: int = DEFAULT_SESSION_LOG_BACKUP_COUNT,
+            compress_after_days: int = DEFAULT_SESSION_LOG_COMPRESS_AFTER_DAYS,
+            max_index_entries: int = DEFAULT_SESSION_LOG_INDEX_MAX_ENTRIES
+    ):
+        self.log_dir = os.path.abspath(log_dir)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress_after_days = compress_after_days
+        self.max_index_entries = max_index_entries
+        self.index_path = os.path.join(
+            self.log_dir,
+            SESSION_LOG_INDEX_FILENAME
+        )
+        self.latest_path = os.path.join(
+            self.log_dir,
+            SESSION_LOG_LATEST_FILENAME
+        )
+        self.lock_path = os.path.join(
+            self.log_dir,
+            SESSION_LOG_LOCK_FILENAME
+        )
+        self.archive_path = os.path.join(
+            self.log_dir,
+            SESSION_LOG_ARCHIVE_FILENAME
+        )
+        self.session_id = None
+        self.handler = None
+
+    # ====================================================================== #
+    # This section reads and writes the index.
+    # ====================================================================== #
+
+    @contextmanager
+    def _locked(self):
+        """Serialises index updates between application instances."""
+        os.makedirs(self.log_dir, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+            if index.get("version") == SESSION_LOG_INDEX_VERSION:
+                return index
+        except (OSError, json.JSONDecodeError):
+            pass
+        return self._build_index()
+
+    def _build_index(self) -> dict:
+        """
+        Indexes the session logs already on disk. Only runs once, when the
+        index file is missing or unreadable.
+        """
+        sessions = {}
+        for root, _, files in os.walk(self.log_dir):
+            for filename in files:
+                if filename.endswith(".log.gz"):
+                    stem = filename[:-len(".log.gz")]
+                elif filename.endswith(".log"):
+                    stem = filename[:-len(".log")]
+                else:
+                    continue
+                path = os.path.join(root, filename)
+                stat = os.stat(path)
+                session_id = stem.removesuffix("-session")
+                try:
+                    start = datetime.strptime(
+                        session_id[:19],
+                        "%Y-%m-%d-%H-%M-%S"
+                    ).isoformat()
+                except ValueError:
+                    start = datetime.fromtimestamp(
+                        stat.st_mtime
+                    ).isoformat(timespec="seconds")
+                sessions[session_id] = {
+                    "id": session_id,
+                    "path": os.path.relpath(path, self.log_dir),
+                    "projekts": [],
+                    "start": start,
+                    "end": datetime.fromtimestamp(
+                        stat.st_mtime
+                    ).isoformat(timespec="seconds"),
+                    "size": stat.st_size,
+                    "compressed": filename.endswith(".gz"),
+                }
+
+        latest = max(
+            sessions.values(),
+            key=lambda entry: entry["start"],
+            default=None
+        )
+        if sessions:
+            logger.info(f"Indexed {len(sessions)} existing session logs.")
+        return {
+            "version": SESSION_LOG_INDEX_VERSION,
+            "latest": latest["id"] if latest else None,
+            "sessions": sessions,
+        }
+
+    def _archive_old_entries(self, index: dict):
+        """
+        Moves the oldest sessions beyond 'max_index_entries' from the index
+        to the end of the archive file. The latest session and the session
+        of this process always stay in the index.
+        """
+        sessions = index["sessions"]
+        excess = len(sessions) - self.max_index_entries
+        if excess <= 0:
+            return
+        keep = {index.get("latest"), self.session_id}
+        oldest = sorted(
+            (entry for entry in sessions.values() if entry["id"] not in keep),
+            key=lambda entry: entry["start"]
+        )[:excess]
+        with open(self.archive_path, "a") as f:
+            for entry in oldest:
+                f.write(json.dumps(entry) + "\n")
+                del sessions[entry["id"]]
+        logger.debug(f"Archived {len(oldest)} session log index entries.")
+
+    def _write_index(self, index: dict):
+        self._archive_old_entries(index)
+        _write_json_atomic(self.index_path, index)
+        latest_id = index.get("latest")
+        if latest_id in index["sessions"]:
+            _write_json_atomic(
+                self.latest_path,
+                index["sessions"][latest_id]
+            )
+
+    def _update_session(self, session_id: str, **changes):
+        with self._locked():
+            index = self._read_index()
+            entry = index["sessions"].get(session_id)
+            if entry is None:
+                return
+            entry.update(changes)
+            self._write_index(index)
+
+    # ====================================================================== #
+    # This section starts and ends the session of this process.
+    # ====================================================================== #
+
+    def start_session(
+            self,
+            level=logging.DEBUG,
+            log_format: str = DEFAULT_SESSION_LOG_FORMAT
+    ) -> dict:
+        """
+        Creates the log of a new session, attaches a size-rotated handler
+        for it to the root logger and records it as the latest session.
+        Sessions older than 'compress_after_days' are gzipped on a
+        background thread.
+
+        Returns:
+            dict: The index entry of the new session.
+        """
+        current_time = datetime.now()
+        day_dir = os.path.join(
+            self.log_dir,
+            current_time.strftime("%Y"),
+            current_time.strftime("%m"),
+            current_time.strftime("%d")
+        )
+        os.makedirs(day_dir, exist_ok=True)
+
+        session_id = current_time.strftime("%Y-%m-%d-%H-%M-%S")
+        with self._locked():
+            index = self._read_index()
+            if session_id in index["sessions"]:
+                session_id = f"{session_id}-{os.getpid()}"
+            log_path = os.path.join(
+                day_dir,
+                f"{session_id}{SESSION_LOG_SUFFIX}"
+            )
+            entry = {
+                "id": session_id,
+                "path": os.path.relpath(log_path, self.log_dir),
+                "projekts": [],
+                "start": current_time.isoformat(timespec="seconds"),
+                "end": None,
+                "size": 0,
+                "compressed": False,
+            }
+            index["sessions"][session_id] = entry
+            index["latest"] = session_id
+            self._write_index(index)
+
+        self.session_id = session_id
+        self.handler = RotatingFileHandler(
+            log_path,
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count
+        )
+        self.handler.setLevel(level)
+        self.handler.setFormatter(logging.Formatter(log_format))
+        logging.getLogger().addHandler(self.handler)
+        atexit.register(self.end_session)
+
+        threading.Thread(
+            target=self.compress_old_sessions,
+            name="session-log-compress",
+            daemon=True
+        ).start()
+
+        return entry
+
+    def end_session(self):
+        """Records the end time and final size of this process's session."""
+        if self.session_id is None:
+            return
+        session_id = self.session_id
+        self.session_id = None
+        if self.handler is not None:
+            logging.getLogger().removeHandler(self.handler)
+            self.handler.close()
+            self.handler = None
+        entry = self.get_session(session_id)
+        if entry is None:
+            return
+        size = sum(
+            os.path.getsize(path) for path in self.get_session_files(entry)
+        )
+        self._update_session(session_id, end=_now(), size=size)
+
+    def add_projekt(self, projekt_name: str):
+        """Records that this session created 'projekt_name'."""
+        entry = self.current_session()
+        if entry is None or projekt_name in entry["projekts"]:
+            return
+        self._update_session(
+            entry["id"],
+            projekts=entry["projekts"] + [projekt_name]
+        )
+
+    # ====================================================================== #
+    # This section looks up sessions.
+    # ====================================================================== #
+
+    def get_session(self, session_id: str) -> Optional[dict]:
+        """Returns the index entry of 'session_id', or None."""
+        if session_id is None:
+            return None
+        latest = self.latest_session()
+        if latest is not None and latest["id"] == session_id:
+            return latest
+        with self._locked():
+            return self._read_index()["sessions"].get(session_id)
+
+    def current_session(self) -> Optional[dict]:
+        """Returns the entry of the session of this process, or None."""
+        return self.get_session(self.session_id)
+
+    def latest_session(self) -> Optional[dict]:
+        """Returns the entry of the most recently started session, or None."""
+        try:
+            with open(self.latest_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+        with self._locked():
+            index = self._read_index()
+            if not os.path.exists(self.index_path):
+                self._write_index(index)
+        return index["sessions"].get(index.get("latest"))
+
+    def get_trace_path(self) -> Optional[str]:
+        """Returns the Chrome trace path next to this process's session log."""
+        entry = self.current_session()
+        if entry is None:
+            return None
+        log_path = os.path.join(self.log_dir, entry["path"])
+        return f"{log_path.removesuffix(SESSION_LOG_SUFFIX)}-trace.json"
+
+    def get_session_files(self, entry: dict) -> list:
+        """
+        Returns the existing files of a session: its log followed by the
+        rotated segments, oldest last.
+        """
+        path = os.path.join(self.log_dir, entry["path"])
+        candidates = [path]
+        if entry.get("compressed"):
+            base = path[:-len(".gz")]
+            candidates += [
+                f"{base}.{n}.gz" for n in range(1, self.backup_count + 1)
+            ]
+        else:
+            candidates += [
+                f"{path}.{n}" for n in range(1, self.backup_count + 1)
+            ]
+        return [
+            candidate for candidate in candidates
+            if os.path.exists(candidate)
+        ]
+
+    # ====================================================================== #
+    # This section compresses old sessions.
+    # ====================================================================== #
+
+    def compress_old_sessions(self, now: Optional[datetime] = None) -> int:
+        """
+        Gzips the logs of every finished session that was last written
+        more than 'compress_after_days' ago, and drops index entries whose
+        logs no longer exist.
+
+        Returns:
+            int: The number of sessions compressed.
+        """
+        cutoff = (
+            (now or datetime.now()) -
+            timedelta(days=self.compress_after_days)
+        ).timestamp()
+
+        with self._locked():
+            index = self._read_index()
+            candidates = []
+            missing = []
+            for session_id, entry in index["sessions"].items():
+                if entry.get("compressed") or session_id == self.session_id:
+                    continue
+                path = os.path.join(self.log_dir, entry["path"])
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    missing.append(session_id)
+                    continue
+                if mtime < cutoff:
+                    candidates.append(dict(entry))
+            if missing:
+                for session_id in missing:
+                    del index["sessions"][session_id]
+                self._write_index(index)
+
+        compressed = {}
+        for entry in candidates:
+            try:
+                files = self.get_session_files(entry)
+                size = sum(os.path.getsize(path) for path in files)
+                for path in files:
+                    _gzip_file(path)
+                compressed[entry["id"]] = size
+            except OSError as e:
+                logger.warning(
+                    f"Could not compress session log {entry['path']}: {e}"
+                )
+
+        if compressed:
+            with self._locked():
+                index = self._read_index()
+                for session_id, size in compressed.items():
+                    entry = index["sessions"].get(session_id)
+                    if entry is None or entry.get("compressed"):
+                        continue
+                    entry["path"] = f"{entry['path']}.gz"
+                    entry["compressed"] = True
+                    entry["size"] = size
+                    if entry.get("end") is None:
+                        entry["end"] = entry["start"]
+                self._write_index(index)
+            logger.debug(f"Compressed {len(compressed)} old session logs.")
+
+        return len(compressed)
+
+
+# ========================================================================== #
+# This section holds the manager of the running application.
+# ========================================================================== #
+
+_session_log_manager = None
+
+
+def start_session_log(log_dir: str, **kwargs) -> SessionLogManager:
+    """
+    Starts the session log of this process in 'log_dir'. Keyword arguments
+    are passed to SessionLogManager.
+    """
+    global _session_log_manager
+    manager = SessionLogManager(log_dir, **kwargs)
+    manager.start_session()
+    _session_log_manager = manager
+    return manager
+
+
+def get_session_log_manager(log_dir: str) -> SessionLogManager:
+    """
+    Returns the manager started by start_session_log if it owns 'log_dir',
+    else a manager that can look up the sessions in 'log_dir'.
+    """
+    manager = _session_log_manager
+    if (
+        manager is not None and
+        manager.log_dir == os.path.abspath(log_dir)
+    ):
+        return manager
+    return SessionLogManager(log_dir)
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the session log manager.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added get_trace_path for the session's Chrome trace.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Cap the index at 'max_index_entries' sessions and append
+#               older entries to an archive file.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     system_snapshot_utils.py
+# Purpose:      Gather the user, group, host and OS details once.
+# Description:  Builds an immutable SystemSnapshot on a background thread at
+#               startup. Every probe runs with its own timeout, so slow or
+#               absent DNS, LDAP or NIS only delays the fields they provide,
+#               and no probe opens an outbound socket. The snapshot can be
+#               cached on disk for the current boot.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import getpass
+import grp
+import json
+import logging
+import platform
+import pwd
+import socket
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds each probe may take before its fields keep their defaults.
+DEFAULT_PROBE_TIMEOUT = 2.0
+
+# Seconds a consumer such as the UI waits for the background gather. The
+# probes share one deadline, so a gather started at launch is done by then.
+DEFAULT_SNAPSHOT_WAIT_TIMEOUT = DEFAULT_PROBE_TIMEOUT
+
+# Bump when SystemSnapshot fields change, to ignore older disk caches.
+SYSTEM_SNAPSHOT_VERSION = 1
+
+DEFAULT_SYSTEM_SNAPSHOT_CACHE = os.path.join(
+    os.environ.get(
+        "XDG_CACHE_HOME",
+        os.path.join(os.path.expanduser("~"), ".cache")
+    ),
+    "logik-projekt",
+    "system_snapshot.json"
+)
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """User, group, host and OS details of the running session."""
+    username: str = "unknown"
+    uid: int = -1
+    gid: int = -1
+    real_name: str = ""
+    home_directory: str = ""
+    shell: str = ""
+    primary_group: str = "(unknown_group - could not retrieve primary group)"
+    groups: Tuple[str, ...] = ()
+    hostname: str = ""
+    short_hostname: str = ""
+    fqdn: str = ""
+    aliases: Tuple[str, ...] = ()
+    ipv4_addresses: Tuple[str, ...] = ()
+    os_system: str = "unknown"
+    os_release: str = ""
+    os_machine: str = ""
+    distribution: str = ""
+    boot_id: str = ""
+    created: float = 0.0
+    timed_out: Tuple[str, ...] = field(default=())
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SystemSnapshot":
+        values = {}
+        for snapshot_field in fields(cls):
+            if snapshot_field.name not in data:
+                continue
+            value = data[snapshot_field.name]
+            if isinstance(value, list):
+                value = tuple(value)
+            values[snapshot_field.name] = value
+        return cls(**values)
+
+
+# ========================================================================== #
+# This section defines the probes. Each returns a dict of snapshot fields.
+# ========================================================================== #
+
+def _probe_user() -> dict:
+    uid = os.getuid()
+    try:
+        pwd_entry = pwd.getpwuid(uid)
+    except KeyError:
+        # Containers and some NSS setups run uids without a passwd entry
+        pwd_entry = None
+    try:
+        username = os.getlogin()
+    except OSError:
+        username = os.environ.get("USER") or os.environ.get("USERNAME")
+    if not username and pwd_entry is not None:
+        username = pwd_entry.pw_name
+    if not username:
+        try:
+            username = getpass.getuser()
+        except (KeyError, OSError):
+            username = f"uid:{uid}"
+    result = {"uid": uid, "gid": os.getgid(), "username": username}
+    if pwd_entry is not None:
+        result.update(
+            {
+                "real_name": pwd_entry.pw_gecos,
+                "home_directory": pwd_entry.pw_dir,
+                "shell": pwd_entry.pw_shell,
+            }
+        )
+    else:
+        result.update(
+            {
+                "home_directory": os.environ.get(
+                    "HOME", os.path.expanduser("~")
+                ),
+                "shell": os.environ.get("SHELL", ""),
+            }
+        )
+    return result
+
+
+def _probe_primary_group() -> dict:
+    gid = os.getgid()
+    try:
+        return {"primary_group": grp.getgrgid(gid).gr_name}
+    except KeyError:
+        return {"primary_group": f"gid:{gid}"}
+
+
+def _probe_groups() -> dict:
+    group_names = []
+    for gid in os.getgroups():
+        try:
+            group_names.append(grp.getgrgid(gid).gr_name)
+        except KeyError:
+            group_names.append(f"gid:{gid}")
+    return {"groups": tuple(sorted(set(group_names)))}
+
+
+def _probe_hostname() -> dict:
+    hostname = socket.gethostname()
+    return {
+        "hostname": hostname,
+        "short_hostname": hostname.split(".")[0],
+    }
+
+
+def _probe_fqdn() -> dict:
+    hostname = socket.gethostname()
+    name, aliases, _ = socket.gethostbyaddr(hostname)
+    return {"fqdn": name, "aliases": tuple(aliases)}
+
+
+def _probe_ipv4_addresses() -> dict:
+    addresses = []
+    try:
+        import netifaces
+        for interface in netifaces.interfaces():
+            for addr_info in netifaces.ifaddresses(interface).get(
+                    netifaces.AF_INET, []):
+                addresses.append(addr_info["addr"])
+    except ImportError:
+        if platform.system() == "Linux":
+            result = subprocess.run(
+                ["hostname", "-I"],
+                capture_output=True,
+                text=True,
+                timeout=DEFAULT_PROBE_TIMEOUT
+            )
+            if result.returncode == 0:
+                addresses.extend(result.stdout.split())
+    return {"ipv4_addresses": tuple(dict.fromkeys(addresses))}
+
+
+def _probe_os() -> dict:
+    uname = platform.uname()
+    result = {
+        "os_system": uname.system,
+        "os_release": uname.release,
+        "os_machine": uname.machine,
+    }
+    if uname.system == "Linux":
+        try:
+            import distro
+            result["distribution"] = (
+                f"{distro.name()} {distro.version()}".strip()
+            )
+        except ImportError:
+            try:
+                os_release = platform.freedesktop_os_release()
+                result["distribution"] = os_release.get("PRETTY_NAME", "")
+            except OSError:
+                pass
+    elif uname.system == "Darwin":
+        result["distribution"] = f"macOS {platform.mac_ver()[0]}"
+    return result
+
+
+# Probes whose fields the UI needs, then the ones that may hit DNS or LDAP.
+SYSTEM_SNAPSHOT_PROBES = (
+    ("user", _probe_user),
+    ("hostname", _probe_hostname),
+    ("primary_group", _probe_primary_group),
+    ("os", _probe_os),
+    ("groups", _probe_groups),
+    ("ipv4_addresses", _probe_ipv4_addresses),
+    ("fqdn", _probe_fqdn),
+)
+
+
+def get_boot_id() -> str:
+    """Returns an id that changes on every reboot, or '' if unknown."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id", "r") as f:
+            return f.read().strip()
+    except OSError:
+        pass
+    try:
+        result = subprocess.run(
+            ["sysctl", "-n", "kern.boottime"],
+            capture_output=True,
+            text=True,
+            timeout=1.0
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return ""
+
+
+def get_fallback_hostname() -> dict:
+    """
+    Returns the hostname fields for a snapshot whose hostname probe gave
+    nothing. The workstation name goes into Flame projekt names, so it is
+    read again with gethostname(), which only asks the kernel for its
+    node name and cannot hang on DNS.
+    """
+    try:
+        return _probe_hostname()
+    except OSError as e:
+        logger.warning(f"Could not read the hostname: {e}")
+        return {}
+
+
+def make_default_snapshot(**values) -> SystemSnapshot:
+    """
+    Returns a snapshot of defaults, for when the gather failed or did not
+    finish, with the hostname fields filled in.
+    """
+    return SystemSnapshot(
+        created=time.time(),
+        **get_fallback_hostname(),
+        **values
+    )
+
+
+# ========================================================================== #
+# This section gathers and caches the snapshot.
+# ========================================================================== #
+
+def gather_system_snapshot(
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT
+) -> SystemSnapshot:
+    """
+    Runs every probe on its own daemon thread and waits for all of them
+    up to 'probe_timeout' seconds in total. A probe that fails or is
+    still running keeps the default values of its fields and is listed
+    in 'timed_out'.
+    """
+    results = {}
+
+    def run_probe(name, probe):
+        try:
+            results[name] = probe()
+        except Exception as e:
+            logger.debug(f"System probe '{name}' failed: {e}")
+            results[name] = {}
+
+    threads = []
+    for name, probe in SYSTEM_SNAPSHOT_PROBES:
+        thread = threading.Thread(
+            target=run_probe,
+            args=(name, probe),
+            name=f"system-probe-{name}",
+            daemon=True
+        )
+        thread.start()
+        threads.append((name, thread))
+
+    deadline = time.monotonic() + probe_timeout
+    timed_out = []
+    for name, thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            timed_out.append(name)
+            logger.warning(
+                f"System probe '{name}' did not answer within "
+                f"{probe_timeout:g}s. Using defaults."
+            )
+
+    values = {}
+    for name, _ in SYSTEM_SNAPSHOT_PROBES:
+        if name not in timed_out:
+            values.update(results.get(name, {}))
+    if not values.get("short_hostname"):
+        values.update(get_fallback_hostname())
+    if not values.get("fqdn"):
+        values["fqdn"] = values.get("hostname", "")
+
+    return SystemSnapshot(
+        boot_id=get_boot_id(),
+        created=time.time(),
+        timed_out=tuple(timed_out),
+        **values
+    )
+
+
+def load_system_snapshot_cache(cache_path: str) -> Optional[SystemSnapshot]:
+    """
+    Returns the cached snapshot if it was written by this user during
+    the current boot and every probe had answered, else None.
+    """
+    try:
+        with open(cache_path, "r") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if data.get("version") != SYSTEM_SNAPSHOT_VERSION:
+        return None
+    snapshot = SystemSnapshot.from_dict(data.get("snapshot", {}))
+    boot_id = get_boot_id()
+    if not boot_id or snapshot.boot_id != boot_id:
+        return None
+    if snapshot.uid != os.getuid() or snapshot.timed_out:
+        return None
+    return snapshot
+
+
+def write_system_snapshot_cache(snapshot: SystemSnapshot, cache_path: str):
+    """Writes a complete snapshot to the disk cache."""
+    if snapshot.timed_out or not snapshot.boot_id:
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(
+                {
+                    "version": SYSTEM_SNAPSHOT_VERSION,
+                    "snapshot": snapshot.to_dict(),
+                },
+                f,
+                indent=4
+            )
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not cache the system snapshot: {e}")
+
+
+class _SystemSnapshotProvider:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread = None
+        self._snapshot = None
+
+    def start(self, cache_path=None, probe_timeout=DEFAULT_PROBE_TIMEOUT):
+        with self._lock:
+            if self._thread is not None or self._ready.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._gather,
+                args=(cache_path, probe_timeout),
+                name="system-snapshot",
+                daemon=True
+            )
+            self._thread.start()
+
+    def _gather(self, cache_path, probe_timeout):
+        snapshot = None
+        try:
+            if cache_path:
+                snapshot = load_system_snapshot_cache(cache_path)
+            if snapshot is None:
+                snapshot = gather_system_snapshot(probe_timeout)
+                if cache_path:
+                    write_system_snapshot_cache(snapshot, cache_path)
+        finally:
+            self._snapshot = snapshot or make_default_snapshot()
+            self._ready.set()
+
+    def get(self, timeout=None) -> SystemSnapshot:
+        if not self._ready.is_set():
+            self.start()
+            if not self._ready.wait(timeout):
+                return make_default_snapshot(timed_out=("all",))
+        return self._snapshot
+
+    def reset(self):
+        with self._lock:
+            self._thread = None
+            self._snapshot = None
+            self._ready.clear()
+
+
+_system_snapshot_provider = _SystemSnapshotProvider()
+
+
+def start_system_snapshot(
+        cache_path: Optional[str] = None,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT
+):
+    """
+    Starts gathering the system snapshot on a background thread. Call it
+    once at startup; later calls do nothing. With 'cache_path', a
+    snapshot cached during the current boot is reused.
+    """
+    _system_snapshot_provider.start(cache_path, probe_timeout)
+
+
+def get_system_snapshot(timeout: Optional[float] = None) -> SystemSnapshot:
+    """
+    Returns the system snapshot, waiting up to 'timeout' seconds (for
+    ever if None) for the background gather, which is started here if
+    start_system_snapshot was never called. On timeout a snapshot of
+    defaults is returned and the gather keeps running.
+    """
+    return _system_snapshot_provider.get(timeout)
+
+
+def reset_system_snapshot():
+    """Forgets the in-memory snapshot so that the next call gathers anew."""
+    _system_snapshot_provider.reset()
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the cached, asynchronously gathered SystemSnapshot.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Fall back to $USER or getpass.getuser() for uids without a
+#               passwd entry, and to 'gid:N' for gids without a group.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Fill in the hostname with gethostname() when its probe gave
+#               nothing, and add DEFAULT_SNAPSHOT_WAIT_TIMEOUT.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     template_utils.py
+# Purpose:      Render text templates in a single pass.
+# Description:  Compiles templates into alternating literal and placeholder
+#               segments, caches the compiled form by path and mtime and
+#               renders it with one join. Unknown placeholders, malformed
+#               '%%NAME%%' placeholders and missing values raise a
+#               TemplateError before anything is written.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# The '%%NAME%%' placeholders of the shell script templates.
+SCRIPT_PLACEHOLDER_PATTERN = re.compile(r"%%[A-Z0-9_]+%%")
+
+# Placeholders with one '%' missing on either side, e.g. '%%NAME%'. A bare
+# '%%' is left alone, it is valid shell such as '${var%%pattern}'.
+MALFORMED_PLACEHOLDER_PATTERN = re.compile(
+    r"%%[A-Z][A-Z0-9_]*%(?!%)|(?<![%\w])%[A-Z][A-Z0-9_]*%%"
+)
+
+# Compiled templates by (absolute path, pattern), with the mtime they were
+# compiled from.
+_template_cache = {}
+
+# Compiled key patterns by key set, see get_key_pattern.
+_key_pattern_cache = {}
+
+
+class TemplateError(ValueError):
+    """A template uses placeholders that cannot be filled."""
+
+
+class CompiledTemplate:
+    """
+    A template split into literals and placeholders.
+
+    'literals' always holds one more item than 'placeholders', so the
+    rendered text is literals[0], value of placeholders[0], literals[1],
+    and so on.
+    """
+
+    def __init__(self, literals, placeholders, source="<string>"):
+        self.literals = tuple(literals)
+        self.placeholders = tuple(placeholders)
+        self.names = frozenset(self.placeholders)
+        self.source = source
+
+    def check_values(self, values: dict):
+        """Raises a TemplateError naming every placeholder without value."""
+        missing = self.names.difference(values)
+        if missing:
+            raise TemplateError(
+                f"No value for {', '.join(sorted(missing))} in template: "
+                f"{self.source}"
+            )
+
+    def render(self, values: dict) -> str:
+        """Fills every placeholder from 'values' in one pass."""
+        self.check_values(values)
+        parts = [self.literals[0]]
+        for placeholder, literal in zip(self.placeholders, self.literals[1:]):
+            parts.append(str(values[placeholder]))
+            parts.append(literal)
+        return "".join(parts)
+
+
+def compile_template(
+        text: str,
+        pattern=SCRIPT_PLACEHOLDER_PATTERN,
+        known_placeholders=None,
+        source="<string>"
+) -> CompiledTemplate:
+    """
+    Splits a template into literal and placeholder segments.
+
+    Args:
+        text (str): The template text.
+        pattern (re.Pattern): Matches one whole placeholder.
+        known_placeholders (iterable): If given, any other placeholder
+            in the template raises a TemplateError.
+        source (str): Name of the template used in error messages.
+
+    Returns:
+        CompiledTemplate: The compiled template.
+    """
+    literals = []
+    placeholders = []
+    position = 0
+    for match in pattern.finditer(text):
+        literals.append(text[position:match.start()])
+        placeholders.append(match.group(0))
+        position = match.end()
+    literals.append(text[position:])
+
+    if pattern is SCRIPT_PLACEHOLDER_PATTERN:
+        for literal in literals:
+            malformed = MALFORMED_PLACEHOLDER_PATTERN.search(literal)
+            if malformed:
+                raise TemplateError(
+                    f"Malformed placeholder '{malformed.group(0)}' in "
+                    f"template: {source}"
+                )
+
+    if known_placeholders is not None:
+        unknown = set(placeholders).difference(known_placeholders)
+        if unknown:
+            raise TemplateError(
+                f"Unknown placeholders {', '.join(sorted(unknown))} in "
+                f"template: {source}"
+            )
+
+    return CompiledTemplate(literals, placeholders, source)
+
+
+def load_template(
+        template_path: str,
+        pattern=SCRIPT_PLACEHOLDER_PATTERN,
+        known_placeholders=None
+) -> CompiledTemplate:
+    """
+    Returns the compiled template of a file, compiling it only when the
+    file is new to the cache or its mtime has changed. With
+    'known_placeholders', any other placeholder raises a TemplateError.
+    """
+    path = os.path.abspath(template_path)
+    mtime = os.stat(path).st_mtime_ns
+    key = (path, pattern.pattern)
+
+    cached = _template_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        compiled_template = cached[1]
+    else:
+        with open(path, 'r') as f:
+            compiled_template = compile_template(
+                f.read(),
+                pattern=pattern,
+                source=template_path
+            )
+        _template_cache[key] = (mtime, compiled_template)
+
+    if known_placeholders is not None:
+        unknown = compiled_template.names.difference(known_placeholders)
+        if unknown:
+            raise TemplateError(
+                f"Unknown placeholders {', '.join(sorted(unknown))} in "
+                f"template: {template_path}"
+            )
+
+    return compiled_template
+
+
+def clear_template_cache():
+    """Forgets every compiled template."""
+    _template_cache.clear()
+
+
+def render_template(template_path: str, values: dict) -> str:
+    """Renders a '%%NAME%%' template file with 'values'."""
+    return load_template(template_path).render(values)
+
+
+@dataclass
+class TemplateJob:
+    """One template file rendered to one output file."""
+    template_path: str
+    output_path: str
+    values: dict
+    mode: int = 0o755
+
+
+def _write_rendered(job: TemplateJob, content: str):
+    os.makedirs(os.path.dirname(job.output_path), exist_ok=True)
+    with open(job.output_path, 'w') as f:
+        f.write(content)
+    if job.mode is not None:
+        os.chmod(job.output_path, job.mode)
+    logger.debug(f"Rendered {job.template_path} to {job.output_path}")
+
+
+def render_templates(jobs, max_workers: int = None) -> list:
+    """
+    Renders a batch of TemplateJobs and writes their output files.
+
+    Every template is compiled and checked against its values before the
+    first file is written, so a placeholder typo leaves no half-written
+    set of scripts behind. Values the template never uses are logged.
+    With 'max_workers' above 1, the files are written by that many
+    threads.
+
+    Returns:
+        list: The output paths, in the order of 'jobs'.
+    """
+    jobs = list(jobs)
+    rendered = []
+    for job in jobs:
+        compiled_template = load_template(job.template_path)
+        unused = set(job.values).difference(compiled_template.names)
+        if unused:
+            logger.warning(
+                f"Template {job.template_path} does not use: "
+                f"{', '.join(sorted(unused))}"
+            )
+        rendered.append((job, compiled_template.render(job.values)))
+
+    if max_workers and max_workers > 1 and len(rendered) > 1:
+        with ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="render_templates"
+        ) as executor:
+            for future in [
+                executor.submit(_write_rendered, job, content)
+                for job, content in rendered
+            ]:
+                future.result()
+    else:
+        for job, content in rendered:
+            _write_rendered(job, content)
+
+    return [job.output_path for job in jobs]
+
+
+def get_key_pattern(keys) -> re.Pattern:
+    """
+    Returns a pattern matching any of 'keys' as a placeholder, longest
+    key first so that no key is shadowed by one of its prefixes.
+    """
+    keys = frozenset(keys)
+    pattern = _key_pattern_cache.get(keys)
+    if pattern is None:
+        ordered_keys = sorted(keys, key=len, reverse=True)
+        pattern = re.compile(
+            "|".join(re.escape(key) for key in ordered_keys) or r"(?!)"
+        )
+        _key_pattern_cache[keys] = pattern
+    return pattern
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the single-pass template renderer.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Write the files of a batch concurrently with 'max_workers'.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Only placeholder-like markers count as malformed, so shell
+#               expansions such as '${var%%pattern}' are accepted.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     trace_utils.py
+# Purpose:      Record timed spans and export them as a Chrome trace.
+# Description:  Provides the 'traced' decorator and the 'trace_span' context
+#               manager. While tracing is off both cost one global lookup
+#               per call. While it is on, every span records its name,
+#               start, duration, thread and key arguments, and the spans
+#               are written as Chrome Trace Event JSON that opens in
+#               Perfetto or chrome://tracing.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-18
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import json
+import time
+import atexit
+import logging
+import inspect
+import functools
+import threading
+from pathlib import PurePath
+
+logger = logging.getLogger(__name__)
+
+# Setting this environment variable to anything but '' or '0' turns
+# tracing on when the application starts.
+TRACE_ENVIRONMENT_VARIABLE = "LOGIK_PROJEKT_TRACE"
+
+# Argument values recorded on a span. Longer strings are cut.
+TRACE_ARGUMENT_TYPES = (str, int, float, bool, PurePath)
+TRACE_ARGUMENT_MAX_LENGTH = 256
+
+# The tracer while tracing is on, else None.
+_tracer = None
+
+
+class _NullSpan:
+    """The span handed out while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _trace_value(value):
+    if isinstance(value, PurePath):
+        value = str(value)
+    if isinstance(value, str) and len(value) > TRACE_ARGUMENT_MAX_LENGTH:
+        value = value[:TRACE_ARGUMENT_MAX_LENGTH] + "..."
+    return value
+
+
+class Span:
+    """One timed region, recorded when the 'with' block ends."""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.add_span(self, end)
+        return False
+
+    def set(self, **args):
+        """Adds key arguments, e.g. a byte count known only at the end."""
+        for key, value in args.items():
+            self.args[key] = _trace_value(value)
+
+
+class Tracer:
+    """Collects spans and writes them as Chrome Trace Event JSON."""
+
+    def __init__(self, trace_path: str):
+        self.trace_path = trace_path
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events = []
+        self.thread_names = {}
+        self.lock = threading.Lock()
+
+    def add_span(self, span: Span, end: int):
+        thread = threading.current_thread()
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": (span.start - self.origin) / 1000,
+            "dur": (end - span.start) / 1000,
+            "pid": self.pid,
+            "tid": thread.ident,
+        }
+        if span.args:
+            event["args"] = span.args
+        with self.lock:
+            self.events.append(event)
+            self.thread_names.setdefault(thread.ident, thread.name)
+
+    def write(self):
+        """Writes every span recorded so far, replacing the previous file."""
+        with self.lock:
+            events = list(self.events)
+            thread_names = dict(self.thread_names)
+        metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self.pid,
+                "args": {"name": "LOGIK-PROJEKT"},
+            }
+        ]
+        metadata += [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in thread_names.items()
+        ]
+        os.makedirs(
+            os.path.dirname(os.path.abspath(self.trace_path)),
+            exist_ok=True
+        )
+        temp_path = f"{self.trace_path}.{self.pid}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(
+                {
+                    "traceEvents": metadata + events,
+                    "displayTimeUnit": "ms",
+                },
+                f
+            )
+        os.replace(temp_path, self.trace_path)
+
+
+def trace_span(name: str, category: str = "logik-projekt", **args):
+    """
+    Returns a context manager timing the 'with' block as one span.
+
+    Keyword arguments are recorded on the span; call 'set' on the value
+    of the 'with' statement to add more before the block ends.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(
+        tracer,
+        name,
+        category,
+        {key: _trace_value(value) for key, value in args.items()}
+    )
+
+
+def traced(name: str = None, category: str = None, slot: bool = False):
+    """
+    Decorates a function so that every call is recorded as a span.
+
+    The span is named after the function unless 'name' is given, and its
+    category defaults to the module path below 'src.core' or 'src'.
+    String, number and path arguments are recorded by parameter name.
+
+    Qt passes a slot only as many signal arguments as the slot accepts,
+    which it cannot tell through the wrapper. With 'slot', positional
+    arguments beyond the parameters of the function are dropped the same
+    way.
+    """
+    def decorator(function):
+        module_name = function.__module__ or ""
+        span_name = name or function.__qualname__
+        span_category = category or (
+            module_name.removeprefix("src.core.").removeprefix("src.")
+        )
+        code = getattr(function, "__code__", None)
+        parameter_names = (
+            code.co_varnames[:code.co_argcount] if code else ()
+        )
+        slot_argument_count = (
+            len(parameter_names)
+            if slot and code and not code.co_flags & inspect.CO_VARARGS
+            else None
+        )
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if slot_argument_count is not None:
+                args = args[:slot_argument_count]
+            tracer = _tracer
+            if tracer is None:
+                return function(*args, **kwargs)
+            span_args = {
+                key: _trace_value(value)
+                for key, value in zip(parameter_names, args)
+                if isinstance(value, TRACE_ARGUMENT_TYPES)
+            }
+            for key, value in kwargs.items():
+                if isinstance(value, TRACE_ARGUMENT_TYPES):
+                    span_args[key] = _trace_value(value)
+            with Span(tracer, span_name, span_category, span_args):
+                return function(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def start_tracing(trace_path: str) -> Tracer:
+    """
+    Turns tracing on. The spans are written to 'trace_path' by
+    flush_trace, stop_tracing or at exit.
+    """
+    global _tracer
+    if _tracer is not None:
+        stop_tracing()
+    _tracer = Tracer(trace_path)
+    atexit.register(stop_tracing)
+    logger.info(f"Tracing to {trace_path}")
+    return _tracer
+
+
+def flush_trace():
+    """Writes the spans recorded so far without turning tracing off."""
+    tracer = _tracer
+    if tracer is None:
+        return
+    try:
+        tracer.write()
+    except OSError as e:
+        logger.warning(f"Could not write trace {tracer.trace_path}: {e}")
+
+
+def stop_tracing():
+    """Writes the trace and turns tracing off."""
+    global _tracer
+    flush_trace()
+    _tracer = None
+
+
+def tracing_requested() -> bool:
+    """True if the environment asks for tracing."""
+    return os.environ.get(TRACE_ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added span tracing with Chrome trace export.
+# -------------------------------------------------------------------------- #
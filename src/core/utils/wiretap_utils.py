@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     wiretap_utils.py
+# Purpose:      Wiretap node operations behind one interface.
+# Description:  A WiretapBackend creates Flame nodes and returns a
+#               WiretapResult for each. WiretapCLIBackend runs
+#               wiretap_create_node with a timeout and parses its output,
+#               WiretapAPIBackend creates many nodes in one session of the
+#               Wiretap Python API that ships with Flame, and
+#               LocalWiretapBackend records nodes as files in a directory
+#               for machines without Flame. Every call is counted with its
+#               latency and outcome in the wiretap metrics.
+#
+#               LOGIK_PROJEKT_WIRETAP selects the backend: 'cli' (the
+#               default), 'api' or 'local:<directory>'.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Production
+# Type:         Utility
+# Created:      2026-10-18
+# Modified:     2026-10-18
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import time
+import logging
+import threading
+import subprocess
+from dataclasses import dataclass, field, asdict
+
+from src.core.utils.trace_utils import trace_span
+
+logger = logging.getLogger(__name__)
+
+WIRETAP_ENVIRONMENT_VARIABLE = "LOGIK_PROJEKT_WIRETAP"
+WIRETAP_BACKEND_CLI = "cli"
+WIRETAP_BACKEND_API = "api"
+WIRETAP_BACKEND_LOCAL_PREFIX = "local:"
+
+WIRETAP_CREATE_NODE_PATH = (
+    "/opt/Autodesk/wiretap/tools/current/wiretap_create_node"
+)
+DEFAULT_WIRETAP_SERVER = "127.0.0.1:IFFFS"
+DEFAULT_WIRETAP_PARENT_NODE = "/projects"
+DEFAULT_WIRETAP_NODE_TYPE = "PROJECT"
+DEFAULT_WIRETAP_METADATA_STREAM = "XML"
+
+# Seconds one wiretap_create_node may take before it is stopped.
+DEFAULT_WIRETAP_TIMEOUT = 120
+
+# Words in the output of a failed creation that mean the node is there.
+WIRETAP_EXISTS_MARKERS = ("already exists", "exists already")
+
+# Open backends by location.
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+class WiretapError(Exception):
+    """The wiretap backend cannot be used."""
+
+
+@dataclass
+class WiretapNode:
+    """A node to create, with the metadata file that describes it."""
+    name: str
+    metadata_path: str
+    parent: str = DEFAULT_WIRETAP_PARENT_NODE
+    node_type: str = DEFAULT_WIRETAP_NODE_TYPE
+    stream: str = DEFAULT_WIRETAP_METADATA_STREAM
+
+    @property
+    def node_path(self) -> str:
+        return f"{self.parent.rstrip('/')}/{self.name}"
+
+
+@dataclass
+class WiretapResult:
+    """The outcome of creating one node."""
+    node_path: str
+    ok: bool = False
+    # The node was there before, which wiretap reports as a failure.
+    exists: bool = False
+    seconds: float = 0.0
+    returncode: int = None
+    error: str = ""
+    output: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class WiretapMetrics:
+    """
+    Call counts, failures and latency of wiretap operations, by backend
+    and operation.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations = {}
+
+    def record(
+            self,
+            backend: str,
+            operation: str,
+            seconds: float,
+            failed: bool
+    ):
+        with self._lock:
+            metric = self._operations.setdefault(
+                (backend, operation),
+                {
+                    "calls": 0,
+                    "failures": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                }
+            )
+            metric["calls"] += 1
+            metric["failures"] += int(failed)
+            metric["total_seconds"] += seconds
+            metric["max_seconds"] = max(metric["max_seconds"], seconds)
+
+    def to_dict(self) -> dict:
+        """Returns '<backend>.<operation>' -> counts and latencies."""
+        with self._lock:
+            return {
+                f"{backend}.{operation}": dict(
+                    metric,
+                    mean_seconds=metric["total_seconds"] / metric["calls"]
+                )
+                for (backend, operation), metric
+                in sorted(self._operations.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
+
+
+_metrics = WiretapMetrics()
+
+
+def get_wiretap_metrics() -> WiretapMetrics:
+    """Returns the wiretap metrics of this process."""
+    return _metrics
+
+
+class WiretapBackend:
+    """
+    The interface of the wiretap operations.
+
+    A backend creates nodes and reports every one as a WiretapResult, so
+    callers never see how the node was made. Failures are results, not
+    exceptions; WiretapError means the backend itself is unusable.
+    """
+
+    name = ""
+
+    def create_node(self, node: WiretapNode) -> WiretapResult:
+        """Creates one node."""
+        return self.create_nodes([node])[0]
+
+    def create_nodes(self, nodes) -> list:
+        """Creates every node in 'nodes' and returns their results."""
+        return [self._measure(self._create_node, node) for node in nodes]
+
+    def _create_node(self, node: WiretapNode) -> WiretapResult:
+        raise NotImplementedError
+
+    def _measure(self, create, node: WiretapNode) -> WiretapResult:
+        """Runs 'create' for 'node' as a traced, measured call."""
+        start = time.perf_counter()
+        with trace_span(
+                "wiretap_create_node",
+                category="wiretap",
+                backend=self.name,
+                node=node.node_path
+        ):
+            try:
+                result = create(node)
+            except OSError as e:
+                result = WiretapResult(node.node_path, error=str(e))
+        result.seconds = time.perf_counter() - start
+        _metrics.record(
+            self.name,
+            "create_node",
+            result.seconds,
+            not result.ok
+        )
+        log_wiretap_result(result)
+        return result
+
+    def close(self):
+        pass
+
+
+class WiretapCLIBackend(WiretapBackend):
+    """Runs wiretap_create_node once per node."""
+
+    name = WIRETAP_BACKEND_CLI
+
+    def __init__(
+            self,
+            server: str = DEFAULT_WIRETAP_SERVER,
+            executable: str = WIRETAP_CREATE_NODE_PATH,
+            timeout: float = DEFAULT_WIRETAP_TIMEOUT
+    ):
+        self.server = server
+        self.executable = executable
+        self.timeout = timeout
+
+    def get_command(self, node: WiretapNode) -> list:
+        return [
+            self.executable,
+            "-h", self.server,
+            "-n", node.parent,
+            "-t", node.node_type,
+            "-d", node.name,
+            "-s", node.stream,
+            "-f", node.metadata_path,
+        ]
+
+    def _create_node(self, node: WiretapNode) -> WiretapResult:
+        command = self.get_command(node)
+        logger.info(f"Running: {subprocess.list2cmdline(command)}")
+        try:
+            process = subprocess.run(
+                command,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                errors="replace",
+                timeout=self.timeout,
+                # The node files are left writable by every workstation.
+                umask=0
+            )
+        except subprocess.TimeoutExpired as e:
+            return WiretapResult(
+                node.node_path,
+                error=f"wiretap_create_node timed out after {e.timeout} s",
+                output=parse_wiretap_output(e.stdout, e.stderr)
+            )
+        return parse_wiretap_result(
+            node.node_path,
+            process.returncode,
+            process.stdout,
+            process.stderr
+        )
+
+
+class WiretapAPIBackend(WiretapBackend):
+    """
+    Creates nodes through the Wiretap Python API of Flame. One client
+    session and server handle serve every node of a create_nodes call.
+    """
+
+    name = WIRETAP_BACKEND_API
+
+    def __init__(self, server: str = DEFAULT_WIRETAP_SERVER):
+        self.server = server
+
+    @staticmethod
+    def load_api():
+        try:
+            from adsk import libwiretapPythonClientAPI
+        except ImportError as e:
+            raise WiretapError(
+                "The wiretap API backend needs the Wiretap Python API of "
+                "Flame (adsk.libwiretapPythonClientAPI)."
+            ) from e
+        return libwiretapPythonClientAPI
+
+    def create_nodes(self, nodes) -> list:
+        nodes = list(nodes)
+        if not nodes:
+            return []
+        api = self.load_api()
+        if not api.WireTapClientInit():
+            raise WiretapError("Cannot start the Wiretap client.")
+        try:
+            start = time.perf_counter()
+            server = api.WireTapServerHandle(self.server)
+            _metrics.record(
+                self.name,
+                "connect",
+                time.perf_counter() - start,
+                False
+            )
+            parents = {}
+
+            def create(node):
+                parent = parents.get(node.parent)
+                if parent is None:
+                    parent = api.WireTapNodeHandle(server, node.parent)
+                    parents[node.parent] = parent
+                with open(node.metadata_path, 'r', encoding='utf-8') as f:
+                    metadata = f.read()
+                child = api.WireTapNodeHandle()
+                if not parent.createNode(node.name, node.node_type, child):
+                    error = parent.lastError()
+                    return WiretapResult(
+                        node.node_path,
+                        exists=is_exists_error(error),
+                        error=error
+                    )
+                if not child.setMetaData(node.stream, metadata):
+                    return WiretapResult(
+                        node.node_path,
+                        error=child.lastError()
+                    )
+                return WiretapResult(node.node_path, ok=True)
+
+            return [self._measure(create, node) for node in nodes]
+        finally:
+            api.WireTapClientUninit()
+
+
+class LocalWiretapBackend(WiretapBackend):
+    """
+    Records nodes as '<root>/<parent>/<name>.<stream lowercase>' files
+    holding their metadata, for tests and benchmarks without Flame. A
+    node that is already recorded fails as it would on a Flame server.
+    """
+
+    name = "local"
+
+    def __init__(self, root_dir: str):
+        self.root_dir = os.path.abspath(root_dir)
+
+    def get_node_file_path(self, node: WiretapNode) -> str:
+        return os.path.join(
+            self.root_dir,
+            node.parent.strip("/"),
+            f"{node.name}.{node.stream.lower()}"
+        )
+
+    def _create_node(self, node: WiretapNode) -> WiretapResult:
+        node_file_path = self.get_node_file_path(node)
+        with open(node.metadata_path, 'rb') as f:
+            metadata = f.read()
+        os.makedirs(os.path.dirname(node_file_path), exist_ok=True)
+        try:
+            with open(node_file_path, 'xb') as f:
+                f.write(metadata)
+        except FileExistsError:
+            return WiretapResult(
+                node.node_path,
+                exists=True,
+                error=f"Node {node.node_path} already exists."
+            )
+        return WiretapResult(node.node_path, ok=True)
+
+    def list_nodes(self, parent: str = DEFAULT_WIRETAP_PARENT_NODE) -> list:
+        """Returns the names of the nodes recorded below 'parent'."""
+        try:
+            filenames = os.listdir(
+                os.path.join(self.root_dir, parent.strip("/"))
+            )
+        except FileNotFoundError:
+            return []
+        return sorted(os.path.splitext(name)[0] for name in filenames)
+
+
+def parse_wiretap_output(stdout, stderr) -> list:
+    """Returns the non-empty output lines, stderr lines prefixed."""
+    lines = []
+    for prefix, text in (("", stdout), ("stderr: ", stderr)):
+        if isinstance(text, bytes):
+            text = text.decode(errors="replace")
+        lines += [
+            f"{prefix}{line.strip()}"
+            for line in (text or "").splitlines()
+            if line.strip()
+        ]
+    return lines
+
+
+def is_exists_error(text: str) -> bool:
+    text = (text or "").lower()
+    return any(marker in text for marker in WIRETAP_EXISTS_MARKERS)
+
+
+def parse_wiretap_result(
+        node_path: str,
+        returncode: int,
+        stdout: str,
+        stderr: str
+) -> WiretapResult:
+    """Builds the result of one wiretap tool run from its output."""
+    output = parse_wiretap_output(stdout, stderr)
+    result = WiretapResult(
+        node_path,
+        ok=returncode == 0,
+        returncode=returncode,
+        output=output
+    )
+    if not result.ok:
+        errors = [
+            line for line in output
+            if line.startswith("stderr: ") or "error" in line.lower()
+        ]
+        result.error = (
+            "; ".join(errors or output) or
+            f"exited with code {returncode}"
+        )
+        result.exists = is_exists_error(result.error)
+    return result
+
+
+def log_wiretap_result(result: WiretapResult):
+    if result.ok:
+        logger.info(
+            f"Created wiretap node {result.node_path} in "
+            f"{result.seconds:.2f} s."
+        )
+    elif result.exists:
+        logger.warning(f"Wiretap node {result.node_path} already exists.")
+    else:
+        logger.error(
+            f"Failed to create wiretap node {result.node_path}: "
+            f"{result.error}"
+        )
+
+
+def get_wiretap_location() -> str:
+    return (
+        os.environ.get(WIRETAP_ENVIRONMENT_VARIABLE, "") or
+        WIRETAP_BACKEND_CLI
+    )
+
+
+def get_wiretap_backend(location: str = None) -> WiretapBackend:
+    """
+    Returns the backend at 'location', default LOGIK_PROJEKT_WIRETAP:
+    'cli', 'api' or 'local:<directory>'. Backends stay open for the
+    process.
+    """
+    if location is None:
+        location = get_wiretap_location()
+    with _backends_lock:
+        backend = _backends.get(location)
+        if backend is None:
+            if location == WIRETAP_BACKEND_CLI:
+                backend = WiretapCLIBackend()
+            elif location == WIRETAP_BACKEND_API:
+                backend = WiretapAPIBackend()
+            elif location.startswith(WIRETAP_BACKEND_LOCAL_PREFIX):
+                backend = LocalWiretapBackend(
+                    location[len(WIRETAP_BACKEND_LOCAL_PREFIX):]
+                )
+            else:
+                raise WiretapError(f"Unknown wiretap backend: {location}")
+            _backends[location] = backend
+        return backend
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the wiretap backends with per-call metrics.
+# -------------------------------------------------------------------------- #
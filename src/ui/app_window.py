@@ -16,7 +16,7 @@
 # Status:       Production
 # Type:         Application
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -74,16 +74,24 @@ from src.core.utils import (
 from src.core.utils.threaded_logging_utils import (
     SignalHandler
 )
+from src.core.utils.flame_launch_utils import (
+    FLAME_LAUNCH_EXITED,
+    FLAME_LAUNCH_FAILED,
+    FLAME_LAUNCH_READY,
+    FLAME_LAUNCH_RUNNING,
+)
 import logging
 import os
 import shutil
 
 import src.core.utils.validation_utils as validation_utils
+from src.core.utils.trace_utils import traced
 
 
 class Worker(QObject):
     finished = Signal()
     error = Signal(str)
+    flame_status = Signal(str, str)
     template_imported = Signal(dict, dict)
     template_exported = Signal(str, str)
 
@@ -94,7 +102,12 @@ class Worker(QObject):
     @Slot(dict)
     def create_projekt(self, projekt_summary_data):
         try:
-            create_projekt(projekt_summary_data)
+            projekt_name = projekt_summary_data.get("logik_projekt_name", "")
+            # Flame runs detached, its status comes back as a signal.
+            create_projekt(
+                projekt_summary_data,
+                lambda status: self.flame_status.emit(projekt_name, status)
+            )
 
             logging.info("Create PROJEKT triggered from AppWindow")
             logging.info("LOGIK-PROJEKT creation successful.")
@@ -279,6 +292,7 @@ class AppWindow(QMainWindow):
         self.worker.moveToThread(self.thread)
         self.worker.finished.connect(self.on_worker_finished)
         self.worker.error.connect(self.on_worker_error)
+        self.worker.flame_status.connect(self.on_flame_status)
 
         self.worker.template_imported.connect(
             self.on_template_imported
@@ -308,6 +322,18 @@ class AppWindow(QMainWindow):
         )
         QMessageBox.critical(self, "Error", error_message)
 
+    @Slot(str, str)
+    def on_flame_status(self, projekt_name, status):
+        messages = {
+            FLAME_LAUNCH_RUNNING: f"Starting Flame for {projekt_name}...",
+            FLAME_LAUNCH_READY: f"Flame is up with {projekt_name}.",
+            FLAME_LAUNCH_EXITED: f"Flame exited ({projekt_name}).",
+            FLAME_LAUNCH_FAILED: f"Flame launch failed ({projekt_name}).",
+        }
+        message = messages.get(status, f"Flame {status} ({projekt_name}).")
+        logging.info(message)
+        self.statusBar().showMessage(message)
+
     @Slot(str, str)
     def on_template_exported(self, export_message, user_chosen_path):
         display_message = f"Template automatically saved to: {export_message}\n\nTemplate also saved to: {user_chosen_path}"
@@ -327,6 +353,7 @@ class AppWindow(QMainWindow):
         )
         self._update_all_summaries()
 
+    @traced(category="ui", slot=True)
     def _update_all_summaries(self):
         template_info_data = self.template_info_panel.get_template_info()
         template_params_data = (
@@ -673,3 +700,12 @@ class AppWindow(QMainWindow):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced _update_all_summaries, which refreshes every panel.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Report the status of the detached Flame launch in the
+#               status bar.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Module
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -43,6 +43,7 @@ from src.ui.widgets.display.projekt_summary_widget import (
     ProjektSummaryWidget
 )
 from src.core.utils import validation_utils
+from src.core.utils.trace_utils import traced
 
 
 class ProjektSummaryPanel(QWidget):
@@ -131,6 +132,7 @@ class ProjektSummaryPanel(QWidget):
         )
         main_row_counter += 1
 
+    @traced(category="ui", slot=True)
     def set_projekt_summary_data(self, data):
         """Set project summary data.
       
@@ -208,3 +210,8 @@ class ProjektSummaryPanel(QWidget):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced set_projekt_summary_data, which redraws the
+#               projekt summary.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Module
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -35,6 +35,7 @@ from src.ui.widgets.button.import_template_widget import (
 from src.ui.widgets.display.projekt_template_widget import (
     ProjektTemplateWidget
 )
+from src.core.utils.trace_utils import traced
 
 
 class ProjektTemplatePanel(QWidget):
@@ -93,6 +94,7 @@ class ProjektTemplatePanel(QWidget):
             1
         )
 
+    @traced(category="ui", slot=True)
     def set_projekt_template_data(self, data):
         """Set project template data.
       
@@ -142,3 +144,8 @@ class ProjektTemplatePanel(QWidget):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced set_projekt_template_data, which loads the chosen
+#               projekt template.
+# -------------------------------------------------------------------------- #
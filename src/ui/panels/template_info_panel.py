@@ -16,7 +16,7 @@
 # Status:       Production
 # Type:         Module
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -44,6 +44,7 @@ from src.ui.widgets.entry.description_widget import (
     DescriptionWidget
 )
 from src.core.utils.calculated_name_utils import get_calculated_name
+from src.core.utils.trace_utils import traced
 
 
 class TemplateInfoPanel(QWidget):
@@ -158,6 +159,7 @@ class TemplateInfoPanel(QWidget):
             self._update_calculated_name
         )
 
+    @traced(category="ui", slot=True)
     def _update_calculated_name(self):
         """Update the calculated name based on serial, client, and campaign."""
         serial = self.serial_number_widget.get()
@@ -254,3 +256,7 @@ class TemplateInfoPanel(QWidget):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced _update_calculated_name, run on every name edit.
+# -------------------------------------------------------------------------- #
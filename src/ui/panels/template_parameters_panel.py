@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Module
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -49,6 +49,7 @@ from src.core.functions.get.get_init_config_values import get_init_config_values
 from src.core.functions.get.get_ocio_config_values import get_ocio_config_values
 from src.core.functions.get.get_cache_integers_values import get_cache_integer_values
 from src.core.functions.get.get_cache_float_values import get_cache_float_values
+from src.core.utils.trace_utils import traced
 
 
 class TemplateParametersPanel(QWidget):
@@ -163,6 +164,7 @@ class TemplateParametersPanel(QWidget):
     def _emit_parameters_updated(self):
         self.parameters_updated.emit()
 
+    @traced(category="ui", slot=True)
     def _update_resolution_fields(self):
         selected_resolution_data = (
             self.resolution_widget.get_selected_resolution_data()
@@ -294,3 +296,8 @@ class TemplateParametersPanel(QWidget):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced _update_resolution_fields, run when the resolution
+#               choice changes.
+# -------------------------------------------------------------------------- #
@@ -15,7 +15,7 @@
 # Status:       Production
 # Type:         Module
 # Created:      2025-07-01
-# Modified:     2025-10-30
+# Modified:     2026-10-18
 
 # Changelog:    Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -37,6 +37,7 @@ from src.ui.widgets.button.export_template_widget import (
     ExportTemplateWidget
 )
 from src.core.app_logic import AppLogic
+from src.core.utils.trace_utils import traced
 
 
 class TemplateSummaryPanel(QWidget):
@@ -105,6 +106,7 @@ class TemplateSummaryPanel(QWidget):
             2
         )
 
+    @traced(category="ui", slot=True)
     def set_template_summary_panel_data(self, data):
         """Set template summary panel data.
       
@@ -156,3 +158,8 @@ class TemplateSummaryPanel(QWidget):
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Traced set_template_summary_panel_data, which fills the
+#               template summary fields.
+# -------------------------------------------------------------------------- #
@@ -3,6 +3,13 @@
 # Filename:      create_ocio_conversion_tasks.py
 # Purpose:       Creates JSON files that describe how to make new CTF files.
 # Description:   Loads JSON data and use OCIO to create new CTF files.
+#                Camera CTF names are mapped to OCIO colour spaces by an
+#                ordered rule table, and task JSON files are only rewritten
+#                when their content changes.
+
+#                Usage: create_ocio_conversion_tasks.py
+#                           [--camera-ctf-dir DIR] [--output-dir DIR]
+#                           [--ocio-config FILE]
 
 # Author:        phil_man@mac.com
 # Copyright:     Copyright (c) 2025
@@ -14,7 +21,7 @@
 # Status:        Production
 # Type:          Application
 # Created:       2025-07-01
-# Modified:      2025-10-06
+# Modified:      2026-10-18
 
 # Changelog:     Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -26,6 +33,7 @@
 import os
 import json
 import re
+import argparse
 import logging
 import datetime
 
@@ -61,6 +69,9 @@ json_output_dir = os.path.abspath(
     )
 )
 
+# Define the directory holding the generated OCIO config JSON files.
+ocio_config_json_dir = os.path.dirname(json_output_dir)
+
 # Define the target color spaces.
 target_color_spaces = {
     'ACES2065-1': 'ACES-AP0',
@@ -71,6 +82,65 @@ target_color_spaces = {
     # 'Rec.1886 Rec.709 - Display': 'Rec709-Display',
 }
 
+# Camera CTF name fragment -> OCIO input space. The first rule, in table
+# order, whose fragment appears anywhere in the CTF file name wins, so
+# more specific fragments must come before their prefixes.
+camera_color_space_rules = (
+    # Apple
+    ("AppleLog", "Apple Log"),
+
+    # ARRI
+    ("Alexa-v2-LogC", "ARRI LogC3 (EI800)"),
+    ("Alexa-v3-LogC", "ARRI LogC3 (EI800)"),
+    ("LogC4", "ARRI LogC4"),
+    ("LinearARRIWideGamut4", "Linear ARRI Wide Gamut 4"),
+
+    # Blackmagic Design
+    ("BMDFilm", "BMDFilm WideGamut Gen5"),
+    ("DaVinciIntermediate", "DaVinci Intermediate WideGamut"),
+    ("LinearBMDWideGamut", "Linear BMD WideGamut Gen5"),
+    ("LinearDaVinciWideGamut", "Linear DaVinci WideGamut"),
+
+    # Canon
+    ("CanonLog2", "CanonLog2 CinemaGamut D55"),
+    ("CanonLog3", "CanonLog3 CinemaGamut D55"),
+    ("C500_CinemaGamut_D55", "CanonLog2 CinemaGamut D55"),
+    ("C500_CinemaGamut_Tng", "CanonLog2 CinemaGamut D55"),
+    ("C500_DCI-P3+_D55", "CanonLog2 CinemaGamut D55"),
+    ("C500_DCI-P3+_Tng", "CanonLog2 CinemaGamut D55"),
+
+    # Panasonic
+    ("VLog", "V-Log V-Gamut"),
+    ("LinearVGamut", "Linear V-Gamut"),
+
+    # RED
+    ("REDlogFilm", "Log3G10 REDWideGamutRGB"),
+    ("LinearDRAGONcolor2", "Linear REDcolor2"),
+    ("LinearDRAGONcolor", "Linear REDcolor"),
+    ("LinearREDWideGamutRGB", "Linear REDWideGamutRGB"),
+    ("LinearREDcolor2", "Linear REDcolor2"),
+    ("LinearREDcolor3", "Linear REDcolor3"),
+    ("LinearREDcolor4", "Linear REDcolor4"),
+    ("LinearREDcolor", "Linear REDcolor"),
+    ("Log3G10-REDWideGamutRGB", "Log3G10 REDWideGamutRGB"),
+
+    # Sony
+    ("SLog2", "S-Log2 S-Gamut"),
+    ("SLog3", "S-Log3 S-Gamut3"),
+    ("F35-SLog", "S-Log3 S-Gamut3"),
+    ("F65-Raw", "Raw"),
+    ("LinearSGamut3-Venice", "Linear Venice S-Gamut3"),
+    ("LinearSGamut3", "Linear S-Gamut3"),
+    ("Raw-SGamut3", "Raw"),
+
+    # Vision Research
+    ("Phantom-Log2", "Phantom-Log2"),
+
+    # Generic
+    ("HybridLogGamma", "Camera Rec.2100-HLG"),
+    ("untonemapped_Rec709-camera", "Camera Rec.709"),
+)
+
 # -------------------------------------------------------------------------- #
 # Setup Logging
 # -------------------------------------------------------------------------- #
@@ -86,135 +156,86 @@ log_dir = os.path.abspath(
     )
 )
 
-os.makedirs(log_dir, exist_ok=True)
-log_filename = os.path.join(
-    log_dir,
-    (f"ocio_conversion_tasks_"
-     f"{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log")
-)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename),
-        logging.StreamHandler()
-    ],
-    force=True
-)
+def setup_logging():
+    """Logs to the console and to a timestamped file in the logs dir."""
+    os.makedirs(log_dir, exist_ok=True)
+    log_filename = os.path.join(
+        log_dir,
+        (f"ocio_conversion_tasks_"
+         f"{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log")
+    )
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_filename),
+            logging.StreamHandler()
+        ],
+        force=True
+    )
+
+
+# -------------------------------------------------------------------------- #
+# Camera colour space matching.
+# -------------------------------------------------------------------------- #
+
+
+class ColorSpaceMatcher:
+    """
+    Ordered substring rules compiled into a single regular expression.
+
+    The pattern is an alternation inside a lookahead, so one scan of a
+    name reports a candidate rule at every position. The lowest rule
+    index among the candidates is the rule an if/elif chain over the
+    table would have picked.
+    """
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        self.rule_index = {}
+        for index, (fragment, _) in enumerate(self.rules):
+            self.rule_index.setdefault(fragment, index)
+
+        # Alternatives keep table order, so at any one position the regex
+        # reports the lowest matching rule index.
+        fragments = sorted(self.rule_index, key=self.rule_index.get)
+        self.pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(f) for f in fragments) + '))'
+        )
+
+    def match(self, name, default="Unknown"):
+        best_index = None
+        for match in self.pattern.finditer(name):
+            index = self.rule_index[match.group(1)]
+            if best_index is None or index < best_index:
+                best_index = index
+        if best_index is None:
+            return default
+        return self.rules[best_index][1]
+
+
+camera_color_space_matcher = ColorSpaceMatcher(camera_color_space_rules)
 
 
 def get_input_space_from_ctf_name(ctf_file_name):
     """
     Infers the OCIO input space name from the CTF file name.
-    This function needs to be comprehensive and cover all expected CTF
-    naming conventions.
+    New camera naming conventions are added to 'camera_color_space_rules'.
     """
+    return camera_color_space_matcher.match(ctf_file_name)
+
+
+# -------------------------------------------------------------------------- #
+# OCIO config lookup.
+# -------------------------------------------------------------------------- #
+
 
-    if "AppleLog" in ctf_file_name:
-        return "Apple Log"
-
-    elif "Alexa-v2-LogC" in ctf_file_name:
-        return "ARRI LogC3 (EI800)"
-    elif "Alexa-v3-LogC" in ctf_file_name:
-        return "ARRI LogC3 (EI800)"
-    elif "LogC4" in ctf_file_name:
-        return "ARRI LogC4"
-    elif "LinearARRIWideGamut4" in ctf_file_name:
-        return "Linear ARRI Wide Gamut 4"
-
-    elif "BMDFilm" in ctf_file_name:
-        return "BMDFilm WideGamut Gen5"
-    elif "DaVinciIntermediate" in ctf_file_name:
-        return "DaVinci Intermediate WideGamut"
-    elif "LinearBMDWideGamut" in ctf_file_name:
-        return "Linear BMD WideGamut Gen5"
-    elif "LinearDaVinciWideGamut" in ctf_file_name:
-        return "Linear DaVinci WideGamut"
-
-    elif "CanonLog2" in ctf_file_name:
-        return "CanonLog2 CinemaGamut D55"
-    elif "CanonLog3" in ctf_file_name:
-        return "CanonLog3 CinemaGamut D55"
-    elif "C500_CinemaGamut_D55" in ctf_file_name:
-        return "CanonLog2 CinemaGamut D55"
-    elif "C500_CinemaGamut_Tng" in ctf_file_name:
-        return "CanonLog2 CinemaGamut D55"
-    elif "C500_DCI-P3+_D55" in ctf_file_name:
-        return "CanonLog2 CinemaGamut D55"
-    elif "C500_DCI-P3+_Tng" in ctf_file_name:
-        return "CanonLog2 CinemaGamut D55"
-
-    elif "VLog" in ctf_file_name:
-        return "V-Log V-Gamut"
-    elif "LinearVGamut" in ctf_file_name:
-        return "Linear V-Gamut"
-
-    elif "REDlogFilm" in ctf_file_name:
-        return "Log3G10 REDWideGamutRGB"
-    elif "LinearDRAGONcolor2" in ctf_file_name:
-        return "Linear REDcolor2"
-    elif "LinearDRAGONcolor" in ctf_file_name:
-        return "Linear REDcolor"
-    elif "LinearREDWideGamutRGB" in ctf_file_name:
-        return "Linear REDWideGamutRGB"
-    elif "LinearREDcolor2" in ctf_file_name:
-        return "Linear REDcolor2"
-    elif "LinearREDcolor3" in ctf_file_name:
-        return "Linear REDcolor3"
-    elif "LinearREDcolor4" in ctf_file_name:
-        return "Linear REDcolor4"
-    elif "LinearREDcolor" in ctf_file_name:
-        return "Linear REDcolor"
-    elif "Log3G10-REDWideGamutRGB" in ctf_file_name:
-        return "Log3G10 REDWideGamutRGB"
-
-    elif "SLog2" in ctf_file_name:
-        return "S-Log2 S-Gamut"
-    elif "SLog3" in ctf_file_name:
-        return "S-Log3 S-Gamut3"
-    elif "F35-SLog" in ctf_file_name:
-        return "S-Log3 S-Gamut3"
-    elif "F65-Raw" in ctf_file_name:
-        return "Raw"
-    elif "LinearSGamut3-Venice" in ctf_file_name:
-        return "Linear Venice S-Gamut3"
-    elif "LinearSGamut3" in ctf_file_name:
-        return "Linear S-Gamut3"
-    elif "Raw-SGamut3" in ctf_file_name:
-        return "Raw"
-
-    elif "Phantom-Log2" in ctf_file_name:
-        return "Phantom-Log2"
-
-    elif "HybridLogGamma" in ctf_file_name:
-        return "Camera Rec.2100-HLG"
-
-    elif "untonemapped_Rec709-camera" in ctf_file_name:
-        return "Camera Rec.709"
-
-    return "Unknown"  # Default if no match is found
-
-
-def get_latest_ocio_config_file():
+def get_latest_ocio_config_file(json_dir=ocio_config_json_dir):
     """
     Finds the OCIO config JSON file with the highest version number.
     """
-    json_dir = os.path.abspath(
-        os.path.join(
-            os.path.dirname(__file__),
-            '..',
-            '..',
-            '..',
-            '..',
-            'cfg',
-            'site-cfg',
-            'flame-cfg',
-            'flame-scripts',
-            'opencolorio',
-            'flame_colortoolkit_files'
-        )
-    )
     if not os.path.isdir(json_dir):
         logging.warning(f"JSON directory not found at {json_dir}")
         return None
@@ -239,149 +260,236 @@ def get_latest_ocio_config_file():
     return latest_file
 
 
+def load_available_color_spaces(ocio_config_path):
+    """
+    Returns the set of colour space names in an OCIO config JSON file, or
+    None when it cannot be read or lists no colour spaces.
+    """
+    try:
+        with open(ocio_config_path, 'r') as f:
+            ocio_data = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        logging.error(
+            f"Error reading or parsing OCIO config file: {e}. "
+            f"Exiting."
+        )
+        return None
+
+    available_color_spaces = set(
+        ocio_data.get("ocio_configuration", {})
+        .get("available_color_spaces", [])
+    )
+    if not available_color_spaces:
+        logging.error(
+            "Could not find 'available_color_spaces' in the "
+            "config file. Exiting."
+        )
+        return None
+
+    return available_color_spaces
+
+
 # -------------------------------------------------------------------------- #
-# Main function to generate the conversion tasks.
+# Conversion task generation.
 # -------------------------------------------------------------------------- #
 
 
-def generate_conversion_tasks():
-    # Find and load the latest OCIO config file.
-    latest_ocio_config_path = get_latest_ocio_config_file()
-    available_color_spaces = []
+def iter_camera_ctf_files(ctf_dir):
+    """
+    Yields (relative dir, file name, path) of every camera to ACES CTF
+    below 'ctf_dir', walking the tree with os.scandir in sorted order.
+    """
+    pending = ['']
+    while pending:
+        relative_dir = pending.pop()
+        try:
+            with os.scandir(os.path.join(ctf_dir, relative_dir)) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            logging.warning(f"Cannot read {e.filename}: {e.strerror}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=True):
+                subdirs.append(os.path.join(relative_dir, entry.name))
+            elif entry.name.endswith('.ctf') and '_to_ACES' in entry.name:
+                yield relative_dir or '.', entry.name, entry.path
+        pending.extend(reversed(subdirs))
+
+
+def build_conversion_tasks(ctf_path, ctf_file_name, input_space_ocio):
+    """Returns (conversion name, task dict) for every target space."""
+    # Infer the camera space name for the output file name.
+    # Replace any spaces with underscores, but preserve hyphens
+    # from original CTF name.
+    camera_space_name = (
+        ctf_file_name
+        .replace('_to_ACES.ctf', '')
+        .replace(' ', '_')
+    )
 
-    if latest_ocio_config_path:
-        logging.info(
-            f"Using latest OCIO config: "
-            f"{os.path.basename(latest_ocio_config_path)}"
+    for target_space_ocio, target_space_name in target_color_spaces.items():
+        # Ensure conversion_name and output_clf_name also replace any
+        # spaces with underscores
+        conversion_name = (
+            f"{camera_space_name}_to_{target_space_name}".replace(' ', '_')
         )
-        try:
-            with open(latest_ocio_config_path, 'r') as f:
-                ocio_data = json.load(f)
-            available_color_spaces = (
-                ocio_data.get("ocio_configuration", {})
-                .get("available_color_spaces", [])
-            )
-            if not available_color_spaces:
-                logging.error(
-                    "Could not find 'available_color_spaces' in the "
-                    "config file. Exiting."
-                )
-                return
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+        yield conversion_name, {
+            "name": conversion_name,
+            "output_clf": f"{conversion_name}.clf",
+            "input_space": input_space_ocio,
+            "target_space": target_space_ocio,
+            "inputs": [
+                {
+                    "file": ctf_path,
+                    "inverse": False
+                }
+            ]
+        }
+
+
+def write_if_changed(file_path, content):
+    """Writes 'content' unless the file already holds it. True if written."""
+    try:
+        with open(file_path, 'r') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w') as f:
+        f.write(content)
+    return True
+
+
+def generate_conversion_tasks(
+        ctf_dir=camera_ctf_dir,
+        output_dir=json_output_dir,
+        ocio_config_path=None
+):
+    """
+    Writes one conversion task JSON per camera CTF and target space.
+
+    Args:
+        ctf_dir (str): Root of the camera CTF files.
+        output_dir (str): Root of the conversion task JSON files.
+        ocio_config_path (str): OCIO config JSON used to validate colour
+            spaces. Defaults to the latest generated config.
+
+    Returns:
+        dict: {'written': [...], 'unchanged': [...], 'skipped': [...]} of
+        task JSON paths relative to 'output_dir' and skipped CTF names,
+        or None when no OCIO config could be loaded.
+    """
+    # Find and load the latest OCIO config file.
+    if ocio_config_path is None:
+        ocio_config_path = get_latest_ocio_config_file()
+        if not ocio_config_path:
             logging.error(
-                f"Error reading or parsing OCIO config file: {e}. "
-                f"Exiting."
+                "No OCIO config file found. Cannot validate color spaces. "
+                "Exiting."
             )
-            return
-    else:
-        logging.error(
-            "No OCIO config file found. Cannot validate color spaces. "
-            "Exiting."
-        )
-        return
+            return None
+
+    logging.info(
+        f"Using OCIO config: {os.path.basename(ocio_config_path)}"
+    )
+    available_color_spaces = load_available_color_spaces(ocio_config_path)
+    if available_color_spaces is None:
+        return None
 
     # Ensure the root output directory exists.
-    os.makedirs(json_output_dir, exist_ok=True)
-
-    # Walk through the camera CTF directory.
-    for root, dirs, files in os.walk(camera_ctf_dir):
-        for file in files:
-            if file.endswith('.ctf') and '_to_ACES' in file:
-                ctf_path = os.path.join(root, file)
-                ctf_file_name = os.path.basename(ctf_path)
-
-                # Infer the input space from the CTF file name.
-                input_space_ocio = get_input_space_from_ctf_name(
-                    ctf_file_name
-                )
-
-                if input_space_ocio == "Unknown":
-                    logging.warning(
-                        f"Could not infer input space for {ctf_file_name}. "
-                        f"Skipping."
-                    )
-                    continue
-
-                # Validate the inferred space against the available OCIO
-                # color spaces.
-                if input_space_ocio not in available_color_spaces:
-                    logging.warning(
-                        f"Inferred space '{input_space_ocio}' for "
-                        f"{ctf_file_name} is not in the available OCIO "
-                        f"config spaces. Skipping."
-                    )
-                    continue
-
-                # Infer the camera space name for the output file name.
-                # Replace any spaces with underscores, but preserve hyphens
-                # from original CTF name.
-                camera_space_name = (
-                    ctf_file_name
-                    .replace('_to_ACES.ctf', '')
-                    .replace(' ', '_')
-                )
-
-                for target_space_ocio, target_space_name in (
-                        target_color_spaces.items()):
-                    # Ensure conversion_name and output_clf_name also
-                    # replace any spaces with underscores
-                    conversion_name_raw = (
-                        f"{camera_space_name}_to_{target_space_name}"
-                    )
-                    conversion_name = conversion_name_raw.replace(' ', '_')
-                    output_clf_name = f"{conversion_name}.clf"
-
-                    conversion_task = {
-                        "name": conversion_name,
-                        "output_clf": output_clf_name,
-                        "input_space": input_space_ocio,
-                        "target_space": target_space_ocio,
-                        "inputs": [
-                            {
-                                "file": ctf_path,
-                                "inverse": False
-                            }
-                        ]
-                    }
-
-                    # Create the same subdirectory structure in the output
-                    # directory.
-                    relative_path = os.path.relpath(root, camera_ctf_dir)
-                    output_subdirectory = os.path.join(
-                        json_output_dir,
-                        relative_path
-                    )
-                    os.makedirs(output_subdirectory, exist_ok=True)
-
-                    # Write each conversion task to a separate JSON file in
-                    # the correct subdirectory.
-                    json_filename = f"{conversion_name}.json"
-                    json_filepath = os.path.join(
-                        output_subdirectory,
-                        json_filename
-                    )
-                    with open(json_filepath, 'w') as f:
-                        json.dump(conversion_task, f, indent=2)
-
-                    # Make the output path relative for cleaner printing
-                    printed_path = os.path.join(relative_path, json_filename)
-                    logging.info(f"Generated: {printed_path}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    summary = {"written": [], "unchanged": [], "skipped": []}
+
+    for relative_path, ctf_file_name, ctf_path in iter_camera_ctf_files(
+            ctf_dir):
+        # Infer the input space from the CTF file name.
+        input_space_ocio = get_input_space_from_ctf_name(ctf_file_name)
+
+        if input_space_ocio == "Unknown":
+            logging.warning(
+                f"Could not infer input space for {ctf_file_name}. "
+                f"Skipping."
+            )
+            summary['skipped'].append(ctf_file_name)
+            continue
+
+        # Validate the inferred space against the available OCIO
+        # color spaces.
+        if input_space_ocio not in available_color_spaces:
+            logging.warning(
+                f"Inferred space '{input_space_ocio}' for "
+                f"{ctf_file_name} is not in the available OCIO "
+                f"config spaces. Skipping."
+            )
+            summary['skipped'].append(ctf_file_name)
+            continue
+
+        for conversion_name, conversion_task in build_conversion_tasks(
+                ctf_path, ctf_file_name, input_space_ocio):
+            # Write each conversion task to a separate JSON file in the
+            # same subdirectory structure as the camera CTFs.
+            printed_path = os.path.normpath(
+                os.path.join(relative_path, f"{conversion_name}.json")
+            )
+            json_filepath = os.path.join(output_dir, printed_path)
+
+            if write_if_changed(
+                    json_filepath,
+                    json.dumps(conversion_task, indent=2)):
+                logging.info(f"Generated: {printed_path}")
+                summary['written'].append(printed_path)
+            else:
+                summary['unchanged'].append(printed_path)
 
     logging.info(
-        f"\nSuccessfully generated all conversion tasks in "
-        f"{json_output_dir}"
+        f"Conversion tasks in {output_dir}: "
+        f"{len(summary['written'])} written, "
+        f"{len(summary['unchanged'])} unchanged, "
+        f"{len(summary['skipped'])} camera CTFs skipped."
     )
 
+    return summary
+
 
 # -------------------------------------------------------------------------- #
 # Run the main function.
 # -------------------------------------------------------------------------- #
 
 
-if __name__ == '__main__':
-    generate_conversion_tasks()
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generates the OCIO conversion task JSON files."
+    )
+    parser.add_argument(
+        '--camera-ctf-dir', default=camera_ctf_dir,
+        help="Root of the camera CTF files."
+    )
+    parser.add_argument(
+        '--output-dir', default=json_output_dir,
+        help="Root of the conversion task JSON files."
+    )
+    parser.add_argument(
+        '--ocio-config', default=None,
+        help="OCIO config JSON (default: latest generated config)."
+    )
+    arguments = parser.parse_args(argv)
+
+    setup_logging()
+    generate_conversion_tasks(
+        ctf_dir=arguments.camera_ctf_dir,
+        output_dir=arguments.output_dir,
+        ocio_config_path=arguments.ocio_config
+    )
 
 
+if __name__ == '__main__':
+    main()
+
 # -------------------------------------------------------------------------- #
 
 # DISCLAIMER:    This file is part of LOGIK-PROJEKT.
@@ -423,3 +531,11 @@ if __name__ == '__main__':
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Moved camera name matching into an ordered rule table.
+#               Validates colour spaces against a set.
+#               Walks the CTF tree with os.scandir.
+#               Rewrites task JSON only when its content changes.
+#               Added generate_conversion_tasks arguments and a CLI.
+# -------------------------------------------------------------------------- #
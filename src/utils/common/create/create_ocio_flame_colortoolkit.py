@@ -2,7 +2,14 @@
 # -------------------------------------------------------------------------- #
 # Filename:      create_ocio_flame_colortoolkit.py
 # Purpose:       Creates the Flame_ColorToolkit Color Transform Files.
-# Description:   Loads JSON files and generates CTF files.
+# Description:   Loads JSON files and generates CTF files. Conversions whose
+#                task JSON and source CTFs are unchanged since the last run
+#                are skipped, and the changed ones are written in parallel.
+#                Generated CTFs whose task JSON is gone are removed.
+
+#                Usage: create_ocio_flame_colortoolkit.py [--json-dir DIR]
+#                           [--output-dir DIR] [--workers N] [--force]
+#                           [--keep-stale]
 
 # Author:        phil_man@mac.com
 # Copyright:     Copyright (c) 2025
@@ -14,7 +21,7 @@
 # Status:        Production
 # Type:          Application
 # Created:       2025-07-01
-# Modified:      2025-10-06
+# Modified:      2026-10-19
 
 # Changelog:     Changelog at bottom of script.
 # -------------------------------------------------------------------------- #
@@ -25,9 +32,12 @@
 
 import os
 import json
+import hashlib
+import argparse
 import PyOpenColorIO as ocio
 import logging
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # -------------------------------------------------------------------------- #
 
@@ -65,10 +75,6 @@ output_dir = os.path.abspath(
     )
 )
 
-config = ocio.Config.CreateRaw()
-logging.info("Using minimal OCIO config for writing CTF files only.")
-os.makedirs(output_dir, exist_ok=True)
-
 aces_to_acescg_path = (
     "/opt/Autodesk/colour_mgmt/configs/legacy_configs/"
     "syncolor_ctfs/primaries/ACES_to_ACEScg.ctf"
@@ -79,6 +85,13 @@ acescg_to_aces_path = (
     "syncolor_ctfs/primaries/ACEScg_to_ACES.ctf"
 )
 
+# Bump when the way CTFs are built changes, to force a full rebuild.
+recipe_generator_version = 2
+
+# Minimal OCIO config used only for writing CTF files, created on first use
+# in each worker process.
+config = None
+
 
 # -------------------------------------------------------------------------- #
 # Setup Logging
@@ -95,22 +108,35 @@ log_dir = os.path.abspath(
     )
 )
 
-os.makedirs(log_dir, exist_ok=True)
-log_filename = os.path.join(
-    log_dir,
-    (f"flame_colortoolkit_creation_"
-     f"{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log")
-)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename),
-        logging.StreamHandler()
-    ],
-    force=True
-)
+def setup_logging():
+    """Logs to the console and to a timestamped file in the logs dir."""
+    os.makedirs(log_dir, exist_ok=True)
+    log_filename = os.path.join(
+        log_dir,
+        (f"flame_colortoolkit_creation_"
+         f"{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log")
+    )
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_filename),
+            logging.StreamHandler()
+        ],
+        force=True
+    )
+
+
+def get_config():
+    """Returns the minimal OCIO config used to write CTF files."""
+    global config
+    if config is None:
+        config = ocio.Config.CreateRaw()
+        logging.info("Using minimal OCIO config for writing CTF files only.")
+    return config
+
 
 # -------------------------------------------------------------------------- #
 # Helper Functions
@@ -225,6 +251,84 @@ def generate_inverse_name(original_name, original_output_name):
     )
 
 
+def describe_source_transforms(group_transform):
+    """Lists the source file and direction of each transform in a group."""
+    return [
+        {
+            "file": os.path.basename(t.getSrc()),
+            "direction": (
+                "inverse"
+                if t.getDirection() == ocio.TRANSFORM_DIR_INVERSE
+                else "forward"
+            )
+        } for t in group_transform
+    ]
+
+
+# -------------------------------------------------------------------------- #
+# Change Detection
+# -------------------------------------------------------------------------- #
+
+
+def file_sha256(file_path, file_hashes=None):
+    """
+    Returns the SHA-256 of a file, or None when it does not exist.
+
+    Many conversions share a source CTF, so hashes are memoised in the
+    optional 'file_hashes' dict for the length of a run.
+    """
+    if file_hashes is not None and file_path in file_hashes:
+        return file_hashes[file_path]
+
+    digest = None
+    if file_path and os.path.isfile(file_path):
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+
+    if file_hashes is not None:
+        file_hashes[file_path] = digest
+    return digest
+
+
+def get_source_ctf_paths(conversion):
+    """Returns every CTF file a conversion reads, in a stable order."""
+    source_paths = [
+        ctf_input.get('file') for ctf_input in conversion.get('inputs', [])
+    ]
+    if '-AP1' in conversion.get('name', ''):
+        source_paths.extend([aces_to_acescg_path, acescg_to_aces_path])
+    return source_paths
+
+
+def compute_recipe_hash(json_bytes, conversion, file_hashes=None):
+    """
+    Hashes the task JSON, the content of every source CTF it references
+    and the generator version into the recipe hash of a conversion.
+    """
+    sha256 = hashlib.sha256()
+    sha256.update(f"generator:{recipe_generator_version}\n".encode())
+    sha256.update(json_bytes)
+    for source_path in get_source_ctf_paths(conversion):
+        source_hash = file_sha256(source_path, file_hashes)
+        sha256.update(f"\n{source_path}:{source_hash}".encode())
+    return sha256.hexdigest()
+
+
+def read_recipe_hash(ctf_path):
+    """Returns the recipe hash stored next to a CTF, or None."""
+    if not os.path.isfile(ctf_path):
+        return None
+    recipe_path = os.path.splitext(ctf_path)[0] + '.json'
+    try:
+        with open(recipe_path, 'r') as f:
+            return json.load(f).get('recipe_hash')
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return None
+
+
 # -------------------------------------------------------------------------- #
 # Write CTF with GroupTransform
 # -------------------------------------------------------------------------- #
@@ -239,7 +343,7 @@ def write_ctf_and_recipe(group_transform, output_path, recipe_data):
         group_transform.write(
             "Color Transform Format",
             output_path,
-            config
+            get_config()
         )
         logging.info(f"  - Successfully created CTF: {output_path}")
     except Exception as e:
@@ -257,129 +361,345 @@ def write_ctf_and_recipe(group_transform, output_path, recipe_data):
         logging.error(
             f"  - Failed to write recipe {recipe_path}: {str(e)}"
         )
+        return False
 
     return True
 
 
 # -------------------------------------------------------------------------- #
-# Main Processing Loop
+# Conversion Tasks
 # -------------------------------------------------------------------------- #
 
-logging.info("Starting CTF generation...")
-logging.info(f"PyOpenColorIO version: {ocio.GetVersion()}")
 
-for root, dirs, files in os.walk(json_input_dir):
-    if root == json_input_dir:
-        continue
+def load_conversion_task(json_file_path, json_dir, ctf_output_dir,
+                         file_hashes=None):
+    """
+    Reads one conversion task JSON and resolves its output paths.
+
+    Returns a task dict, or None when the JSON is invalid or incomplete.
+    """
+    try:
+        with open(json_file_path, 'rb') as f:
+            json_bytes = f.read()
+        conversion = json.loads(json_bytes)
+    except (OSError, json.JSONDecodeError):
+        logging.error(
+            f"Invalid JSON: {json_file_path}. Skipping."
+        )
+        return None
+
+    conversion_name = conversion.get('name')
+    output_clf_name = conversion.get('output_clf')
+    inputs = conversion.get('inputs')
+
+    if not conversion_name or not output_clf_name or not inputs:
+        logging.warning(
+            f"Skipping invalid conversion task in "
+            f"{os.path.basename(json_file_path)}."
+        )
+        return None
+
+    relative_path = os.path.relpath(
+        os.path.dirname(json_file_path),
+        json_dir
+    )
+    ctf_output_subdirectory = os.path.join(ctf_output_dir, relative_path)
+
+    output_ctf_name = output_clf_name.replace('.clf', '.ctf')
+    inverse_name, inverse_ctf_name = generate_inverse_name(
+        conversion_name,
+        output_ctf_name
+    )
+
+    return {
+        "json_file_path": json_file_path,
+        "conversion": conversion,
+        "conversion_name": conversion_name,
+        "inverse_name": inverse_name,
+        "forward_path": os.path.join(
+            ctf_output_subdirectory, output_ctf_name
+        ),
+        "inverse_path": os.path.join(
+            ctf_output_subdirectory, inverse_ctf_name
+        ),
+        "recipe_hash": compute_recipe_hash(
+            json_bytes, conversion, file_hashes
+        ),
+    }
+
+
+def find_conversion_tasks(json_dir, ctf_output_dir, file_hashes=None):
+    """
+    Walks the task JSON tree, skipping files at its root as before, and
+    returns (tasks, invalid json paths).
+    """
+    tasks = []
+    invalid = []
+
+    for root, dirs, files in os.walk(json_dir):
+        dirs.sort()
+        if root == json_dir:
+            continue
 
-    for filename in files:
-        if filename.endswith('.json'):
+        for filename in sorted(files):
+            if not filename.endswith('.json'):
+                continue
             json_file_path = os.path.join(root, filename)
+            task = load_conversion_task(
+                json_file_path, json_dir, ctf_output_dir, file_hashes
+            )
+            if task is None:
+                invalid.append(json_file_path)
+            else:
+                tasks.append(task)
+
+    return tasks, invalid
+
+
+def is_task_up_to_date(task):
+    """True when both CTFs exist and their recipes carry the task's hash."""
+    return all(
+        read_recipe_hash(ctf_path) == task['recipe_hash']
+        for ctf_path in (task['forward_path'], task['inverse_path'])
+    )
+
+
+def find_stale_outputs(ctf_output_dir, json_dir, tasks, invalid):
+    """
+    Returns the generated CTFs that no conversion task produces any more.
+
+    Only CTFs with a recipe naming their 'source_json' are considered, so
+    files placed in the output tree by hand are never reported. Outputs of
+    a task JSON that failed to load are kept until it is fixed or removed.
+    """
+    expected = {
+        os.path.abspath(ctf_path)
+        for task in tasks
+        for ctf_path in (task['forward_path'], task['inverse_path'])
+    }
+    unreadable = {
+        (
+            os.path.relpath(os.path.dirname(json_path), json_dir),
+            os.path.basename(json_path)
+        )
+        for json_path in invalid
+    }
+    stale = []
+
+    for root, dirs, files in os.walk(ctf_output_dir):
+        dirs.sort()
+        relative_path = os.path.relpath(root, ctf_output_dir)
+        for filename in sorted(files):
+            if not filename.endswith('.ctf'):
+                continue
+            ctf_path = os.path.join(root, filename)
+            if os.path.abspath(ctf_path) in expected:
+                continue
+            recipe_path = os.path.splitext(ctf_path)[0] + '.json'
             try:
-                with open(json_file_path, 'r') as f:
-                    conversion = json.load(f)
-            except json.JSONDecodeError:
-                logging.error(
-                    f"Invalid JSON: {json_file_path}. Skipping."
-                )
+                with open(recipe_path, 'r') as f:
+                    source_json = json.load(f).get('source_json')
+            except (OSError, json.JSONDecodeError, AttributeError):
+                continue
+            if not source_json:
+                continue
+            if (relative_path, source_json) in unreadable:
                 continue
+            stale.append(ctf_path)
 
-            conversion_name = conversion.get('name')
-            output_clf_name = conversion.get('output_clf')
-            inputs = conversion.get('inputs')
+    return stale
 
-            if not conversion_name or not output_clf_name or not inputs:
-                logging.warning(
-                    f"Skipping invalid conversion task in {filename}."
-                )
-                continue
 
-            relative_path = os.path.relpath(root, json_input_dir)
-            ctf_output_subdirectory = os.path.join(
-                output_dir,
-                relative_path
-            )
-            os.makedirs(ctf_output_subdirectory, exist_ok=True)
+def remove_stale_output(ctf_path):
+    """Removes a stale CTF and its recipe JSON."""
+    for path in (ctf_path, os.path.splitext(ctf_path)[0] + '.json'):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    logging.info(f"  - Removed stale CTF: {ctf_path}")
 
-            output_ctf_name = output_clf_name.replace('.clf', '.ctf')
 
-            # --- Process Forward Transform ---
-            logging.info(
-                f"Processing FORWARD conversion: {conversion_name}"
-            )
-            forward_transforms = []
-            if create_forward_transform(
-                    conversion,
-                    forward_transforms,
-                    conversion_name):
-                if forward_transforms:
-                    g = ocio.GroupTransform(forward_transforms)
-                    # output_ctf_name is now expected to be clean from
-                    # generate_conversion_tasks.py
-                    out_path = os.path.join(
-                        ctf_output_subdirectory,
-                        output_ctf_name
-                    )
-                    recipe = {
-                        "output_file": output_ctf_name,
-                        "source_json": os.path.basename(json_file_path),
-                        "transform_direction": "forward",
-                        "source_transforms": [
-                            {
-                                "file": os.path.basename(t.getSrc()),
-                                "direction": (
-                                    "inverse"
-                                    if t.getDirection() ==
-                                    ocio.TRANSFORM_DIR_INVERSE
-                                    else "forward"
-                                )
-                            } for t in g
-                        ]
-                    }
-                    write_ctf_and_recipe(g, out_path, recipe)
-
-            # --- Process Inverse Transform ---
-            inverse_name, inverse_ctf_name = generate_inverse_name(
-                conversion_name,
-                output_ctf_name
-            )
-            logging.info(
-                f"Processing INVERSE conversion: {inverse_name}"
+def process_conversion_task(task):
+    """
+    Builds and writes the forward and inverse CTFs of one conversion.
+
+    Runs in a worker process. Returns (conversion name, success).
+    """
+    conversion = task['conversion']
+    conversion_name = task['conversion_name']
+    source_json = os.path.basename(task['json_file_path'])
+    success = True
+
+    os.makedirs(os.path.dirname(task['forward_path']), exist_ok=True)
+
+    directions = (
+        ("forward", conversion_name, create_forward_transform,
+         task['forward_path']),
+        ("inverse", task['inverse_name'], create_inverse_transform,
+         task['inverse_path']),
+    )
+
+    for direction, name, create_transform, ctf_path in directions:
+        logging.info(
+            f"Processing {direction.upper()} conversion: {name}"
+        )
+        transforms = []
+        if not create_transform(conversion, transforms, conversion_name):
+            success = False
+            continue
+        if not transforms:
+            continue
+
+        g = ocio.GroupTransform(transforms)
+        recipe = {
+            "output_file": os.path.basename(ctf_path),
+            "source_json": source_json,
+            "transform_direction": direction,
+            "source_transforms": describe_source_transforms(g),
+            "recipe_hash": task['recipe_hash'],
+            "generator_version": recipe_generator_version,
+        }
+        if not write_ctf_and_recipe(g, ctf_path, recipe):
+            success = False
+
+    return conversion_name, success
+
+
+# -------------------------------------------------------------------------- #
+# Main Processing
+# -------------------------------------------------------------------------- #
+
+
+def generate_flame_colortoolkit(
+        json_dir=json_input_dir,
+        ctf_output_dir=output_dir,
+        max_workers=None,
+        force=False,
+        remove_stale=True
+):
+    """
+    Generates the forward and inverse CTFs of every conversion task.
+
+    Conversions whose recipe hash matches the recipes already on disk are
+    skipped unless 'force' is set. Changed conversions are written on a
+    process pool of 'max_workers' processes, or inline when there is
+    only one. Generated CTFs whose task is gone are removed, or only
+    reported when 'remove_stale' is False.
+
+    Returns:
+        dict: {'generated': [...], 'skipped': [...], 'failed': [...],
+        'stale': [...], 'removed': [...]} of conversion names, with invalid
+        task JSON paths under 'failed' and CTF paths under 'stale' and
+        'removed'.
+    """
+    logging.info("Starting CTF generation...")
+    logging.info(f"PyOpenColorIO version: {ocio.GetVersion()}")
+
+    os.makedirs(ctf_output_dir, exist_ok=True)
+
+    tasks, invalid = find_conversion_tasks(json_dir, ctf_output_dir, {})
+    summary = {
+        "generated": [],
+        "skipped": [],
+        "failed": list(invalid),
+        "stale": [],
+        "removed": [],
+    }
+
+    for ctf_path in find_stale_outputs(
+            ctf_output_dir, json_dir, tasks, invalid):
+        if remove_stale:
+            remove_stale_output(ctf_path)
+            summary['removed'].append(ctf_path)
+        else:
+            summary['stale'].append(ctf_path)
+
+    pending = []
+    for task in tasks:
+        if not force and is_task_up_to_date(task):
+            summary['skipped'].append(task['conversion_name'])
+        else:
+            pending.append(task)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(pending)))
+
+    if max_workers == 1:
+        results = map(process_conversion_task, pending)
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        results = executor.map(process_conversion_task, pending)
+
+    try:
+        for conversion_name, success in results:
+            summary['generated' if success else 'failed'].append(
+                conversion_name
             )
-            inverse_transforms = []
-            if create_inverse_transform(
-                    conversion,
-                    inverse_transforms,
-                    conversion_name):
-                if inverse_transforms:
-                    g = ocio.GroupTransform(inverse_transforms)
-                    # inverse_ctf_name is now expected to be clean from
-                    # generate_conversion_tasks.py
-                    inv_path = os.path.join(
-                        ctf_output_subdirectory,
-                        inverse_ctf_name
-                    )
-                    recipe = {
-                        "output_file": inverse_ctf_name,
-                        "source_json": os.path.basename(json_file_path),
-                        "transform_direction": "inverse",
-                        "source_transforms": [
-                            {
-                                "file": os.path.basename(t.getSrc()),
-                                "direction": (
-                                    "inverse"
-                                    if t.getDirection() ==
-                                    ocio.TRANSFORM_DIR_INVERSE
-                                    else "forward"
-                                )
-                            } for t in g
-                        ]
-                    }
-                    write_ctf_and_recipe(g, inv_path, recipe)
-
-logging.info("Processing complete. All transforms generated.")
+    finally:
+        if max_workers > 1:
+            executor.shutdown()
+
+    return summary
+
+
+def log_summary(summary):
+    """Logs the generated, skipped and failed conversion counts."""
+    for failed in summary['failed']:
+        logging.error(f"Failed: {failed}")
+    for stale in summary['stale']:
+        logging.warning(f"Stale (task JSON removed): {stale}")
+    logging.info(
+        f"Processing complete. "
+        f"Generated: {len(summary['generated'])}, "
+        f"skipped (unchanged): {len(summary['skipped'])}, "
+        f"failed: {len(summary['failed'])}, "
+        f"stale removed: {len(summary['removed'])}, "
+        f"stale kept: {len(summary['stale'])}."
+    )
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generates the Flame ColorToolkit CTF files."
+    )
+    parser.add_argument(
+        '--json-dir', default=json_input_dir,
+        help="Root of the conversion task JSON files."
+    )
+    parser.add_argument(
+        '--output-dir', default=output_dir,
+        help="Root of the generated CTF and recipe files."
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help="Number of worker processes (default: CPU count)."
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help="Regenerate every conversion, even when unchanged."
+    )
+    parser.add_argument(
+        '--keep-stale', action='store_true',
+        help="Report generated CTFs whose task JSON is gone, don't delete."
+    )
+    arguments = parser.parse_args(argv)
+
+    setup_logging()
+    summary = generate_flame_colortoolkit(
+        json_dir=arguments.json_dir,
+        ctf_output_dir=arguments.output_dir,
+        max_workers=arguments.workers,
+        force=arguments.force,
+        remove_stale=not arguments.keep_stale
+    )
+    log_summary(summary)
+
+
+if __name__ == '__main__':
+    main()
+
 # -------------------------------------------------------------------------- #
 
 # DISCLAIMER:    This file is part of LOGIK-PROJEKT.
@@ -421,3 +741,15 @@ logging.info("Processing complete. All transforms generated.")
 #               Verified compatibility with Autodesk Flame 2026.2.0.
 #               No code changes required.
 # -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Restructured into a callable pipeline with a CLI.
+#               Skips conversions whose recipe hash is unchanged.
+#               Writes changed conversions on a process pool.
+#               Logs a summary of generated, skipped and failed tasks.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Removes generated CTFs whose task JSON was removed, or
+#               reports them with --keep-stale.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:      verify_ocio_flame_colortoolkit.py
+# Purpose:       Verifies the round trip of the Flame_ColorToolkit CTFs.
+# Description:   Pairs each forward CTF written by
+#                create_ocio_flame_colortoolkit.py with its inverse, pushes
+#                a dense RGB lattice and log-spaced grey ramps through both
+#                with PyOpenColorIO CPU processors and reports the maximum
+#                and mean round-trip error of every pair as JSON.
+
+#                Usage: verify_ocio_flame_colortoolkit.py [--ctf-dir DIR]
+#                           [--report FILE] [--lattice-size 65]
+#                           [--tolerance 0.001] [--workers N]
+
+# Author:        phil_man@mac.com
+# Copyright:     Copyright (c) 2025
+# Disclaimer:    Disclaimer at bottom of script.
+# License:       GNU General Public License v3.0 (GPL-3.0) .
+#                https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:       2026.2.0
+# Status:        Production
+# Type:          Application
+# Created:       2026-10-18
+# Modified:      2026-10-19
+
+# Changelog:     Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+# -------------------------------------------------------------------------- #
+# This section defines the import statements and directory paths.
+# -------------------------------------------------------------------------- #
+
+import os
+import sys
+import json
+import math
+import argparse
+import logging
+import datetime
+import numpy as np
+import PyOpenColorIO as ocio
+from concurrent.futures import ProcessPoolExecutor
+
+# -------------------------------------------------------------------------- #
+
+ctf_input_dir = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        '..',
+        '..',
+        '..',
+        '..',
+        'cfg',
+        'site-cfg',
+        'flame-cfg',
+        'flame-presets',
+        'colour_mgmt',
+        'transforms',
+        'flame-colortoolkit'
+    )
+)
+
+log_dir = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        '..',
+        '..',
+        '..',
+        '..',
+        'logs',
+    )
+)
+
+default_report_path = os.path.join(
+    log_dir,
+    'flame_colortoolkit_verification.json'
+)
+
+# Points per axis of the RGB test lattice (65^3 = 274,625 points).
+default_lattice_size = 65
+
+# Points of each log-spaced grey ramp, from 2^-16 to 1.0.
+ramp_size = 4096
+
+# Maximum absolute round-trip error accepted for a pair.
+default_tolerance = 1e-3
+
+# Test buffer shared by every pair handled by one worker process.
+_test_buffer = None
+
+
+# -------------------------------------------------------------------------- #
+# Setup Logging
+# -------------------------------------------------------------------------- #
+
+
+def setup_logging():
+    """Logs to the console and to a timestamped file in the logs dir."""
+    os.makedirs(log_dir, exist_ok=True)
+    log_filename = os.path.join(
+        log_dir,
+        (f"flame_colortoolkit_verification_"
+         f"{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log")
+    )
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_filename),
+            logging.StreamHandler()
+        ],
+        force=True
+    )
+
+
+# -------------------------------------------------------------------------- #
+# Test Data
+# -------------------------------------------------------------------------- #
+
+
+def build_test_buffer(lattice_size=default_lattice_size):
+    """
+    Returns a contiguous (N, 3) float32 array holding an RGB lattice over
+    [0, 1] followed by log-spaced grey, red, green and blue ramps.
+    """
+    axis = np.linspace(0.0, 1.0, lattice_size, dtype=np.float32)
+    r, g, b = np.meshgrid(axis, axis, axis, indexing='ij')
+    lattice = np.stack((r, g, b), axis=-1).reshape(-1, 3)
+
+    ramp = np.logspace(-16, 0, ramp_size, base=2.0, dtype=np.float32)
+    ramps = np.zeros((4, ramp_size, 3), dtype=np.float32)
+    ramps[0] = ramp[:, None]
+    for channel in range(3):
+        ramps[channel + 1, :, channel] = ramp
+
+    return np.ascontiguousarray(
+        np.concatenate((lattice, ramps.reshape(-1, 3))),
+        dtype=np.float32
+    )
+
+
+def count_test_points(lattice_size=default_lattice_size):
+    """Returns the number of rows build_test_buffer() would produce."""
+    return lattice_size ** 3 + 4 * ramp_size
+
+
+def get_test_buffer(lattice_size):
+    """Builds the test buffer once per worker process."""
+    global _test_buffer
+    if _test_buffer is None or _test_buffer[0] != lattice_size:
+        _test_buffer = (lattice_size, build_test_buffer(lattice_size))
+    return _test_buffer[1]
+
+
+# -------------------------------------------------------------------------- #
+# Transform Pairs
+# -------------------------------------------------------------------------- #
+
+
+def find_transform_pairs(ctf_dir):
+    """
+    Pairs forward and inverse CTFs through their recipe files.
+
+    Both recipes of a conversion name the same 'source_json' and live in
+    the same directory. Returns (pairs, unpaired forward CTF paths).
+    """
+    recipes = {}
+
+    for root, dirs, files in os.walk(ctf_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(root, filename), 'r') as f:
+                    recipe = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if not isinstance(recipe, dict):
+                continue
+
+            direction = recipe.get('transform_direction')
+            source_json = recipe.get('source_json')
+            output_file = recipe.get('output_file')
+            if direction not in ('forward', 'inverse'):
+                continue
+            if not source_json or not output_file:
+                continue
+
+            ctf_path = os.path.join(root, output_file)
+            if os.path.isfile(ctf_path):
+                recipes.setdefault((root, source_json), {})[direction] = (
+                    ctf_path
+                )
+
+    pairs = []
+    unpaired = []
+    for key in sorted(recipes):
+        pair = recipes[key]
+        if 'forward' in pair and 'inverse' in pair:
+            pairs.append((pair['forward'], pair['inverse']))
+        else:
+            unpaired.extend(pair.values())
+
+    return pairs, unpaired
+
+
+def get_cpu_processor(config, ctf_path):
+    """Returns the default CPU processor of a CTF file."""
+    return config.getProcessor(
+        ocio.FileTransform(ctf_path)
+    ).getDefaultCPUProcessor()
+
+
+def finite_or_none(value):
+    """
+    Returns 'value', or None if it is infinite or NaN, which JSON has no
+    standard spelling for.
+    """
+    return value if math.isfinite(value) else None
+
+
+def verify_transform_pair(pair, lattice_size, tolerance):
+    """
+    Applies the forward then the inverse CTF to the test buffer, one
+    applyRGB call each, and measures the distance to the input.
+
+    Runs in a worker process. Returns the report entry of the pair.
+    """
+    forward_path, inverse_path = pair
+    entry = {
+        "forward": forward_path,
+        "inverse": inverse_path,
+    }
+
+    try:
+        config = ocio.Config.CreateRaw()
+        forward_processor = get_cpu_processor(config, forward_path)
+        inverse_processor = get_cpu_processor(config, inverse_path)
+
+        source = get_test_buffer(lattice_size)
+        pixels = source.copy()
+        forward_processor.applyRGB(pixels)
+        inverse_processor.applyRGB(pixels)
+    except Exception as e:
+        entry.update({"status": "error", "error": str(e)})
+        return entry
+
+    error = np.abs(pixels - source)
+    finite = np.isfinite(error)
+    if not finite.all():
+        entry["non_finite_points"] = int((~finite.all(axis=1)).sum())
+        error = np.where(finite, error, np.inf)
+
+    # A pair that leaves the finite range fails, with no max error (null)
+    worst = int(np.argmax(error.max(axis=1)))
+    max_error = finite_or_none(float(error[worst].max()))
+    entry.update(
+        {
+            "status": (
+                "pass"
+                if max_error is not None and max_error <= tolerance
+                else "fail"
+            ),
+            "max_error": max_error,
+            "mean_error": (
+                float(error[finite].mean()) if finite.any() else None
+            ),
+            "worst_input": source[worst].tolist(),
+            "worst_output": [
+                finite_or_none(value) for value in pixels[worst].tolist()
+            ],
+        }
+    )
+
+    return entry
+
+
+# -------------------------------------------------------------------------- #
+# Main Processing
+# -------------------------------------------------------------------------- #
+
+
+def verify_flame_colortoolkit(
+        ctf_dir=ctf_input_dir,
+        lattice_size=default_lattice_size,
+        tolerance=default_tolerance,
+        max_workers=None
+):
+    """
+    Verifies every forward/inverse CTF pair below 'ctf_dir'.
+
+    Returns:
+        dict: The report, with the run settings, pass/fail/error counts,
+        the unpaired CTFs and one entry per pair.
+    """
+    logging.info("Starting CTF round-trip verification...")
+    logging.info(f"PyOpenColorIO version: {ocio.GetVersion()}")
+
+    pairs, unpaired = find_transform_pairs(ctf_dir)
+    points = count_test_points(lattice_size) if pairs else 0
+    logging.info(
+        f"Verifying {len(pairs)} transform pairs with {points} "
+        f"test points each."
+    )
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(pairs)))
+    arguments = (pairs, [lattice_size] * len(pairs),
+                 [tolerance] * len(pairs))
+
+    if max_workers == 1:
+        entries = list(map(verify_transform_pair, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            entries = list(executor.map(verify_transform_pair, *arguments))
+
+    counts = {"pass": 0, "fail": 0, "error": 0}
+    for entry in entries:
+        counts[entry['status']] += 1
+        name = os.path.relpath(entry['forward'], ctf_dir)
+        if entry['status'] == 'error':
+            logging.error(f"  - {name}: {entry['error']}")
+        elif entry['max_error'] is None:
+            logging.warning(
+                f"  - {name}: {entry['non_finite_points']} test points "
+                f"round trip to infinity or NaN"
+            )
+        elif entry['status'] == 'fail':
+            logging.warning(
+                f"  - {name}: max error {entry['max_error']:.3g} "
+                f"exceeds {tolerance:g}"
+            )
+
+    for ctf_path in unpaired:
+        logging.warning(f"  - No matching transform for: {ctf_path}")
+
+    return {
+        "ctf_dir": ctf_dir,
+        "created": datetime.datetime.now().isoformat(timespec='seconds'),
+        "ocio_version": ocio.GetVersion(),
+        "lattice_size": lattice_size,
+        "test_points": points,
+        "tolerance": tolerance,
+        "counts": counts,
+        "unpaired": unpaired,
+        "transforms": entries,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Verifies the round trip of the Flame ColorToolkit CTFs."
+    )
+    parser.add_argument(
+        '--ctf-dir', default=ctf_input_dir,
+        help="Root of the generated CTF and recipe files."
+    )
+    parser.add_argument(
+        '--report', default=default_report_path,
+        help="Path of the JSON report."
+    )
+    parser.add_argument(
+        '--lattice-size', type=int, default=default_lattice_size,
+        help="Points per axis of the RGB test lattice."
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=default_tolerance,
+        help="Maximum absolute round-trip error of a passing pair."
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help="Number of worker processes (default: CPU count)."
+    )
+    arguments = parser.parse_args(argv)
+
+    setup_logging()
+    report = verify_flame_colortoolkit(
+        ctf_dir=arguments.ctf_dir,
+        lattice_size=arguments.lattice_size,
+        tolerance=arguments.tolerance,
+        max_workers=arguments.workers
+    )
+
+    # Non-finite values are written as null; any left over is a bug and
+    # fails here, before the report file is touched
+    report_json = json.dumps(report, indent=2, allow_nan=False)
+
+    os.makedirs(os.path.dirname(os.path.abspath(arguments.report)),
+                exist_ok=True)
+    with open(arguments.report, 'w') as f:
+        f.write(report_json)
+
+    counts = report['counts']
+    logging.info(
+        f"Verification complete. Passed: {counts['pass']}, "
+        f"failed: {counts['fail']}, errors: {counts['error']}. "
+        f"Report: {arguments.report}"
+    )
+
+    return 1 if counts['fail'] or counts['error'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:    This file is part of LOGIK-PROJEKT.
+
+#                Copyright © 2025 STRENGTH IN NUMBERS
+
+#                LOGIK-PROJEKT creates directories, files, scripts & tools
+#                for use with Autodesk Flame and other software.
+
+#                LOGIK-PROJEKT is free software.
+
+#                You can redistribute it and/or modify it under the terms
+#                of the GNU General Public License as published by the
+#                Free Software Foundation, either version 3 of the License,
+#                or any later version.
+
+#                This program is distributed in the hope that it will be
+#                useful, but WITHOUT ANY WARRANTY; without even the
+
+#                implied warranty of MERCHANTABILITY or
+#                FITNESS FOR A PARTICULAR PURPOSE.
+
+#                See the GNU General Public License for more details.
+#                You should have received a copy of the GNU General
+#                Public License along with this program.
+
+#                If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#                Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the CTF round-trip verification tool.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Counts the test points without building the buffer.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Writes non-finite errors as null and rejects NaN in JSON.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     bench_flame_object_index.py
+# Purpose:      Benchmark Flame API calls of the layout object lookups.
+# Description:  Creates N objects in one library with the previous linear
+#               scan of 'create_or_validate_object' and with the indexed
+#               'ensure_objects', against the counting stub 'flame' module,
+#               and reports the API call counts and wall time of both.
+
+#               Usage: python tests/benchmarks/bench_flame_object_index.py
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Benchmark
+# Created:      2026-10-18
+# Modified:     2026-10-18
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import sys
+import time
+
+repository_root_dir = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+layout_scripts_dir = os.path.join(
+    repository_root_dir,
+    "cfg",
+    "site-cfg",
+    "flame-cfg",
+    "flame-python",
+    "logik_projekt",
+    "projekt_tools",
+    "logik_projekt_layout",
+    "scripts"
+)
+sys.path.insert(0, os.path.join(repository_root_dir, "tests", "stubs"))
+sys.path.insert(0, layout_scripts_dir)
+
+import flame  # noqa: E402
+from modules.functions.flame_object_index import (  # noqa: E402
+    FlameObjectIndex,
+    ensure_objects,
+)
+
+object_counts = (10, 50, 100, 200, 400)
+
+
+def legacy_create_or_validate_object(library, object_name, object_type):
+    """The linear scan used before the index, kept as the baseline."""
+    for obj in getattr(library, f"{object_type}s"):
+        if obj.name == object_name:
+            return obj
+    return getattr(library, f"create_{object_type}")(name=object_name)
+
+
+def run_legacy(object_count):
+    flame.reset()
+    workspace = flame.projects.current_project.current_workspace
+    library = workspace.create_library(name="benchmark")
+    flame.reset_api_calls()
+    start = time.perf_counter()
+    for number in range(object_count):
+        legacy_create_or_validate_object(library, f"folder_{number:04}", "folder")
+    return flame.total_api_calls(), time.perf_counter() - start
+
+
+def run_indexed(object_count):
+    flame.reset()
+    workspace = flame.projects.current_project.current_workspace
+    library = workspace.create_library(name="benchmark")
+    flame.reset_api_calls()
+    start = time.perf_counter()
+    ensure_objects(
+        library,
+        [
+            {"object_name": f"folder_{number:04}", "object_type": "folder"}
+            for number in range(object_count)
+        ],
+        index=FlameObjectIndex()
+    )
+    return flame.total_api_calls(), time.perf_counter() - start
+
+
+def main():
+    devnull = open(os.devnull, "w")
+    print(
+        f"{'objects':>8} {'legacy calls':>13} {'indexed calls':>14} "
+        f"{'legacy s':>10} {'indexed s':>10}"
+    )
+    for object_count in object_counts:
+        legacy_calls, legacy_time = run_legacy(object_count)
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            indexed_calls, indexed_time = run_indexed(object_count)
+        finally:
+            sys.stdout = stdout
+        print(
+            f"{object_count:>8} {legacy_calls:>13} {indexed_calls:>14} "
+            f"{legacy_time:>10.4f} {indexed_time:>10.4f}"
+        )
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the flame object index benchmark.
+# -------------------------------------------------------------------------- #
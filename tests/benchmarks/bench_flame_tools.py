@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     bench_flame_tools.py
+# Purpose:      Benchmark the in-Flame tools against the stub 'flame' module.
+# Description:  Builds synthetic projects of increasing size in the counting
+#               stub 'flame' module, then runs create_projekt_layout, every
+#               create_dated_objects action, the batch and media panel
+#               actions of each openclip tool and both startup workspace
+#               builders against them. Reports the wall time and the number
+#               of Flame API calls of every run.
+
+#               Usage: python tests/benchmarks/bench_flame_tools.py
+#                          [--sizes 10 100 1000] [--latency 0.0001]
+#                          [--tools layout openclip] [--json results.json]
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Benchmark
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import argparse
+import contextlib
+import functools
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+repository_root_dir = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+flame_python_dir = os.path.join(
+    repository_root_dir,
+    "cfg",
+    "site-cfg",
+    "flame-cfg",
+    "flame-python",
+    "logik_projekt"
+)
+layout_scripts_dir = os.path.join(
+    flame_python_dir,
+    "projekt_tools",
+    "logik_projekt_layout",
+    "scripts"
+)
+dated_objects_scripts_dir = os.path.join(
+    flame_python_dir,
+    "projekt_tools",
+    "logik_projekt_dated_objects",
+    "scripts"
+)
+openclip_scripts_dir = os.path.join(
+    flame_python_dir,
+    "openclip_tools",
+    "logik_projekt_openclip",
+    "scripts"
+)
+startup_scripts_dir = os.path.join(
+    repository_root_dir,
+    "cfg",
+    "site-cfg",
+    "flame-cfg",
+    "flame-scripts",
+    "flame-startup-scripts"
+)
+workspace_template_path = os.path.join(
+    repository_root_dir,
+    "pref",
+    "site-prefs",
+    "default-prefs",
+    "logik-projekt-prefs",
+    "flame-workspace.json"
+)
+
+sys.path.insert(0, os.path.join(repository_root_dir, "tests", "stubs"))
+sys.path.insert(0, repository_root_dir)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import flame  # noqa: E402
+
+project_sizes = (10, 100, 1000)
+
+openclip_tool_names = (
+    "comp",
+    "mattes",
+    "multichannel",
+    "neat_video",
+    "precomp",
+)
+
+# ========================================================================== #
+# This section loads the tools.
+# ========================================================================== #
+
+# Module names that every Flame tool ships its own copy of.
+shared_module_prefixes = ("modules", "pyside6_qt_")
+
+
+def load_tool_module(scripts_dir: str, module_name: str,
+                     modules_dir: str = None):
+    """
+    Import a Flame hook from its scripts directory.
+
+    Each tool ships its own 'modules' package, so the copies imported by
+    the previously loaded tool are dropped from sys.modules first. A tool
+    that uses the 'modules' package of another tool names that tool's
+    scripts directory as 'modules_dir'.
+    """
+    for loaded_name in list(sys.modules):
+        if loaded_name.startswith(shared_module_prefixes):
+            del sys.modules[loaded_name]
+    sys.modules.pop(module_name, None)
+    search_dirs = [scripts_dir]
+    if modules_dir:
+        search_dirs.append(modules_dir)
+    sys.path[:0] = search_dirs
+    try:
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            return importlib.import_module(module_name)
+    finally:
+        for search_dir in search_dirs:
+            sys.path.remove(search_dir)
+
+# ========================================================================== #
+# This section builds synthetic projects.
+# ========================================================================== #
+
+def populate_project(size: int):
+    """
+    Reset the stub and fill the project with 'size' objects per container.
+
+    The libraries, folders and reels the tools look up are created up
+    front among 'size' unrelated siblings, the desktop 'Reels' group gets
+    'size' extra reels and the open batch group gets 'size' clip nodes.
+    A library reel holding 'size' clips is returned as the media panel
+    selection.
+    """
+    flame.reset()
+    workspace = flame.projects.current_project.current_workspace
+    desktop = workspace.desktop
+
+    for library_name in ("desktops", "reference", "editorial"):
+        library = workspace.create_library(name=library_name)
+        for number in range(size):
+            library.create_folder(name=f"folder_{number:05}")
+    for number in range(size):
+        workspace.create_library(name=f"library_{number:05}")
+
+    desktop_reel_group = desktop.reel_groups[0]
+    for number in range(size):
+        desktop_reel_group.create_reel(name=f"reel_{number:05}")
+
+    for number in range(size):
+        clip_node = flame.batch.create_node("Clip")
+        clip_node.name = f"sh{number:04}_plate_v001"
+        clip_node.pos_x = 0
+        clip_node.pos_y = number * -192
+
+    clips_reel = workspace.create_library(name="media").create_reel(
+        name="plates"
+    )
+    for number in range(size):
+        clips_reel.create_clip(
+            name=f"sh{number:04}_plate_v001",
+            shot_name=f"sh{number:04}"
+        )
+
+    flame.reset_api_calls()
+    return clips_reel.clips
+
+
+def synthetic_workspace_template(size: int) -> list:
+    """The default workspace template plus 'size' generated libraries."""
+    with open(workspace_template_path, "r", encoding="utf-8") as f:
+        workspace_data = json.load(f)
+    for number in range(size):
+        workspace_data.append(
+            {
+                "type": "library",
+                "name": f"library_{number:05}",
+                "expanded": False,
+                "children": [
+                    {"type": "folder", "name": "plates"},
+                    {
+                        "type": "reel_group",
+                        "name": "reviews",
+                        "reel_names": ["internal", "client"]
+                    },
+                ]
+            }
+        )
+    return workspace_data
+
+# ========================================================================== #
+# This section defines the benchmarked runs.
+# ========================================================================== #
+
+def run_layout(size):
+    tool = load_tool_module(layout_scripts_dir, "create_projekt_layout")
+    populate_project(size)
+    yield "create_projekt_layout", tool.create_layout
+
+
+def run_dated_objects(size):
+    tool = load_tool_module(
+        dated_objects_scripts_dir,
+        "create_dated_objects",
+        modules_dir=layout_scripts_dir
+    )
+    for action_name in (
+            "create_dated_desktop",
+            "create_dated_ref_folder",
+            "create_dated_conforms_reel_group",
+            "create_dated_postings_reel"):
+        populate_project(size)
+        yield action_name, getattr(tool, action_name)
+
+
+def run_openclip(size):
+    config_dir = tempfile.mkdtemp(prefix="bench_openclip_")
+    for openclip_tool_name in openclip_tool_names:
+        tool = load_tool_module(
+            openclip_scripts_dir,
+            f"logik_projekt_openclip_{openclip_tool_name}"
+        )
+        tool.CONFIG_PATH = os.path.join(config_dir, openclip_tool_name)
+        os.makedirs(tool.CONFIG_PATH)
+
+        populate_project(size)
+        yield (
+            f"openclip_{openclip_tool_name} batch",
+            functools.partial(
+                getattr(tool, f"projekt_{openclip_tool_name}_batch_clips"),
+                list(flame.batch._children["nodes"])
+            )
+        )
+
+        selection = populate_project(size)
+        yield (
+            f"openclip_{openclip_tool_name} media panel",
+            functools.partial(
+                getattr(
+                    tool, f"projekt_{openclip_tool_name}_media_panel_clips"
+                ),
+                selection
+            )
+        )
+
+
+def run_startup(size):
+    from src.core.utils.flame_workspace_utils import (
+        compile_flame_workspace_plan,
+    )
+
+    tool = load_tool_module(startup_scripts_dir, "flame_startup_script_template")
+    startup_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    workspace_data = synthetic_workspace_template(size)
+    with open(
+            os.path.join(startup_dir, "flame-workspace.json"),
+            "w",
+            encoding="utf-8") as f:
+        json.dump(workspace_data, f)
+    with open(
+            os.path.join(startup_dir, "flame-workspace-plan.json"),
+            "w",
+            encoding="utf-8") as f:
+        json.dump(compile_flame_workspace_plan(workspace_data), f)
+
+    def legacy_builder():
+        with contextlib.chdir(startup_dir):
+            tool.set_all_expansion_states(tool.create_workspace_from_template())
+
+    def plan_builder():
+        with contextlib.chdir(startup_dir):
+            tool.replay_workspace_plan(tool.load_workspace_plan())
+
+    flame.reset()
+    yield "startup workspace (template)", legacy_builder
+    flame.reset()
+    yield "startup workspace (plan)", plan_builder
+
+
+benchmarked_tools = {
+    "layout": run_layout,
+    "dated_objects": run_dated_objects,
+    "openclip": run_openclip,
+    "startup": run_startup,
+}
+
+# ========================================================================== #
+# This section runs the benchmark.
+# ========================================================================== #
+
+def measure(action):
+    """Run one tool action and return (api calls, seconds, top calls)."""
+    flame.reset_api_calls()
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        start = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - start
+    return (
+        flame.total_api_calls(),
+        elapsed,
+        flame.api_calls.most_common(3)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the in-Flame tools against the stub 'flame'."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(project_sizes),
+        help="Synthetic project sizes (objects per container)."
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0,
+        help="Seconds of artificial latency per Flame API call."
+    )
+    parser.add_argument(
+        "--tools", nargs="+", choices=sorted(benchmarked_tools),
+        default=list(benchmarked_tools),
+        help="Tools to benchmark."
+    )
+    parser.add_argument(
+        "--json", dest="json_path",
+        help="Also write the results to this JSON file."
+    )
+    arguments = parser.parse_args()
+
+    flame.set_latency(arguments.latency)
+    results = []
+
+    print(f"{'tool':<40} {'size':>6} {'api calls':>10} {'seconds':>10}  "
+          f"top calls")
+    for size in arguments.sizes:
+        for tool_name in arguments.tools:
+            for action_name, action in benchmarked_tools[tool_name](size):
+                calls, elapsed, top_calls = measure(action)
+                results.append(
+                    {
+                        "tool": action_name,
+                        "size": size,
+                        "api_calls": calls,
+                        "seconds": elapsed,
+                        "top_calls": dict(top_calls),
+                    }
+                )
+                top = ", ".join(f"{name} {count}" for name, count in top_calls)
+                print(f"{action_name:<40} {size:>6} {calls:>10} "
+                      f"{elapsed:>10.4f}  {top}")
+
+    if arguments.json_path:
+        with open(arguments.json_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"latency": arguments.latency, "results": results}, f,
+                indent=4
+            )
+
+
+if __name__ == "__main__":
+    main()
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the in-Flame tools benchmark.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Loaded create_dated_objects with the layout tool's modules.
+# -------------------------------------------------------------------------- #
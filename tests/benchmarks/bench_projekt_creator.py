@@ -0,0 +1,790 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     bench_projekt_creator.py
+# Purpose:      Benchmark the projekt creation pipeline.
+# Description:  Builds the projekt summary of tests/TEST-DATA.json with
+#               synthetic filesystem trees of 100, 1k and 10k directories
+#               and runs ProjektCreator.create_projekt into a temp root.
+#               Wiretap, the Flame launch and /opt/Autodesk/shared are
+#               replaced by local stand-ins. Every run happens in its own
+#               process and reports per-step timings and peak RSS, plus
+#               syscall counts when strace is installed. Results are
+#               appended to a JSON history file and compared against a
+#               stored baseline.
+
+#               Usage: python tests/benchmarks/bench_projekt_creator.py
+#                          [--sizes 100 1000 10000] [--repeat 3]
+#                          [--root /mnt/storage/tmp] [--no-strace]
+#                          [--history history.json] [--baseline base.json]
+#                          [--save-baseline] [--threshold 0.25] [--strict]
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Benchmark
+# Created:      2026-10-18
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import platform
+import resource
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+repository_root_dir = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+test_data_path = os.path.join(repository_root_dir, "tests", "TEST-DATA.json")
+benchmark_logs_dir = os.path.join(repository_root_dir, "logs", "benchmarks")
+default_history_path = os.path.join(
+    benchmark_logs_dir,
+    "bench_projekt_creator_history.json"
+)
+default_baseline_path = os.path.join(
+    benchmark_logs_dir,
+    "bench_projekt_creator_baseline.json"
+)
+
+sys.path.insert(0, repository_root_dir)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+template_sizes = (100, 1000, 10000)
+template_fanout = 10
+
+# Steps of ProjektCreator.create_projekt that are module-level functions of
+# projekt_creator, in pipeline order. Anything else (logging, the makedirs
+# of step 4) is reported under 'other'.
+pipeline_steps = (
+    ("export_session_variables", "02 export session variables"),
+    ("export_session_adsk_json", "03 export session adsk json"),
+    ("create_projekt_filesystem_dirs", "04 create filesystem dirs"),
+    ("export_session_xml", "05 export session xml"),
+    ("create_flame_wiretap_node", "06 create wiretap node"),
+    ("create_flame_setup_dirs", "07 create flame setup dirs"),
+    ("create_flame_symbolic_links", "08 create symbolic links"),
+    ("copy_flame_presets", "09 copy flame presets"),
+    ("copy_flame_python_scripts", "10 copy flame python scripts"),
+    ("copy_flame_bookmarks", "11 copy flame bookmarks"),
+    ("copy_init_config", "12 copy init config"),
+    ("create_flame_archive_script", "13 create archive script"),
+    ("create_projekt_backup_script", "14 create backup script"),
+    ("create_flame_startup_script", "15 create startup script"),
+    ("create_flame_launcher_script", "16 create launcher script"),
+    ("create_projekt_launcher_alias", "17 create launcher alias"),
+    ("launch_flame", "18 launch flame"),
+    ("copy_current_session_files", "19 copy session files"),
+    ("create_projekt_pgsql_db", "20 record projekt in catalog"),
+)
+
+# Regressions smaller than these are treated as noise.
+min_regression_seconds = 0.005
+min_regression_rss_kb = 4096
+min_regression_syscalls = 100
+
+# ========================================================================== #
+# This section builds the synthetic inputs.
+# ========================================================================== #
+
+def build_filesystem_tree(node_count: int, tree_path: str):
+    """
+    Write a filesystem tree template of 'node_count' directories in the
+    format of filesystem-tree.json. Every directory has up to
+    'template_fanout' children, so 10k nodes reach a depth of four.
+    """
+    paths = []
+    subdirectories = []
+    for number in range(node_count):
+        name = f"dir_{number:05}"
+        parent_number = number // template_fanout - 1
+        if parent_number < 0:
+            path = name
+            parent = "projekt directories"
+        else:
+            path = f"{paths[parent_number]}/{name}"
+            parent = paths[parent_number].rsplit("/", 1)[-1]
+        paths.append(path)
+        subdirectories.append(
+            {
+                "path": path,
+                "name": name,
+                "depth": path.count("/") + 1,
+                "hasChildren": (number + 1) * template_fanout < node_count,
+                "parent": parent,
+            }
+        )
+
+    with open(tree_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "original_path": tree_path,
+                "original_name": "logik-projekt",
+                "original_depth": 0,
+                "analysis": {
+                    "timestamp": time.strftime("%Y_%m_%d-%H_%M_%S"),
+                    "root_directory": "logik-projekt",
+                    "total_subdirectories": node_count,
+                },
+                "subdirectories": subdirectories,
+            },
+            f,
+            indent=2
+        )
+
+
+def build_projekt_summary_data(work_dir: str, tree_path: str) -> dict:
+    """
+    Build the summary the UI would hand to create_projekt for the
+    template in TEST-DATA.json, rooted in 'work_dir'.
+    """
+    from src.core.functions.get.get_projekt_summary_data import (
+        get_projekt_summary_data
+    )
+    from src.core.template_manager.template_models import (
+        TemplateInfo,
+        TemplateParameters,
+    )
+
+    with open(test_data_path, "r", encoding="utf-8") as f:
+        test_data = {
+            key.rstrip(": ").strip(): value
+            for key, value in json.load(f).items()
+        }
+
+    template_info = TemplateInfo(
+        template_serial_number=test_data["Template Serial Number"],
+        template_client_name=test_data["Template Client Name"],
+        template_campaign_name=test_data["Template Campaign Name"],
+        template_calculated_name=test_data["Template Name"],
+        template_description=test_data["Template Description"],
+    )
+    template_parameters = TemplateParameters(
+        template_resolution=test_data["Template Resolution"],
+        template_resolution_w=test_data["Template Width"],
+        template_resolution_h=test_data["Template Height"],
+        template_aspect_ratio=test_data["Template Aspect Ratio"],
+        template_bit_depth=test_data["Template Bit Depth"],
+        template_framerate=test_data["Template Framerate"],
+        template_scan_mode=test_data["Template Scan Mode"],
+        template_start_frame=test_data["Template Start Frame"],
+        template_init_config=test_data["Template Init Config"],
+        template_ocio_config=test_data["Template OCIO Config"],
+        template_ocio_name=test_data["Template OCIO Name"],
+        template_ocio_path=test_data["Template OCIO Path"],
+        template_cache_integer=test_data["Template Cache Integer"],
+        template_cache_integer_id=str(test_data["Template Cache Integer ID"]),
+        template_cache_float=test_data["Template Cache Float"],
+        template_cache_float_id=str(test_data["Template Cache Float ID"]),
+    )
+
+    default_prefs_dir = os.path.join(
+        repository_root_dir,
+        "pref",
+        "site-prefs",
+        "default-prefs",
+        "logik-projekt-prefs"
+    )
+    flame_home = os.path.join(
+        work_dir,
+        "opt",
+        "Autodesk",
+        "project",
+        template_info.template_calculated_name
+    )
+    summary_data = get_projekt_summary_data(
+        template_info,
+        template_parameters,
+        {
+            "flame_software_choice": "flame_2026.2",
+            "flame_home_directory": flame_home,
+            "flame_setups_directory": "<project home>",
+            "flame_media_directory": "<project home>",
+            "flame_catalog_directory": "<project home>",
+            "logik_projekt_config": {
+                "PROJEKT Configuration Name": "logik-projekt",
+                "PROJEKT Filesystem Tree": tree_path,
+                "PROJEKT Flame Workspace": os.path.join(
+                    default_prefs_dir,
+                    "flame-workspace.json"
+                ),
+                "PROJEKT Flame Bookmarks": os.path.join(
+                    default_prefs_dir,
+                    "cf_bookmarks.json"
+                ),
+            },
+        },
+    )
+    summary_data["logik_projekt_path"] = os.path.join(
+        work_dir,
+        "PROJEKTS",
+        template_info.template_calculated_name
+    )
+    summary_data["launch_flame_after_creation"] = True
+    return summary_data
+
+# ========================================================================== #
+# This section replaces Wiretap, Flame and /opt/Autodesk with stand-ins.
+# ========================================================================== #
+
+def prepare_work_dir(work_dir: str):
+    """
+    Lay out 'work_dir' as a stand-in repository root: 'cfg' and the site
+    preferences link back to the repository, while the session
+    preferences, logs, Wiretap node store and /opt/Autodesk/shared are
+    local directories. The projekt catalog is a local database.
+    """
+    os.environ["LOGIK_PROJEKT_CATALOG"] = os.path.join(
+        work_dir,
+        "logik_projekt_catalog.sqlite"
+    )
+    os.symlink(
+        os.path.join(repository_root_dir, "cfg"),
+        os.path.join(work_dir, "cfg")
+    )
+    os.makedirs(os.path.join(work_dir, "pref", "session-preferences"))
+    os.symlink(
+        os.path.join(repository_root_dir, "pref", "site-prefs"),
+        os.path.join(work_dir, "pref", "site-prefs")
+    )
+    for local_dir in (
+        ("logs", "session-logs"),
+        ("opt", "Autodesk", "shared"),
+        ("opt", "Autodesk", "wiretap", "projects"),
+    ):
+        os.makedirs(os.path.join(work_dir, *local_dir))
+
+
+class StandInFlameProcess(subprocess.Popen):
+    """Runs a shell that prints a line instead of the Flame launcher."""
+
+    def __init__(self, args, **kwargs):
+        super().__init__(
+            ["/bin/sh", "-c", 'echo "Flame stand-in for $0"', args[0]],
+            **kwargs
+        )
+
+
+@contextlib.contextmanager
+def stand_ins_installed(work_dir: str, step_timings: dict):
+    """
+    Patch projekt_creator for one run: time every pipeline step, swap in
+    the stand-ins and point every repository-relative output at
+    'work_dir'.
+    """
+    from src.core.functions.get.get_application_paths import (
+        GetApplicationPaths
+    )
+    from src.core.projekt_manager import projekt_creator
+    from src.core.utils import flame_launch_utils, path_utils
+    from src.core.utils.wiretap_utils import LocalWiretapBackend
+
+    def timed(label, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                step_timings[label] = (
+                    step_timings.get(label, 0.0) +
+                    time.perf_counter() - start
+                )
+        return wrapper
+
+    patched_attributes = {
+        (projekt_creator, "create_flame_wiretap_node"): functools.partial(
+            projekt_creator.create_flame_wiretap_node,
+            backend=LocalWiretapBackend(
+                os.path.join(work_dir, "opt", "Autodesk", "wiretap")
+            )
+        ),
+        (flame_launch_utils, "subprocess"): SimpleNamespace(
+            Popen=StandInFlameProcess,
+            DEVNULL=subprocess.DEVNULL,
+            PIPE=subprocess.PIPE,
+            STDOUT=subprocess.STDOUT,
+        ),
+        (projekt_creator, "path_utils"): SimpleNamespace(
+            get_repository_root_dir=lambda: Path(work_dir),
+            create_directory=path_utils.create_directory,
+        ),
+        (GetApplicationPaths, "AUTODESK_SHARED_DIR"): os.path.join(
+            work_dir,
+            "opt",
+            "Autodesk",
+            "shared",
+            ""
+        ),
+        (GetApplicationPaths, "SESSION_PREFERENCES_DIR"): os.path.join(
+            work_dir,
+            "pref",
+            "session-preferences"
+        ),
+        (GetApplicationPaths, "SESSION_LOGS_DIR"): os.path.join(
+            work_dir,
+            "logs",
+            "session-logs"
+        ),
+    }
+    originals = {
+        key: getattr(*key) for key in patched_attributes
+    }
+    for key, value in patched_attributes.items():
+        setattr(*key, value)
+    for function_name, label in pipeline_steps:
+        key = (projekt_creator, function_name)
+        originals.setdefault(key, getattr(projekt_creator, function_name))
+        setattr(projekt_creator, function_name, timed(label, getattr(*key)))
+
+    try:
+        yield
+    finally:
+        for key, value in originals.items():
+            setattr(*key, value)
+
+# ========================================================================== #
+# This section runs the pipeline once, in a child process.
+# ========================================================================== #
+
+def run_pipeline(node_count: int, work_dir: str) -> dict:
+    """Run create_projekt once in 'work_dir' and measure it."""
+    from src.core.projekt_manager.projekt_creator import create_projekt
+    from src.core.utils.session_log_utils import start_session_log
+
+    prepare_work_dir(work_dir)
+    tree_path = os.path.join(work_dir, "filesystem-tree.json")
+    build_filesystem_tree(node_count, tree_path)
+    os.chdir(work_dir)
+
+    # Log the way src/app.py does, so logging cost is part of the timings
+    start_session_log(os.path.join(work_dir, "logs", "session-logs"))
+
+    summary_data = build_projekt_summary_data(work_dir, tree_path)
+    step_timings = {}
+    with stand_ins_installed(work_dir, step_timings):
+        start = time.perf_counter()
+        flame_launch = create_projekt(summary_data)
+        total_seconds = time.perf_counter() - start
+        # The stand-in runs detached, let it finish before cleaning up.
+        flame_launch.wait()
+
+    step_timings["other"] = max(
+        0.0,
+        total_seconds - sum(step_timings.values())
+    )
+    created_dirs = sum(
+        len(dirs) for _, dirs, _ in os.walk(summary_data["logik_projekt_path"])
+    )
+    return {
+        "nodes": node_count,
+        "total_seconds": total_seconds,
+        "steps": step_timings,
+        "created_dirs": created_dirs,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "children_peak_rss_kb": resource.getrusage(
+            resource.RUSAGE_CHILDREN
+        ).ru_maxrss,
+    }
+
+
+def parse_strace_summary(text: str) -> dict:
+    """
+    Read the table written by 'strace -c'.
+
+    Returns:
+        dict: 'total' calls, 'errors' and the call count of each syscall.
+    """
+    syscalls = {}
+    total = errors = 0
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < 5 or not fields[0].replace(".", "").isdigit():
+            continue
+        name = fields[-1]
+        calls = int(fields[3])
+        call_errors = int(fields[4]) if len(fields) == 6 else 0
+        if name == "total":
+            total, errors = calls, call_errors
+        else:
+            syscalls[name] = calls
+    return {
+        "total": total or sum(syscalls.values()),
+        "errors": errors,
+        "calls": dict(
+            sorted(syscalls.items(), key=lambda item: -item[1])
+        ),
+    }
+
+
+def run_child(node_count: int, root_dir: str, strace: bool, keep: bool):
+    """
+    Run the pipeline in a fresh interpreter so that imports, caches and
+    peak RSS are not shared between runs. The pipeline's own console
+    output goes to 'bench-output.log' in the work directory.
+    """
+    work_dir = tempfile.mkdtemp(prefix="bench-projekt-", dir=root_dir)
+    result_path = os.path.join(work_dir, "bench-result.json")
+    strace_path = os.path.join(work_dir, "bench-strace.txt")
+    command = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--child",
+        "--nodes", str(node_count),
+        "--work-dir", os.path.join(work_dir, "root"),
+        "--output", result_path,
+    ]
+    if strace:
+        command = ["strace", "-f", "-c", "-o", strace_path] + command
+
+    try:
+        with open(os.path.join(work_dir, "bench-output.log"), "w") as output:
+            subprocess.run(
+                command,
+                stdout=output,
+                stderr=subprocess.STDOUT,
+                cwd=work_dir,
+                check=True
+            )
+        with open(result_path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+        if strace:
+            with open(strace_path, "r", encoding="utf-8") as f:
+                result["syscalls"] = parse_strace_summary(f.read())
+        return result
+    except subprocess.CalledProcessError:
+        print(
+            f"Run of {node_count} nodes failed, see "
+            f"{os.path.join(work_dir, 'bench-output.log')}",
+            file=sys.stderr
+        )
+        keep = True
+        raise
+    finally:
+        if not keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+# ========================================================================== #
+# This section summarises runs and compares them with the baseline.
+# ========================================================================== #
+
+def summarise_runs(timed_runs: list, strace_run) -> dict:
+    """Reduce the timed runs of one size to medians."""
+    step_names = []
+    for run in timed_runs:
+        for name in run["steps"]:
+            if name not in step_names:
+                step_names.append(name)
+    totals = [run["total_seconds"] for run in timed_runs]
+    return {
+        "repeat": len(timed_runs),
+        "created_dirs": timed_runs[0]["created_dirs"],
+        "total_seconds": {
+            "median": statistics.median(totals),
+            "min": min(totals),
+            "max": max(totals),
+        },
+        "steps": {
+            name: statistics.median(
+                run["steps"].get(name, 0.0) for run in timed_runs
+            )
+            for name in sorted(step_names)
+        },
+        "peak_rss_kb": max(run["peak_rss_kb"] for run in timed_runs),
+        "children_peak_rss_kb": max(
+            run["children_peak_rss_kb"] for run in timed_runs
+        ),
+        "syscalls": strace_run["syscalls"] if strace_run else None,
+    }
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    List every measurement that grew by more than 'threshold' (a fraction)
+    over the baseline and by more than the noise floor.
+    """
+    regressions = []
+
+    def check(size, name, current, previous, floor):
+        if previous is None or current is None:
+            return
+        if current - previous > max(previous * threshold, floor):
+            regressions.append(
+                {
+                    "nodes": size,
+                    "measurement": name,
+                    "baseline": previous,
+                    "current": current,
+                    "change": (current / previous - 1) if previous else None,
+                }
+            )
+
+    for size, result in results.items():
+        previous = baseline.get("sizes", {}).get(size)
+        if previous is None:
+            continue
+        check(
+            size,
+            "total_seconds",
+            result["total_seconds"]["median"],
+            previous["total_seconds"]["median"],
+            min_regression_seconds
+        )
+        for step_name, seconds in result["steps"].items():
+            check(
+                size,
+                f"steps/{step_name}",
+                seconds,
+                previous["steps"].get(step_name),
+                min_regression_seconds
+            )
+        check(
+            size,
+            "peak_rss_kb",
+            result["peak_rss_kb"],
+            previous["peak_rss_kb"],
+            min_regression_rss_kb
+        )
+        if result["syscalls"] and previous.get("syscalls"):
+            check(
+                size,
+                "syscalls/total",
+                result["syscalls"]["total"],
+                previous["syscalls"]["total"],
+                min_regression_syscalls
+            )
+    return regressions
+
+
+def get_git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=repository_root_dir,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def load_json(path: str, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return default
+
+
+def write_json(path: str, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+    os.replace(temp_path, path)
+
+
+def print_results(results: dict):
+    for size, result in results.items():
+        total = result["total_seconds"]
+        print(
+            f"\n{size} nodes, {result['created_dirs']} dirs created: "
+            f"median {total['median']:.3f}s "
+            f"(min {total['min']:.3f}s, max {total['max']:.3f}s), "
+            f"peak RSS {result['peak_rss_kb'] / 1024:.1f} MiB"
+        )
+        for step_name, seconds in result["steps"].items():
+            print(f"    {step_name:<32} {seconds:>9.4f}s")
+        syscalls = result["syscalls"]
+        if syscalls:
+            top = ", ".join(
+                f"{name} {calls}"
+                for name, calls in list(syscalls["calls"].items())[:6]
+            )
+            print(
+                f"    syscalls: {syscalls['total']} "
+                f"({syscalls['errors']} errors), top: {top}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark ProjektCreator.create_projekt."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(template_sizes),
+        help="Directory counts of the synthetic filesystem trees."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Timed runs per size; the median is reported."
+    )
+    parser.add_argument(
+        "--root", default=tempfile.gettempdir(),
+        help="Directory on the storage to benchmark."
+    )
+    parser.add_argument(
+        "--no-strace", action="store_true",
+        help="Skip the extra run under 'strace -c'."
+    )
+    parser.add_argument("--history", default=default_history_path)
+    parser.add_argument("--baseline", default=default_baseline_path)
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="Store this run as the new baseline."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Relative growth over the baseline flagged as a regression."
+    )
+    parser.add_argument(
+        "--strict", action="store_true",
+        help="Exit with status 1 when a regression is flagged."
+    )
+    parser.add_argument(
+        "--keep", action="store_true",
+        help="Keep the work directories of every run."
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--nodes", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.child:
+        os.makedirs(arguments.work_dir)
+        result = run_pipeline(arguments.nodes, arguments.work_dir)
+        write_json(arguments.output, result)
+        return
+
+    os.makedirs(arguments.root, exist_ok=True)
+    use_strace = not arguments.no_strace and shutil.which("strace")
+    if not arguments.no_strace and not use_strace:
+        print("strace not found, syscall counts are skipped.")
+
+    results = {}
+    for size in arguments.sizes:
+        print(f"Running {size} nodes...", flush=True)
+        timed_runs = [
+            run_child(size, arguments.root, False, arguments.keep)
+            for _ in range(arguments.repeat)
+        ]
+        strace_run = (
+            run_child(size, arguments.root, True, arguments.keep)
+            if use_strace else None
+        )
+        results[str(size)] = summarise_runs(timed_runs, strace_run)
+
+    print_results(results)
+
+    baseline = load_json(arguments.baseline, None)
+    regressions = (
+        find_regressions(results, baseline, arguments.threshold)
+        if baseline else []
+    )
+    if baseline is None:
+        print(f"\nNo baseline at {arguments.baseline}.")
+    elif regressions:
+        print(f"\n{len(regressions)} regressions against the baseline:")
+        for regression in regressions:
+            change = regression["change"]
+            print(
+                f"    {regression['nodes']:>6} nodes  "
+                f"{regression['measurement']:<40} "
+                f"{regression['baseline']:.4g} -> {regression['current']:.4g}"
+                + (f" (+{change:.0%})" if change is not None else "")
+            )
+    else:
+        print("\nNo regressions against the baseline.")
+
+    entry = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_commit": get_git_commit(),
+        "hostname": socket.gethostname(),
+        "python": platform.python_version(),
+        "root": os.path.abspath(arguments.root),
+        "sizes": results,
+        "regressions": regressions,
+    }
+    history = load_json(arguments.history, [])
+    history.append(entry)
+    write_json(arguments.history, history)
+    print(f"Appended results to {arguments.history}")
+
+    if arguments.save_baseline:
+        write_json(arguments.baseline, entry)
+        print(f"Saved baseline to {arguments.baseline}")
+
+    if regressions and arguments.strict:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added the projekt creation pipeline benchmark.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Time the detached Flame launch of step 19 as a pipeline
+#               step and wait for the stand-in before cleaning up.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Follow the catalog record to step 20.
+# -------------------------------------------------------------------------- #
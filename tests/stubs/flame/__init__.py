@@ -0,0 +1,625 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     __init__.py
+# Purpose:      In-memory stand-in for the Autodesk Flame python API.
+# Description:  Models the parts of the 'flame' module used by the in-Flame
+#               tools of LOGIK-PROJEKT, so that they can be exercised and
+#               benchmarked outside of Flame. Every attribute read, attribute
+#               write and method call that would cross the Flame API is
+#               counted in 'api_calls' and can be given an artificial
+#               latency with 'set_latency'.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Stub
+# Created:      2026-10-18
+# Modified:     2026-10-18
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import collections
+import time
+
+# -------------------------------------------------------------------------- #
+# API call accounting
+# -------------------------------------------------------------------------- #
+
+api_calls = collections.Counter()
+
+_latency = 0.0
+
+
+def set_latency(seconds: float):
+    """Sleep for 'seconds' on every counted Flame API call."""
+    global _latency
+    _latency = seconds
+
+
+def reset_api_calls():
+    """Clear the API call counters."""
+    api_calls.clear()
+
+
+def total_api_calls() -> int:
+    """Return the number of API calls made since the last reset."""
+    return sum(api_calls.values())
+
+
+def _api_call(name: str):
+    api_calls[name] += 1
+    if _latency:
+        time.sleep(_latency)
+
+
+# -------------------------------------------------------------------------- #
+# Attributes
+# -------------------------------------------------------------------------- #
+
+class PyAttribute:
+    """Value wrapper returned by Flame for object attributes."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def get_value(self):
+        return self._value
+
+    def set_value(self, value):
+        self._value = value
+
+    def __eq__(self, other):
+        if isinstance(other, PyAttribute):
+            other = other._value
+        return self._value == other
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __str__(self):
+        # Flame quotes string values, hence the 'str(clip.name)[1:-1]' idiom
+        if isinstance(self._value, str):
+            return repr(self._value)
+        return str(self._value)
+
+    def __repr__(self):
+        return repr(self._value)
+
+
+class _ApiAttribute:
+    """Descriptor for an object attribute that counts reads and writes."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        _api_call(f"{owner.__name__}.{self.name}")
+        return PyAttribute(instance._values.get(self.name))
+
+    def __set__(self, instance, value):
+        _api_call(f"{type(instance).__name__}.{self.name}=")
+        if isinstance(value, PyAttribute):
+            value = value.get_value()
+        instance._values[self.name] = value
+
+
+class _ApiList:
+    """Descriptor for a child list; one API call per access."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        _api_call(f"{owner.__name__}.{self.name}")
+        return list(instance._children[self.name])
+
+
+# -------------------------------------------------------------------------- #
+# Objects
+# -------------------------------------------------------------------------- #
+
+class PyObject:
+    """Base class for every stub Flame object."""
+
+    name = _ApiAttribute()
+    colour = _ApiAttribute()
+    colour_label = _ApiAttribute()
+    expanded = _ApiAttribute()
+    tags = _ApiAttribute()
+
+    def __init__(self, name="", parent=None):
+        self._values = {
+            "name": name,
+            "colour": (0.0, 0.0, 0.0),
+            "colour_label": "",
+            "expanded": False,
+            "tags": [],
+        }
+        self._children = collections.defaultdict(list)
+        self.parent = parent
+        self.attributes = {}
+
+    def _create(self, list_name, object_class, name):
+        _api_call(f"{type(self).__name__}.create_{object_class.__name__}")
+        child = object_class(name=name, parent=self)
+        self._children[list_name].append(child)
+        return child
+
+    def _remove(self, child):
+        for children in self._children.values():
+            if child in children:
+                children.remove(child)
+                return
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self._values.get('name')!r}>"
+
+
+class PySegment(PyObject):
+    shot_name = _ApiAttribute()
+
+    def __init__(self, name="", parent=None, shot_name=""):
+        super().__init__(name=name, parent=parent)
+        self._values["shot_name"] = shot_name
+
+
+class PyTrack(PyObject):
+    segments = _ApiList()
+
+
+class PyVersion(PyObject):
+    tracks = _ApiList()
+
+
+class PyClip(PyObject):
+    duration = _ApiAttribute()
+    frame_rate = _ApiAttribute()
+    start_time = _ApiAttribute()
+    versions = _ApiList()
+
+    def __init__(self, name="", parent=None, duration=100, shot_name=""):
+        super().__init__(name=name, parent=parent)
+        self._values.update(
+            {
+                "duration": duration,
+                "frame_rate": "23.976 fps",
+                "start_time": "00:00:00:00",
+            }
+        )
+        version = PyVersion(parent=self)
+        track = PyTrack(parent=version)
+        track._children["segments"].append(
+            PySegment(name=name, parent=track, shot_name=shot_name)
+        )
+        version._children["tracks"].append(track)
+        self._children["versions"].append(version)
+
+    def _shot_name(self):
+        segment = (
+            self._children["versions"][0]._children["tracks"][0]
+            ._children["segments"][0]
+        )
+        return segment._values["shot_name"]
+
+
+class PySequence(PyClip):
+    pass
+
+
+class PyReel(PyObject):
+    clips = _ApiList()
+    sequences = _ApiList()
+
+    def create_clip(self, name="", duration=100, shot_name=""):
+        _api_call("PyReel.create_PyClip")
+        clip = PyClip(
+            name=name, parent=self, duration=duration, shot_name=shot_name
+        )
+        self._children["clips"].append(clip)
+        return clip
+
+
+# -------------------------------------------------------------------------- #
+# Batch
+# -------------------------------------------------------------------------- #
+
+class PyNode:
+    """
+    Batch node with free-form attributes.
+
+    Flame nodes expose a different attribute set per node type, so any
+    attribute may be written; reads of unknown attributes raise like
+    Flame does. 'pos_x' and 'pos_y' are plain ints, everything else is
+    returned wrapped in a PyAttribute.
+    """
+
+    plain_attributes = ("pos_x", "pos_y")
+
+    def __init__(self, node_type="", name="", parent=None):
+        object.__setattr__(self, "parent", parent)
+        object.__setattr__(
+            self,
+            "_values",
+            {"name": name, "type": node_type, "pos_x": 0, "pos_y": 0}
+        )
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in self._values:
+            raise AttributeError(name)
+        _api_call(f"{type(self).__name__}.{name}")
+        if name in self.plain_attributes:
+            return self._values[name]
+        return PyAttribute(self._values[name])
+
+    def __setattr__(self, name, value):
+        if name.startswith("_") or name == "parent":
+            object.__setattr__(self, name, value)
+            return
+        _api_call(f"{type(self).__name__}.{name}=")
+        if isinstance(value, PyAttribute):
+            value = value.get_value()
+        self._values[name] = value
+
+    def change_plugin(self, plugin_name):
+        _api_call(f"{type(self).__name__}.change_plugin")
+        self._values["plugin_name"] = plugin_name
+        return True
+
+    def duplicate(self, keep_node_connections=False):
+        _api_call(f"{type(self).__name__}.duplicate")
+        node = type(self)(parent=self.parent)
+        node._values.update(self._values)
+        node._values["name"] = f"{self._values['name']}_copy"
+        if self.parent is not None:
+            self.parent._children["nodes"].append(node)
+        return node
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} {self._values.get('type')!r} "
+            f"{self._values.get('name')!r}>"
+        )
+
+
+class PyClipNode(PyNode):
+    def __init__(self, node_type="Clip", name="", parent=None, clip=None):
+        super().__init__(node_type=node_type, name=name, parent=parent)
+        clip = clip or PyClip(name=name)
+        object.__setattr__(self, "_clip", clip)
+        self._values["duration"] = clip._values["duration"]
+
+    @property
+    def clip(self):
+        _api_call("PyClipNode.clip")
+        return self._clip
+
+
+class PyReelGroup(PyObject):
+    reels = _ApiList()
+
+    default_reel_names = ("Reel 1", "Reel 2", "Reel 3", "Sequences")
+
+    def __init__(self, name="", parent=None):
+        super().__init__(name=name, parent=parent)
+        for reel_name in self.default_reel_names:
+            self._children["reels"].append(PyReel(name=reel_name, parent=self))
+
+    def create_reel(self, name=""):
+        return self._create("reels", PyReel, name)
+
+
+class PyBatchGroup(PyObject):
+    """Batch group; 'flame.batch' is the one currently open."""
+
+    reels = _ApiList()
+    shelf_reels = _ApiList()
+    nodes = _ApiList()
+    start_frame = _ApiAttribute()
+    duration = _ApiAttribute()
+
+    def __init__(
+            self,
+            name="",
+            parent=None,
+            nb_reels=4,
+            nb_shelf_reels=1,
+            reels=None,
+            shelf_reels=None,
+            start_frame=1,
+            duration=100
+    ):
+        super().__init__(name=name, parent=parent)
+        self._values.update({"start_frame": start_frame, "duration": duration})
+        reel_names = reels or [
+            f"Schematic Reel {number}" for number in range(1, nb_reels + 1)
+        ]
+        shelf_reel_names = shelf_reels or [
+            "Batch Renders" if number == 1 else f"Batch Renders {number}"
+            for number in range(1, nb_shelf_reels + 1)
+        ]
+        for reel_name in reel_names:
+            self._children["reels"].append(PyReel(name=reel_name, parent=self))
+        for reel_name in shelf_reel_names:
+            self._children["shelf_reels"].append(
+                PyReel(name=reel_name, parent=self)
+            )
+
+    def create_reel(self, name=""):
+        return self._create("reels", PyReel, name)
+
+    def create_node(self, node_type, file_path=""):
+        _api_call("PyBatchGroup.create_node")
+        node_class = PyClipNode if node_type == "Clip" else PyNode
+        node = node_class(node_type=node_type, name=node_type, parent=self)
+        self._children["nodes"].append(node)
+        return node
+
+    def connect_nodes(self, output_node, output_socket, input_node,
+                      input_socket):
+        _api_call("PyBatchGroup.connect_nodes")
+        connections = self._children["connections"]
+        connections.append(
+            (output_node, output_socket, input_node, input_socket)
+        )
+        return True
+
+    def frame_all(self):
+        _api_call("PyBatchGroup.frame_all")
+
+    def create_batch_group(self, name="", **kwargs):
+        """Create a batch group on the desktop and open it."""
+        desktop = projects._current_project._workspace._desktop
+        return desktop.create_batch_group(name, **kwargs)
+
+
+class PyFolder(PyObject):
+    folders = _ApiList()
+    reel_groups = _ApiList()
+    reels = _ApiList()
+    batch_groups = _ApiList()
+
+    def create_folder(self, name=""):
+        return self._create("folders", PyFolder, name)
+
+    def create_reel_group(self, name=""):
+        return self._create("reel_groups", PyReelGroup, name)
+
+    def create_reel(self, name=""):
+        return self._create("reels", PyReel, name)
+
+    def create_batch_group(self, name="", **kwargs):
+        _api_call(f"{type(self).__name__}.create_PyBatchGroup")
+        batch_group = PyBatchGroup(name=name, parent=self, **kwargs)
+        self._children["batch_groups"].append(batch_group)
+        return batch_group
+
+
+class PyLibrary(PyFolder):
+    pass
+
+
+class PyDesktop(PyObject):
+    reel_groups = _ApiList()
+    reels = _ApiList()
+    batch_groups = _ApiList()
+
+    def __init__(self, name="Desktop", parent=None):
+        super().__init__(name=name, parent=parent)
+        self._children["reel_groups"].append(
+            PyReelGroup(name="Reels", parent=self)
+        )
+
+    def create_reel_group(self, name=""):
+        return self._create("reel_groups", PyReelGroup, name)
+
+    def create_reel(self, name=""):
+        return self._create("reels", PyReel, name)
+
+    def create_batch_group(self, name="", **kwargs):
+        global _current_batch
+        _api_call("PyDesktop.create_PyBatchGroup")
+        batch_group = PyBatchGroup(name=name, parent=self, **kwargs)
+        self._children["batch_groups"].append(batch_group)
+        _current_batch = batch_group
+        return batch_group
+
+
+class PyWorkspace(PyObject):
+    libraries = _ApiList()
+
+    def __init__(self, name="Workspace", parent=None):
+        super().__init__(name=name, parent=parent)
+        self._children["libraries"].append(
+            PyLibrary(name="Default Library", parent=self)
+        )
+        self._desktop = PyDesktop(parent=self)
+
+    @property
+    def desktop(self):
+        _api_call("PyWorkspace.desktop")
+        return self._desktop
+
+    def create_library(self, name=""):
+        return self._create("libraries", PyLibrary, name)
+
+
+class PyProject(PyObject):
+    def __init__(self, name="projekt", parent=None):
+        super().__init__(name=name, parent=parent)
+        self._workspace = PyWorkspace(parent=self)
+
+    @property
+    def current_workspace(self):
+        _api_call("PyProject.current_workspace")
+        return self._workspace
+
+
+class PyUser(PyObject):
+    def __init__(self, name="artist", parent=None):
+        super().__init__(name=name, parent=parent)
+        self._values["nickname"] = name
+
+    @property
+    def nickname(self):
+        _api_call("PyUser.nickname")
+        return self._values["nickname"]
+
+
+# -------------------------------------------------------------------------- #
+# Module level API
+# -------------------------------------------------------------------------- #
+
+class _Projects:
+    def __init__(self):
+        self._current_project = PyProject()
+
+    @property
+    def current_project(self):
+        _api_call("projects.current_project")
+        return self._current_project
+
+
+class _Users:
+    def __init__(self):
+        self._current_user = PyUser()
+
+    @property
+    def current_user(self):
+        _api_call("users.current_user")
+        return self._current_user
+
+
+class _MediaPanel:
+    def __init__(self):
+        self.selected_entries = []
+
+    def copy(self, source_entries, destination, duplicate_action="add"):
+        """Copy clips into a reel; a batch schematic reel gets clip nodes."""
+        _api_call("media_panel.copy")
+        if not isinstance(source_entries, (list, tuple)):
+            source_entries = [source_entries]
+        copies = []
+        for entry in source_entries:
+            clip = PyClip(
+                name=entry._values["name"],
+                parent=destination,
+                duration=entry._values.get("duration", 100),
+                shot_name=entry._shot_name()
+            )
+            destination._children["clips"].append(clip)
+            if isinstance(destination.parent, PyBatchGroup):
+                node = PyClipNode(
+                    name=clip._values["name"],
+                    parent=destination.parent,
+                    clip=clip
+                )
+                destination.parent._children["nodes"].append(node)
+            copies.append(clip)
+        return copies
+
+
+class _Messages:
+    def show_in_console(self, message, message_type="info", duration=-1):
+        _api_call("messages.show_in_console")
+
+
+projects = _Projects()
+users = _Users()
+media_panel = _MediaPanel()
+messages = _Messages()
+
+_current_batch = None
+
+
+def __getattr__(name):
+    # 'flame.batch' is resolved on every access, like the real module
+    if name == "batch":
+        _api_call("batch")
+        return _current_batch
+    raise AttributeError(f"module 'flame' has no attribute '{name}'")
+
+
+def go_to(tab_name):
+    """Switch the Flame tab; only counted."""
+    _api_call("go_to")
+    return True
+
+
+def delete(flame_object, confirm=False):
+    """Remove an object from its parent container."""
+    _api_call("delete")
+    if flame_object.parent is not None:
+        if isinstance(flame_object, PyNode):
+            flame_object.parent._children["nodes"].remove(flame_object)
+        else:
+            flame_object.parent._remove(flame_object)
+    return True
+
+
+def reset(project_name: str = "projekt", user_name: str = "artist"):
+    """Start over with a new, empty project and clear the counters."""
+    global _current_batch
+    projects._current_project = PyProject(name=project_name)
+    users._current_user = PyUser(name=user_name)
+    media_panel.selected_entries = []
+    desktop = projects._current_project._workspace._desktop
+    _current_batch = PyBatchGroup(name="Batch", parent=desktop)
+    desktop._children["batch_groups"].append(_current_batch)
+    reset_api_calls()
+
+
+reset()
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added a counting stub of the Flame python API.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-18
+# Changelist:   Added batch, media_panel, clip nodes, clips and segments.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     conftest.py
+# Purpose:      Shared fixtures of the LOGIK-PROJEKT unit tests.
+# Description:  Puts the repository root and the stub 'flame' module on
+#               sys.path and provides helpers to load the in-Flame tools
+#               and scripts, which are not packaged, from their files.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import contextlib
+import importlib.util
+import os
+import sys
+import threading
+
+import pytest
+
+repository_root_dir = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+sys.path.insert(0, os.path.join(repository_root_dir, "tests", "stubs"))
+sys.path.insert(0, repository_root_dir)
+
+
+def load_module_from_path(module_name: str, *path_parts):
+    """
+    Import a script that is not part of a package from its file.
+
+    The script's directory is on sys.path while it is imported, so its
+    flat imports of sibling modules resolve as they do in production.
+    """
+    module_path = os.path.join(repository_root_dir, *path_parts)
+    module_dir = os.path.dirname(module_path)
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, module_dir)
+    try:
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(module_dir)
+    return module
+
+
+def make_projekt_config(base_dir: str, name: str, workstation: str = "ws1"):
+    """
+    The ProjektParameters of a projekt below 'base_dir', with the Flame
+    projekt home and setups laid out as get_projekt_summary_data does.
+    """
+    from src.core.projekt_manager.projekt_models import ProjektParameters
+
+    flame_projekt_name = f"{name}_20262_{workstation}"
+    flame_projekt_home = os.path.join(base_dir, "flame", flame_projekt_name)
+    return ProjektParameters(
+        current_workstation=workstation,
+        current_os="Linux",
+        flame_software_choice="flame_2026.2",
+        flame_software_sanitized_version="20262",
+        flame_projekt_name=flame_projekt_name,
+        flame_projekt_home=flame_projekt_home,
+        flame_projekt_setups_dir=f"{flame_projekt_home}/setups",
+        flame_projekt_media_dir=f"{flame_projekt_home}/media",
+        flame_projekt_catalog_dir=os.path.join(base_dir, "catalog", name),
+        logik_projekt_name=name,
+        logik_projekt_path=os.path.join(base_dir, "projekts", name),
+        logik_projekt_config_workspace=os.path.join(
+            repository_root_dir,
+            "cfg/site-cfg/flame-cfg/flame-templates/"
+            "flame-workspace-templates/flame-workspace-template.json"
+        ),
+    )
+
+
+SHOT_INDEX_MODULE_PATH = (
+    "cfg/site-cfg/flame-cfg/flame-python/logik_projekt/projekt_tools/"
+    "logik_projekt_create_scripts/scripts/modules/functions/shot_index.py"
+)
+
+
+@pytest.fixture(scope="module")
+def shot_index():
+    """The shot indexer module of the create-scripts tools."""
+    return load_module_from_path("shot_index", SHOT_INDEX_MODULE_PATH)
+
+
+@pytest.fixture
+def no_daemon(tmp_path, monkeypatch, shot_index):
+    """Points the shot index clients at a socket nobody listens on."""
+    monkeypatch.setenv(
+        shot_index.SHOT_INDEX_SOCKET_VARIABLE,
+        str(tmp_path / "none.sock")
+    )
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch, shot_index):
+    """A shot indexer daemon serving in a thread, and its index."""
+    socket_path = str(tmp_path / "shot_index.sock")
+    monkeypatch.setenv(shot_index.SHOT_INDEX_SOCKET_VARIABLE, socket_path)
+    server = shot_index.ShotIndexServer(
+        socket_path,
+        shot_index.ShotIndexRequestHandler
+    )
+    server.shot_index = shot_index.ShotIndex()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.start()
+    yield server.shot_index
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+@pytest.fixture
+def flame_stub():
+    """The stub 'flame' module, reset to an empty project."""
+    import flame
+
+    flame.reset()
+    return flame
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Shared fixtures for the unit tests.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Shared the shot indexer fixtures of the create-scripts
+#               tool tests.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_create_ocio_conversion_tasks.py
+# Purpose:      Tests of the OCIO conversion task generator.
+# Description:  Checks the camera colour space rule table against a plain
+#               first-match loop and generates conversion tasks from a small
+#               camera CTF tree in a temporary directory.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import json
+import os
+
+import pytest
+
+from src.utils.common.create import create_ocio_conversion_tasks as tasks
+
+camera_ctfs = {
+    "ARRI/Alexa-v3-LogC_EI800_to_ACES.ctf": "ARRI LogC3 (EI800)",
+    "ARRI/LogC4_to_ACES.ctf": "ARRI LogC4",
+    "RED/LinearDRAGONcolor2_to_ACES.ctf": "Linear REDcolor2",
+    "RED/LinearREDcolor3_to_ACES.ctf": "Linear REDcolor3",
+    "Sony/Venice/LinearSGamut3-Venice_to_ACES.ctf": "Linear Venice S-Gamut3",
+    "Sony/SLog3_to_ACES.ctf": "S-Log3 S-Gamut3",
+}
+
+
+def first_match(name, rules):
+    """The if/elif chain the rule table replaced."""
+    for fragment, color_space in rules:
+        if fragment in name:
+            return color_space
+    return "Unknown"
+
+
+@pytest.fixture
+def ctf_tree(tmp_path):
+    ctf_dir = tmp_path / "camera"
+    for relative_path in camera_ctfs:
+        path = ctf_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("<ProcessList/>")
+    # Not camera to ACES CTFs, never listed
+    (ctf_dir / "ARRI" / "LogC4_to_Rec709.ctf").write_text("")
+    (ctf_dir / "ARRI" / "notes.txt").write_text("")
+    # A camera no rule knows, and one whose space the config lacks
+    (ctf_dir / "Other").mkdir()
+    (ctf_dir / "Other" / "Mystery_to_ACES.ctf").write_text("")
+    (ctf_dir / "Other" / "BMDFilm_to_ACES.ctf").write_text("")
+
+    config_path = tmp_path / "ocio_v2_4_config.json"
+    config_path.write_text(json.dumps({
+        "ocio_configuration": {
+            "available_color_spaces": sorted(set(camera_ctfs.values()))
+        }
+    }))
+    return ctf_dir, tmp_path / "json", config_path
+
+
+@pytest.mark.parametrize("name", [
+    "Alexa-v3-LogC4_to_ACES.ctf",
+    "LinearDRAGONcolor2_to_ACES.ctf",
+    "LinearREDcolor2_to_ACES.ctf",
+    "LinearSGamut3-Venice_to_ACES.ctf",
+    "F35-SLog3_to_ACES.ctf",
+    "C500_CinemaGamut_D55-CanonLog3_to_ACES.ctf",
+    "Mystery_to_ACES.ctf",
+])
+def test_rule_table_keeps_first_match_semantics(name):
+    assert tasks.get_input_space_from_ctf_name(name) == first_match(
+        name, tasks.camera_color_space_rules
+    )
+
+
+def test_camera_ctfs_are_found_in_sorted_order(ctf_tree):
+    ctf_dir, _, _ = ctf_tree
+
+    found = [
+        os.path.join(relative_dir, name)
+        for relative_dir, name, _ in tasks.iter_camera_ctf_files(str(ctf_dir))
+    ]
+
+    assert found == [
+        "ARRI/Alexa-v3-LogC_EI800_to_ACES.ctf",
+        "ARRI/LogC4_to_ACES.ctf",
+        "Other/BMDFilm_to_ACES.ctf",
+        "Other/Mystery_to_ACES.ctf",
+        "RED/LinearDRAGONcolor2_to_ACES.ctf",
+        "RED/LinearREDcolor3_to_ACES.ctf",
+        "Sony/SLog3_to_ACES.ctf",
+        "Sony/Venice/LinearSGamut3-Venice_to_ACES.ctf",
+    ]
+
+
+def test_tasks_are_generated_for_every_target_space(ctf_tree):
+    ctf_dir, output_dir, config_path = ctf_tree
+
+    summary = tasks.generate_conversion_tasks(
+        str(ctf_dir), str(output_dir), str(config_path)
+    )
+
+    targets = tasks.target_color_spaces
+    assert len(summary["written"]) == len(camera_ctfs) * len(targets)
+    assert summary["unchanged"] == []
+    assert sorted(summary["skipped"]) == [
+        "BMDFilm_to_ACES.ctf", "Mystery_to_ACES.ctf"
+    ]
+
+    task_path = output_dir / "Sony" / "Venice" / (
+        "LinearSGamut3-Venice_to_ACES-AP1.json"
+    )
+    task = json.loads(task_path.read_text())
+    assert task == {
+        "name": "LinearSGamut3-Venice_to_ACES-AP1",
+        "output_clf": "LinearSGamut3-Venice_to_ACES-AP1.clf",
+        "input_space": "Linear Venice S-Gamut3",
+        "target_space": "ACEScg",
+        "inputs": [
+            {
+                "file": str(
+                    ctf_dir / "Sony" / "Venice"
+                    / "LinearSGamut3-Venice_to_ACES.ctf"
+                ),
+                "inverse": False,
+            }
+        ],
+    }
+
+
+def test_unchanged_tasks_are_not_rewritten(ctf_tree):
+    ctf_dir, output_dir, config_path = ctf_tree
+    tasks.generate_conversion_tasks(
+        str(ctf_dir), str(output_dir), str(config_path)
+    )
+    task_path = output_dir / "ARRI" / "LogC4_to_ACES-AP0.json"
+    os.utime(task_path, (0, 0))
+    (ctf_dir / "RED" / "LinearREDcolor3_to_ACES.ctf").rename(
+        ctf_dir / "RED" / "LinearREDcolor4_to_ACES.ctf"
+    )
+
+    summary = tasks.generate_conversion_tasks(
+        str(ctf_dir), str(output_dir), str(config_path)
+    )
+
+    assert task_path.stat().st_mtime == 0
+    assert "ARRI/LogC4_to_ACES-AP0.json" in summary["unchanged"]
+    # Linear REDcolor4 is not in the test config
+    assert "LinearREDcolor4_to_ACES.ctf" in summary["skipped"]
+    assert summary["written"] == []
+
+
+def test_missing_config_returns_none(ctf_tree):
+    ctf_dir, output_dir, config_path = ctf_tree
+
+    assert tasks.generate_conversion_tasks(
+        str(ctf_dir), str(output_dir), str(config_path) + ".missing"
+    ) is None
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the OCIO conversion task generator.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_create_shot_bookmarks.py
+# Purpose:      Tests of the shot bookmarks of the create-scripts tools.
+# Description:  Updates a small cf_bookmarks.json in a temporary directory
+#               and checks the added, removed and moved shot bookmarks,
+#               and that a batch of additions is written once.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import json
+import os
+
+import pytest
+
+from tests.unit.conftest import load_module_from_path
+
+
+@pytest.fixture(scope="module")
+def create_shot_bookmarks():
+    return load_module_from_path(
+        "create_shot_bookmarks",
+        "cfg/site-cfg/flame-cfg/flame-python/logik_projekt/projekt_tools/"
+        "logik_projekt_create_scripts/scripts/modules/functions/"
+        "create_shot_bookmarks.py"
+    )
+
+
+@pytest.fixture
+def bookmarks_file(tmp_path, monkeypatch):
+    # No shot indexer daemon answers on this socket
+    monkeypatch.setenv(
+        "LOGIK_PROJEKT_SHOT_INDEX_SOCKET", str(tmp_path / "missing.sock")
+    )
+    shots_dir = tmp_path / "shots"
+    for shot in ("sh010", "sh030"):
+        (shots_dir / shot).mkdir(parents=True)
+    bookmarks = [
+        {"Bookmark": "sh010", "Path": "/old/shots/sh010",
+         "Visibility": "Global"},
+        {"Bookmark": "sh020", "Path": str(shots_dir / "sh020"),
+         "Visibility": "Global"},
+    ]
+    data = {"DlBookmark": {"Sections": [{
+        "Section": "Project",
+        "Bookmarks": [{
+            "Folder": "projekt directories",
+            "Bookmarks": [{"Folder": "shots", "Bookmarks": bookmarks}]
+        }]
+    }]}}
+    json_file_path = tmp_path / "cf_bookmarks.json"
+    json_file_path.write_text(json.dumps(data))
+    return str(shots_dir), str(json_file_path)
+
+
+def read_shot_bookmarks(json_file_path):
+    with open(json_file_path) as f:
+        data = json.load(f)
+    projekt = data["DlBookmark"]["Sections"][0]["Bookmarks"][0]
+    return projekt["Bookmarks"][0]["Bookmarks"]
+
+
+def test_update_bookmarks_json_matches_shots_dir(
+        create_shot_bookmarks, bookmarks_file):
+    shots_dir, json_file_path = bookmarks_file
+
+    create_shot_bookmarks.update_bookmarks_json(shots_dir, json_file_path)
+
+    assert read_shot_bookmarks(json_file_path) == [
+        {"Bookmark": shot, "Path": os.path.join(shots_dir, shot),
+         "Visibility": "Global"}
+        for shot in ("sh010", "sh030")
+    ]
+
+
+def test_flush_rewrites_stale_paths_without_queued_changes(
+        create_shot_bookmarks, bookmarks_file):
+    shots_dir, json_file_path = bookmarks_file
+    updater = create_shot_bookmarks.ShotBookmarksUpdater(
+        shots_dir, json_file_path
+    )
+
+    updater.sync(["sh010", "sh020"])
+
+    assert not updater.added and not updater.removed
+    assert updater.flush() == 1
+    assert [
+        bookmark["Path"]
+        for bookmark in read_shot_bookmarks(json_file_path)
+    ] == [os.path.join(shots_dir, "sh010"), os.path.join(shots_dir, "sh020")]
+    assert updater.flush() == 0
+
+
+def count_writes(create_shot_bookmarks, monkeypatch):
+    writes = []
+    write_json_atomic = create_shot_bookmarks.write_json_atomic
+
+    def record_write(json_file_path, data):
+        writes.append(json_file_path)
+        write_json_atomic(json_file_path, data)
+
+    monkeypatch.setattr(
+        create_shot_bookmarks, "write_json_atomic", record_write
+    )
+    return writes
+
+
+def test_a_batch_of_additions_is_written_once(
+        create_shot_bookmarks, bookmarks_file, monkeypatch):
+    shots_dir, json_file_path = bookmarks_file
+    writes = count_writes(create_shot_bookmarks, monkeypatch)
+    shots = [f"sh{number:03}" for number in range(30, 130, 10)]
+
+    with create_shot_bookmarks.ShotBookmarksUpdater(
+            shots_dir, json_file_path) as updater:
+        for shot in shots:
+            updater.add_shots([shot])
+        assert writes == []
+
+    assert writes == [json_file_path]
+    assert [
+        bookmark["Bookmark"]
+        for bookmark in read_shot_bookmarks(json_file_path)
+    ] == sorted(["sh010", "sh020"] + shots)
+
+
+def test_a_failed_batch_is_not_written(
+        create_shot_bookmarks, bookmarks_file, monkeypatch):
+    shots_dir, json_file_path = bookmarks_file
+    writes = count_writes(create_shot_bookmarks, monkeypatch)
+
+    with pytest.raises(RuntimeError):
+        with create_shot_bookmarks.ShotBookmarksUpdater(
+                shots_dir, json_file_path) as updater:
+            updater.add_shots(["sh030"])
+            raise RuntimeError("shot creation failed")
+
+    assert writes == []
+
+
+def test_shot_processing_bookmarks_every_shot_in_one_write(
+        create_shot_bookmarks, bookmarks_file, monkeypatch):
+    shots_dir, json_file_path = bookmarks_file
+    writes = count_writes(create_shot_bookmarks, monkeypatch)
+    functions_dir = (
+        "cfg/site-cfg/flame-cfg/flame-python/logik_projekt/projekt_tools/"
+        "logik_projekt_create_scripts/scripts/modules/functions/"
+    )
+    shot_tree = load_module_from_path(
+        "shot_tree", functions_dir + "shot_tree.py"
+    )
+    process_shot_info = load_module_from_path(
+        "process_shot_info_nuke", functions_dir + "process_shot_info_nuke.py"
+    ).process_shot_info
+    tree = shot_tree.ShotTree(os.path.dirname(shots_dir))
+
+    with create_shot_bookmarks.ShotBookmarksUpdater(
+            tree.shots_dir, json_file_path) as updater:
+        process_shot_info(tree.job_structure, "nuke", ["comp", "roto"],
+                          1001, 1001, shot_tree=tree, bookmarks=updater)
+
+    assert writes == [json_file_path]
+    assert [
+        bookmark["Bookmark"]
+        for bookmark in read_shot_bookmarks(json_file_path)
+    ] == ["sh010", "sh020", "sh030"]
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the shot bookmarks of the create-scripts tools.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tested that a batch of shot additions, also from the shot
+#               processing, is written once.
+# -------------------------------------------------------------------------- #
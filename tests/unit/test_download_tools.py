@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_download_tools.py
+# Purpose:      Tests of the Nuke tool downloader and its content cache.
+# Description:  Serves archives from a local http.server and checks the
+#               cached download, the conditional revalidation, the retry
+#               path and the eviction of the download cache.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import hashlib
+import http.server
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from tests.unit.conftest import load_module_from_path
+
+archive_content = b"PK-not-really-a-zip" * 1000
+
+
+class ArchiveHandler(http.server.BaseHTTPRequestHandler):
+    """Serves 'archive_content' with an ETag; fails the first requests."""
+
+    failures_left = 0
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append(
+            (self.path, self.headers.get("If-None-Match"))
+        )
+        if type(self).failures_left:
+            type(self).failures_left -= 1
+            self.send_error(500)
+            return
+        etag = '"%s"' % hashlib.sha256(archive_content).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(archive_content)))
+        self.end_headers()
+        self.wfile.write(archive_content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    ArchiveHandler.failures_left = 0
+    ArchiveHandler.requests = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ArchiveHandler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, args=(0.05,), daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def download_tools(tmp_path, monkeypatch):
+    # The module opens 'download_tools.log' in the working directory
+    monkeypatch.chdir(tmp_path)
+    module = load_module_from_path(
+        "download_tools", "resources", "nuke", "repo", "download_tools.py"
+    )
+    monkeypatch.setattr(module, "ALLOWED_HOSTS", ["127.0.0.1"])
+    sleeps = []
+    monkeypatch.setattr(module.time, "sleep", sleeps.append)
+    module.sleeps = sleeps
+    yield module
+    for handler in list(module.logger.handlers):
+        handler.close()
+        module.logger.removeHandler(handler)
+
+
+def test_download_is_cached_and_revalidated(download_tools, server, tmp_path):
+    cache_dir = tmp_path / "cache"
+    url = f"{server}/tool.zip"
+
+    first = download_tools.fetch_url_to_cache(url, cache_dir=cache_dir)
+    second = download_tools.fetch_url_to_cache(url, cache_dir=cache_dir)
+
+    assert first == second
+    assert first.read_bytes() == archive_content
+    metadata = download_tools.read_cache_metadata(url, cache_dir)
+    assert metadata["sha256"] == hashlib.sha256(archive_content).hexdigest()
+    # The second request is conditional and answered with 304
+    assert ArchiveHandler.requests[0][1] is None
+    assert ArchiveHandler.requests[1][1] == metadata["etag"]
+    assert not list(cache_dir.glob("*.part"))
+
+
+def test_failed_attempts_are_retried(download_tools, server, tmp_path):
+    ArchiveHandler.failures_left = 2
+
+    content_path = download_tools.fetch_url_to_cache(
+        f"{server}/tool.zip", cache_dir=tmp_path / "cache", retries=3, delay=7
+    )
+
+    assert content_path.read_bytes() == archive_content
+    assert len(ArchiveHandler.requests) == 3
+    assert download_tools.sleeps == [7, 7]
+
+
+def test_no_sleep_after_the_last_attempt(download_tools, server, tmp_path):
+    ArchiveHandler.failures_left = 3
+
+    content_path = download_tools.fetch_url_to_cache(
+        f"{server}/tool.zip", cache_dir=tmp_path / "cache", retries=3, delay=7
+    )
+
+    assert content_path is None
+    assert len(ArchiveHandler.requests) == 3
+    assert download_tools.sleeps == [7, 7]
+
+
+def test_pinned_digest_mismatch_is_rejected(download_tools, server, tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    content_path = download_tools.fetch_url_to_cache(
+        f"{server}/tool.zip", expected_sha256="0" * 64, cache_dir=cache_dir
+    )
+
+    assert content_path is None
+    assert not list(cache_dir.iterdir())
+
+
+def test_disallowed_host_is_not_fetched(download_tools, server, tmp_path):
+    url = server.replace("127.0.0.1", "localhost") + "/tool.zip"
+
+    assert download_tools.fetch_url_to_cache(
+        url, cache_dir=tmp_path / "cache"
+    ) is None
+    assert ArchiveHandler.requests == []
+
+
+def test_prune_evicts_old_and_least_recently_used_entries(
+        download_tools, server, tmp_path):
+    cache_dir = tmp_path / "cache"
+    urls = [f"{server}/tool_{number}.zip" for number in range(3)]
+    for url in urls:
+        download_tools.fetch_url_to_cache(url, cache_dir=cache_dir)
+
+    now = time.time()
+    for age, url in zip((400 * 86400, 20, 10), urls):
+        for path in download_tools.get_cache_paths(url, cache_dir):
+            os.utime(path, (now - age, now - age))
+    stale_part = cache_dir / "leftover.part"
+    stale_part.write_bytes(b"x")
+    os.utime(stale_part, (now - 7200, now - 7200))
+
+    evicted = download_tools.prune_download_cache(
+        cache_dir,
+        max_bytes=len(archive_content),
+        max_age=90 * 86400
+    )
+
+    assert evicted == urls[:2]
+    assert not stale_part.exists()
+    assert download_tools.read_cache_metadata(urls[2], cache_dir) is not None
+    assert sorted(path.suffix for path in cache_dir.iterdir()) == [
+        ".download", ".json"
+    ]
+
+
+def test_metadata_is_written_atomically(download_tools, tmp_path):
+    metadata_path = tmp_path / "entry.json"
+    metadata_path.write_text("{}")
+
+    download_tools.write_cache_metadata(metadata_path, {"url": "u"})
+
+    assert json.loads(metadata_path.read_text()) == {"url": "u"}
+    assert [path.name for path in tmp_path.iterdir()
+            if path.suffix == ".part"] == []
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the Nuke tool downloader.
+# -------------------------------------------------------------------------- #
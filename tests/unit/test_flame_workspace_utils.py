@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_flame_workspace_utils.py
+# Purpose:      Tests of the Flame workspace build plan.
+# Description:  Compiles small workspace templates and checks the reel plan,
+#               then builds each template in the stub 'flame' module with
+#               the legacy template walk and with the plan replay of the
+#               startup script, and compares the resulting trees.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import contextlib
+import json
+import os
+
+import pytest
+
+from src.core.utils.flame_workspace_utils import compile_flame_workspace_plan
+from tests.unit.conftest import load_module_from_path, repository_root_dir
+
+workspace_template = [
+    {"type": "desktop", "name_template": "{date}-{user}"},
+    {
+        "type": "desktop_contents",
+        "items": [
+            {
+                "type": "reel_group",
+                "name": "{date}-conform",
+                "reels": [{"name": "Sources"}, {"name": "Sequences"}],
+            },
+            {
+                "type": "reel_group",
+                "name": "review",
+                "reels": [{"name": "{user}-postings"}],
+            },
+        ],
+    },
+    {
+        "type": "library",
+        "name": "{user}",
+        "children": [
+            {"type": "reel_group", "name": "plates"},
+            {"type": "folder", "name": "edits"},
+        ],
+    },
+]
+
+
+@pytest.fixture
+def startup_tool(flame_stub):
+    return load_module_from_path(
+        "flame_startup_script_template",
+        "cfg",
+        "site-cfg",
+        "flame-cfg",
+        "flame-scripts",
+        "flame-startup-scripts",
+        "flame_startup_script_template.py",
+    )
+
+
+def dump_tree(flame_object):
+    """(name, {child list: [child trees]}) without counting API calls."""
+    return (
+        flame_object._values["name"],
+        {
+            list_name: [dump_tree(child) for child in children]
+            for list_name, children in sorted(flame_object._children.items())
+            if children
+            and list_name in ("libraries", "folders", "reel_groups", "reels")
+        },
+    )
+
+
+def load_default_workspace_template():
+    with open(
+            os.path.join(
+                repository_root_dir,
+                "pref",
+                "site-prefs",
+                "default-prefs",
+                "logik-projekt-prefs",
+                "flame-workspace.json"
+            ),
+            "r",
+            encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_workspace(flame, tool, work_dir, template, use_plan):
+    with open(os.path.join(work_dir, "flame-workspace.json"), "w") as f:
+        json.dump(template, f)
+    with open(os.path.join(work_dir, "flame-workspace-plan.json"), "w") as f:
+        json.dump(compile_flame_workspace_plan(template), f)
+
+    with contextlib.chdir(work_dir), \
+            contextlib.redirect_stdout(open(os.devnull, "w")):
+        if use_plan:
+            tool.replay_workspace_plan(tool.load_workspace_plan())
+        else:
+            tool.set_all_expansion_states(
+                tool.create_workspace_from_template()
+            )
+
+    workspace = flame.projects._current_project._workspace
+    return dump_tree(workspace), dump_tree(workspace._desktop)
+
+
+def reel_plan(operations, group_name):
+    """The adopt_reels operations of the named desktop reel group."""
+    group_ref = next(
+        operation["ref"] for operation in operations
+        if operation["op"] == "create" and operation["name"] == group_name
+    )
+    return [
+        operation for operation in operations
+        if operation["op"] == "adopt_reels"
+        and operation["parent"] == group_ref
+    ]
+
+
+def test_desktop_reel_group_gets_filler_reels_when_created():
+    operations = compile_flame_workspace_plan(workspace_template)["operations"]
+
+    filler_op, template_op = reel_plan(operations, "review")
+
+    assert filler_op["if_created"] is True
+    assert [reel["name"] for reel in filler_op["reels"]] == [
+        "review-1", "review-2", "review-3"
+    ]
+    assert not template_op.get("if_created")
+    assert [reel["name"] for reel in template_op["reels"]] == [
+        "{user}-postings"
+    ]
+
+
+def test_library_reel_group_gets_numbered_reels():
+    operations = compile_flame_workspace_plan(workspace_template)["operations"]
+    group_ref = next(
+        operation["ref"] for operation in operations
+        if operation["op"] == "create" and operation["name"] == "plates"
+    )
+
+    (reel_op,) = [
+        operation for operation in operations
+        if operation["op"] == "adopt_reels"
+        and operation["parent"] == group_ref
+    ]
+
+    assert [reel["name"] for reel in reel_op["reels"]] == [
+        "plates-1", "plates-2", "plates-3"
+    ]
+
+
+@pytest.mark.parametrize(
+    "template",
+    [workspace_template, load_default_workspace_template()],
+    ids=["test-template", "default-template"]
+)
+def test_plan_builds_the_same_tree_as_the_template_walk(
+        flame_stub, startup_tool, tmp_path, template):
+    legacy_tree = build_workspace(
+        flame_stub, startup_tool, tmp_path, template, use_plan=False
+    )
+    flame_stub.reset()
+    plan_tree = build_workspace(
+        flame_stub, startup_tool, tmp_path, template, use_plan=True
+    )
+
+    assert plan_tree == legacy_tree
+
+
+def test_created_desktop_reel_group_reels(
+        flame_stub, startup_tool, tmp_path):
+    plan_tree = build_workspace(
+        flame_stub, startup_tool, tmp_path, workspace_template, use_plan=True
+    )
+
+    desktop_groups = dict(plan_tree[1][1]["reel_groups"])
+    assert [name for name, _ in desktop_groups["review"]["reels"]] == [
+        "Sequences", "review-1", "review-2", "review-3", "artist-postings"
+    ]
+
+
+def test_existing_desktop_reel_group_gets_no_filler_reels(
+        flame_stub, startup_tool, tmp_path):
+    trees = []
+    for use_plan in (False, True):
+        flame_stub.reset()
+        desktop = flame_stub.projects._current_project._workspace._desktop
+        desktop.create_reel_group("review")
+        trees.append(
+            build_workspace(
+                flame_stub,
+                startup_tool,
+                tmp_path,
+                workspace_template,
+                use_plan
+            )
+        )
+
+    assert trees[1] == trees[0]
+    desktop_groups = dict(trees[1][1][1]["reel_groups"])
+    assert "review-1" not in [
+        name for name, _ in desktop_groups["review"]["reels"]
+    ]
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the Flame workspace build plan.
+# -------------------------------------------------------------------------- #
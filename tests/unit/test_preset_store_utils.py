@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_preset_store_utils.py
+# Purpose:      Tests of the content-addressed preset store.
+# Description:  Materializes a small preset tree into two projekts in a
+#               temporary directory and checks that the presets keep the
+#               mode of their source and share no inode.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import stat
+
+from src.core.utils.preset_store_utils import PresetStore
+
+
+def make_presets(source_dir):
+    os.makedirs(os.path.join(source_dir, "batch"))
+    preset_path = os.path.join(source_dir, "batch", "comp.batch")
+    with open(preset_path, "w") as f:
+        f.write("preset\n")
+    os.chmod(preset_path, 0o664)
+    script_path = os.path.join(source_dir, "setup.sh")
+    with open(script_path, "w") as f:
+        f.write("#!/bin/sh\n")
+    os.chmod(script_path, 0o775)
+
+
+def test_presets_keep_their_mode_and_share_no_inode(tmp_path):
+    source_dir = str(tmp_path / "presets")
+    make_presets(source_dir)
+    store = PresetStore(str(tmp_path / "store"))
+
+    projekts = [str(tmp_path / "job_a"), str(tmp_path / "job_b")]
+    for projekt in projekts:
+        counts = store.materialize(source_dir, projekt)
+        assert "hardlink" not in counts
+        assert sum(counts.values()) == 2
+
+    for relative_path, mode in (
+            (os.path.join("batch", "comp.batch"), 0o664),
+            ("setup.sh", 0o775),
+    ):
+        paths = [os.path.join(projekt, relative_path) for projekt in projekts]
+        stats = [os.stat(path) for path in paths]
+        assert [stat.S_IMODE(s.st_mode) for s in stats] == [mode, mode]
+        assert stats[0].st_ino != stats[1].st_ino
+        assert all(s.st_nlink == 1 for s in stats)
+
+
+def test_editing_a_preset_leaves_other_projekts_alone(tmp_path):
+    source_dir = str(tmp_path / "presets")
+    make_presets(source_dir)
+    store = PresetStore(str(tmp_path / "store"))
+    for projekt in ("job_a", "job_b"):
+        store.materialize(source_dir, str(tmp_path / projekt))
+
+    with open(tmp_path / "job_a" / "batch" / "comp.batch", "a") as f:
+        f.write("edited\n")
+
+    assert (tmp_path / "job_b" / "batch" / "comp.batch").read_text() == (
+        "preset\n"
+    )
+    key = store.add_file(os.path.join(source_dir, "batch", "comp.batch"))
+    with open(store.blob_path(key)) as f:
+        assert f.read() == "preset\n"
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the content-addressed preset store.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_projekt_catalog_utils.py
+# Purpose:      Tests of the SQLite projekt catalog.
+# Description:  Picks the SQLite journal mode from a mount table written to
+#               a temporary directory and records and looks up projekts in
+#               a temporary catalog.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+
+import pytest
+
+from src.core.utils import projekt_catalog_utils
+from src.core.utils.projekt_catalog_utils import (
+    SQLiteCatalogBackend,
+    get_filesystem_type,
+    get_sqlite_journal_mode,
+    make_catalog_entry,
+)
+from tests.unit.conftest import repository_root_dir
+
+
+@pytest.fixture
+def mounts(tmp_path, monkeypatch):
+    mounts_path = tmp_path / "mounts"
+    mounts_path.write_text(
+        "/dev/sda1 / ext4 rw 0 0\n"
+        "server:/projekts /mnt/projekts nfs4 rw 0 0\n"
+        "/dev/sdb1 /mnt/projekts/local xfs rw 0 0\n"
+        "server:/my\\040jobs /mnt/my\\040jobs nfs rw 0 0\n"
+        "/dev/sdc1 " + str(tmp_path) + " ext4 rw 0 0\n"
+    )
+    monkeypatch.setattr(
+        projekt_catalog_utils,
+        "PROC_MOUNTS_PATH",
+        str(mounts_path)
+    )
+    return mounts_path
+
+
+def test_filesystem_type_of_the_closest_mount(mounts):
+    assert get_filesystem_type("/home/user/catalog.sqlite") == "ext4"
+    assert get_filesystem_type("/mnt/projekts/catalog.sqlite") == "nfs4"
+    assert get_filesystem_type("/mnt/projekts/local/catalog.sqlite") == "xfs"
+    assert get_filesystem_type("/mnt/projektsX/catalog.sqlite") == "ext4"
+    assert get_filesystem_type("/mnt/my jobs/catalog.sqlite") == "nfs"
+
+
+def test_journal_mode_follows_the_filesystem(mounts, monkeypatch):
+    assert get_sqlite_journal_mode("/home/user/catalog.sqlite") == "WAL"
+    assert get_sqlite_journal_mode("/mnt/projekts/catalog.sqlite") == "DELETE"
+    assert get_sqlite_journal_mode("/mnt/projekts/local/c.sqlite") == "WAL"
+
+    monkeypatch.setattr(
+        projekt_catalog_utils,
+        "PROC_MOUNTS_PATH",
+        str(mounts) + ".missing"
+    )
+    assert get_sqlite_journal_mode("/home/user/catalog.sqlite") == "DELETE"
+
+
+def test_default_catalog_is_outside_the_repository():
+    assert not os.path.abspath(
+        projekt_catalog_utils.DEFAULT_CATALOG_PATH
+    ).startswith(repository_root_dir + os.sep)
+
+
+@pytest.mark.parametrize("network", [False, True])
+def test_catalog_records_and_finds_projekts(tmp_path, mounts, network):
+    if network:
+        mounts.write_text("server:/ " + str(tmp_path) + " nfs rw 0 0\n")
+    database_path = str(tmp_path / "catalog" / "catalog.sqlite")
+    catalog = SQLiteCatalogBackend(database_path)
+    assert catalog.journal_mode == ("DELETE" if network else "WAL")
+
+    parameters = {
+        "logik_projekt_name": "job_a",
+        "logik_projekt_path": str(tmp_path / "projekts" / "job_a"),
+        "current_workstation": "ws1",
+        "flame_software_version": "2026.2",
+    }
+    try:
+        catalog.record([make_catalog_entry(parameters)])
+        projekts = catalog.find_projekts(name="job_*")
+        journal_mode = catalog.query("PRAGMA journal_mode")[0]
+    finally:
+        catalog.close()
+
+    assert [projekt["projekt_name"] for projekt in projekts] == ["job_a"]
+    assert projekts[0]["sessions"][0]["workstation"] == "ws1"
+    assert list(journal_mode.values()) == [catalog.journal_mode.lower()]
+    if network:
+        assert not os.path.exists(database_path + "-wal")
+
+
+def test_name_patterns_match_underscores_literally(tmp_path, mounts):
+    catalog = SQLiteCatalogBackend(str(tmp_path / "catalog.sqlite"))
+    names = ("job_a", "jobxa", "job%a", "job_ab")
+    try:
+        catalog.record(
+            [
+                make_catalog_entry(
+                    {
+                        "logik_projekt_name": name,
+                        "logik_projekt_path": str(tmp_path / name),
+                        "current_workstation": "ws1",
+                    }
+                )
+                for name in names
+            ]
+        )
+        found = {
+            pattern: sorted(
+                projekt["projekt_name"]
+                for projekt in catalog.find_projekts(name=pattern)
+            )
+            for pattern in ("job_*", "job%*", "job_a*", "*_a")
+        }
+    finally:
+        catalog.close()
+
+    assert found == {
+        "job_*": ["job_a", "job_ab"],
+        "job%*": ["job%a"],
+        "job_a*": ["job_a", "job_ab"],
+        "*_a": ["job_a"],
+    }
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the SQLite projekt catalog.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Test the escaping of LIKE wildcards in name patterns.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_projekt_doctor.py
+# Purpose:      Tests of the script repair of the projekt doctor.
+# Description:  Repairs the missing scripts of a projekt in a temporary
+#               directory and checks that they are written to the projekt
+#               only, never to the session preferences.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import json
+import os
+
+from src.core.projekt_manager import projekt_doctor
+from src.core.projekt_manager.projekt_artifacts import (
+    get_script_specs,
+    get_script_templates_path,
+)
+from tests.unit.conftest import make_projekt_config, repository_root_dir
+
+
+def test_repair_writes_every_script_into_the_projekt(tmp_path, monkeypatch):
+    monkeypatch.chdir(repository_root_dir)
+    session_launcher = os.path.join(
+        repository_root_dir,
+        "pref",
+        "session-preferences",
+        "current_session-flame_launcher.sh"
+    )
+    session_state = (
+        os.stat(session_launcher).st_mtime_ns
+        if os.path.exists(session_launcher) else None
+    )
+    config = make_projekt_config(str(tmp_path), "job_a")
+
+    report = projekt_doctor.ProjektDoctorReport(config.logik_projekt_path)
+    projekt_doctor.check_scripts(report, config, repair=True)
+
+    assert report.findings
+    assert all(finding.repaired for finding in report.findings)
+    for spec in get_script_specs(config):
+        assert os.path.isfile(spec.path)
+        if spec.executable:
+            assert os.access(spec.path, os.X_OK)
+    assert (
+        os.stat(session_launcher).st_mtime_ns
+        if os.path.exists(session_launcher) else None
+    ) == session_state
+
+
+def test_repairs_do_not_share_a_launcher(tmp_path, monkeypatch):
+    monkeypatch.chdir(repository_root_dir)
+    configs = [
+        make_projekt_config(str(tmp_path), "job_a"),
+        make_projekt_config(str(tmp_path), "job_b"),
+    ]
+
+    for config in configs:
+        report = projekt_doctor.ProjektDoctorReport(config.logik_projekt_path)
+        projekt_doctor.check_scripts(report, config, repair=True)
+
+    for config in configs:
+        launcher_path = os.path.join(
+            config.flame_projekt_setups_dir,
+            "scripts",
+            "startup",
+            "flame_launcher_script.sh"
+        )
+        with open(launcher_path) as f:
+            launcher = f.read()
+        assert config.flame_projekt_name in launcher
+        other = [c for c in configs if c is not config][0]
+        assert other.flame_projekt_name not in launcher
+
+
+def check_repaired_scripts(tmp_path):
+    config = make_projekt_config(str(tmp_path), "job_a")
+    projekt_doctor.check_scripts(
+        projekt_doctor.ProjektDoctorReport(config.logik_projekt_path),
+        config,
+        repair=True
+    )
+    report = projekt_doctor.ProjektDoctorReport(config.logik_projekt_path)
+    return config, report
+
+
+def test_scripts_older_than_their_template_are_not_stale(
+        tmp_path, monkeypatch):
+    monkeypatch.chdir(repository_root_dir)
+    config, report = check_repaired_scripts(tmp_path)
+    # As after a checkout of the templates or a copy of the projekt
+    for spec in get_script_specs(config):
+        os.utime(spec.path, (0, 0))
+
+    projekt_doctor.check_scripts(report, config, repair=False)
+
+    assert report.findings == []
+
+
+def test_scripts_of_another_template_version_are_stale(
+        tmp_path, monkeypatch):
+    monkeypatch.chdir(repository_root_dir)
+    config, report = check_repaired_scripts(tmp_path)
+    with open(get_script_templates_path(config)) as f:
+        script_templates = json.load(f)
+    assert set(script_templates) == {
+        spec.generator for spec in get_script_specs(config)
+    }
+    script_templates["create_backup_script"] = "0" * 64
+    with open(get_script_templates_path(config), "w") as f:
+        json.dump(script_templates, f)
+
+    projekt_doctor.check_scripts(report, config, repair=False)
+
+    assert [(finding.kind, finding.path) for finding in report.findings] == [
+        ("stale_script", spec.path)
+        for spec in get_script_specs(config)
+        if spec.generator == "create_backup_script"
+    ]
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the script repair of the projekt doctor.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the stale script check by template hash.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_projekt_fanout.py
+# Purpose:      Tests of the multi-workstation fan-out.
+# Description:  Fans a projekt in a temporary directory out to two
+#               workstations and compares the launcher, archive and backup
+#               scripts rendered for each.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import re
+
+from src.core.projekt_manager.projekt_fanout import (
+    fan_out_workstations,
+    get_workstation_config,
+)
+from src.core.utils.projekt_catalog_utils import SQLiteCatalogBackend
+from tests.unit.conftest import make_projekt_config, repository_root_dir
+
+CREATION_DATE = re.compile(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d")
+
+
+def test_workstation_config_follows_the_workstation(tmp_path):
+    config = make_projekt_config(str(tmp_path), "job_a", "ws1")
+
+    ws2 = get_workstation_config(config, "ws2")
+
+    assert ws2 == make_projekt_config(str(tmp_path), "job_a", "ws2")
+    assert ws2.flame_projekt_name == "job_a_20262_ws2"
+    assert ws2.flame_projekt_setups_dir == os.path.join(
+        str(tmp_path), "flame", "job_a_20262_ws2", "setups"
+    )
+    # Set apart from the projekt home, so shared by the workstations.
+    assert ws2.flame_projekt_catalog_dir == config.flame_projekt_catalog_dir
+    assert get_workstation_config(config, "ws1") == config
+
+
+def read_outputs(config):
+    name = config.logik_projekt_name
+    workstation = config.current_workstation
+    paths = {
+        "launcher": os.path.join(
+            config.logik_projekt_path,
+            "logs",
+            workstation,
+            "current_session-flame_launcher.sh"
+        ),
+        "archive": os.path.join(
+            config.logik_projekt_path,
+            "flame",
+            "archive",
+            "scripts",
+            f"archive_script-{name}-{workstation}.sh"
+        ),
+        "backup": os.path.join(
+            config.logik_projekt_path,
+            "backup",
+            "backup-scripts",
+            workstation,
+            f"backup-{name}-{workstation}.sh"
+        ),
+    }
+    outputs = {}
+    for kind, path in paths.items():
+        with open(path) as f:
+            outputs[kind] = CREATION_DATE.sub("<date>", f.read())
+    return outputs
+
+
+def test_each_workstation_gets_its_own_scripts(tmp_path, monkeypatch):
+    monkeypatch.chdir(repository_root_dir)
+    session_files_dir = tmp_path / "session-preferences"
+    session_files_dir.mkdir()
+    catalog = SQLiteCatalogBackend(str(tmp_path / "catalog.sqlite"))
+    config = make_projekt_config(str(tmp_path), "job_a", "ws1")
+
+    try:
+        fan_out_workstations(
+            config,
+            ["ws1", "ws2"],
+            session_files_dir=str(session_files_dir),
+            catalog=catalog
+        )
+    finally:
+        catalog.close()
+
+    ws1 = read_outputs(config)
+    ws2 = read_outputs(get_workstation_config(config, "ws2"))
+    for kind in ws1:
+        assert "job_a_20262_ws1" in ws1[kind]
+        assert "job_a_20262_ws1" not in ws2[kind], kind
+        assert "job_a_20262_ws2" in ws2[kind], kind
+        assert ws2[kind].replace("ws2", "ws1") == ws1[kind], kind
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the multi-workstation fan-out.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_session_log_utils.py
+# Purpose:      Tests of the session log index.
+# Description:  Starts sessions in a temporary log directory and checks the
+#               index entries, the latest session pointer and the cap on
+#               the number of indexed sessions.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import json
+
+import pytest
+
+from src.core.utils.session_log_utils import (
+    SESSION_LOG_ARCHIVE_FILENAME,
+    SessionLogManager,
+)
+
+
+@pytest.fixture
+def old_logs(tmp_path):
+    """Six session logs of earlier days, as written before the index."""
+    session_ids = [f"2026-01-0{day}-10-00-00" for day in range(1, 7)]
+    for session_id in session_ids:
+        day_dir = tmp_path / "2026" / "01" / session_id[8:10]
+        day_dir.mkdir(parents=True)
+        (day_dir / f"{session_id}-session.log").write_text("log\n")
+    return session_ids
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SessionLogManager(
+        str(tmp_path), compress_after_days=10000, max_index_entries=4
+    )
+    yield manager
+    manager.end_session()
+
+
+def read_archive(tmp_path):
+    lines = (tmp_path / SESSION_LOG_ARCHIVE_FILENAME).read_text().splitlines()
+    return [json.loads(line)["id"] for line in lines]
+
+
+def test_session_is_indexed_with_its_projekts(manager, tmp_path):
+    entry = manager.start_session()
+    manager.add_projekt("job_a")
+    manager.add_projekt("job_a")
+
+    latest = manager.latest_session()
+    assert latest["id"] == entry["id"]
+    assert latest["projekts"] == ["job_a"]
+    assert (tmp_path / entry["path"]).exists()
+
+    manager.end_session()
+    index = json.loads((tmp_path / "session-log-index.json").read_text())
+    assert index["sessions"][entry["id"]]["end"] is not None
+
+
+def test_index_keeps_only_the_newest_sessions(manager, old_logs, tmp_path):
+    # Indexing the existing logs archives the two oldest at once
+    assert manager.latest_session()["id"] == old_logs[-1]
+    assert read_archive(tmp_path) == old_logs[:2]
+
+    entry = manager.start_session()
+
+    index = json.loads((tmp_path / "session-log-index.json").read_text())
+    assert sorted(index["sessions"]) == old_logs[3:] + [entry["id"]]
+    # Archived entries are appended, never rewritten
+    assert read_archive(tmp_path) == old_logs[:3]
+
+
+def test_archived_logs_stay_on_disk(manager, old_logs, tmp_path):
+    manager.latest_session()
+
+    for session_id in old_logs[:2]:
+        assert list(tmp_path.rglob(f"{session_id}-session.log"))
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the session log index.
+# -------------------------------------------------------------------------- #
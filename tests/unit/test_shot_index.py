@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_shot_index.py
+# Purpose:      Tests of the shot indexer of the create-scripts tools.
+# Description:  Indexes a small shot tree in a temporary directory and
+#               compares the listings and sequences of the index with a
+#               direct scan, with and without a running daemon.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+import stat
+
+import pytest
+
+from tests.unit.conftest import load_module_from_path
+
+
+@pytest.fixture(scope="module")
+def openexr_sequences():
+    return load_module_from_path(
+        "path_to_shot_source_openexr_sequences",
+        "cfg/site-cfg/flame-cfg/flame-python/logik_projekt/projekt_tools/"
+        "logik_projekt_create_scripts/scripts/modules/functions/"
+        "path_to_shot_source_openexr_sequences.py"
+    )
+
+
+class FakeWatcher(object):
+    def __init__(self):
+        self.wds = 0
+
+    def add_watch(self, path):
+        self.wds += 1
+        return self.wds
+
+    def remove_watch(self, wd):
+        pass
+
+    def read_events(self):
+        return []
+
+
+@pytest.fixture
+def shots_dir(tmp_path):
+    renders_dir = tmp_path / "shots" / "sh010" / "media" / "renders"
+    for version, frames in (("v0001", (1001, 1002, 1003)), ("v0002", (1001,))):
+        version_dir = renders_dir / f"sh010_nuke_comp_{version}"
+        version_dir.mkdir(parents=True)
+        for frame in frames:
+            (
+                version_dir / f"sh010_nuke_comp_{version}.{frame:08d}.exr"
+            ).write_text("")
+    (renders_dir / "notes").mkdir()
+    sources_dir = tmp_path / "shots" / "sh010" / "media" / "sources" / "plate"
+    sources_dir.mkdir(parents=True)
+    for frame in (86400, 86402):
+        (sources_dir / f"A001C003.{frame}.EXR").write_text("")
+    (sources_dir / "A001C003.mov").write_text("")
+    return str(tmp_path / "shots")
+
+
+def test_group_sequences(shot_index):
+    names = ["a.0001.exr", "a.0003.exr", "a.0002.EXR", "b.12.exr", "a.mov"]
+
+    assert shot_index.group_sequences("/d", names, ".exr") == [
+        {
+            "sequence_dir": "/d", "prefix": "a", "suffix": "EXR",
+            "start_frame": 2, "end_frame": 2, "frame_count": 1,
+            "padding": 4, "frames": ["0002"],
+        },
+        {
+            "sequence_dir": "/d", "prefix": "a", "suffix": "exr",
+            "start_frame": 1, "end_frame": 3, "frame_count": 2,
+            "padding": 4, "frames": ["0001", "0003"],
+        },
+        {
+            "sequence_dir": "/d", "prefix": "b", "suffix": "exr",
+            "start_frame": 12, "end_frame": 12, "frame_count": 1,
+            "padding": 2, "frames": ["12"],
+        },
+    ]
+
+
+def test_sequences_have_their_frame_ranges(shot_index, shots_dir, no_daemon):
+    sources_dir = os.path.join(shots_dir, "sh010", "media", "sources")
+
+    sequences = shot_index.find_sequences(sources_dir)
+
+    assert [
+        (s["prefix"], s["start_frame"], s["end_frame"], s["frame_count"])
+        for s in sequences
+    ] == [("A001C003", 86400, 86402, 2)]
+    assert shot_index.ShotIndex().sequences(sources_dir, ".exr") == sequences
+
+
+def test_openexr_sequences_are_listed_per_frame(
+        openexr_sequences,
+        shots_dir,
+        no_daemon
+):
+    renders_dir = os.path.join(shots_dir, "sh010", "media", "renders")
+
+    info, start_frame, end_frame = (
+        openexr_sequences.path_to_shot_source_openexr_sequences(
+            renders_dir, 0, 0
+        )
+    )
+
+    assert (start_frame, end_frame) == (1001, 1003)
+    assert [
+        (
+            os.path.basename(frame["shot_source_version_openexr_path"]),
+            frame["shot_source_version_openexr_frame_number"],
+            frame["shot_source_version_filename_prefix"],
+        )
+        for frame in info
+    ] == [
+        ("sh010_nuke_comp_v0001.00001001.exr", 1001, "sh010_nuke_comp_v0001"),
+        ("sh010_nuke_comp_v0001.00001002.exr", 1002, "sh010_nuke_comp_v0001"),
+        ("sh010_nuke_comp_v0001.00001003.exr", 1003, "sh010_nuke_comp_v0001"),
+        ("sh010_nuke_comp_v0002.00001001.exr", 1001, "sh010_nuke_comp_v0002"),
+    ]
+    assert all(
+        os.path.isfile(frame["shot_source_version_openexr_path"])
+        for frame in info
+    )
+
+
+def test_watched_local_dirs_are_not_statted(
+        shot_index,
+        shots_dir,
+        tmp_path,
+        monkeypatch
+):
+    mounts_path = tmp_path / "mounts"
+    mounts_path.write_text("/dev/sda1 / ext4 rw 0 0\n")
+    index = shot_index.ShotIndex(FakeWatcher(), str(mounts_path))
+    sequences = index.sequences(shots_dir, ".exr")
+
+    def stat(path, *args, **kwargs):
+        raise AssertionError(f"statted {path}")
+
+    monkeypatch.setattr(shot_index.os, "stat", stat)
+    assert index.sequences(shots_dir, ".exr") == sequences
+    assert index.listdir(shots_dir) == (["sh010"], [])
+
+
+def test_network_dirs_are_checked_against_mtimes(
+        shot_index,
+        shots_dir,
+        tmp_path
+):
+    mounts_path = tmp_path / "mounts"
+    mounts_path.write_text(f"server:/projekts {tmp_path} nfs4 rw 0 0\n")
+    index = shot_index.ShotIndex(FakeWatcher(), str(mounts_path))
+    assert index.listdir(shots_dir) == (["sh010"], [])
+
+    # Made on another host: inotify reports nothing.
+    os.mkdir(os.path.join(shots_dir, "sh020"))
+    os.utime(shots_dir, ns=(0, 0))
+
+    assert index.listdir(shots_dir) == (["sh010", "sh020"], [])
+
+
+def test_daemon_answers_like_a_scan(
+        shot_index,
+        shots_dir,
+        tmp_path,
+        monkeypatch,
+        daemon
+):
+    sources_dir = os.path.join(shots_dir, "sh010", "media", "sources")
+
+    sequences = shot_index.find_sequences(sources_dir)
+    assert shot_index.list_dir_entries(shots_dir) == (["sh010"], [])
+    assert daemon.roots
+
+    monkeypatch.setenv(
+        shot_index.SHOT_INDEX_SOCKET_VARIABLE,
+        str(tmp_path / "none.sock")
+    )
+    assert shot_index.find_sequences(sources_dir) == sequences
+
+
+def test_private_socket_dir(shot_index, tmp_path):
+    socket_dir = str(tmp_path / "socket")
+
+    shot_index.make_private_dir(socket_dir)
+    assert stat.S_IMODE(os.stat(socket_dir).st_mode) == 0o700
+    shot_index.make_private_dir(socket_dir)
+
+    os.chmod(socket_dir, 0o755)
+    with pytest.raises(PermissionError):
+        shot_index.make_private_dir(socket_dir)
+
+    link = str(tmp_path / "link")
+    os.symlink(str(tmp_path), link)
+    with pytest.raises(PermissionError):
+        shot_index.make_private_dir(link)
+
+
+def test_socket_falls_back_to_a_private_dir(shot_index, monkeypatch):
+    monkeypatch.delenv(shot_index.SHOT_INDEX_SOCKET_VARIABLE, raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+    socket_path = shot_index.get_shot_index_socket_path()
+
+    assert os.path.dirname(socket_path) == (
+        f"/tmp/logik_projekt_shot_index-{os.getuid()}"
+    )
+
+
+def test_daemon_refuses_other_users(shot_index, monkeypatch, daemon):
+    monkeypatch.setattr(shot_index.os, "getuid", lambda: -2)
+
+    assert shot_index.query_shot_index({"op": "status"}) is None
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the shot indexer of the create-scripts tools.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Dropped the render version tests, tested the per-frame
+#               OpenEXR listing and that watched local directories are
+#               not statted.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Moved the shot indexer fixtures to conftest.py.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_shot_tree.py
+# Purpose:      Tests of the shot tree of the create-scripts tools.
+# Description:  Builds a small job in a temporary directory, creates its
+#               shot directories through the shot tree, with and without
+#               a running shot indexer, and runs the Nuke and After
+#               Effects shot processing on a given shot tree.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+
+import pytest
+
+from tests.unit.conftest import load_module_from_path
+
+FUNCTIONS_DIR = (
+    "cfg/site-cfg/flame-cfg/flame-python/logik_projekt/projekt_tools/"
+    "logik_projekt_create_scripts/scripts/modules/functions/"
+)
+
+# The directories shot_tree creates for one shot and app.
+SHOT_DIRS = (
+    "batch_setups",
+    "media/renders",
+    "media/sources",
+    "openclip/output_clips/nuke",
+    "openclip/segment_clips/nuke",
+    "scripts/nuke",
+)
+
+
+def load_function_module(name):
+    return load_module_from_path(name, FUNCTIONS_DIR + name + ".py")
+
+
+@pytest.fixture(scope="module")
+def shot_tree():
+    return load_function_module("shot_tree")
+
+
+@pytest.fixture
+def job_root(tmp_path):
+    shots_dir = tmp_path / "job" / "shots"
+    for shot in ("sh010", "sh020"):
+        (shots_dir / shot).mkdir(parents=True)
+    plate_dir = shots_dir / "sh010" / "media" / "sources" / "plate"
+    plate_dir.mkdir(parents=True)
+    for frame in (1001, 1002, 1003):
+        (plate_dir / f"plate.{frame}.exr").write_text("")
+    return str(tmp_path / "job")
+
+
+def test_shot_structure_paths(shot_tree):
+    structure = shot_tree.shot_structure_paths(
+        "/job/shots", "sh010", "nuke", "comp"
+    )
+
+    assert structure["shot_renders_dir"] == "/job/shots/sh010/media/renders"
+    assert structure["shot_scripts_app_task_dir"] == (
+        "/job/shots/sh010/scripts/nuke/comp"
+    )
+    assert structure["shot_segment_clips_app_task_dir"] == (
+        "/job/shots/sh010/openclip/segment_clips/nuke/source/comp"
+    )
+    assert set(shot_tree.SHOT_STRUCTURE_CREATED_DIRS) <= set(structure)
+    assert not os.path.exists("/job/shots/sh010")
+
+
+def test_shot_tree_creates_the_missing_dirs(shot_tree, job_root, no_daemon):
+    tree = shot_tree.ShotTree(job_root)
+    shots_dir = os.path.join(job_root, "shots")
+
+    assert tree.shots == ["sh010", "sh020"]
+    # media/sources of sh010 exists already.
+    assert tree.create_shot_dirs("nuke", ["comp", "roto"]) == 11
+    assert tree.create_shot_dirs("nuke", ["comp", "roto"]) == 0
+    for shot in tree.shots:
+        for directory in SHOT_DIRS:
+            assert os.path.isdir(os.path.join(shots_dir, shot, directory))
+
+    os.rmdir(os.path.join(shots_dir, "sh020", "batch_setups"))
+    assert shot_tree.ShotTree(job_root).create_shot_dirs("nuke", ["comp"]) == 1
+
+
+def test_shot_tree_skips_the_dirs_the_indexer_knows(
+        shot_tree,
+        job_root,
+        daemon,
+        monkeypatch
+):
+    shot_tree.ShotTree(job_root).create_shot_dirs("nuke", ["comp"])
+    tree = shot_tree.ShotTree(job_root, ["sh010", "sh030"])
+    checked = []
+    isdir = os.path.isdir
+
+    def record_isdir(path):
+        checked.append(path)
+        return isdir(path)
+
+    monkeypatch.setattr(shot_tree.os.path, "isdir", record_isdir)
+
+    assert tree.create_shot_dirs("nuke", ["comp"]) == 6
+    assert sorted(checked) == sorted(
+        f"{tree.shots_dir}/sh030/{directory}" for directory in SHOT_DIRS
+    )
+
+
+@pytest.mark.parametrize(
+    "module_name, app_name, scripts",
+    [
+        (
+            "process_shot_info_nuke",
+            "nuke",
+            (
+                "scripts/nuke/shot/comp/sh010_nuke_comp_v0000.nk",
+                "scripts/nuke/sources/comp/plate_nuke_comp_v0000.nk",
+            ),
+        ),
+        (
+            "process_shot_info_after_effects",
+            "after_effects",
+            (
+                "scripts/after_effects/sources/comp/"
+                "plate_after_effects_comp_v0000.jsx",
+            ),
+        ),
+    ]
+)
+def test_process_shot_info_uses_the_given_shot_tree(
+        shot_tree,
+        job_root,
+        no_daemon,
+        module_name,
+        app_name,
+        scripts
+):
+    process_shot_info = load_function_module(module_name).process_shot_info
+    tree = shot_tree.ShotTree(job_root, ["sh010"])
+    sh010_dir = os.path.join(tree.shots_dir, "sh010")
+
+    process_shot_info(tree.job_structure, app_name, ["comp"], 1001, 1001,
+                      shot_tree=tree)
+
+    for script in scripts:
+        assert os.path.isfile(os.path.join(sh010_dir, script))
+    assert os.path.isfile(os.path.join(
+        sh010_dir,
+        f"openclip/segment_clips/{app_name}/comp/plate_{app_name}_comp.clip"
+    ))
+    assert tree.source_sequences("sh010", "plate", 1001, 1001)[1:] == (
+        1001, 1003
+    )
+    # Only the shots of the tree are processed.
+    assert os.listdir(os.path.join(tree.shots_dir, "sh020")) == []
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the shot tree of the create-scripts tools.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_system_snapshot_utils.py
+# Purpose:      Tests of the system snapshot probes.
+# Description:  Runs the user and group probes as if the uid and gid had no
+#               passwd or group entry, as in containers and some NSS setups.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import time
+
+import pytest
+
+from src.core.utils import system_snapshot_utils
+
+
+def raise_key_error(*args):
+    raise KeyError(args)
+
+
+def raise_os_error(*args):
+    raise OSError("no controlling terminal")
+
+
+@pytest.fixture
+def no_passwd_entry(monkeypatch):
+    monkeypatch.setattr(system_snapshot_utils.pwd, "getpwuid", raise_key_error)
+    monkeypatch.setattr(system_snapshot_utils.grp, "getgrgid", raise_key_error)
+    monkeypatch.setattr(system_snapshot_utils.os, "getlogin", raise_os_error)
+    monkeypatch.setenv("HOME", "/home/ghost")
+    monkeypatch.setenv("SHELL", "/bin/zsh")
+    for name in ("USER", "USERNAME", "LOGNAME", "LNAME"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_user_falls_back_to_the_environment(no_passwd_entry, monkeypatch):
+    monkeypatch.setenv("USER", "ghost")
+
+    result = system_snapshot_utils._probe_user()
+
+    assert result["username"] == "ghost"
+    assert result["home_directory"] == "/home/ghost"
+    assert result["shell"] == "/bin/zsh"
+    assert "real_name" not in result
+
+
+def test_user_falls_back_to_getpass(no_passwd_entry, monkeypatch):
+    monkeypatch.setenv("LOGNAME", "logname-user")
+
+    assert system_snapshot_utils._probe_user()["username"] == "logname-user"
+
+
+def test_user_without_any_name_gets_the_uid(no_passwd_entry):
+    result = system_snapshot_utils._probe_user()
+
+    assert result["username"] == f"uid:{result['uid']}"
+
+
+def test_primary_group_without_entry_gets_the_gid(no_passwd_entry):
+    result = system_snapshot_utils._probe_primary_group()
+
+    assert result["primary_group"].startswith("gid:")
+
+
+def test_snapshot_is_gathered_without_passwd_entry(
+        no_passwd_entry, monkeypatch):
+    monkeypatch.setenv("USER", "ghost")
+
+    snapshot = system_snapshot_utils.gather_system_snapshot(probe_timeout=5)
+
+    assert snapshot.username == "ghost"
+    assert "user" not in snapshot.timed_out
+
+
+def test_timed_out_hostname_probe_falls_back_to_gethostname(monkeypatch):
+    monkeypatch.setattr(
+        system_snapshot_utils,
+        "SYSTEM_SNAPSHOT_PROBES",
+        (("hostname", lambda: time.sleep(1) or {}),)
+    )
+    monkeypatch.setattr(
+        system_snapshot_utils.socket, "gethostname", lambda: "ws1.example"
+    )
+
+    snapshot = system_snapshot_utils.gather_system_snapshot(probe_timeout=0)
+
+    assert snapshot.timed_out == ("hostname",)
+    assert snapshot.short_hostname == "ws1"
+    assert snapshot.fqdn == "ws1.example"
+
+
+def test_snapshot_wait_timeout_keeps_the_hostname(monkeypatch):
+    provider = system_snapshot_utils._SystemSnapshotProvider()
+    monkeypatch.setattr(provider, "start", lambda: None)
+    monkeypatch.setattr(
+        system_snapshot_utils.socket, "gethostname", lambda: "ws2"
+    )
+
+    snapshot = provider.get(timeout=0)
+
+    assert snapshot.timed_out == ("all",)
+    assert snapshot.short_hostname == "ws2"
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the system snapshot probes.
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the hostname fallback of timed-out snapshots.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_template_utils.py
+# Purpose:      Tests of the single-pass template renderer.
+# Description:  Compiles and renders '%%NAME%%' templates, including shell
+#               code that uses '%%' itself, and renders template batches
+#               into a temporary directory.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+
+import pytest
+
+from src.core.utils.template_utils import (
+    TemplateError,
+    TemplateJob,
+    compile_template,
+    render_templates,
+)
+
+
+def test_placeholders_are_filled_in_one_pass():
+    template = compile_template("a=%%A%% b=%%B%% a=%%A%%")
+
+    assert template.render({"%%A%%": "1", "%%B%%": "%%A%%"}) == (
+        "a=1 b=%%A%% a=1"
+    )
+
+
+@pytest.mark.parametrize("shell_code", [
+    'base="${file%%.*}"',
+    'stem=${NAME%%_SUFFIX}',
+    'printf "%d%%\\n" "$percent"',
+    'echo "100%%"',
+])
+def test_shell_percent_signs_are_not_placeholders(shell_code):
+    template = compile_template(f"#!/bin/bash\n{shell_code}\necho %%NAME%%\n")
+
+    assert template.names == {"%%NAME%%"}
+    assert shell_code in template.render({"%%NAME%%": "x"})
+
+
+@pytest.mark.parametrize("typo", ["%%NAME%", "%NAME%%"])
+def test_malformed_placeholders_raise(typo):
+    with pytest.raises(TemplateError, match="Malformed placeholder"):
+        compile_template(f"echo {typo}\n")
+
+
+def test_unknown_and_missing_placeholders_raise():
+    with pytest.raises(TemplateError, match="Unknown placeholders"):
+        compile_template("%%A%% %%B%%", known_placeholders={"%%A%%"})
+
+    with pytest.raises(TemplateError, match="No value for %%B%%"):
+        compile_template("%%A%% %%B%%").render({"%%A%%": "1"})
+
+
+def test_batch_writes_nothing_when_a_template_is_bad(tmp_path):
+    good = tmp_path / "good.sh.template"
+    good.write_text("echo %%A%%\n")
+    bad = tmp_path / "bad.sh.template"
+    bad.write_text("echo %%A%% %%B%%\n")
+    jobs = [
+        TemplateJob(str(good), str(tmp_path / "out" / "good.sh"), {"%%A%%": 1}),
+        TemplateJob(str(bad), str(tmp_path / "out" / "bad.sh"), {"%%A%%": 1}),
+    ]
+
+    with pytest.raises(TemplateError):
+        render_templates(jobs)
+    assert not (tmp_path / "out").exists()
+
+    jobs[1].values["%%B%%"] = 2
+    render_templates(jobs)
+    assert (tmp_path / "out" / "bad.sh").read_text() == "echo 1 2\n"
+    assert os.stat(tmp_path / "out" / "good.sh").st_mode & 0o777 == 0o755
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the single-pass template renderer.
+# -------------------------------------------------------------------------- #
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_toolset_tree.py
+# Purpose:      Tests of the Nuke-free toolset tree of projekt_core.
+# Description:  Scans, updates and refreshes a ToolsetTree over a small
+#               toolset directory in a temporary directory, including a
+#               toolset directory that is created after the scan.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import os
+
+import pytest
+
+from tests.unit.conftest import load_module_from_path
+
+TOOLSET_TREE_PATHS = {
+    "resources": (
+        "resources/nuke/repo/projekt_core_v0.0.1/projekt_core/"
+        "toolsetTree.py"
+    ),
+    "filesystem_template": (
+        "cfg/site-cfg/logik-projekt-cfg/logik-projekt-templates/"
+        "filesystem-templates/default-filesystem-templates/logik-projekt/"
+        "software/nuke/repo/projekt_core_v0.0.1/projekt_core/"
+        "toolsetTree.py"
+    ),
+}
+
+
+@pytest.fixture(params=sorted(TOOLSET_TREE_PATHS))
+def ToolsetTree(request):
+    return load_module_from_path(
+        f"toolsetTree_{request.param}",
+        TOOLSET_TREE_PATHS[request.param]
+    ).ToolsetTree
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("")
+    return str(path)
+
+
+def test_scan_lists_toolsets_and_hides_empty_menus(tmp_path, ToolsetTree):
+    touch(tmp_path / "b.nk")
+    touch(tmp_path / "a.nk")
+    touch(tmp_path / "keyers" / "ibk.nk")
+    touch(tmp_path / "keyers" / "__hidden.nk")
+    touch(tmp_path / "keyers" / "notes.txt")
+    os.makedirs(tmp_path / "empty" / "deeper")
+    touch(tmp_path / "#old" / "c.nk")
+
+    tree = ToolsetTree(tmp_path)
+    tree.scan()
+
+    assert tree.entries() == [
+        ("item", "a", (tmp_path / "a.nk").as_posix()),
+        ("item", "b", (tmp_path / "b.nk").as_posix()),
+        ("menu", "keyers", [
+            ("item", "ibk", (tmp_path / "keyers" / "ibk.nk").as_posix()),
+        ]),
+    ]
+
+
+def test_add_and_remove_report_menu_changes(tmp_path, ToolsetTree):
+    touch(tmp_path / "a.nk")
+    tree = ToolsetTree(tmp_path)
+    tree.scan()
+
+    path = touch(tmp_path / "c.nk")
+    assert tree.add(path) == [{
+        "action": "addItem", "menuPath": (), "name": "c",
+        "path": (tmp_path / "c.nk").as_posix(), "index": 1,
+    }]
+
+    path = touch(tmp_path / "grades" / "warm.nk")
+    changes = tree.add(path)
+    assert [change["action"] for change in changes] == ["addMenu"]
+    assert changes[0]["name"] == "grades"
+
+    os.remove(path)
+    assert tree.remove(path) == [
+        {"action": "removeMenu", "menuPath": (), "name": "grades"}
+    ]
+
+
+def test_refresh_reads_changed_directories(tmp_path, ToolsetTree):
+    touch(tmp_path / "a.nk")
+    tree = ToolsetTree(tmp_path)
+    tree.scan()
+
+    touch(tmp_path / "keyers" / "ibk.nk")
+    os.remove(tmp_path / "a.nk")
+    os.utime(tmp_path, ns=(0, 1))
+
+    actions = sorted(change["action"] for change in tree.refresh())
+    assert actions == ["addMenu", "removeItem"]
+    assert [entry[1] for entry in tree.entries()] == ["keyers"]
+
+
+def test_root_created_after_scan(tmp_path, ToolsetTree):
+    root = tmp_path / "toolsets"
+    tree = ToolsetTree(root)
+    tree.scan()
+    assert tree.entries() == []
+
+    # Before the root exists, an add is ignored rather than failing.
+    assert tree.add(str(root / "a.nk")) == []
+
+    path = touch(root / "keyers" / "ibk.nk")
+    changes = tree.add(path)
+    assert [change["action"] for change in changes] == ["addMenu"]
+    assert changes[0]["menuPath"] == ()
+    assert changes[0]["name"] == "keyers"
+
+    touch(root / "a.nk")
+    os.utime(root, ns=(0, 1))
+    assert [change["action"] for change in tree.refresh()] == ["addItem"]
+
+
+def test_refresh_finds_a_root_created_after_scan(tmp_path, ToolsetTree):
+    root = tmp_path / "toolsets"
+    tree = ToolsetTree(root)
+    tree.scan()
+
+    touch(root / "a.nk")
+    assert tree.refresh() == [{
+        "action": "addItem", "menuPath": (), "name": "a",
+        "path": (root / "a.nk").as_posix(), "index": 0,
+    }]
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the Nuke-free toolset tree of projekt_core.
+# -------------------------------------------------------------------------- #
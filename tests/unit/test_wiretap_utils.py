@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------- #
+# Filename:     test_wiretap_utils.py
+# Purpose:      Tests of the wiretap backends and their metrics.
+# Description:  Creates nodes with the local backend, runs a stand-in
+#               wiretap_create_node for the CLI backend, parses its
+#               output, times it out and checks that projekt creation
+#               carries on when the wiretap backend cannot be used.
+
+# Author:       phil_man@mac.com
+# Copyright:    Copyright (c) 2025
+# Disclaimer:   Disclaimer at bottom of script.
+# License:      GNU General Public License v3.0 (GPL-3.0).
+#               https://www.gnu.org/licenses/gpl-3.0.en.html
+
+# Version:      2026.2.0
+# Status:       Development
+# Type:         Test
+# Created:      2026-10-19
+# Modified:     2026-10-19
+
+# Changelog:    Changelog at bottom of script.
+# -------------------------------------------------------------------------- #
+
+import logging
+import os
+
+import pytest
+
+from src.core.projekt_manager.projekt_creator import ProjektCreator
+from src.core.utils.wiretap_utils import (
+    WIRETAP_ENVIRONMENT_VARIABLE,
+    LocalWiretapBackend,
+    WiretapCLIBackend,
+    WiretapError,
+    WiretapMetrics,
+    WiretapNode,
+    get_wiretap_backend,
+    get_wiretap_metrics,
+    parse_wiretap_output,
+    parse_wiretap_result,
+)
+from tests.unit.conftest import make_projekt_config
+
+
+@pytest.fixture(autouse=True)
+def metrics():
+    get_wiretap_metrics().reset()
+    yield get_wiretap_metrics()
+    get_wiretap_metrics().reset()
+
+
+@pytest.fixture
+def node(tmp_path):
+    metadata_path = tmp_path / "project.xml"
+    metadata_path.write_text("<Project/>")
+    return WiretapNode("job_20262_ws1", str(metadata_path))
+
+
+def make_wiretap_tool(tmp_path, script):
+    """A stand-in wiretap_create_node running the shell 'script'."""
+    tool_path = tmp_path / "wiretap_create_node"
+    tool_path.write_text("#!/bin/sh\n" + script)
+    tool_path.chmod(0o755)
+    return str(tool_path)
+
+
+def test_local_backend_records_nodes(tmp_path, node, metrics):
+    backend = LocalWiretapBackend(str(tmp_path / "wiretap"))
+
+    result = backend.create_node(node)
+    again = backend.create_node(node)
+
+    assert (result.ok, result.exists) == (True, False)
+    assert result.node_path == "/projects/job_20262_ws1"
+    assert (again.ok, again.exists) == (False, True)
+    assert backend.list_nodes() == ["job_20262_ws1"]
+    with open(backend.get_node_file_path(node)) as f:
+        assert f.read() == "<Project/>"
+    assert metrics.to_dict()["local.create_node"]["calls"] == 2
+    assert metrics.to_dict()["local.create_node"]["failures"] == 1
+
+
+def test_local_backend_reports_a_missing_metadata_file(tmp_path):
+    backend = LocalWiretapBackend(str(tmp_path / "wiretap"))
+
+    result = backend.create_node(
+        WiretapNode("job", str(tmp_path / "missing.xml"))
+    )
+
+    assert not result.ok and not result.exists
+    assert "missing.xml" in result.error
+    assert backend.list_nodes() == []
+
+
+def test_parse_wiretap_output():
+    assert parse_wiretap_output(
+        "Creating node\n\n  done \n",
+        b"warning: slow\n"
+    ) == ["Creating node", "done", "stderr: warning: slow"]
+    assert parse_wiretap_output(None, None) == []
+
+
+def test_parse_wiretap_result():
+    ok = parse_wiretap_result("/projects/a", 0, "Created /projects/a\n", "")
+    failed = parse_wiretap_result(
+        "/projects/b",
+        1,
+        "Connecting\nError: server busy\n",
+        ""
+    )
+    exists = parse_wiretap_result(
+        "/projects/c",
+        1,
+        "",
+        "Node c already exists.\n"
+    )
+    silent = parse_wiretap_result("/projects/d", 3, "", "")
+
+    assert (ok.ok, ok.error, ok.output) == (True, "", ["Created /projects/a"])
+    assert (failed.ok, failed.exists) == (False, False)
+    assert failed.error == "Error: server busy"
+    assert (exists.ok, exists.exists) == (False, True)
+    assert exists.error == "stderr: Node c already exists."
+    assert silent.error == "exited with code 3"
+    assert silent.returncode == 3
+
+
+def test_cli_backend_runs_the_tool(tmp_path, node, metrics):
+    backend = WiretapCLIBackend(
+        executable=make_wiretap_tool(tmp_path, 'echo "node $4 $8"\n')
+    )
+
+    result = backend.create_node(node)
+
+    assert result.ok
+    assert result.output == ["node /projects job_20262_ws1"]
+    assert metrics.to_dict()["cli.create_node"]["failures"] == 0
+
+
+def test_cli_backend_times_out(tmp_path, node, metrics):
+    backend = WiretapCLIBackend(
+        executable=make_wiretap_tool(
+            tmp_path,
+            'echo "Connecting"\nexec sleep 10\n'
+        ),
+        timeout=0.5
+    )
+
+    result = backend.create_node(node)
+
+    assert not result.ok and not result.exists
+    assert result.returncode is None
+    assert result.error == "wiretap_create_node timed out after 0.5 s"
+    assert result.seconds < 10
+    assert metrics.to_dict()["cli.create_node"]["failures"] == 1
+
+
+def test_cli_backend_reports_a_missing_tool(tmp_path, node):
+    backend = WiretapCLIBackend(executable=str(tmp_path / "missing"))
+
+    result = backend.create_node(node)
+
+    assert not result.ok
+    assert "missing" in result.error
+
+
+def test_metrics_aggregate_by_backend_and_operation():
+    metrics = WiretapMetrics()
+    metrics.record("cli", "create_node", 1.0, False)
+    metrics.record("cli", "create_node", 3.0, True)
+    metrics.record("api", "connect", 0.5, False)
+
+    assert metrics.to_dict() == {
+        "api.connect": {
+            "calls": 1,
+            "failures": 0,
+            "total_seconds": 0.5,
+            "max_seconds": 0.5,
+            "mean_seconds": 0.5,
+        },
+        "cli.create_node": {
+            "calls": 2,
+            "failures": 1,
+            "total_seconds": 4.0,
+            "max_seconds": 3.0,
+            "mean_seconds": 2.0,
+        },
+    }
+    metrics.reset()
+    assert metrics.to_dict() == {}
+
+
+def test_unknown_backend_is_an_error():
+    with pytest.raises(WiretapError):
+        get_wiretap_backend("ftp")
+
+
+def test_creation_carries_on_without_a_wiretap_backend(
+        tmp_path,
+        node,
+        monkeypatch,
+        caplog
+):
+    monkeypatch.setenv(WIRETAP_ENVIRONMENT_VARIABLE, "ftp")
+    config = make_projekt_config(str(tmp_path), "job")
+
+    with caplog.at_level(logging.ERROR):
+        result = ProjektCreator().create_flame_projekt(
+            config,
+            node.metadata_path
+        )
+
+    assert result is None
+    assert "Unknown wiretap backend: ftp" in caplog.text
+
+
+def test_creation_creates_the_flame_projekt(tmp_path, node, monkeypatch):
+    wiretap_dir = str(tmp_path / "wiretap")
+    monkeypatch.setenv(WIRETAP_ENVIRONMENT_VARIABLE, f"local:{wiretap_dir}")
+    config = make_projekt_config(str(tmp_path), "job")
+
+    result = ProjektCreator().create_flame_projekt(
+        config,
+        node.metadata_path
+    )
+
+    assert result.ok
+    assert os.listdir(os.path.join(wiretap_dir, "projects")) == [
+        "job_20262_ws1.xml"
+    ]
+
+
+# -------------------------------------------------------------------------- #
+
+# DISCLAIMER:   This file is part of LOGIK-PROJEKT.
+
+#               Copyright © 2025 STRENGTH IN NUMBERS
+
+#               LOGIK-PROJEKT creates directories, files, scripts & tools
+#               for use with Autodesk Flame and other software.
+
+#               LOGIK-PROJEKT is free software.
+
+#               You can redistribute it and/or modify it under the terms
+#               of the GNU General Public License as published by the
+#               Free Software Foundation, either version 3 of the License,
+#               or any later version.
+
+#               This program is distributed in the hope that it will be
+#               useful, but WITHOUT ANY WARRANTY; without even the
+#               implied warranty of MERCHANTABILITY or
+#               FITNESS FOR A PARTICULAR PURPOSE.
+
+#               See the GNU General Public License for more details.
+#               You should have received a copy of the GNU General
+#               Public License along with this program.
+
+#               If not, see <https://www.gnu.org/licenses/gpl-3.0.en.html>.
+
+#               Contact: phil_man@mac.com
+
+# -------------------------------------------------------------------------- #
+# C2 A9 32 30 32 35 53 54 52 45 4E 47 54 48 2D 49 4E 2D 4E 55 4D 42 45 52 53 #
+# -------------------------------------------------------------------------- #
+# Changelog:
+# -------------------------------------------------------------------------- #
+# Version:      2026.2.0
+# Modified:     2026-10-19
+# Changelist:   Tests of the wiretap backends and their metrics.
+# -------------------------------------------------------------------------- #